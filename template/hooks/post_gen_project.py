@@ -90,6 +90,7 @@ print("Cleaning up unused files...")
 # --- AI Agent files (remove unused framework-specific files) ---
 if not use_pydantic_ai:
     remove_file(os.path.join(backend_app, "agents", "assistant.py"))
+    remove_file(os.path.join(backend_app, "agents", "http_clients.py"))
 if not use_langchain:
     remove_file(os.path.join(backend_app, "agents", "langchain_assistant.py"))
 if not use_langgraph:
@@ -236,6 +237,9 @@ if not (use_postgresql and use_sqlalchemy):
     remove_file(os.path.join(backend_tests, "test_services_conversation.py"))
 if not use_celery:
     remove_file(os.path.join(backend_tests, "test_worker.py"))
+if not enable_rag:
+    remove_file(os.path.join(backend_tests, "test_rag_retrieval.py"))
+    remove_file(os.path.join(backend_tests, "test_rag_ingestion.py"))
 if not (enable_admin_panel and use_postgresql):
     remove_file(os.path.join(backend_tests, "test_admin.py"))
 
@@ -253,7 +257,9 @@ if not enable_docker:
 
 # --- Cleanup stub files (files with only docstring, no code) ---
 core_dir = os.path.join(backend_app, "core")
-for stub_candidate in ["security.py", "cache.py", "rate_limit.py", "oauth.py", "logfire_setup.py", "csrf.py"]:
+for stub_candidate in [
+    "security.py", "cache.py", "rate_limit.py", "oauth.py", "logfire_setup.py", "csrf.py", "pdf_tables.py",
+]:
     filepath = os.path.join(core_dir, stub_candidate)
     if is_stub_file(filepath):
         remove_file(filepath)
@@ -268,6 +274,7 @@ else:
     worker_dir = os.path.join(backend_app, "worker")
     if not use_celery:
         remove_file(os.path.join(worker_dir, "celery_app.py"))
+        remove_file(os.path.join(worker_dir, "event_loop.py"))
         remove_file(os.path.join(worker_dir, "tasks", "examples.py"))
     if not use_taskiq:
         remove_file(os.path.join(worker_dir, "taskiq_app.py"))
@@ -275,6 +282,8 @@ else:
         remove_file(os.path.join(worker_dir, "tasks", "schedules.py"))
     if not use_arq:
         remove_file(os.path.join(worker_dir, "arq_app.py"))
+    if not enable_rag:
+        remove_file(os.path.join(worker_dir, "queues.py"))
 
 
 # --- Cleanup empty directories ---
@@ -23,6 +23,7 @@ from pydantic_ai.providers.openai import OpenAIProvider
 {%- endif %}
 {%- if cookiecutter.use_anthropic %}
 from pydantic_ai.models.anthropic import AnthropicModel
+from pydantic_ai.providers.anthropic import AnthropicProvider
 {%- endif %}
 {%- if cookiecutter.use_google %}
 from pydantic_ai.models.google import GoogleModel
@@ -34,6 +35,7 @@ from pydantic_ai.providers.openrouter import OpenRouterProvider
 {%- endif %}
 from pydantic_ai.settings import ModelSettings
 
+from app.agents.http_clients import get_http_client
 from app.agents.prompts import DEFAULT_SYSTEM_PROMPT
 {%- if cookiecutter.enable_rag %}
 from app.agents.prompts import get_system_prompt_with_rag
@@ -44,7 +46,9 @@ from app.agents.tools.web_search import web_search
 {%- endif %}
 {%- if cookiecutter.enable_rag %}
 from app.agents.tools.rag_tool import search_knowledge_base
+from app.rag.tenancy import tenant_scope
 {%- endif %}
+from app.agents.registry import agent_registry
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -59,6 +63,7 @@ class Deps:
 
     user_id: str | None = None
     user_name: str | None = None
+    project_id: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
@@ -85,27 +90,31 @@ class AssistantAgent:
 
     def _create_agent(self) -> Agent[Deps, str]:
         """Create and configure the PydanticAI agent."""
+        # Providers share one connection pool, so keep-alive survives agent rebuilds
 {%- if cookiecutter.use_openai %}
         model = OpenAIResponsesModel(
             self.model_name,
-            provider=OpenAIProvider(api_key=settings.OPENAI_API_KEY),
+            provider=OpenAIProvider(api_key=settings.OPENAI_API_KEY, http_client=get_http_client("openai")),
         )
 {%- endif %}
 {%- if cookiecutter.use_anthropic %}
         model = AnthropicModel(
             self.model_name,
+            provider=AnthropicProvider(
+                api_key=settings.ANTHROPIC_API_KEY or None, http_client=get_http_client("anthropic")
+            ),
         )
 {%- endif %}
 {%- if cookiecutter.use_google %}
         model = GoogleModel(
             self.model_name,
-            provider=GoogleProvider(api_key=settings.GOOGLE_API_KEY),
+            provider=GoogleProvider(api_key=settings.GOOGLE_API_KEY, http_client=get_http_client("google")),
         )
 {%- endif %}
 {%- if cookiecutter.use_openrouter %}
         model = OpenRouterModel(
             self.model_name,
-            provider=OpenRouterProvider(api_key=settings.OPENROUTER_API_KEY),
+            provider=OpenRouterProvider(api_key=settings.OPENROUTER_API_KEY, http_client=get_http_client("openrouter")),
         )
 {%- endif %}
 
@@ -152,7 +161,9 @@ class AssistantAgent:
             Returns:
                 Formatted string with search results including content and scores.
             """
-            return await search_knowledge_base(query=query, top_k=top_k)
+            # Scoped to shared documents and those of the user and project running the agent
+            tenants = tenant_scope(user_id=ctx.deps.user_id, project_id=ctx.deps.project_id)
+            return await search_knowledge_base(query=query, top_k=top_k, tenants=tenants)
 {%- endif %}
 
 {%- if cookiecutter.enable_web_search %}
@@ -255,16 +266,25 @@ class AssistantAgent:
                 yield event
 
 
-def get_agent(model_name: str | None = None) -> AssistantAgent:
-    """Factory function to create an AssistantAgent.
+def get_agent(model_name: str | None = None, system_prompt: str | None = None) -> AssistantAgent:
+    """Return the shared AssistantAgent for a model and system prompt.
+
+    Agents are built once and reused across messages (see app.agents.registry);
+    per-conversation state travels in Deps and the message history.
 
     Args:
         model_name: Override the default AI model.
+        system_prompt: Override the default system prompt.
 
     Returns:
         Configured AssistantAgent instance.
     """
-    return AssistantAgent(model_name=model_name)
+    return agent_registry.get(
+        "pydantic_ai",
+        model_name or settings.AI_MODEL,
+        system_prompt,
+        lambda: AssistantAgent(model_name=model_name, system_prompt=system_prompt),
+    )
 
 
 async def run_agent(
@@ -7,6 +7,7 @@ Uses CrewAI's event system for real-time streaming to WebSocket.
 """
 
 import asyncio
+import contextvars
 import logging
 import os
 from queue import Empty, Queue
@@ -457,9 +458,11 @@ class CrewAIAssistant:
         self._crew = None
 
         loop = asyncio.get_event_loop()
+        # Run in a copy of this context: the crew's tools read the caller's tenant scope
+        ctx = contextvars.copy_context()
         result = await loop.run_in_executor(
             None,
-            lambda: self.crew.kickoff(inputs=inputs)
+            lambda: ctx.run(self.crew.kickoff, inputs=inputs)
         )
 
         task_results = []
@@ -540,8 +543,8 @@ class CrewAIAssistant:
             finally:
                 event_queue.put(None)  # Signal completion
 
-        # Start crew in background thread
-        thread = Thread(target=run_with_events, daemon=True)
+        # Start crew in background thread, in a copy of this context (tools read the tenant scope)
+        thread = Thread(target=contextvars.copy_context().run, args=(run_with_events,), daemon=True)
         thread.start()
 
         # Yield events as they arrive
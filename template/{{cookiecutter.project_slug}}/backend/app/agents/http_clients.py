@@ -0,0 +1,76 @@
+{%- if cookiecutter.use_pydantic_ai %}
+"""Shared HTTP connection pools for LLM provider clients.
+
+Every agent talking to the same provider uses one tuned ``httpx.AsyncClient``,
+so connections (and their TLS sessions) are kept alive across turns and
+conversations instead of being opened per agent. Pool limits come from the
+``AI_HTTP_*`` settings.
+
+Like agents, clients belong to the event loop they were created on: a
+different loop (e.g. a worker running each task in a fresh loop) gets its own.
+"""
+
+import asyncio
+import contextlib
+import logging
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_clients: dict[str, tuple[asyncio.AbstractEventLoop | None, tuple[float, ...], httpx.AsyncClient]] = {}
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _pool_settings() -> tuple[float, ...]:
+    return (
+        settings.AI_HTTP_MAX_CONNECTIONS,
+        settings.AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        settings.AI_HTTP_KEEPALIVE_EXPIRY,
+        settings.AI_HTTP_TIMEOUT,
+    )
+
+
+def get_http_client(provider: str) -> httpx.AsyncClient:
+    """Return the shared HTTP client of a provider, creating it on first use."""
+    loop = _running_loop()
+    pool_settings = _pool_settings()
+    cached = _clients.get(provider)
+    if cached is not None:
+        cached_loop, cached_settings, client = cached
+        if cached_loop is loop and cached_settings == pool_settings and not client.is_closed:
+            return client
+
+    max_connections, max_keepalive, keepalive_expiry, timeout = pool_settings
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=int(max_connections),
+            max_keepalive_connections=int(max_keepalive),
+            keepalive_expiry=keepalive_expiry,
+        ),
+        # Long reads for slow generations, but fail fast on unreachable hosts
+        timeout=httpx.Timeout(timeout, connect=10.0),
+    )
+    _clients[provider] = (loop, pool_settings, client)
+    logger.info(f"Created HTTP connection pool for {provider} (max {int(max_connections)} connections)")
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every shared client (on application shutdown)."""
+    clients = [client for _, _, client in _clients.values()]
+    _clients.clear()
+    for client in clients:
+        with contextlib.suppress(Exception):
+            await client.aclose()
+{%- else %}
+"""Shared LLM provider HTTP clients - not configured."""
+{%- endif %}
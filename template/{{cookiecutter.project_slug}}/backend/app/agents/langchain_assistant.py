@@ -31,6 +31,7 @@ from app.agents.tools.web_search import web_search_sync
 {%- if cookiecutter.enable_rag %}
 from app.agents.tools.rag_tool import search_knowledge_base_sync
 {%- endif %}
+from app.agents.registry import agent_registry
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -243,13 +244,25 @@ class LangChainAssistant:
             yield event
 
 
-def get_agent() -> LangChainAssistant:
-    """Factory function to create a LangChainAssistant.
+def get_agent(model_name: str | None = None, system_prompt: str | None = None) -> LangChainAssistant:
+    """Return the shared LangChainAssistant for a model and system prompt.
+
+    Agents are built once and reused across messages (see app.agents.registry);
+    per-conversation state travels in the context and the message history.
+
+    Args:
+        model_name: Override the default AI model.
+        system_prompt: Override the default system prompt.
 
     Returns:
         Configured LangChainAssistant instance.
     """
-    return LangChainAssistant()
+    return agent_registry.get(
+        "langchain",
+        model_name or settings.AI_MODEL,
+        system_prompt,
+        lambda: LangChainAssistant(model_name=model_name, system_prompt=system_prompt),
+    )
 
 
 async def run_agent(
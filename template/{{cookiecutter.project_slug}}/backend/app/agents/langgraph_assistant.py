@@ -385,13 +385,18 @@ class LangGraphAssistant:
             yield stream_mode, data
 
 
-def get_agent() -> LangGraphAssistant:
+def get_agent(model_name: str | None = None) -> LangGraphAssistant:
     """Factory function to create a LangGraphAssistant.
 
+    Not cached in app.agents.registry: each instance keeps its own checkpointer.
+
+    Args:
+        model_name: Override the default AI model.
+
     Returns:
         Configured LangGraphAssistant instance.
     """
-    return LangGraphAssistant()
+    return LangGraphAssistant(model_name=model_name)
 
 
 async def run_agent(
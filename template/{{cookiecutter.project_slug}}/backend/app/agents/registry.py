@@ -0,0 +1,105 @@
+"""Registry of built agents, reused across messages and conversations.
+
+Building an agent is not free: the framework agent is rebuilt, tools are
+registered again and a new model client is created, which also throws away
+its HTTP keep-alive connections and TLS sessions. Agents built here hold no
+per-conversation state (that travels in deps/context and message history),
+so one instance per (framework, model, system-prompt variant) serves every
+conversation.
+
+Cached agents are dropped when the settings they were built from change
+(``AI_*``, ``LLM_*`` and ``*_API_KEY``), when a different event loop asks for
+them (their HTTP clients belong to the loop they were created on), or
+explicitly with :func:`invalidate_agents`.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Models are picked per message by clients - bound the number of cached agents
+MAX_CACHED_AGENTS = 32
+
+
+def _settings_fingerprint() -> str:
+    """Hash of the settings agents are built from."""
+    values = {
+        name: getattr(settings, name)
+        for name in sorted(type(settings).model_fields)
+        if name.startswith(("AI_", "LLM_")) or name.endswith("_API_KEY")
+    }
+    return hashlib.sha256(repr(values).encode()).hexdigest()
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def prompt_variant(system_prompt: str | None) -> str:
+    """Short cache key of a system prompt (``default`` when not overridden)."""
+    if system_prompt is None:
+        return "default"
+    return hashlib.sha1(system_prompt.encode()).hexdigest()[:16]
+
+
+class AgentRegistry:
+    """Built agents keyed by (framework, model, system-prompt variant), least recently used evicted first."""
+
+    def __init__(self, max_size: int = MAX_CACHED_AGENTS):
+        self.max_size = max_size
+        self._agents: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+        self._fingerprint: str | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self, framework: str, model_name: str, system_prompt: str | None, build: Callable[[], T]) -> T:
+        """Return the cached agent for the key, building it with ``build`` on a miss."""
+        self._drop_stale()
+        key = (framework, model_name, prompt_variant(system_prompt))
+        agent = self._agents.get(key)
+        if agent is not None:
+            self._agents.move_to_end(key)
+            return agent
+
+        agent = build()
+        self._agents[key] = agent
+        if len(self._agents) > self.max_size:
+            self._agents.popitem(last=False)
+        logger.debug(f"Built {framework} agent for {model_name} ({key[2]})")
+        return agent
+
+    def invalidate(self) -> None:
+        """Drop every cached agent; the next request rebuilds them."""
+        self._agents.clear()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def _drop_stale(self) -> None:
+        fingerprint = _settings_fingerprint()
+        loop = _running_loop()
+        if fingerprint != self._fingerprint or loop is not self._loop:
+            if self._agents:
+                logger.info("AI settings or event loop changed, rebuilding agents")
+            self.invalidate()
+            self._fingerprint = fingerprint
+            self._loop = loop
+
+
+agent_registry = AgentRegistry()
+
+
+def invalidate_agents() -> None:
+    """Drop all cached agents (e.g. after changing prompts or tools at runtime)."""
+    agent_registry.invalidate()
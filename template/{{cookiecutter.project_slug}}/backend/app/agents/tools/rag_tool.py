@@ -58,6 +58,7 @@ async def search_knowledge_base(
     collection: str | None = None,
     collections: list[str] | None = None,
     top_k: int = 5,
+    tenants: list[str] | None = None,
 ) -> str:
     """Search the knowledge base and return formatted results.
 
@@ -66,6 +67,8 @@ async def search_knowledge_base(
         collection: Name of a single collection. If None, uses RAG_DEFAULT_COLLECTION env var.
         collections: List of collection names for cross-collection search (overrides collection).
         top_k: Number of top results to retrieve (default: 5).
+        tenants: Only search the documents of these tenants (default: the scope of
+            the current context, see app.rag.tenancy.set_tenant_scope).
 
     Returns:
         Formatted string with search results including citations.
@@ -73,7 +76,11 @@ async def search_knowledge_base(
     import os
     from typing import Any
 
+    from app.rag.tenancy import current_tenant_scope
+
     service: Any = get_retrieval_service()
+    if tenants is None:
+        tenants = current_tenant_scope()
 
     default_collection = os.environ.get("RAG_DEFAULT_COLLECTION", "all")
     target_collection = collection or default_collection
@@ -83,6 +90,7 @@ async def search_knowledge_base(
             query=query,
             collection_names=collections,
             limit=top_k,
+            tenants=tenants,
         )
     elif target_collection == "all":
         try:
@@ -90,9 +98,13 @@ async def search_knowledge_base(
             if not all_collections:
                 return "No collections found in the knowledge base."
             if len(all_collections) == 1:
-                results = await service.retrieve(query=query, collection_name=all_collections[0], limit=top_k)
+                results = await service.retrieve(
+                    query=query, collection_name=all_collections[0], limit=top_k, tenants=tenants
+                )
             else:
-                results = await service.retrieve_multi(query=query, collection_names=all_collections, limit=top_k)
+                results = await service.retrieve_multi(
+                    query=query, collection_names=all_collections, limit=top_k, tenants=tenants
+                )
         except Exception as e:
             logger.error(f"Failed to list collections: {e}")
             return f"Error accessing knowledge base: {e}"
@@ -101,6 +113,7 @@ async def search_knowledge_base(
             query=query,
             collection_name=target_collection,
             limit=top_k,
+            tenants=tenants,
         )
 
     if not results:
@@ -128,7 +141,7 @@ async def search_knowledge_base(
     )
 
 
-def _run_async_search(query: str, collection: str, top_k: int) -> str:
+def _run_async_search(query: str, collection: str, top_k: int, tenants: list[str]) -> str:
     """Run async search in a dedicated event loop within a thread.
 
     This creates a fresh event loop for each call, avoiding event loop
@@ -138,7 +151,7 @@ def _run_async_search(query: str, collection: str, top_k: int) -> str:
     asyncio.set_event_loop(loop)
     try:
         return loop.run_until_complete(
-            search_knowledge_base(query, collection, top_k=top_k)
+            search_knowledge_base(query, collection, top_k=top_k, tenants=tenants)
         )
     finally:
         loop.close()
@@ -169,12 +182,15 @@ def search_knowledge_base_sync(
         top_k,
     )
     try:
+        from app.rag.tenancy import current_tenant_scope
+
         # Use ThreadPoolExecutor with a dedicated event loop
         # This avoids "Event loop is closed" errors when asyncio.run()
-        # is called multiple times or from within an async context
+        # is called multiple times or from within an async context.
+        # The scope is resolved here: the executor thread does not see this context
         with ThreadPoolExecutor(max_workers=1) as executor:
             future = executor.submit(
-                _run_async_search, query, collection, top_k
+                _run_async_search, query, collection, top_k, current_tenant_scope()
             )
             result = future.result()
         logger.debug("search_knowledge_base_sync completed successfully")
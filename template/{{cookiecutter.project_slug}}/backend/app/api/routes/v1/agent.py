@@ -147,7 +147,11 @@ async def agent_websocket(
 
     # Conversation state per connection
     conversation_history: list[dict[str, str]] = []
+{%- if cookiecutter.websocket_auth_jwt %}
+    deps = Deps(user_id=str(user.id), user_name=user.full_name)
+{%- else %}
     deps = Deps()
+{%- endif %}
 {%- if cookiecutter.use_database %}
     current_conversation_id: str | None = None
 {%- endif %}
@@ -588,6 +592,9 @@ from langchain.messages import AIMessage, AIMessageChunk, HumanMessage, SystemMe
 from app.agents.langchain_assistant import AgentContext, get_agent
 from app.core.config import settings
 from app.services.agent import AgentConnectionManager
+{%- if cookiecutter.enable_rag and cookiecutter.websocket_auth_jwt %}
+from app.rag.tenancy import set_tenant_scope
+{%- endif %}
 {%- if cookiecutter.websocket_auth_jwt %}
 from app.api.deps import get_current_user_ws
 from app.db.models.user import User
@@ -705,6 +712,10 @@ async def agent_websocket(
 {%- if cookiecutter.websocket_auth_jwt %}
     context["user_id"] = str(user.id) if user else None
     context["user_name"] = user.email if user else None
+{%- if cookiecutter.enable_rag %}
+    # Knowledge-base searches of this connection only see shared and this user's documents
+    set_tenant_scope(user_id=user.id)
+{%- endif %}
 {%- endif %}
 {%- if cookiecutter.use_database %}
     current_conversation_id: str | None = None
@@ -1048,6 +1059,9 @@ from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, Sys
 from app.agents.langgraph_assistant import AgentContext, get_agent
 from app.core.config import settings
 from app.services.agent import AgentConnectionManager
+{%- if cookiecutter.enable_rag and cookiecutter.websocket_auth_jwt %}
+from app.rag.tenancy import set_tenant_scope
+{%- endif %}
 {%- if cookiecutter.websocket_auth_jwt %}
 from app.api.deps import get_current_user_ws
 from app.db.models.user import User
@@ -1166,6 +1180,10 @@ async def agent_websocket(
 {%- if cookiecutter.websocket_auth_jwt %}
     context["user_id"] = str(user.id) if user else None
     context["user_name"] = user.email if user else None
+{%- if cookiecutter.enable_rag %}
+    # Knowledge-base searches of this connection only see shared and this user's documents
+    set_tenant_scope(user_id=user.id)
+{%- endif %}
 {%- endif %}
 {%- if cookiecutter.use_database %}
     current_conversation_id: str | None = None
@@ -1510,6 +1528,9 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect{%- if cookiecutter
 from app.agents.crewai_assistant import CrewContext, get_crew
 from app.core.config import settings
 from app.services.agent import AgentConnectionManager
+{%- if cookiecutter.enable_rag and cookiecutter.websocket_auth_jwt %}
+from app.rag.tenancy import set_tenant_scope
+{%- endif %}
 {%- if cookiecutter.websocket_auth_jwt %}
 from app.api.deps import get_current_user_ws
 from app.db.models.user import User
@@ -1611,6 +1632,10 @@ async def agent_websocket(
 {%- if cookiecutter.websocket_auth_jwt %}
     context["user_id"] = str(user.id) if user else None
     context["user_name"] = user.email if user else None
+{%- if cookiecutter.enable_rag %}
+    # Knowledge-base searches of this connection only see shared and this user's documents
+    set_tenant_scope(user_id=user.id)
+{%- endif %}
 {%- endif %}
 {%- if cookiecutter.use_database %}
     current_conversation_id: str | None = None
@@ -1981,6 +2006,9 @@ from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, Sys
 from app.agents.deepagents_assistant import AgentContext, Decision, InterruptData, get_agent
 from app.core.config import settings
 from app.services.agent import AgentConnectionManager
+{%- if cookiecutter.enable_rag and cookiecutter.websocket_auth_jwt %}
+from app.rag.tenancy import set_tenant_scope
+{%- endif %}
 {%- if cookiecutter.websocket_auth_jwt %}
 from app.api.deps import get_current_user_ws
 from app.db.models.user import User
@@ -2122,6 +2150,10 @@ async def agent_websocket(
 {%- if cookiecutter.websocket_auth_jwt %}
     context["user_id"] = str(user.id) if user else None
     context["user_name"] = user.email if user else None
+{%- if cookiecutter.enable_rag %}
+    # Knowledge-base searches of this connection only see shared and this user's documents
+    set_tenant_scope(user_id=user.id)
+{%- endif %}
 {%- endif %}
 {%- if cookiecutter.use_database %}
     current_conversation_id: str | None = None
@@ -2611,6 +2643,9 @@ from pydantic_ai.messages import BinaryContent, TextPart
 from app.agents.pydantic_deep_assistant import PydanticDeepContext, get_agent
 from app.core.config import settings
 from app.services.agent import AgentConnectionManager
+{%- if cookiecutter.enable_rag and (cookiecutter.websocket_auth_jwt or (cookiecutter.use_jwt and cookiecutter.use_postgresql)) %}
+from app.rag.tenancy import set_tenant_scope
+{%- endif %}
 {%- if cookiecutter.websocket_auth_jwt %}
 from app.api.deps import get_current_user_ws
 from app.db.models.user import User
@@ -2714,6 +2749,10 @@ async def agent_websocket(
 {%- if cookiecutter.websocket_auth_jwt %}
     context["user_id"] = str(user.id) if user else None
     context["user_name"] = user.email if user else None
+{%- if cookiecutter.enable_rag %}
+    # Knowledge-base searches of this connection only see shared and this user's documents
+    set_tenant_scope(user_id=user.id)
+{%- endif %}
 {%- endif %}
 {%- if cookiecutter.use_database %}
     current_conversation_id: str | None = None
@@ -3215,6 +3254,11 @@ async def project_chat_websocket(
             except Exception as exc:
                 await websocket.close(code=4003, reason=str(exc))
                 return
+{%- if cookiecutter.enable_rag %}
+
+        # Knowledge-base searches of this chat only see shared, this user's and this project's documents
+        set_tenant_scope(user_id={% if cookiecutter.websocket_auth_jwt %}user.id{% else %}None{% endif %}, project_id=project_id)
+{%- endif %}
 
         # Build agent backend for this project
         backend: Any = StateBackend()
@@ -11,9 +11,9 @@ from fastapi import APIRouter, File, HTTPException, UploadFile, status
 from fastapi.responses import FileResponse
 
 from app.api.deps import CurrentUser, FileUploadSvc
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import NotFoundError, PayloadTooLargeError
 from app.schemas.file import FileInfo, FileUploadResponse
-from app.services.file_storage import get_file_storage
+from app.services.file_storage import get_file_storage, iter_upload
 
 logger = logging.getLogger(__name__)
 
@@ -27,20 +27,27 @@ async def upload_file(
     file: UploadFile = File(...),
 ) -> Any:
     """Upload a file for use in chat."""
-    data = await file.read()
-    is_valid, error = file_upload_svc.validate_upload(file.content_type, len(data))
+    # Type check, and size check when the client declared the size
+    is_valid, error = file_upload_svc.validate_upload(file.content_type, file.size or 0)
     if not is_valid:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
-    file_type = file_upload_svc.classify_file(file.content_type or "", file.filename or "unknown")
-{%- if cookiecutter.use_postgresql %}
-    parsed_content = await file_upload_svc.parse_content(data, file_type, file.content_type or "")
-{%- else %}
-    parsed_content = file_upload_svc.parse_content(data, file_type, file.content_type or "")
-{%- endif %}
-
     storage = get_file_storage()
-    storage_path = await storage.save(str(current_user.id), file.filename or "unknown", data)
+    try:
+        stored = await storage.save_stream(
+            str(current_user.id), file.filename or "unknown", iter_upload(file),
+            max_size=file_upload_svc.MAX_UPLOAD_SIZE,
+        )
+    except PayloadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message) from e
+    storage_path = stored.storage_path
+
+    file_type = file_upload_svc.classify_file(file.content_type or "", file.filename or "unknown")
+    parsed_content = None
+    if file_type != "image":
+        # Images are never parsed, so they are never read back into memory
+        data = await storage.load(storage_path)
+        parsed_content = await file_upload_svc.parse_content(data, file_type, file.content_type or "")
 
 {%- if cookiecutter.use_postgresql %}
     chat_file = await file_upload_svc.create_chat_file(
@@ -50,7 +57,7 @@ async def upload_file(
         user_id=current_user.id,
         filename=file.filename or "unknown",
         mime_type=file.content_type or "application/octet-stream",
-        size=len(data),
+        size=stored.size,
         storage_path=storage_path,
         file_type=file_type,
         parsed_content=parsed_content,
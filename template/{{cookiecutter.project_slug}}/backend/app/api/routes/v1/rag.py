@@ -2,10 +2,9 @@
 """RAG API routes for collection management, search, document upload, and deletion."""
 
 import logging
-import os
-import tempfile
 from pathlib import Path
 from typing import Any
+from uuid import UUID
 {%- if (cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq) and cookiecutter.enable_redis %}
 import asyncio
 from collections.abc import AsyncIterable
@@ -16,16 +15,22 @@ from fastapi.sse import EventSourceResponse, ServerSentEvent
 {%- endif %}
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, UploadFile, File, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.api.deps import IngestionSvc, RetrievalSvc, VectorStoreSvc
+from app.rag.snapshot import SnapshotError, check_compatible, iter_snapshot, read_manifest
+from app.rag.summary_index import DocumentSummaryIndex
+from app.rag.tenancy import tenant_key, tenant_scope
+from app.rag.vectorstore import FilterError
 {%- if cookiecutter.use_jwt %}
 from app.api.deps import CurrentAdmin, CurrentUser
+from app.db.models.user import UserRole
 {%- endif %}
 {%- if (cookiecutter.use_postgresql or cookiecutter.use_sqlite) %}
 from app.api.deps import RAGDocumentSvc, RAGSyncSvc, SyncSourceSvc
 from app.core.config import settings as app_settings
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import NotFoundError, PayloadTooLargeError
+from app.rag.batch_upload import BatchUpload
 from app.rag.config import get_supported_formats
 from app.schemas.sync_source import (
     ConnectorList,
@@ -34,18 +39,38 @@ from app.schemas.sync_source import (
     SyncSourceRead,
     SyncSourceUpdate,
 )
-from app.services.file_storage import get_file_storage
+from app.services.file_storage import get_file_storage, iter_upload
 {%- if not (cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq) %}
-from app.tasks.rag import ingest_document_in_background, sync_local_in_background, sync_source_in_background
+from app.tasks.rag import (
+    ingest_batch_in_background,
+    build_summary_index_in_background,
+    ingest_document_in_background,
+    import_snapshot_in_background,
+    reembed_collection_in_background,
+    sync_local_in_background,
+    sync_source_in_background,
+)
 {%- endif %}
 {%- if cookiecutter.use_celery or cookiecutter.use_taskiq %}
-from app.worker.tasks.rag_tasks import ingest_document_task, sync_collection_task, sync_single_source_task
+from app.worker.tasks.rag_tasks import (
+    build_summary_index_task,
+    ingest_batch_task,
+    ingest_document_task,
+    import_snapshot_task,
+    reembed_collection_task,
+    sync_collection_task,
+    sync_single_source_task,
+)
 {%- endif %}
 {%- if cookiecutter.use_arq %}
 from app.worker.arq_app import get_arq_pool
+from app.worker.queues import BULK_QUEUE, QUEUE_KEYS
 {%- endif %}
 from fastapi.responses import FileResponse
 {%- endif %}
+{%- if cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq %}
+from app.worker.queues import get_queue_stats
+{%- endif %}
 {%- if cookiecutter.use_mongodb %}
 from app.core.config import settings as app_settings
 from app.rag.config import get_supported_formats
@@ -60,8 +85,12 @@ from app.schemas.rag import (
     RAGSearchResult,
 )
 {%- if (cookiecutter.use_postgresql or cookiecutter.use_sqlite) %}
+from app.schemas.rag import RAGBatchIngestItem, RAGBatchIngestResponse, RAGBatchSkippedItem
 from app.schemas.rag import RAGIngestResponse, RAGRetryResponse, RAGTrackedDocumentList
-from app.schemas.rag import RAGSyncLogList, RAGSyncRequest, RAGSyncResponse
+from app.schemas.rag import RAGReembedRequest, RAGSyncLogList, RAGSyncRequest, RAGSyncResponse
+{%- endif %}
+{%- if cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq %}
+from app.schemas.rag import RAGQueueStatsList
 {%- endif %}
 
 logger = logging.getLogger(__name__)
@@ -125,6 +154,7 @@ async def drop_collection(
 ) -> None:
     """Drop an entire collection — vectors and all SQL document records."""
     await vector_store.delete_collection(name)
+    await DocumentSummaryIndex(vector_store).drop(name)
 {%- if cookiecutter.use_postgresql or cookiecutter.use_sqlite %}
     await rag_doc_svc.delete_by_collection(name)
 {%- endif %}
@@ -154,6 +184,40 @@ async def list_documents(
     return await vector_store.get_document_list(name)
 
 
+@router.get("/collections/{name}/export")
+async def export_collection(
+    name: str,
+    vector_store: VectorStoreSvc,
+{%- if cookiecutter.use_jwt %}
+    _: CurrentAdmin,
+{%- endif %}
+) -> StreamingResponse:
+    """Download a collection snapshot: its chunks with their vectors, as a zip file.
+
+    Streamed part by part while the collection is read. Importing it
+    (``POST /collections/{name}/import``) does not embed anything again.
+    """
+    if name not in await vector_store.list_collections():
+        raise HTTPException(status_code=404, detail=f"Collection '{name}' not found")
+    return StreamingResponse(
+        iter_snapshot(vector_store, name),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{name}.snapshot.zip"'},
+    )
+
+
+@router.delete("/collections/{name}/summary-index", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
+async def drop_summary_index(
+    name: str,
+    vector_store: VectorStoreSvc,
+{%- if cookiecutter.use_jwt %}
+    _: CurrentAdmin,
+{%- endif %}
+) -> None:
+    """Drop a collection's document summary index; searches go back to flat."""
+    await DocumentSummaryIndex(vector_store).drop(name)
+
+
 @router.post("/search", response_model=RAGSearchResponse)
 async def search_documents(
     request: RAGSearchRequest,
@@ -164,6 +228,12 @@ async def search_documents(
     use_reranker: bool = Query(False, description="Whether to use reranking (if configured)"),
 ) -> Any:
     """Search for relevant document chunks. Supports multi-collection search."""
+{%- if cookiecutter.use_jwt %}
+    # Users only see shared documents and their own; admins see every tenant's
+    tenants = None if current_user.has_role(UserRole.ADMIN) else tenant_scope(user_id=current_user.id)
+{%- else %}
+    tenants = None
+{%- endif %}
     if request.collection_names and len(request.collection_names) > 1:
         results = await retrieval_service.retrieve_multi(
             query=request.query,
@@ -171,19 +241,29 @@ async def search_documents(
             limit=request.limit,
             min_score=request.min_score,
             use_reranker=use_reranker,
+            tenants=tenants,
         )
     else:
         collection = (request.collection_names[0] if request.collection_names else request.collection_name)
-        results = await retrieval_service.retrieve(
-            query=request.query,
-            collection_name=collection,
-            limit=request.limit,
-            min_score=request.min_score,
-            filter=request.filter or "",
-            use_reranker=use_reranker,
-        )
+        try:
+            results = await retrieval_service.retrieve(
+                query=request.query,
+                collection_name=collection,
+                limit=request.limit,
+                min_score=request.min_score,
+                filter=request.filter or "",
+                use_reranker=use_reranker,
+                tenants=tenants,
+            )
+        except FilterError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
     api_results = [
-        RAGSearchResult(**hit.model_dump())
+        RAGSearchResult(
+            content=hit.content,
+            score=hit.score,
+            metadata=hit.metadata,
+            parent_doc_id=hit.parent_doc_id or "",
+        )
         for hit in results
     ]
     return RAGSearchResponse(results=api_results)
@@ -206,6 +286,20 @@ async def delete_document(
 
 {%- if (cookiecutter.use_postgresql or cookiecutter.use_sqlite) %}
 
+
+def _allowed_extensions() -> set[str]:
+    """File extensions the configured document parser accepts."""
+{%- if cookiecutter.use_all_pdf_parsers %}
+    return get_supported_formats(getattr(app_settings, "PDF_PARSER", "pymupdf"))
+{%- elif cookiecutter.use_llamaparse %}
+    return get_supported_formats("llamaparse")
+{%- elif cookiecutter.use_liteparse %}
+    return get_supported_formats("liteparse")
+{%- else %}
+    return get_supported_formats("pymupdf")
+{%- endif %}
+
+
 @router.post("/collections/{name}/ingest", response_model=RAGIngestResponse, response_model_exclude_none=True)
 async def ingest_file(
     name: str,
@@ -218,18 +312,12 @@ async def ingest_file(
 {%- endif %}
     file: UploadFile = File(...),
     replace: bool = Query(False),
+    user_id: UUID | None = Query(None, description="Ingest for this user only (see RAG_TENANT_PARTITIONING)"),
+    project_id: UUID | None = Query(None, description="Ingest for this project only (takes precedence over user_id)"),
 ) -> Any:
     """Upload and ingest a file into a collection. Tracks status in DB."""
-
-{%- if cookiecutter.use_all_pdf_parsers %}
-    ALLOWED = get_supported_formats(getattr(app_settings, "PDF_PARSER", "pymupdf"))
-{%- elif cookiecutter.use_llamaparse %}
-    ALLOWED = get_supported_formats("llamaparse")
-{%- elif cookiecutter.use_liteparse %}
-    ALLOWED = get_supported_formats("liteparse")
-{%- else %}
-    ALLOWED = get_supported_formats("pymupdf")
-{%- endif %}
+    tenant = tenant_key(user_id=user_id, project_id=project_id)
+    ALLOWED = _allowed_extensions()
     max_size = app_settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
     filename = file.filename or "unknown"
@@ -240,21 +328,29 @@ async def ingest_file(
             detail=f"File type '{ext}' not supported. Allowed: {', '.join(sorted(ALLOWED))}",
         )
 
-    data = await file.read()
-    if len(data) > max_size:
-        raise HTTPException(status_code=413, detail=f"File too large. Maximum {app_settings.MAX_UPLOAD_SIZE_MB}MB.")
+    too_large = f"File too large. Maximum {app_settings.MAX_UPLOAD_SIZE_MB}MB."
+    if file.size is not None and file.size > max_size:
+        raise HTTPException(status_code=413, detail=too_large)
 
+    # Streamed to its final location once; the ingestion reads it from there
     storage = get_file_storage()
-    storage_path = await storage.save(f"rag/{name}", filename, data)
+    try:
+        stored = await storage.save_stream(f"rag/{name}", filename, iter_upload(file), max_size=max_size)
+    except PayloadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=too_large) from e
+    stored_path = storage.get_full_path(stored.storage_path)
+    if stored_path is None:
+        raise HTTPException(status_code=500, detail="Stored file is not on a local path")
+    storage_path = stored.storage_path
 
 {%- if cookiecutter.use_postgresql %}
     rag_doc = await rag_doc_svc.create_document(
-        collection_name=name, filename=filename, filesize=len(data),
+        collection_name=name, filename=filename, filesize=stored.size,
         filetype=ext.lstrip("."), storage_path=storage_path,
     )
 {%- else %}
     rag_doc = rag_doc_svc.create_document(
-        collection_name=name, filename=filename, filesize=len(data),
+        collection_name=name, filename=filename, filesize=stored.size,
         filetype=ext.lstrip("."), storage_path=storage_path,
     )
 {%- endif %}
@@ -263,28 +359,21 @@ async def ingest_file(
     await vector_store.create_collection(name)
 {%- if cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq %}
 
-    # Save to shared media volume (accessible by both app and worker containers)
-    tmp_dir = os.path.join(str(app_settings.MEDIA_DIR), "_rag_tmp")
-    os.makedirs(tmp_dir, exist_ok=True)
-    tmp_path = os.path.join(tmp_dir, f"{str(doc_id)}{ext}")
-    with open(tmp_path, "wb") as f:
-        f.write(data)
-
-    # Dispatch async task
+    # Dispatch async task (MEDIA_DIR is shared by the app and worker containers)
 {%- if cookiecutter.use_celery %}
     ingest_document_task.delay(
         rag_document_id=str(doc_id), collection_name=name,
-        filepath=tmp_path, source_path=filename, replace=replace,
+        filepath=str(stored_path), source_path=filename, replace=replace, tenant=tenant,
     )
 {%- elif cookiecutter.use_taskiq %}
     await ingest_document_task.kiq(
         rag_document_id=str(doc_id), collection_name=name,
-        filepath=tmp_path, source_path=filename, replace=replace,
+        filepath=str(stored_path), source_path=filename, replace=replace, tenant=tenant,
     )
 {%- elif cookiecutter.use_arq %}
     pool = await get_arq_pool()
     await pool.enqueue_job("ingest_document_task",
-        str(doc_id), name, tmp_path, filename, replace,
+        str(doc_id), name, str(stored_path), filename, replace, tenant,
     )
 {%- endif %}
 
@@ -296,17 +385,14 @@ async def ingest_file(
             "filename": filename,
             "collection": name,
             "message": "File accepted. Processing in background.",
+            "content_hash": stored.sha256,
         },
     )
 {%- else %}
 
-    tmp_dir = os.path.join(tempfile.gettempdir(), "rag_ingest")
-    os.makedirs(tmp_dir, exist_ok=True)
-    tmp_path = os.path.join(tmp_dir, f"{str(doc_id)}{ext}")
-    with open(tmp_path, "wb") as f:
-        f.write(data)
-
-    background_tasks.add_task(ingest_document_in_background, str(doc_id), name, tmp_path, filename, replace)
+    background_tasks.add_task(
+        ingest_document_in_background, str(doc_id), name, str(stored_path), filename, replace, tenant
+    )
 
     return JSONResponse(
         status_code=status.HTTP_202_ACCEPTED,
@@ -316,11 +402,104 @@ async def ingest_file(
             "filename": filename,
             "collection": name,
             "message": "File accepted. Processing in background.",
+            "content_hash": stored.sha256,
         },
     )
 {%- endif %}
 
 
+@router.post(
+    "/collections/{name}/ingest/batch",
+    response_model=RAGBatchIngestResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def ingest_batch(
+    name: str,
+    background_tasks: BackgroundTasks,
+    rag_doc_svc: RAGDocumentSvc,
+    vector_store: VectorStoreSvc,
+{%- if cookiecutter.use_jwt %}
+    _: CurrentAdmin,
+{%- endif %}
+    files: list[UploadFile] = File(..., description="Documents and/or .zip / .tar(.gz) archives of documents"),
+    replace: bool = Query(False),
+    user_id: UUID | None = Query(None, description="Ingest for this user only (see RAG_TENANT_PARTITIONING)"),
+    project_id: UUID | None = Query(None, description="Ingest for this project only (takes precedence over user_id)"),
+) -> Any:
+    """Upload many documents at once and ingest them as a single background job.
+
+    Archives are unpacked member by member straight to storage. Unsupported or
+    oversized files are reported in ``skipped`` instead of failing the batch.
+    """
+    tenant = tenant_key(user_id=user_id, project_id=project_id)
+    storage = get_file_storage()
+    batch = BatchUpload(
+        storage,
+        name,
+        allowed_extensions=_allowed_extensions(),
+        max_file_size=app_settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024,
+        max_files=app_settings.RAG_BATCH_MAX_FILES,
+    )
+    try:
+        for file in files:
+            await batch.add(file)
+        if not batch.files:
+            raise HTTPException(
+                status_code=400,
+                detail={"message": "No ingestible documents in the upload", "skipped": batch.skipped},
+            )
+        paths = [storage.get_full_path(f.stored.storage_path) for f in batch.files]
+        if None in paths:
+            raise HTTPException(status_code=500, detail="Stored file is not on a local path")
+
+        rows = [
+            {
+                "filename": f.filename, "filesize": f.stored.size,
+                "filetype": f.filetype, "storage_path": f.stored.storage_path,
+            }
+            for f in batch.files
+        ]
+{%- if cookiecutter.use_postgresql %}
+        docs = await rag_doc_svc.create_documents(collection_name=name, documents=rows)
+{%- else %}
+        docs = rag_doc_svc.create_documents(collection_name=name, documents=rows)
+{%- endif %}
+        await vector_store.create_collection(name)
+    except BaseException:
+        await batch.discard()
+        raise
+
+    # One job for the whole batch (MEDIA_DIR is shared by the app and worker containers)
+    documents = [
+        {"id": str(doc.id), "filepath": str(path), "source_path": f.source_path, "tenant": tenant}
+        for doc, f, path in zip(docs, batch.files, paths, strict=True)
+    ]
+{%- if cookiecutter.use_celery %}
+    ingest_batch_task.delay(collection_name=name, documents=documents, replace=replace)
+{%- elif cookiecutter.use_taskiq %}
+    await ingest_batch_task.kiq(collection_name=name, documents=documents, replace=replace)
+{%- elif cookiecutter.use_arq %}
+    pool = await get_arq_pool()
+    await pool.enqueue_job("ingest_batch_task", name, documents, replace, _queue_name=QUEUE_KEYS[BULK_QUEUE])
+{%- else %}
+    background_tasks.add_task(ingest_batch_in_background, name, documents, replace)
+{%- endif %}
+
+    return RAGBatchIngestResponse(
+        status="processing",
+        collection=name,
+        accepted=len(docs),
+        documents=[
+            RAGBatchIngestItem(
+                id=str(doc.id), filename=f.filename, source_path=f.source_path, content_hash=f.stored.sha256,
+            )
+            for doc, f in zip(docs, batch.files, strict=True)
+        ],
+        skipped=[RAGBatchSkippedItem(filename=filename, reason=reason) for filename, reason in batch.skipped],
+        message=f"{len(docs)} documents accepted. Processing in background.",
+    )
+
+
 @router.get("/documents", response_model=RAGTrackedDocumentList)
 {%- if cookiecutter.use_postgresql %}
 async def list_rag_documents(
@@ -476,6 +655,7 @@ async def trigger_local_sync(
     pool = await get_arq_pool()
     await pool.enqueue_job("sync_collection_task",
         str(sync_log.id), "local", request.collection_name, request.mode, request.path,
+        _queue_name=QUEUE_KEYS[BULK_QUEUE],
     )
 {%- else %}
     background_tasks.add_task(sync_local_in_background, str(sync_log.id), request.collection_name, request.mode, request.path)
@@ -484,6 +664,170 @@ async def trigger_local_sync(
     return RAGSyncResponse(id=str(sync_log.id), status="running", message=f"Sync started for '{request.collection_name}' (mode={request.mode})")
 
 
+@router.post("/collections/{name}/reembed", response_model=RAGSyncResponse)
+async def reembed_collection(
+    name: str,
+    request: RAGReembedRequest,
+    background_tasks: BackgroundTasks,
+    vector_store: VectorStoreSvc,
+    rag_sync_svc: RAGSyncSvc,
+{%- if cookiecutter.use_jwt %}
+    _: CurrentAdmin,
+{%- endif %}
+) -> Any:
+    """Re-embed a collection with another embedding model, without downtime.
+
+    The collection is rebuilt in a shadow collection while searches keep
+    reading it, then swapped in. Progress is tracked as a sync log
+    (source "reembed", counted in chunks) and can be cancelled like a sync.
+    """
+    if name not in await vector_store.list_collections():
+        raise HTTPException(status_code=404, detail=f"Collection '{name}' not found")
+
+{%- if cookiecutter.use_postgresql %}
+    sync_log = await rag_sync_svc.create_sync_log(source="reembed", collection_name=name, mode="full")
+{%- else %}
+    sync_log = rag_sync_svc.create_sync_log(source="reembed", collection_name=name, mode="full")
+{%- endif %}
+
+{%- if cookiecutter.use_celery %}
+    reembed_collection_task.delay(
+        sync_log_id=str(sync_log.id), collection_name=name, model=request.model, dim=request.dim,
+    )
+{%- elif cookiecutter.use_taskiq %}
+    await reembed_collection_task.kiq(
+        sync_log_id=str(sync_log.id), collection_name=name, model=request.model, dim=request.dim,
+    )
+{%- elif cookiecutter.use_arq %}
+    pool = await get_arq_pool()
+    await pool.enqueue_job("reembed_collection_task",
+        str(sync_log.id), name, request.model, request.dim,
+        _queue_name=QUEUE_KEYS[BULK_QUEUE],
+    )
+{%- else %}
+    background_tasks.add_task(reembed_collection_in_background, str(sync_log.id), name, request.model, request.dim)
+{%- endif %}
+
+    return RAGSyncResponse(id=str(sync_log.id), status="running", message=f"Re-embedding '{name}' with {request.model}")
+
+
+@router.post("/collections/{name}/import", response_model=RAGSyncResponse)
+async def import_collection(
+    name: str,
+    background_tasks: BackgroundTasks,
+    vector_store: VectorStoreSvc,
+    rag_sync_svc: RAGSyncSvc,
+{%- if cookiecutter.use_jwt %}
+    _: CurrentAdmin,
+{%- endif %}
+    file: UploadFile = File(...),
+    restart: bool = Query(False, description="Import from the start instead of resuming"),
+) -> Any:
+    """Bulk-load a collection snapshot (from ``GET /collections/{name}/export``).
+
+    Vectors are loaded as they are, so the snapshot must come from the same
+    embedding model. Progress is tracked as a sync log (source "import",
+    counted in chunks); uploading the same snapshot again after a failure or
+    cancellation resumes where the import stopped.
+    """
+    max_size = app_settings.RAG_SNAPSHOT_MAX_UPLOAD_MB * 1024 * 1024
+    too_large = f"Snapshot too large. Maximum {app_settings.RAG_SNAPSHOT_MAX_UPLOAD_MB}MB."
+    if file.size is not None and file.size > max_size:
+        raise HTTPException(status_code=413, detail=too_large)
+
+    storage = get_file_storage()
+    try:
+        stored = await storage.save_stream(
+            "rag/snapshots", file.filename or f"{name}.snapshot.zip", iter_upload(file), max_size=max_size
+        )
+    except PayloadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=too_large) from e
+    stored_path = storage.get_full_path(stored.storage_path)
+    if stored_path is None:
+        raise HTTPException(status_code=500, detail="Stored file is not on a local path")
+    try:
+        manifest = read_manifest(stored_path)
+        await check_compatible(manifest, vector_store, name)
+    except SnapshotError as e:
+        await storage.delete(stored.storage_path)
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+{%- if cookiecutter.use_postgresql %}
+    sync_log = await rag_sync_svc.create_sync_log(source="import", collection_name=name, mode="full")
+{%- else %}
+    sync_log = rag_sync_svc.create_sync_log(source="import", collection_name=name, mode="full")
+{%- endif %}
+
+{%- if cookiecutter.use_celery %}
+    import_snapshot_task.delay(
+        sync_log_id=str(sync_log.id), collection_name=name, filepath=str(stored_path),
+        storage_path=stored.storage_path, restart=restart,
+    )
+{%- elif cookiecutter.use_taskiq %}
+    await import_snapshot_task.kiq(
+        sync_log_id=str(sync_log.id), collection_name=name, filepath=str(stored_path),
+        storage_path=stored.storage_path, restart=restart,
+    )
+{%- elif cookiecutter.use_arq %}
+    pool = await get_arq_pool()
+    await pool.enqueue_job("import_snapshot_task",
+        str(sync_log.id), name, str(stored_path), stored.storage_path, restart,
+        _queue_name=QUEUE_KEYS[BULK_QUEUE],
+    )
+{%- else %}
+    background_tasks.add_task(
+        import_snapshot_in_background, str(sync_log.id), name, str(stored_path), stored.storage_path, restart
+    )
+{%- endif %}
+
+    return RAGSyncResponse(
+        id=str(sync_log.id), status="running",
+        message=f"Importing {manifest.chunk_count} chunks of '{manifest.collection_name}' into '{name}'",
+    )
+
+
+@router.post("/collections/{name}/summary-index", response_model=RAGSyncResponse)
+async def build_summary_index(
+    name: str,
+    background_tasks: BackgroundTasks,
+    vector_store: VectorStoreSvc,
+    rag_sync_svc: RAGSyncSvc,
+{%- if cookiecutter.use_jwt %}
+    _: CurrentAdmin,
+{%- endif %}
+) -> Any:
+    """Build (or rebuild) a collection's document summary index.
+
+    Searches of the collection then select the top documents by their
+    summary vectors first, and search only their chunks. Progress is tracked
+    as a sync log (source "summary", counted in documents).
+    """
+    if name not in await vector_store.list_collections():
+        raise HTTPException(status_code=404, detail=f"Collection '{name}' not found")
+
+{%- if cookiecutter.use_postgresql %}
+    sync_log = await rag_sync_svc.create_sync_log(source="summary", collection_name=name, mode="full")
+{%- else %}
+    sync_log = rag_sync_svc.create_sync_log(source="summary", collection_name=name, mode="full")
+{%- endif %}
+
+{%- if cookiecutter.use_celery %}
+    build_summary_index_task.delay(sync_log_id=str(sync_log.id), collection_name=name)
+{%- elif cookiecutter.use_taskiq %}
+    await build_summary_index_task.kiq(sync_log_id=str(sync_log.id), collection_name=name)
+{%- elif cookiecutter.use_arq %}
+    pool = await get_arq_pool()
+    await pool.enqueue_job("build_summary_index_task",
+        str(sync_log.id), name,
+        _queue_name=QUEUE_KEYS[BULK_QUEUE],
+    )
+{%- else %}
+    background_tasks.add_task(build_summary_index_in_background, str(sync_log.id), name)
+{%- endif %}
+
+    return RAGSyncResponse(id=str(sync_log.id), status="running", message=f"Building the summary index of '{name}'")
+
+
 @router.delete("/sync/{sync_id}", response_model=RAGMessageResponse)
 {%- if cookiecutter.use_postgresql %}
 async def cancel_sync(
@@ -631,7 +975,7 @@ async def trigger_sync_source(
     await sync_single_source_task.kiq(source_id, str(sync_log.id))
 {%- elif cookiecutter.use_arq %}
     pool = await get_arq_pool()
-    await pool.enqueue_job("sync_single_source_task", source_id, str(sync_log.id))
+    await pool.enqueue_job("sync_single_source_task", source_id, str(sync_log.id), _queue_name=QUEUE_KEYS[BULK_QUEUE])
 {%- else %}
     background_tasks.add_task(sync_source_in_background, source_id, str(sync_log.id))
 {%- endif %}
@@ -688,6 +1032,23 @@ async def rag_status_stream() -> AsyncIterable[ServerSentEvent]:
             pass
 {%- endif %}
 
+{%- if cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq %}
+
+
+@router.get("/queues", response_model=RAGQueueStatsList)
+async def get_queues(
+{%- if cookiecutter.use_jwt %}
+    _: CurrentAdmin,
+{%- endif %}
+) -> Any:
+    """Depth and recent wait times of the interactive and bulk task queues."""
+    try:
+        return RAGQueueStatsList(items=await get_queue_stats())
+    except Exception as e:
+        logger.warning(f"Failed to read queue stats: {e}")
+        raise HTTPException(status_code=503, detail="Task broker unavailable") from e
+{%- endif %}
+
 {%- else %}
 """RAG routes - not configured."""
 {%- endif %}
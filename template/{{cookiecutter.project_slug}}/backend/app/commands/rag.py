@@ -7,7 +7,15 @@ Commands:
     rag-ingest        - Ingest file/directory
     rag-search        - Search knowledge base
     rag-drop          - Drop collection
+    rag-reembed       - Re-embed a collection with another embedding model
+    rag-export        - Export a collection snapshot (chunks and vectors)
+    rag-import        - Import a collection snapshot without re-embedding
+    rag-summary-index - Build or drop a collection's document summary index
     rag-stats         - Overall RAG system statistics
+    rag-bench-pdf     - Compare PDF parsing throughput on a corpus
+    rag-bench-chunks  - Measure chunk building time and memory on a document
+    rag-bench-summary - Compare summary index search with flat search on a collection
+    rag-bench-storage - Measure recall@k of vector storage profiles against full precision
     rag-sources       - List configured sync sources
     rag-source-add    - Add a new sync source
     rag-source-remove - Remove a sync source
@@ -16,6 +24,7 @@ Commands:
 import asyncio
 import os
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -67,6 +76,20 @@ def get_rag_services() -> tuple[RAGSettings, BaseVectorStore, DocumentProcessor,
     return settings, vector_store, processor, retrieval, ingestion
 
 
+def build_vector_store(settings: RAGSettings) -> BaseVectorStore:
+    """Vector store of the configured backend with the given settings."""
+    embedder = EmbeddingService(settings=settings)
+{%- if cookiecutter.use_milvus %}
+    return MilvusVectorStore(settings=settings, embedding_service=embedder)
+{%- elif cookiecutter.use_qdrant %}
+    return QdrantVectorStore(settings=settings, embedding_service=embedder)
+{%- elif cookiecutter.use_chromadb %}
+    return ChromaVectorStore(settings=settings, embedding_service=embedder)
+{%- elif cookiecutter.use_pgvector %}
+    return PgVectorStore(settings=settings, embedding_service=embedder)
+{%- endif %}
+
+
 async def list_collections_async(vector_store: BaseVectorStore) -> None:
     """List all collections with their stats.
 
@@ -405,8 +428,11 @@ async def drop_collection_async(
             abort=True,
         )
 
+    from app.rag.summary_index import DocumentSummaryIndex
+
     try:
         await vector_store.delete_collection(collection)
+        await DocumentSummaryIndex(vector_store).drop(collection)
         success(f"Collection '{collection}' dropped successfully.")
     except Exception as e:
         error(f"Failed to drop collection: {e}")
@@ -434,6 +460,192 @@ def rag_drop(collection: str, yes: bool) -> None:
     asyncio.run(drop_collection_async(collection, yes, vector_store))
 
 
+async def reembed_async(collection: str, model: str, dim: int | None) -> None:
+    """Re-embed a collection in a shadow collection and swap it in.
+
+    Args:
+        collection: Name of the collection to re-embed.
+        model: Embedding model to re-embed with.
+        dim: Vector dimension, or None to derive it from the model.
+    """
+    from app.rag.reembed import ReembedProgress, build_reembedder
+
+    async def _progress(progress: ReembedProgress) -> None:
+        info(f"  {progress.embedded}/{progress.total} chunks embedded (round {progress.rounds + 1})")
+
+    try:
+        progress = await build_reembedder(collection, model, dim, on_progress=_progress).run()
+    except Exception as e:
+        error(f"Re-embed failed, '{collection}' is unchanged: {e}")
+        return
+    success(
+        f"Collection '{collection}' re-embedded with {model}: "
+        f"{progress.embedded} chunks in {progress.rounds} round(s)."
+    )
+    info(f"Searches and ingestion into '{collection}' now embed with {model}.")
+
+
+@command("rag-reembed", help="Re-embed a collection with another embedding model")
+@click.argument("collection")
+@click.option("--model", "-m", required=True, help="Embedding model to re-embed with")
+@click.option("--dim", type=int, default=None, help="Vector dimension (derived from known models when omitted)")
+def rag_reembed(collection: str, model: str, dim: int | None) -> None:
+    """
+    Rebuild a collection with another embedding model, without downtime.
+
+    Chunks are read back from the collection, embedded with MODEL into a
+    shadow collection and swapped in at the end; searches keep using the
+    old collection until then.
+
+    COLLECTION: Name of the collection to re-embed.
+
+    Example:
+        project cmd rag-reembed documents --model text-embedding-3-large
+    """
+    info(f"Re-embedding '{collection}' with {model}...")
+    asyncio.run(reembed_async(collection, model, dim))
+
+
+async def export_async(collection: str, output: Path, vector_store: BaseVectorStore) -> None:
+    """Write a collection snapshot to a file.
+
+    Args:
+        collection: Name of the collection to export.
+        output: Snapshot file to write.
+        vector_store: Vector store to read the collection from.
+    """
+    from app.rag.snapshot import export_snapshot
+
+    if collection not in await vector_store.list_collections():
+        error(f"Collection '{collection}' not found.")
+        return
+    try:
+        manifest = await export_snapshot(vector_store, collection, output)
+    except Exception as e:
+        error(f"Export failed: {e}")
+        return
+    size_mb = output.stat().st_size / (1024 * 1024)
+    success(f"Exported {manifest.chunk_count} chunks of '{collection}' to {output} ({size_mb:.1f} MB).")
+
+
+@command("rag-export", help="Export a collection snapshot (chunks and vectors)")
+@click.argument("collection")
+@click.option("--output", "-o", type=click.Path(dir_okay=False, path_type=Path), default=None,
+              help="Snapshot file (default: COLLECTION.snapshot.zip)")
+def rag_export(collection: str, output: Path | None) -> None:
+    """
+    Export a collection with its vectors to a snapshot file.
+
+    The snapshot can be imported into any vector store that uses the same
+    embedding model, without calling the embedding provider.
+
+    COLLECTION: Name of the collection to export.
+
+    Example:
+        project cmd rag-export documents -o documents.snapshot.zip
+    """
+    _, vector_store, _, _, _ = get_rag_services()
+    asyncio.run(export_async(collection, output or Path(f"{collection}.snapshot.zip"), vector_store))
+
+
+async def import_async(path: Path, collection: str | None, restart: bool, vector_store: BaseVectorStore) -> None:
+    """Bulk-load a snapshot file into a collection.
+
+    Args:
+        path: Snapshot file to import.
+        collection: Target collection, or None for the snapshot's own.
+        restart: Import from the start instead of resuming an interrupted import.
+        vector_store: Vector store to load the snapshot into.
+    """
+    from app.rag.snapshot import SnapshotImport, import_snapshot
+
+    async def _progress(result: SnapshotImport) -> None:
+        info(f"  {result.chunks}/{result.manifest.chunk_count} chunks imported")
+
+    try:
+        result = await import_snapshot(vector_store, path, collection, restart=restart, on_progress=_progress)
+    except Exception as e:
+        error(f"Import failed: {e}")
+        warning("Run the same command again to resume where it stopped.")
+        return
+    if result.resumed_at_part:
+        info(f"Resumed at part {result.resumed_at_part + 1} of {result.manifest.parts}.")
+    success(f"Imported {result.chunks} chunks into '{result.collection_name}'.")
+
+
+@command("rag-import", help="Import a collection snapshot without re-embedding")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--collection", "-c", default=None, help="Target collection (default: the exported one)")
+@click.option("--restart", is_flag=True, help="Import from the start instead of resuming")
+def rag_import(path: Path, collection: str | None, restart: bool) -> None:
+    """
+    Bulk-load a snapshot written by rag-export.
+
+    Vectors are loaded as they are, so EMBEDDING_MODEL must match the model
+    the snapshot was exported with. An interrupted import resumes where it
+    stopped when run again.
+
+    PATH: Snapshot file to import.
+
+    Example:
+        project cmd rag-import documents.snapshot.zip --collection documents_copy
+    """
+    _, vector_store, _, _, _ = get_rag_services()
+    asyncio.run(import_async(path, collection, restart, vector_store))
+
+
+async def summary_index_async(collection: str, drop: bool, vector_store: BaseVectorStore) -> None:
+    """Build or drop a collection's document summary index.
+
+    Args:
+        collection: Name of the collection.
+        drop: Drop the index instead of building it.
+        vector_store: Vector store holding the collection.
+    """
+    from app.rag.summary_index import DocumentSummaryIndex
+
+    summary_index = DocumentSummaryIndex(vector_store)
+    if drop:
+        await summary_index.drop(collection)
+        success(f"Summary index of '{collection}' dropped; searches are flat again.")
+        return
+    if collection not in await vector_store.list_collections():
+        error(f"Collection '{collection}' not found.")
+        return
+
+    async def _progress(done: int, total: int) -> None:
+        info(f"  {done}/{total} documents summarized")
+
+    try:
+        documents = await summary_index.build(collection, on_progress=_progress)
+    except Exception as e:
+        error(f"Summary index build failed: {e}")
+        return
+    success(f"Built the summary index of '{collection}': {documents} documents.")
+
+
+@command("rag-summary-index", help="Build or drop a collection's document summary index")
+@click.argument("collection")
+@click.option("--drop", is_flag=True, help="Drop the index (searches go back to flat)")
+def rag_summary_index(collection: str, drop: bool) -> None:
+    """
+    Build (or rebuild) the document summary index of a collection.
+
+    Each document gets one summary vector, the centroid of its chunk
+    vectors. Searches then select the top RAG_SUMMARY_TOP_DOCUMENTS
+    documents first and search only their chunks. Ingestion keeps the
+    index up to date once it exists.
+
+    COLLECTION: Name of the collection to index.
+
+    Example:
+        project cmd rag-summary-index documents
+        project cmd rag-summary-index documents --drop
+    """
+    _, vector_store, _, _, _ = get_rag_services()
+    asyncio.run(summary_index_async(collection, drop, vector_store))
+
+
 @command("rag-stats", help="Show overall RAG system statistics")
 def rag_stats() -> None:
     """Display overall RAG system statistics."""
@@ -488,6 +700,358 @@ async def stats_async(
 
     click.echo()
 
+{%- if cookiecutter.use_all_pdf_parsers or not (cookiecutter.use_llamaparse or cookiecutter.use_liteparse) %}
+
+
+async def bench_pdf_async(files: list[Path], modes: tuple[str, ...], settings: RAGSettings) -> None:
+    """Parse every file once per table detection mode and report throughput.
+
+    Args:
+        files: PDF files making up the corpus.
+        modes: Table detection modes to compare (auto, always, off).
+        settings: RAG configuration settings.
+    """
+    import time
+
+    from app.rag.documents import PyMuPDFParser
+
+    click.echo(f"{'mode':<8} {'pages':>7} {'seconds':>9} {'pages/s':>9} {'tables':>7}")
+    for mode in modes:
+        parser = PyMuPDFParser(pages_per_task=settings.pdf_pages_per_task, table_detection=mode)
+        pages = tables = 0
+        started = time.perf_counter()
+        for filepath in files:
+            try:
+                document = await parser.parse(filepath)
+            except Exception as e:
+                warning(f"  {filepath.name}: {e}")
+                continue
+            pages += len(document.pages)
+            tables += sum(page.content.count("\n|---") for page in document.pages)
+        elapsed = time.perf_counter() - started
+        rate = pages / elapsed if elapsed else 0.0
+        click.echo(f"{mode:<8} {pages:>7} {elapsed:>9.2f} {rate:>9.1f} {tables:>7}")
+
+
+@command("rag-bench-pdf", help="Compare PDF parsing throughput on a corpus")
+@click.argument("path", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--mode",
+    "-m",
+    "modes",
+    type=click.Choice(["auto", "always", "off"]),
+    multiple=True,
+    default=("always", "auto"),
+    help="Table detection modes to compare (default: always, auto)",
+)
+def rag_bench_pdf(path: str, modes: tuple[str, ...]) -> None:
+    """
+    Benchmark PyMuPDF parsing over every PDF in a directory.
+
+    PATH: Directory containing the PDF corpus (searched recursively).
+
+    Reports pages/s and detected tables per table detection mode, so the
+    cost of always running find_tables() can be compared with the
+    ruling-line heuristic on your own documents.
+
+    Example:
+        project cmd rag-bench-pdf ./corpus
+        project cmd rag-bench-pdf ./corpus -m auto -m off
+    """
+    from app.core.config import settings as app_settings
+
+    files = sorted(f for f in Path(path).rglob("*.pdf") if f.is_file())
+    if not files:
+        warning("No PDF files found.")
+        return
+
+    info(f"Corpus: {len(files)} PDF files, {app_settings.PARSER_WORKERS} parser workers")
+    asyncio.run(bench_pdf_async(files, modes, app_settings.rag))
+{%- endif %}
+
+
+async def bench_chunks_async(filepath: Path, settings: RAGSettings, rounds: int) -> None:
+    """Build the chunks of one parsed document in both representations and compare.
+
+    Args:
+        filepath: Benchmark document.
+        settings: RAG configuration settings.
+        rounds: Timed rounds per representation (the best one is reported).
+    """
+    import time
+    import tracemalloc
+
+    from app.rag.models import DocumentPage
+
+    class PageCopyChunk(DocumentPage):
+        """Previous chunk model: a validated copy of the whole page per chunk."""
+
+        chunk_content: str
+        chunk_num: int = 0
+
+    processor = DocumentProcessor(settings=settings)
+    document = await processor.parser_for(filepath).parse(filepath)
+
+    def build_compact() -> list[Any]:
+        return [chunk for i, page in enumerate(document.pages) for chunk in processor.chunk_page(page, i)]
+
+    def build_page_copies() -> list[Any]:
+        return [
+            PageCopyChunk(chunk_content=text, chunk_num=n, **page.model_dump(exclude={"parent_doc_id"}))
+            for page in document.pages
+            for n, text in enumerate(processor.split_page(page))
+        ]
+
+    click.echo(f"{filepath.name}: {len(document.pages)} pages")
+    click.echo(f"{'representation':<16} {'chunks':>7} {'ms':>9} {'retained MB':>12} {'peak MB':>9}")
+    for name, build in (("page copies", build_page_copies), ("compact", build_compact)):
+        best = float("inf")
+        for _ in range(rounds):
+            started = time.perf_counter()
+            build()
+            best = min(best, time.perf_counter() - started)
+        tracemalloc.start()
+        chunks = build()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        click.echo(
+            f"{name:<16} {len(chunks):>7} {best * 1000:>9.1f} "
+            f"{retained / 2**20:>12.2f} {peak / 2**20:>9.2f}"
+        )
+        del chunks
+
+
+@command("rag-bench-chunks", help="Measure chunk building time and memory on a document")
+@click.argument("filepath", type=click.Path(exists=True, dir_okay=False))
+@click.option("--rounds", "-n", default=5, show_default=True, help="Timed rounds per representation")
+def rag_bench_chunks(filepath: str, rounds: int) -> None:
+    """
+    Compare compact chunks with per-chunk page copies on one document.
+
+    FILEPATH: Benchmark document (any supported type).
+
+    The document is parsed once, then its chunks are built with the
+    compact representation (chunks reference their page by index) and
+    with the previous one (a pydantic copy of the page per chunk).
+    Parsing runs as in ingestion (OCR included, if enabled); images are
+    not described.
+
+    Example:
+        project cmd rag-bench-chunks ./corpus/report.pdf
+    """
+    from app.core.config import settings as app_settings
+
+    asyncio.run(bench_chunks_async(Path(filepath), app_settings.rag, rounds))
+
+
+async def bench_summary_async(
+    collection: str, queries: int, top_k: int, top_documents: int, vector_store: BaseVectorStore
+) -> None:
+    """Search sampled chunk texts flat and through the summary index, and compare.
+
+    Args:
+        collection: Name of a collection with a summary index.
+        queries: Number of chunks sampled as queries.
+        top_k: Chunks retrieved per query.
+        top_documents: Documents selected by the summary index per query.
+        vector_store: Vector store holding the collection.
+    """
+    import random
+    import statistics
+    import time
+
+    from app.rag.summary_index import DocumentSummaryIndex
+
+    summary_index = DocumentSummaryIndex(vector_store)
+    if not await summary_index.is_enabled(collection):
+        error(f"'{collection}' has no summary index; build it with rag-summary-index first.")
+        return
+
+    # Reservoir sample of chunk texts, used as queries
+    rng = random.Random(0)
+    sample: list[str] = []
+    seen = 0
+    async for chunks in vector_store.scroll_chunks(collection, 1024):
+        for chunk in chunks:
+            seen += 1
+            if len(sample) < queries:
+                sample.append(chunk.content[:300])
+            elif (j := rng.randrange(seen)) < queries:
+                sample[j] = chunk.content[:300]
+    if not sample:
+        warning("The collection is empty.")
+        return
+
+    embedder = await vector_store.embedder_for(collection)
+    flat_ms: list[float] = []
+    two_level_ms: list[float] = []
+    recalls: list[float] = []
+    for text in sample:
+        vector = embedder.embed_query(text)
+        started = time.perf_counter()
+        flat = await vector_store.search_vector(collection, vector, top_k)
+        flat_ms.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        document_ids = await summary_index.top_documents(collection, vector, top_documents)
+        two_level = await vector_store.search_vector(collection, vector, top_k, document_ids=document_ids)
+        two_level_ms.append((time.perf_counter() - started) * 1000)
+        if flat:
+            recalls.append(len({r.key for r in flat} & {r.key for r in two_level}) / len(flat))
+
+    def _p95(values: list[float]) -> float:
+        return sorted(values)[max(0, int(len(values) * 0.95) - 1)]
+
+    click.echo(f"{collection}: {seen} chunks, {len(sample)} queries, top {top_k}, {top_documents} documents")
+    click.echo(f"{'search':<10} {'recall@k':>9} {'median ms':>10} {'p95 ms':>8}")
+    click.echo(f"{'flat':<10} {1.0:>9.3f} {statistics.median(flat_ms):>10.1f} {_p95(flat_ms):>8.1f}")
+    click.echo(
+        f"{'two-level':<10} {statistics.fmean(recalls) if recalls else 0.0:>9.3f} "
+        f"{statistics.median(two_level_ms):>10.1f} {_p95(two_level_ms):>8.1f}"
+    )
+
+
+@command("rag-bench-summary", help="Compare summary index search with flat search on a collection")
+@click.argument("collection")
+@click.option("--queries", "-n", default=50, show_default=True, help="Chunks sampled as queries")
+@click.option("--top-k", "-k", default=10, show_default=True, help="Chunks retrieved per query")
+@click.option("--top-documents", "-d", default=None, type=int,
+              help="Documents selected per query (default: RAG_SUMMARY_TOP_DOCUMENTS)")
+def rag_bench_summary(collection: str, queries: int, top_k: int, top_documents: int | None) -> None:
+    """
+    Measure the recall and latency of two-level search on a collection.
+
+    Chunk texts sampled from the collection are used as queries. Each is
+    searched flat and through the summary index; recall@k is the share of
+    the flat top-k the two-level search also returns. Vector search only:
+    no hybrid fusion or reranking.
+
+    COLLECTION: Name of a collection with a summary index.
+
+    Example:
+        project cmd rag-bench-summary documents -n 100 -d 50
+    """
+    from app.core.config import settings as app_settings
+
+    _, vector_store, _, _, _ = get_rag_services()
+    asyncio.run(bench_summary_async(
+        collection, queries, top_k, top_documents or app_settings.RAG_SUMMARY_TOP_DOCUMENTS, vector_store
+    ))
+
+
+async def bench_storage_async(
+    collection: str, profiles: tuple[str, ...], truncate_dim: int, queries: int, top_k: int
+) -> None:
+    """Copy a full-precision collection into each storage profile and compare search results.
+
+    Args:
+        collection: Name of a collection stored with full vectors (the baseline).
+        profiles: Storage profiles to measure.
+        truncate_dim: Matryoshka truncation applied to the copies, 0 for none.
+        queries: Number of chunks sampled as queries.
+        top_k: Chunks retrieved per query.
+    """
+    import random
+    import statistics
+    import time
+
+    from app.core.config import settings as app_settings
+    from app.rag.config import EmbeddingsConfig
+    from app.rag.embeddings import truncate_vector
+
+    baseline = build_vector_store(app_settings.rag.model_copy(update={"vector_storage": "full"}))
+    if collection not in await baseline.list_collections():
+        error(f"Collection '{collection}' not found.")
+        return
+    # The model the collection was embedded with (re-embedded collections may differ from EMBEDDING_MODEL)
+    model = (await baseline.embedding_config(collection)).model
+    base_settings = baseline.settings.model_copy(update={"embeddings_config": EmbeddingsConfig(model=model)})
+
+    # Reservoir sample of chunk texts, used as queries
+    rng = random.Random(0)
+    sample: list[str] = []
+    seen = 0
+    async for chunks in baseline.scroll_chunks(collection, 1024):
+        for chunk in chunks:
+            seen += 1
+            if len(sample) < queries:
+                sample.append(chunk.content[:300])
+            elif (j := rng.randrange(seen)) < queries:
+                sample[j] = chunk.content[:300]
+    if not sample:
+        warning("The collection is empty.")
+        return
+    embedder = await baseline.embedder_for(collection)
+    query_vectors = [embedder.embed_query(text) for text in sample]
+
+    def _p95(values: list[float]) -> float:
+        return sorted(values)[max(0, int(len(values) * 0.95) - 1)]
+
+    async def _run(store: BaseVectorStore, name: str, dim: int) -> tuple[list[set[str]], list[float]]:
+        keys: list[set[str]] = []
+        timings: list[float] = []
+        for vector in query_vectors:
+            vector = truncate_vector(vector, dim) if dim < len(vector) else vector
+            started = time.perf_counter()
+            results = await store.search_vector(name, vector, top_k)
+            timings.append((time.perf_counter() - started) * 1000)
+            keys.append({r.key for r in results})
+        return keys, timings
+
+    full_dim = base_settings.embeddings_config.dim
+    expected, full_ms = await _run(baseline, collection, full_dim)
+    click.echo(f"{collection}: {seen} chunks, {len(sample)} queries, top {top_k}")
+    click.echo(f"{'storage':<10} {'dim':>5} {'recall@k':>9} {'median ms':>10} {'p95 ms':>8}")
+    click.echo(f"{'full':<10} {full_dim:>5} {1.0:>9.3f} {statistics.median(full_ms):>10.1f} {_p95(full_ms):>8.1f}")
+
+    for profile in profiles:
+        settings = base_settings.model_copy(update={
+            "vector_storage": profile,
+            "embeddings_config": EmbeddingsConfig(model=model, truncate_dim=truncate_dim),
+        })
+        store = build_vector_store(settings)
+        dim = settings.embeddings_config.dim
+        copy_name = await store.create_shadow_collection(collection)
+        try:
+            async for chunks in baseline.scroll_chunks(collection, 512, with_vectors=True):
+                vectors = [truncate_vector(c.vector or [], dim) if truncate_dim else c.vector or [] for c in chunks]
+                await store.upsert_chunks(copy_name, chunks, vectors)
+            got, ms = await _run(store, copy_name, dim)
+        finally:
+            await store.delete_collection(copy_name)
+        recall = statistics.fmean(len(e & g) / len(e) for e, g in zip(expected, got) if e)
+        click.echo(f"{profile:<10} {dim:>5} {recall:>9.3f} {statistics.median(ms):>10.1f} {_p95(ms):>8.1f}")
+
+
+@command("rag-bench-storage", help="Measure recall@k of vector storage profiles against full precision")
+@click.argument("collection")
+@click.option(
+    "--profile",
+    "-p",
+    "profiles",
+    type=click.Choice(["full", "compact", "binary"]),
+    multiple=True,
+    default=("compact", "binary"),
+    help="Storage profiles to measure (default: compact, binary)",
+)
+@click.option("--truncate-dim", "-t", default=0, show_default=True, help="Matryoshka truncation of the copies")
+@click.option("--queries", "-n", default=50, show_default=True, help="Chunks sampled as queries")
+@click.option("--top-k", "-k", default=10, show_default=True, help="Chunks retrieved per query")
+def rag_bench_storage(collection: str, profiles: tuple[str, ...], truncate_dim: int, queries: int, top_k: int) -> None:
+    """
+    Validate vector storage profiles against full-precision search.
+
+    COLLECTION must hold full (float32) vectors. It is copied, vectors
+    included, into a hidden collection per profile (optionally truncated
+    to --truncate-dim dimensions), and chunk texts sampled from it are
+    searched in both; recall@k is the share of the full-precision top-k
+    each profile also returns. The copies are dropped afterwards.
+
+    Example:
+        project cmd rag-bench-storage documents
+        project cmd rag-bench-storage documents -p full -t 512
+    """
+    asyncio.run(bench_storage_async(collection, profiles, truncate_dim, queries, top_k))
+
 
 {%- if cookiecutter.enable_google_drive_ingestion %}
 
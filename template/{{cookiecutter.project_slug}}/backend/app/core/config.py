@@ -41,6 +41,7 @@ class Settings(BaseSettings):
     MODELS_CACHE_DIR: Path = Path("./models_cache")
     MEDIA_DIR: Path = Path("./media")
     MAX_UPLOAD_SIZE_MB: int = 50  # Max file upload size in MB
+    PARSER_WORKERS: int = 2  # Processes for CPU-bound document parsing (0 = parse in a thread)
 
 {%- if cookiecutter.enable_logfire %}
 
@@ -303,6 +304,13 @@ class Settings(BaseSettings):
 {%- endif %}
     AI_FRAMEWORK: str = "{{ cookiecutter.ai_framework }}"
     LLM_PROVIDER: str = "{{ cookiecutter.llm_provider }}"
+{%- if cookiecutter.use_pydantic_ai %}
+    # Connection pool shared by all agents talking to the LLM provider
+    AI_HTTP_MAX_CONNECTIONS: int = 100
+    AI_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    AI_HTTP_KEEPALIVE_EXPIRY: float = 60.0  # seconds an idle connection is kept open
+    AI_HTTP_TIMEOUT: float = 600.0  # read timeout, long enough for slow generations
+{%- endif %}
 {%- if cookiecutter.enable_langsmith %}
 
     # === LangSmith Observability ===
@@ -415,6 +423,8 @@ class Settings(BaseSettings):
     EMBEDDING_MODEL: str = "text-embedding-3-small"
     {%- endif %}
 
+    EMBEDDING_TRUNCATE_DIM: int = 0  # Matryoshka truncation (text-embedding-3-*, gemini), 0 = full vectors
+
     # Chunking
     RAG_CHUNK_SIZE: int = 512
     RAG_CHUNK_OVERLAP: int = 50
@@ -424,7 +434,24 @@ class Settings(BaseSettings):
     RAG_TOP_K: int = 10
     RAG_CHUNKING_STRATEGY: str = "recursive"  # recursive, markdown, or fixed
     RAG_HYBRID_SEARCH: bool = False  # Enable BM25 + vector hybrid search
+    RAG_SUMMARY_TOP_DOCUMENTS: int = 20  # Documents whose chunks are searched, in collections with a summary index
+    RAG_VECTOR_STORAGE: str = "full"  # full, compact (halfvec/int8) or binary; applies to new collections
+    RAG_VECTOR_OVERSAMPLING: float = 3.0  # Candidates per result re-scored with full vectors (compact, binary)
+    RAG_TENANT_PARTITIONING: bool = False  # Partition new collections by user/project (searches are scoped either way)
     RAG_ENABLE_OCR: bool = False  # OCR fallback for scanned PDFs (requires tesseract)
+    RAG_PDF_PAGES_PER_TASK: int = 50  # Large PDFs are split into page ranges parsed in parallel
+    RAG_PDF_TABLE_DETECTION: str = "auto"  # auto (pages with ruling lines), always, or off
+    RAG_STREAMING_MIN_FILE_MB: float = 20.0  # Larger files are ingested page by page (0 = all, -1 = never)
+    RAG_STREAMING_WINDOW_CHUNKS: int = 256  # Chunks embedded and upserted per batch when streaming
+    RAG_PARSE_CACHE_DIR: str = "./data/rag_parse_cache"  # Parsed pages by file hash + parser options, empty = off
+    RAG_BATCH_MAX_FILES: int = 5000  # Documents per batch upload (files + archive members)
+    RAG_WRITE_BUFFER_MAX_VECTORS: int = 512  # Chunks of many documents embedded and upserted together
+    RAG_WRITE_BUFFER_MAX_WAIT_MS: float = 100.0  # Max wait for a write batch to fill up
+    RAG_BULK_INGEST_CONCURRENCY: int = 8  # Documents ingested at once by batch uploads and syncs
+    RAG_REEMBED_BATCH_SIZE: int = 256  # Chunks read, embedded and written per step when re-embedding
+    RAG_REEMBED_MAX_CHUNKS_PER_MINUTE: int = 0  # Re-embedding rate (keep under the provider limit), 0 = unlimited
+    RAG_SNAPSHOT_PART_SIZE: int = 2048  # Chunks per part of a collection snapshot (export/import unit)
+    RAG_SNAPSHOT_MAX_UPLOAD_MB: int = 4096  # Max size of a snapshot uploaded for import
 
     # Reranker
     {%- if cookiecutter.enable_reranker and cookiecutter.use_cohere_reranker %}
@@ -452,8 +479,25 @@ class Settings(BaseSettings):
     # Image Description (LLM vision)
     RAG_ENABLE_IMAGE_DESCRIPTION: bool = True  # set to false to disable LLM image description
     RAG_IMAGE_DESCRIPTION_MODEL: str = ""  # empty = use AI_MODEL
+    RAG_IMAGE_DESCRIPTION_CONCURRENCY: int = 4  # Parallel LLM vision calls per document
+    RAG_IMAGE_MIN_BYTES: int = 4096  # Smaller images (icons, bullets, spacers) are not described
+    RAG_IMAGE_MIN_ENTROPY: float = 2.0  # Bits/byte; near-uniform images (blank scans, fills) are skipped
+    RAG_IMAGE_MAX_PER_DOCUMENT: int = 100  # LLM calls per document (OCR + images), 0 = unlimited
+    RAG_IMAGE_DOCUMENT_BUDGET_SECONDS: float = 300.0  # Time spent describing per document, 0 = unlimited
+    RAG_IMAGE_CACHE_DIR: str = "./data/rag_image_cache"  # Descriptions by image hash, empty = memory only
 {%- endif %}
 
+    # Local folder syncs keep a stat manifest here (one JSON file per collection + folder)
+    RAG_SYNC_MANIFEST_DIR: str = "./data/rag_sync"
+    RAG_SYNC_CANCEL_POLL_SECONDS: float = 2.0  # How often running syncs check for cancellation
+{%- if cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq %}
+    RAG_BULK_YIELD_MAX_SECONDS: float = 60.0  # Max pause of a sync while uploads are queued, 0 = never pause
+{%- endif %}
+
+    # Connector sync downloads
+    RAG_SYNC_DOWNLOAD_CONCURRENCY: int = 4  # Files downloaded in parallel per sync
+    RAG_SYNC_DOWNLOAD_CHUNK_MB: int = 8  # Streaming chunk size (memory per in-flight download)
+
     # Google Drive (optional, for document ingestion via service account)
     {%- if cookiecutter.enable_google_drive_ingestion %}
     GOOGLE_DRIVE_CREDENTIALS_FILE: str = "credentials/google-drive-sa.json"
@@ -517,13 +561,30 @@ class Settings(BaseSettings):
             chunk_overlap=self.RAG_CHUNK_OVERLAP,
             chunking_strategy=self.RAG_CHUNKING_STRATEGY,
             enable_hybrid_search=self.RAG_HYBRID_SEARCH,
+            summary_top_documents=self.RAG_SUMMARY_TOP_DOCUMENTS,
+            vector_storage=self.RAG_VECTOR_STORAGE,
+            vector_oversampling=self.RAG_VECTOR_OVERSAMPLING,
+            tenant_partitioning=self.RAG_TENANT_PARTITIONING,
             enable_ocr=self.RAG_ENABLE_OCR,
-            embeddings_config=EmbeddingsConfig(model=self.EMBEDDING_MODEL),
+            pdf_pages_per_task=self.RAG_PDF_PAGES_PER_TASK,
+            pdf_table_detection=self.RAG_PDF_TABLE_DETECTION,
+            streaming_min_file_mb=self.RAG_STREAMING_MIN_FILE_MB,
+            streaming_window_chunks=self.RAG_STREAMING_WINDOW_CHUNKS,
+            write_buffer_max_vectors=self.RAG_WRITE_BUFFER_MAX_VECTORS,
+            write_buffer_max_wait_ms=self.RAG_WRITE_BUFFER_MAX_WAIT_MS,
+            parse_cache_dir=self.RAG_PARSE_CACHE_DIR,
+            embeddings_config=EmbeddingsConfig(model=self.EMBEDDING_MODEL, truncate_dim=self.EMBEDDING_TRUNCATE_DIM),
             document_parser=DocumentParser(),
             pdf_parser=pdf_parser,
 {%- if cookiecutter.enable_rag_image_description %}
             enable_image_description=self.RAG_ENABLE_IMAGE_DESCRIPTION,
             image_description_model=self.RAG_IMAGE_DESCRIPTION_MODEL,
+            image_description_concurrency=self.RAG_IMAGE_DESCRIPTION_CONCURRENCY,
+            image_min_bytes=self.RAG_IMAGE_MIN_BYTES,
+            image_min_entropy=self.RAG_IMAGE_MIN_ENTROPY,
+            image_max_per_document=self.RAG_IMAGE_MAX_PER_DOCUMENT,
+            image_document_budget_seconds=self.RAG_IMAGE_DOCUMENT_BUDGET_SECONDS,
+            image_cache_dir=self.RAG_IMAGE_CACHE_DIR,
 {%- endif %}
         )
 
@@ -95,6 +95,14 @@ class BadRequestError(AppException):
     status_code = 400
 
 
+class PayloadTooLargeError(AppException):
+    """Request body too large (413)."""
+
+    message = "Payload too large"
+    code = "PAYLOAD_TOO_LARGE"
+    status_code = 413
+
+
 # === 5xx Server Errors ===
 
 
@@ -0,0 +1,55 @@
+{%- if cookiecutter.use_all_pdf_parsers or not cookiecutter.use_llamaparse %}
+"""Table extraction from PyMuPDF pages, shared by RAG ingestion and chat attachments.
+
+``page.find_tables()`` is one of the slowest steps of PDF parsing, and its
+default "lines" strategy only finds tables drawn with ruling lines: pages
+without them are skipped with a cheap look at their vector drawings.
+"""
+
+from typing import Any
+
+
+def has_ruling_lines(page: Any) -> bool:
+    """Cheap check whether a page's vector drawings could form a table grid.
+
+    ``find_tables()`` (default "lines" strategy) only finds tables drawn
+    with ruling lines, so pages without enough horizontal and vertical
+    strokes can skip it entirely.
+    """
+    horizontal = vertical = 0
+    for path in page.get_drawings():
+        for item in path["items"]:
+            if item[0] == "l":
+                p1, p2 = item[1], item[2]
+                if abs(p1.y - p2.y) < 1:
+                    horizontal += 1
+                elif abs(p1.x - p2.x) < 1:
+                    vertical += 1
+            elif item[0] == "re":
+                rect = item[1]
+                if rect.height < 3:
+                    horizontal += 1  # thin filled rect used as a rule
+                elif rect.width < 3:
+                    vertical += 1
+                else:
+                    horizontal += 2
+                    vertical += 2
+            if horizontal >= 3 and vertical >= 2:
+                return True
+    return False
+
+
+def extract_tables(page: Any) -> str:
+    """Extract a page's tables as markdown ("" if it has none)."""
+    try:
+        tables = page.find_tables()
+        if not tables or not tables.tables:
+            return ""
+        parts = []
+        for table in tables.tables:
+            if table.row_count:
+                parts.append(table.to_markdown().strip())
+        return "\n\n".join(parts)
+    except Exception:
+        return ""
+{%- endif %}
@@ -0,0 +1,80 @@
+"""Process pool for CPU-bound work such as document parsing.
+
+PDF extraction holds the GIL for its whole duration, so running it on the event
+loop (or in a thread) stalls every other request served by the same worker.
+Jobs submitted here run in a lazily created pool of spawned processes instead.
+
+Spawned (not forked) children are used so the pool is safe to create from a
+process that already runs an event loop, DB connections or MuPDF state.
+Inside daemonic processes (e.g. Celery prefork children), which are not allowed
+to have children of their own, jobs fall back to a thread.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Recycle children periodically - MuPDF caches grow with every document
+MAX_TASKS_PER_CHILD = 200
+
+_pool: ProcessPoolExecutor | None = None
+_pool_pid: int | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor | None:
+    """Return the shared process pool, creating it on first use.
+
+    Returns None when CPU-bound jobs should run in a thread instead:
+    ``PARSER_WORKERS`` is 0, or the current process is daemonic.
+    """
+    global _pool, _pool_pid
+
+    if settings.PARSER_WORKERS <= 0 or multiprocessing.current_process().daemon:
+        return None
+
+    # A pool inherited through fork belongs to the parent - build a new one
+    if _pool is not None and _pool_pid == os.getpid():
+        return _pool
+
+    _pool = ProcessPoolExecutor(
+        max_workers=settings.PARSER_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=MAX_TASKS_PER_CHILD,
+    )
+    _pool_pid = os.getpid()
+    logger.info(f"Started process pool with {settings.PARSER_WORKERS} workers")
+    return _pool
+
+
+async def run_in_process(func: Callable[..., T], *args: Any) -> T:
+    """Run a picklable, module-level function in the shared process pool.
+
+    Falls back to ``asyncio.to_thread`` when no pool is available, so callers
+    never block the event loop either way.
+    """
+    pool = get_process_pool()
+    if pool is None:
+        return await asyncio.to_thread(func, *args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, partial(func, *args))
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared pool (called on application shutdown)."""
+    global _pool, _pool_pid
+
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+    _pool_pid = None
@@ -31,6 +31,8 @@ class SyncSource(TimestampMixin, SQLModel, table=True):
     last_sync_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True), nullable=True))
     last_sync_status: str | None = Field(default=None, sa_column=Column(String(20), nullable=True))
     last_error: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+    # {source_path: fingerprint} of files ingested by the last sync
+    file_checkpoints: dict[str, str] = Field(default_factory=dict, sa_column=Column(JSONB, nullable=False, server_default="{}"))
 {%- elif cookiecutter.use_postgresql and cookiecutter.use_sqlalchemy %}
 """SyncSource model — stores RAG sync source configurations."""
 
@@ -60,6 +62,8 @@ class SyncSource(TimestampMixin, Base):
     last_sync_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_sync_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # {source_path: fingerprint} of files ingested by the last sync
+    file_checkpoints: Mapped[dict[str, str]] = mapped_column(JSONB, nullable=False, server_default="{}", default=dict)
 {%- elif cookiecutter.use_sqlite and cookiecutter.use_sqlmodel %}
 """SyncSource model — stores RAG sync source configurations."""
 
@@ -88,6 +92,8 @@ class SyncSource(TimestampMixin, SQLModel, table=True):
     last_sync_at: datetime | None = Field(default=None, sa_column=Column(DateTime, nullable=True))
     last_sync_status: str | None = Field(default=None, sa_column=Column(String(20), nullable=True))
     last_error: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+    # JSON string: {source_path: fingerprint} of files ingested by the last sync
+    file_checkpoints: str = Field(default="{}", sa_column=Column(Text, nullable=False, default="{}"))
 {%- elif cookiecutter.use_sqlite and cookiecutter.use_sqlalchemy %}
 """SyncSource model — stores RAG sync source configurations."""
 
@@ -116,5 +122,7 @@ class SyncSource(TimestampMixin, Base):
     last_sync_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_sync_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # JSON string: {source_path: fingerprint} of files ingested by the last sync
+    file_checkpoints: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
 {%- endif %}
 {%- endif %}
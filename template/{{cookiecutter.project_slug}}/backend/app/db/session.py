@@ -1,10 +1,13 @@
 {%- if cookiecutter.use_postgresql %}
 """Async PostgreSQL database session."""
 
+import asyncio
+import os
+import weakref
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
@@ -52,35 +55,121 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
-@asynccontextmanager
-async def get_worker_db_context() -> AsyncGenerator[AsyncSession, None]:
-    """Get a short-lived async session for background workers (Celery/ARQ).
+# Background workers (Celery/ARQ/Taskiq) use their own pooled engine, created
+# lazily inside each worker process and bound to the event loop that runs tasks.
+# It is rebuilt if the process was forked or the loop changed, so pooled
+# connections never cross a fork or an event loop.
+_worker_engine: AsyncEngine | None = None
+_worker_session_maker: async_sessionmaker[AsyncSession] | None = None
+_worker_owner: tuple[int, weakref.ref[asyncio.AbstractEventLoop]] | None = None
+_worker_closer: asyncio.Task[None] | None = None
+
 
-    Creates a fresh engine with NullPool on every call so there are no
-    cross-fork / cross-event-loop connection issues.  The engine is disposed
-    automatically when the context manager exits.
+async def _close_with_loop(worker_engine: AsyncEngine) -> None:
+    """Wait until cancelled, then close the engine's connections on its own loop.
+
+    asyncio.run() cancels leftover tasks before closing its loop, so a worker
+    running each task in a fresh loop still closes every pool it opened.
     """
-    from sqlalchemy.pool import NullPool
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await worker_engine.dispose()
 
-    worker_engine = create_async_engine(
+
+def _discard_worker_engine() -> None:
+    """Forget the worker engine, closing its connections when they are ours.
+
+    Connections inherited through fork belong to the parent - close=False drops
+    them from the pool instead of closing them. In this process, the engine is
+    closed on the loop that opened it (or already was, when that loop shut down).
+    """
+    global _worker_engine, _worker_session_maker, _worker_owner, _worker_closer
+
+    if _worker_engine is not None and _worker_owner is not None:
+        pid, _ = _worker_owner
+        closer = _worker_closer
+        if pid == os.getpid() and closer is not None and not closer.get_loop().is_closed():
+            closer.get_loop().call_soon_threadsafe(closer.cancel)
+        else:
+            _worker_engine.sync_engine.dispose(close=False)
+    _worker_engine = None
+    _worker_session_maker = None
+    _worker_owner = None
+    _worker_closer = None
+
+
+def _get_worker_session_maker() -> async_sessionmaker[AsyncSession]:
+    global _worker_engine, _worker_session_maker, _worker_owner, _worker_closer
+
+    loop = asyncio.get_running_loop()
+    if _worker_session_maker is not None and _worker_owner is not None:
+        pid, loop_ref = _worker_owner
+        if pid == os.getpid() and loop_ref() is loop:
+            return _worker_session_maker
+        _discard_worker_engine()
+
+    _worker_engine = create_async_engine(
         settings.DATABASE_URL,
         echo=False,
-        poolclass=NullPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
     )
-    factory = async_sessionmaker(
-        worker_engine,
+    _worker_session_maker = async_sessionmaker(
+        _worker_engine,
         class_=AsyncSession,
         expire_on_commit=False,
     )
-    async with factory() as session:
+    _worker_owner = (os.getpid(), weakref.ref(loop))
+    _worker_closer = loop.create_task(_close_with_loop(_worker_engine))
+    return _worker_session_maker
+
+
+def init_worker_db() -> None:
+    """Prepare a freshly started worker process (Celery worker_process_init, ARQ/Taskiq startup).
+
+    Drops any engine inherited from the parent through fork; the pooled engine
+    itself is created on first use, inside the loop that runs the tasks.
+    """
+    _discard_worker_engine()
+
+
+async def close_worker_db() -> None:
+    """Close the worker engine's pooled connections (worker shutdown hooks)."""
+    global _worker_engine, _worker_session_maker, _worker_owner, _worker_closer
+
+    if _worker_engine is None or _worker_owner is None:
+        return
+    pid, loop_ref = _worker_owner
+    if pid == os.getpid() and loop_ref() is asyncio.get_running_loop():
+        if _worker_closer is not None:
+            _worker_closer.cancel()
+        await _worker_engine.dispose()
+        _worker_engine = None
+        _worker_session_maker = None
+        _worker_owner = None
+        _worker_closer = None
+    else:
+        _discard_worker_engine()
+
+
+@asynccontextmanager
+async def get_worker_db_context() -> AsyncGenerator[AsyncSession, None]:
+    """Get an async session for background workers (Celery/ARQ/Taskiq).
+
+    Sessions come from a pooled engine owned by the current worker process and
+    event loop, so repeated calls within a task reuse connections instead of
+    opening a new one each time.
+    """
+    async with _get_worker_session_maker()() as session:
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await worker_engine.dispose()
 
 
 async def close_db() -> None:
@@ -236,6 +236,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[{% if cookiecutter.enable_red
 {%- endif %}
 
     # === Shutdown ===
+    from app.core.process_pool import shutdown_process_pool
+    shutdown_process_pool()
+
+{%- if cookiecutter.use_pydantic_ai %}
+    from app.agents.http_clients import close_http_clients
+    await close_http_clients()
+{%- endif %}
+
 {%- if cookiecutter.enable_redis %}
     if "redis" in state:
         await state["redis"].close()
@@ -0,0 +1,169 @@
+{%- if cookiecutter.enable_rag %}
+"""Batch uploads: many documents, or .zip / .tar archives of documents, at once.
+
+``POST /rag/collections/{name}/ingest/batch`` hands every uploaded part to a
+:class:`BatchUpload`. Plain files are streamed to storage as they are; archives
+are opened from the spooled request body and their members are extracted one
+by one, chunk by chunk, straight to storage. Nothing is held in memory and
+no archive is unpacked to a scratch directory first.
+
+Archive members are checked like single uploads: supported extension and at
+most MAX_UPLOAD_SIZE_MB each (enforced on the bytes actually extracted, not
+the size the archive declares). Directories, links, hidden files and nested
+archives are skipped.
+"""
+
+import asyncio
+import gzip
+import logging
+import lzma
+import tarfile
+import zipfile
+import zlib
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import IO
+
+from fastapi import UploadFile
+
+from app.core.exceptions import PayloadTooLargeError
+from app.services.file_storage import UPLOAD_CHUNK_SIZE, BaseFileStorage, StoredFile, iter_upload
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+# Raised while reading a damaged archive (storage errors are not caught)
+ARCHIVE_ERRORS = (zipfile.BadZipFile, tarfile.TarError, EOFError, zlib.error, lzma.LZMAError, gzip.BadGzipFile)
+
+
+def is_archive(filename: str) -> bool:
+    """Whether a file is an archive a batch upload can unpack."""
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+@dataclass(slots=True)
+class BatchFile:
+    """A document of the batch, written to storage."""
+
+    source_path: str  # Path inside its archive, or the uploaded filename
+    filename: str
+    filetype: str
+    stored: StoredFile
+
+
+def _member_path(name: str) -> str | None:
+    """Normalized member path, or None for entries that are not documents."""
+    parts = [p for p in PurePosixPath(name.replace("\\", "/")).parts if p not in ("", ".", "..", "/")]
+    if not parts or parts[0] == "__MACOSX" or any(p.startswith(".") for p in parts):
+        return None
+    return "/".join(parts)
+
+
+def _iter_members(fileobj: IO[bytes], filename: str) -> Iterator[tuple[str, IO[bytes]]]:
+    """Yield (path, stream) for each regular file of an archive, in archive order."""
+    if filename.lower().endswith(".zip"):
+        with zipfile.ZipFile(fileobj) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                with zf.open(info) as member:
+                    yield info.filename, member
+    else:
+        with tarfile.open(fileobj=fileobj, mode="r:*") as tf:
+            for info in tf:
+                if not info.isfile():
+                    continue
+                member = tf.extractfile(info)
+                if member is not None:
+                    with member:
+                        yield info.name, member
+
+
+async def _iter_chunks(stream: IO[bytes]) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(stream.read, UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+class BatchUpload:
+    """Streams the documents of a batch upload to storage.
+
+    Files that cannot be ingested are collected in ``skipped`` with a reason
+    instead of failing the whole batch.
+    """
+
+    def __init__(
+        self,
+        storage: BaseFileStorage,
+        collection_name: str,
+        allowed_extensions: set[str],
+        max_file_size: int,
+        max_files: int,
+    ):
+        self.storage = storage
+        self.collection_name = collection_name
+        self.allowed_extensions = allowed_extensions
+        self.max_file_size = max_file_size
+        self.max_files = max_files
+        self.files: list[BatchFile] = []
+        self.skipped: list[tuple[str, str]] = []
+
+    async def add(self, file: UploadFile) -> None:
+        """Add an uploaded part: a document, or an archive of documents."""
+        filename = file.filename or "unknown"
+        if not is_archive(filename):
+            await self._store(filename, iter_upload(file))
+            return
+        # The request body is already spooled to a file, which archives can seek in
+        members = _iter_members(file.file, filename)
+        try:
+            while True:
+                try:
+                    item = await asyncio.to_thread(next, members, None)
+                except ARCHIVE_ERRORS as e:
+                    logger.warning(f"Unreadable archive {filename}: {e}")
+                    self.skipped.append((filename, f"Unreadable archive: {e}"))
+                    return
+                if item is None:
+                    return
+                name, stream = item
+                path = _member_path(name)
+                if path is not None:
+                    await self._store(path, _iter_chunks(stream))
+        finally:
+            members.close()
+
+    async def _store(self, source_path: str, chunks: AsyncIterator[bytes]) -> None:
+        filename = PurePosixPath(source_path).name
+        ext = PurePosixPath(filename).suffix.lower()
+        if is_archive(filename):
+            self.skipped.append((source_path, "Nested archives are not unpacked"))
+            return
+        if ext not in self.allowed_extensions:
+            self.skipped.append((source_path, f"File type '{ext}' not supported"))
+            return
+        if len(self.files) >= self.max_files:
+            self.skipped.append((source_path, f"Batch limit of {self.max_files} files reached"))
+            return
+        try:
+            stored = await self.storage.save_stream(
+                f"rag/{self.collection_name}", filename, chunks, max_size=self.max_file_size
+            )
+        except PayloadTooLargeError:
+            self.skipped.append((source_path, f"File too large. Maximum {self.max_file_size // (1024 * 1024)}MB."))
+            return
+        except ARCHIVE_ERRORS as e:
+            self.skipped.append((source_path, f"Corrupt archive member: {e}"))
+            return
+        self.files.append(BatchFile(source_path, filename, ext.lstrip("."), stored))
+
+    async def discard(self) -> None:
+        """Delete everything stored so far (the batch could not be queued)."""
+        for file in self.files:
+            try:
+                await self.storage.delete(file.stored.storage_path)
+            except OSError as e:
+                logger.warning(f"Failed to delete {file.stored.storage_path}: {e}")
+        self.files.clear()
+{%- endif %}
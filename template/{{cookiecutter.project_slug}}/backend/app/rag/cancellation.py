@@ -0,0 +1,110 @@
+{%- if cookiecutter.enable_rag %}
+"""Cooperative cancellation for long-running RAG syncs.
+
+``DELETE /rag/sync/{sync_id}`` marks the SyncLog as cancelled and calls
+:func:`request_cancel`, which raises a flag in this process and
+{%- if cookiecutter.enable_redis %}
+sets a short-lived Redis key that workers in other processes can see.
+{%- else %}
+is picked up by other processes through the SyncLog status.
+{%- endif %}
+
+Sync loops hold a :class:`CancellationToken` and call ``is_cancelled()`` as
+often as they like. The flag is cached, and the shared store is polled at most
+every RAG_SYNC_CANCEL_POLL_SECONDS, instead of opening a DB connection per file.
+"""
+
+import logging
+import time
+
+{%- if cookiecutter.enable_redis %}
+import redis
+import redis.asyncio as aioredis
+{%- endif %}
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CANCEL_KEY_PREFIX = "rag:sync:cancel:"
+CANCEL_KEY_TTL = 24 * 3600  # Outlives any sync; the key is never read after it ends
+
+# Syncs cancelled from this process (BackgroundTasks run in the API process)
+_cancelled_here: set[str] = set()
+
+
+async def request_cancel(sync_id: str) -> None:
+    """Signal all running loops of a sync to stop."""
+    _cancelled_here.add(sync_id)
+{%- if cookiecutter.enable_redis %}
+    try:
+        r = aioredis.from_url(settings.REDIS_URL)  # type: ignore[no-untyped-call]
+        await r.set(f"{CANCEL_KEY_PREFIX}{sync_id}", "1", ex=CANCEL_KEY_TTL)
+        await r.aclose()
+    except Exception as e:
+        logger.warning(f"Failed to publish cancellation for sync {sync_id}: {e}")
+{%- endif %}
+
+
+def request_cancel_blocking(sync_id: str) -> None:
+    """Synchronous variant of :func:`request_cancel` for sync call sites."""
+    _cancelled_here.add(sync_id)
+{%- if cookiecutter.enable_redis %}
+    try:
+        r = redis.Redis.from_url(settings.REDIS_URL)
+        r.set(f"{CANCEL_KEY_PREFIX}{sync_id}", "1", ex=CANCEL_KEY_TTL)
+        r.close()
+    except Exception as e:
+        logger.warning(f"Failed to publish cancellation for sync {sync_id}: {e}")
+{%- endif %}
+
+
+class CancellationToken:
+    """Cached, rate-limited view of whether a sync has been cancelled."""
+
+    def __init__(self, sync_id: str, poll_interval: float | None = None):
+        self.sync_id = sync_id
+        self.poll_interval = (
+            settings.RAG_SYNC_CANCEL_POLL_SECONDS if poll_interval is None else poll_interval
+        )
+        self._cancelled = False
+        self._last_poll = float("-inf")
+
+    async def is_cancelled(self) -> bool:
+        """Return True once the sync has been cancelled (cheap to call per item)."""
+        if self._cancelled:
+            return True
+        if self.sync_id in _cancelled_here:
+            self._cancelled = True
+            return True
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return False
+        self._last_poll = now
+        try:
+            self._cancelled = await self._poll()
+        except Exception as e:
+            logger.warning(f"Cancellation check failed for sync {self.sync_id}: {e}")
+        if self._cancelled:
+            logger.info(f"Sync {self.sync_id} cancelled by user")
+        return self._cancelled
+
+    async def _poll(self) -> bool:
+{%- if cookiecutter.enable_redis %}
+        r = aioredis.from_url(settings.REDIS_URL)  # type: ignore[no-untyped-call]
+        try:
+            return bool(await r.exists(f"{CANCEL_KEY_PREFIX}{self.sync_id}"))
+        finally:
+            await r.aclose()
+{%- elif cookiecutter.use_postgresql %}
+        from app.db.session import get_db_context
+        from app.services.rag_sync import RAGSyncService
+
+        async with get_db_context() as db:
+            sync_log = await RAGSyncService(db).get_sync_log(self.sync_id)
+        return sync_log.status == "cancelled"
+{%- else %}
+        # Without Redis, syncs run as BackgroundTasks in the cancelling process
+        return False
+{%- endif %}
+{%- endif %}
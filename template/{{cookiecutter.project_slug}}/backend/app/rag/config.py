@@ -70,8 +70,29 @@ EMBEDDING_DIMENSIONS: dict[str, int] = {
 }
 
 
+# Models trained with Matryoshka representation learning: a prefix of their
+# vector, renormalized, is itself a usable (smaller) embedding.
+MATRYOSHKA_MODELS: frozenset[str] = frozenset({
+    "text-embedding-3-small",
+    "text-embedding-3-large",
+    "gemini-embedding-exp-03-07",
+})
+
+# How vector stores keep vectors, for collections created with the profile:
+#   full     float32 vectors (pgvector vector, Qdrant default, Milvus AUTOINDEX)
+#   compact  pgvector halfvec, Qdrant int8 scalar quantization, Milvus IVF_SQ8
+#   binary   pgvector binary_quantize index, Qdrant binary quantization, Milvus IVF_PQ;
+#            candidates are re-scored with the full vectors (vector_oversampling)
+# Chroma always stores full vectors.
+VECTOR_STORAGE_PROFILES: frozenset[str] = frozenset({"full", "compact", "binary"})
+
+
 class EmbeddingsConfig(BaseModel):
-    """Embeddings configuration. Dimension is auto-derived from model name."""
+    """Embeddings configuration. Dimension is auto-derived from model name.
+
+    ``truncate_dim`` keeps only the first dimensions of each vector (Matryoshka
+    truncation, see MATRYOSHKA_MODELS); ``dim`` is then the truncated size.
+    """
 
 {%- if cookiecutter.use_openai_embeddings %}
     model: str = "text-embedding-3-small"
@@ -87,10 +108,18 @@ class EmbeddingsConfig(BaseModel):
     dim: int = 384
 {%- endif %}
 
+    truncate_dim: int = 0  # 0 = full vectors
+
     @model_validator(mode="after")
     def set_dim_from_model(self) -> "EmbeddingsConfig":
         if self.model in EMBEDDING_DIMENSIONS:
             self.dim = EMBEDDING_DIMENSIONS[self.model]
+        if self.truncate_dim:
+            if self.model not in MATRYOSHKA_MODELS:
+                raise ValueError(f"Embedding model '{self.model}' does not support Matryoshka truncation")
+            if not 0 < self.truncate_dim < self.dim:
+                raise ValueError(f"truncate_dim must be between 1 and {self.dim - 1} for '{self.model}'")
+            self.dim = self.truncate_dim
         return self
 
 
@@ -146,6 +175,14 @@ class RAGSettings(BaseModel):
     chunking_strategy: str = "recursive"
     enable_hybrid_search: bool = False
     enable_ocr: bool = False
+    summary_top_documents: int = 20
+
+    # Vector storage: full (float32), compact (half precision / int8) or binary
+    vector_storage: str = "full"
+    vector_oversampling: float = 3.0  # Quantized candidates re-scored with full vectors, per result
+    # Tenancy: new collections are partitioned by each chunk's tenant (app.rag.tenancy);
+    # scoped searches filter on it either way
+    tenant_partitioning: bool = False
 
     # Embeddings
     embeddings_config: EmbeddingsConfig = Field(default_factory=EmbeddingsConfig)
@@ -158,11 +195,24 @@ class RAGSettings(BaseModel):
     # Parsers
     document_parser: DocumentParser = Field(default_factory=DocumentParser)
     pdf_parser: PdfParser = Field(default_factory=PdfParser)
+    pdf_pages_per_task: int = 50
+    pdf_table_detection: str = "auto"
+    streaming_min_file_mb: float = 20.0
+    streaming_window_chunks: int = 256
+    write_buffer_max_vectors: int = 512
+    write_buffer_max_wait_ms: float = 100.0
+    parse_cache_dir: str = "./data/rag_parse_cache"
 
 {%- if cookiecutter.enable_rag_image_description %}
     # Image description
     enable_image_description: bool = True
     image_description_model: str = ""
+    image_description_concurrency: int = 4
+    image_min_bytes: int = 4096
+    image_min_entropy: float = 2.0
+    image_max_per_document: int = 100
+    image_document_budget_seconds: float = 300.0
+    image_cache_dir: str = "./data/rag_image_cache"
 {%- endif %}
 
     # Sources
@@ -171,4 +221,13 @@ class RAGSettings(BaseModel):
 {%- else %}
     gdrive_ingestion: bool = False
 {%- endif %}
+
+    @model_validator(mode="after")
+    def check_vector_storage(self) -> "RAGSettings":
+        if self.vector_storage not in VECTOR_STORAGE_PROFILES:
+            raise ValueError(
+                f"Unknown vector storage profile '{self.vector_storage}'; "
+                f"use one of: {', '.join(sorted(VECTOR_STORAGE_PROFILES))}"
+            )
+        return self
 {%- endif %}
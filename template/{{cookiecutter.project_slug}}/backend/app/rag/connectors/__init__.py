@@ -1,11 +1,15 @@
 {%- if cookiecutter.enable_rag %}
 """RAG sync connectors — extensible source adapters for document ingestion."""
 
+import asyncio
+import hashlib
 import logging
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, BinaryIO, ClassVar
 
 from pydantic import BaseModel
 
@@ -21,6 +25,51 @@ class RemoteFile(BaseModel):
     size: int | None = None
     modified_at: datetime | None = None
     source_path: str  # Dedup key: "gdrive://file_id", "s3://bucket/key"
+    # Change-detection hints reported by the source listing (no download needed)
+    etag: str | None = None
+    checksum: str | None = None  # Content MD5, when the source exposes one
+    version: str | None = None
+    # SHA256 of the downloaded bytes, filled in by download_file()
+    content_hash: str | None = None
+
+    @property
+    def fingerprint(self) -> str | None:
+        """Cheap identifier of the file's current content, or None if unknown.
+
+        Prefers a content checksum, then the ETag / version reported by the source,
+        then modification time + size, and finally the SHA256 computed while
+        downloading (only available after download_file()).
+        """
+        if self.checksum:
+            return f"md5:{self.checksum}"
+        if self.etag:
+            return f"etag:{self.etag}"
+        if self.version:
+            return f"version:{self.version}"
+        if self.modified_at is not None and self.size is not None:
+            return f"mtime:{self.modified_at.isoformat()}:{self.size}"
+        if self.content_hash:
+            return f"sha256:{self.content_hash}"
+        return None
+
+
+class HashingWriter:
+    """Binary file wrapper that hashes bytes as they are written.
+
+    Lets connectors stream a download straight to disk and get its SHA256
+    without buffering the object or reading the file back.
+    """
+
+    def __init__(self, fh: BinaryIO):
+        self._fh = fh
+        self._digest = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        return self._fh.write(data)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
 
 
 class BaseSyncConnector(ABC):
@@ -31,6 +80,9 @@ class BaseSyncConnector(ABC):
     2. Implement list_files() and download_file()
     3. Define CONFIG_SCHEMA with required/optional fields
     4. Register in CONNECTOR_REGISTRY
+
+    list_files() should fill RemoteFile.etag / checksum / version where the source
+    provides them, so unchanged files can be skipped before they are downloaded.
     """
 
     CONNECTOR_TYPE: ClassVar[str] = ""
@@ -43,7 +95,53 @@ class BaseSyncConnector(ABC):
 
     @abstractmethod
     async def download_file(self, file: RemoteFile, dest_dir: Path) -> Path:
-        """Download a single file to local temp directory. Returns local file path."""
+        """Download a single file to local temp directory. Returns local file path.
+
+        Implementations should stream to disk in bounded chunks through a
+        HashingWriter and set ``file.content_hash``.
+        """
+
+    async def download_files(
+        self,
+        files: Sequence[RemoteFile],
+        dest_dir: Path,
+        concurrency: int = 4,
+    ) -> AsyncIterator[tuple[RemoteFile, Path | None, Exception | None]]:
+        """Download files with bounded concurrency, yielding each as it completes.
+
+        At most ``concurrency`` downloads are in flight; the next ones only start
+        as the caller consumes results, so ingestion of a fetched file overlaps
+        with the downloads behind it without filling the disk. Each file gets
+        its own subdirectory, so equal names from different folders don't clash.
+
+        Yields:
+            (file, local_path, None) on success or (file, None, error) on failure.
+        """
+
+        async def _fetch(file: RemoteFile) -> tuple[RemoteFile, Path | None, Exception | None]:
+            try:
+                file_dir = Path(tempfile.mkdtemp(dir=dest_dir))
+                return file, await self.download_file(file, file_dir), None
+            except Exception as e:
+                return file, None, e
+
+        queue = iter(files)
+        pending: set[asyncio.Task[tuple[RemoteFile, Path | None, Exception | None]]] = set()
+        try:
+            for file in queue:
+                pending.add(asyncio.create_task(_fetch(file)))
+                if len(pending) >= max(1, concurrency):
+                    break
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+                    next_file = next(queue, None)
+                    if next_file is not None:
+                        pending.add(asyncio.create_task(_fetch(next_file)))
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def validate_config(self, config: dict) -> tuple[bool, str | None]:
         """Validate connector config. Returns (is_valid, error_message)."""
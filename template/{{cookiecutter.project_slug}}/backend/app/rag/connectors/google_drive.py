@@ -23,7 +23,7 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 
 from app.core.config import settings
-from app.rag.connectors import BaseSyncConnector, RemoteFile
+from app.rag.connectors import BaseSyncConnector, HashingWriter, RemoteFile
 
 logger = logging.getLogger(__name__)
 
@@ -112,7 +112,7 @@ class GoogleDriveConnector(BaseSyncConnector):
                 .list(
                     q=query,
                     pageSize=100,
-                    fields="nextPageToken, files(id, name, mimeType, size, modifiedTime)",
+                    fields="nextPageToken, files(id, name, mimeType, size, modifiedTime, md5Checksum, version)",
                     pageToken=page_token,
                 )
                 .execute()
@@ -150,6 +150,9 @@ class GoogleDriveConnector(BaseSyncConnector):
                         size=int(f.get("size", 0)),
                         modified_at=modified_at,
                         source_path=f"gdrive://{f['id']}",
+                        # Google Docs have no md5Checksum; their version still bumps on edit
+                        checksum=f.get("md5Checksum"),
+                        version=str(f["version"]) if f.get("version") else None,
                     )
                 )
 
@@ -174,8 +177,10 @@ class GoogleDriveConnector(BaseSyncConnector):
         """Download a file from Google Drive.
 
         For Google Docs formats, exports as PDF/XLSX/PPTX.
-        For regular files, downloads directly.
+        For regular files, downloads directly. Content is streamed to disk in
+        RAG_SYNC_DOWNLOAD_CHUNK_MB chunks and hashed as it is written.
         """
+        chunk_size = settings.RAG_SYNC_DOWNLOAD_CHUNK_MB * 1024 * 1024
 
         def _download():
             service = self._get_drive_service()
@@ -192,10 +197,12 @@ class GoogleDriveConnector(BaseSyncConnector):
                 request = service.files().get_media(fileId=file.id)
 
             with open(dest_path, "wb") as fh:
-                downloader = MediaIoBaseDownload(fh, request)
+                writer = HashingWriter(fh)
+                downloader = MediaIoBaseDownload(writer, request, chunksize=chunk_size)
                 done = False
                 while not done:
                     _, done = downloader.next_chunk()
+            file.content_hash = writer.hexdigest()
 
             logger.info(f"Downloaded {file.name} from Google Drive ({dest_path.stat().st_size} bytes)")
             return dest_path
@@ -15,7 +15,7 @@ import boto3
 from botocore.config import Config
 
 from app.core.config import settings
-from app.rag.connectors import BaseSyncConnector, RemoteFile
+from app.rag.connectors import BaseSyncConnector, HashingWriter, RemoteFile
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +44,17 @@ class S3Connector(BaseSyncConnector):
         },
     }
 
+    _client: Any = None
+
     def _get_s3_client(self, bucket: str = ""):
-        """Get configured boto3 S3 client."""
+        """Get configured boto3 S3 client.
+
+        The client is created once per connector and shared by the download
+        threads (boto3 clients are thread-safe), with a connection pool sized
+        for RAG_SYNC_DOWNLOAD_CONCURRENCY.
+        """
+        if self._client is not None:
+            return self._client
         client_kwargs: dict[str, Any] = {
             "aws_access_key_id": settings.S3_RAG_ACCESS_KEY,
             "aws_secret_access_key": settings.S3_RAG_SECRET_KEY,
@@ -53,7 +62,15 @@ class S3Connector(BaseSyncConnector):
         }
         if settings.S3_RAG_ENDPOINT:
             client_kwargs["endpoint_url"] = settings.S3_RAG_ENDPOINT
-        return boto3.client("s3", **client_kwargs, config=Config(signature_version="s3v4"))
+        self._client = boto3.client(
+            "s3",
+            **client_kwargs,
+            config=Config(
+                signature_version="s3v4",
+                max_pool_connections=max(10, settings.RAG_SYNC_DOWNLOAD_CONCURRENCY),
+            ),
+        )
+        return self._client
 
     async def validate_config(self, config: dict) -> tuple[bool, str | None]:
         """Test S3 bucket access."""
@@ -107,6 +124,8 @@ class S3Connector(BaseSyncConnector):
                             size=obj.get("Size"),
                             modified_at=modified_at,
                             source_path=f"s3://{bucket}/{key}",
+                            # Multipart ETags are not MD5s, but still change with content
+                            etag=obj.get("ETag", "").strip('"') or None,
                         )
                     )
 
@@ -115,15 +134,31 @@ class S3Connector(BaseSyncConnector):
         return await asyncio.to_thread(_list)
 
     async def download_file(self, file: RemoteFile, dest_dir: Path) -> Path:
-        """Download a file from S3."""
+        """Stream a file from S3 to disk, hashing it on the way.
+
+        Memory use is one chunk (RAG_SYNC_DOWNLOAD_CHUNK_MB) regardless of object size.
+        """
         # Extract bucket from source_path: "s3://bucket/key"
         parts = file.source_path.replace("s3://", "").split("/", 1)
         bucket = parts[0]
+        chunk_size = settings.RAG_SYNC_DOWNLOAD_CHUNK_MB * 1024 * 1024
 
         def _download():
             client = self._get_s3_client()
             dest_path = dest_dir / file.name
-            client.download_file(bucket, file.id, str(dest_path))
+            params: dict[str, Any] = {"Bucket": bucket, "Key": file.id}
+            if file.etag:
+                # Fail instead of ingesting a version other than the one listed
+                params["IfMatch"] = f'"{file.etag}"'
+            body = client.get_object(**params)["Body"]
+            try:
+                with open(dest_path, "wb") as fh:
+                    writer = HashingWriter(fh)
+                    for chunk in body.iter_chunks(chunk_size=chunk_size):
+                        writer.write(chunk)
+            finally:
+                body.close()
+            file.content_hash = writer.hexdigest()
             logger.info(f"Downloaded s3://{bucket}/{file.id} ({dest_path.stat().st_size} bytes)")
             return dest_path
 
@@ -1,6 +1,14 @@
 {%- if cookiecutter.enable_rag %}
+import asyncio
 import logging
+import mmap
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+{%- if cookiecutter.enable_rag_image_description %}
+from contextlib import AbstractContextManager, nullcontext
+{%- endif %}
 from pathlib import Path
 from typing import Any
 
@@ -18,8 +26,13 @@ import pymupdf
 from docx import Document as DOCXDocument
 {%- endif %}
 
+{% if cookiecutter.use_all_pdf_parsers or not cookiecutter.use_llamaparse -%}
+from app.core.pdf_tables import extract_tables, has_ruling_lines
+{% endif -%}
+from app.core.process_pool import run_in_process
 from app.rag.config import RAGSettings, DocumentExtensions
 from app.rag.models import Document, DocumentMetadata, DocumentPage, DocumentPageChunk
+from app.rag.parse_cache import ParsedDocument, ParsedDocumentCache
 {%- if cookiecutter.enable_rag_image_description %}
 from app.rag.models import DocumentImage
 {%- endif %}
@@ -61,7 +74,9 @@ class BaseDocumentParser(ABC):
             DocumentMetadata object containing file information.
         """
         import hashlib
-        content_hash = hashlib.sha256(filepath.read_bytes()).hexdigest()
+        with open(filepath, "rb") as fh:
+            # Streams in fixed-size blocks instead of loading the whole file
+            content_hash = hashlib.file_digest(fh, "sha256").hexdigest()
         return DocumentMetadata(
             filename=filepath.name,
             filesize=filepath.stat().st_size,
@@ -80,13 +95,46 @@ class BaseDocumentParser(ABC):
         """
         pass
 
+    async def read_metadata(self, filepath: Path) -> DocumentMetadata:
+        """Collect document metadata without parsing the content.
+        Args:
+            filepath: Path to the document file.
+        Returns:
+            DocumentMetadata object containing file information.
+        """
+        return await asyncio.to_thread(self.get_document_metadata, filepath)
+
+    async def iter_pages(self, filepath: Path) -> AsyncIterator[DocumentPage]:
+        """Yield the document's pages one at a time (streaming ingestion).
+
+        The default parses the whole file first; parsers that can read
+        incrementally override it so only a few pages are held in memory.
+        Args:
+            filepath: Path to the file to parse.
+        Yields:
+            DocumentPage objects in page order.
+        """
+        document = await self.parse(filepath)
+        for page in document.pages:
+            yield page
+
+    def cache_options(self) -> dict[str, Any]:
+        """Settings that change this parser's output (part of the parse cache key)."""
+        return {}
+
 
 class TextDocumentParser(BaseDocumentParser):
     """Parser for text-based documents (TXT, MD).
     Uses Python's built-in file reading capabilities to extract
     text content from plain text and Markdown files.
+
+    For streaming, the file is memory-mapped and yielded in segments of about
+    ``SEGMENT_BYTES``, cut at line breaks, so it is never read whole. Each
+    segment is yielded as a page of its own, numbered from 1.
     """
 
+    SEGMENT_BYTES = 1024 * 1024
+
     def _parse_text_file(self, filepath: Path) -> Document:
         """Extract raw text from a TXT or MD file.
         Args:
@@ -125,6 +173,30 @@ class TextDocumentParser(BaseDocumentParser):
         else:
             raise ValueError(f"Unsupported file extension. Allowed extensions: {self.allowed}")
 
+    def _read_segments(self, filepath: Path) -> Iterator[str]:
+        """Read a text file through mmap in line-aligned segments of ~SEGMENT_BYTES."""
+        with open(filepath, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos, size = 0, len(mm)
+                while pos < size:
+                    # Cutting after a newline never splits a UTF-8 sequence
+                    end = mm.find(b"\n", pos + self.SEGMENT_BYTES)
+                    end = size if end == -1 else end + 1
+                    yield mm[pos:end].decode("utf-8")
+                    pos = end
+
+    async def iter_pages(self, filepath: Path) -> AsyncIterator[DocumentPage]:
+        if not self.is_extension_allowed(filepath) or filepath.suffix not in (".txt", ".md"):
+            raise ValueError(f"Extension {filepath.suffix} not supported by TextDocumentParser")
+        segments = self._read_segments(filepath)
+        page_num = 1
+        while (segment := await asyncio.to_thread(next, segments, None)) is not None:
+            # Numbered like pages: chunk numbers restart in each segment, and chunk IDs include the page
+            yield DocumentPage(page_num=page_num, content=segment)
+            page_num += 1
+
 
 {%- if cookiecutter.use_all_pdf_parsers %}
 
@@ -185,79 +257,65 @@ class PyMuPDFParser(BaseDocumentParser):
     - OCR fallback for scanned pages (optional, requires tesseract)
     - Image extraction for LLM-based description
     - Document metadata (author, title, TOC)
+
+    Extraction runs in the shared process pool so it never blocks the event
+    loop. Large PDFs are split into ranges of ``pages_per_task`` pages that are
+    parsed in parallel and merged back in page order. Workers return plain
+    data; OCR and image description calls are awaited in the calling process.
+
+    ``iter_pages()`` streams the same pipeline range by range for large files.
+
+    Each page's text blocks are read once and reused for header/footer
+    detection and for the page text. ``table_detection`` controls when
+    ``find_tables()`` runs: "auto" only on pages with ruling lines, "always"
+    on every page, "off" never.
     """
 
     MIN_TEXT_LENGTH = 50  # below this -> likely a scan, try OCR
-
-    def __init__(self, enable_ocr: bool = False, image_describer: Any = None):
+    STREAM_LOOKAHEAD = 2  # page ranges parsed ahead of the consumer in iter_pages()
+    EDGE_RATIO = 0.15  # blocks in the top/bottom 15% may be headers/footers
+    REPEATED_RATIO = 0.7  # edge text on >70% of pages is a header/footer
+
+    def __init__(
+        self,
+        enable_ocr: bool = False,
+        image_describer: Any = None,
+        pages_per_task: int = 50,
+        table_detection: str = "auto",
+    ):
         self.enable_ocr = enable_ocr
         self._image_describer = image_describer
+        self.pages_per_task = max(1, pages_per_task)
+        self.table_detection = table_detection
 
-    def _detect_repeated_content(self, doc: Any) -> set[str]:
-        """Detect headers/footers -- text appearing on >70% of pages."""
-        if len(doc) < 3:
-            return set()
-        text_counts: dict[str, int] = {}
-        for page in doc:
-            for b in page.get_text("blocks"):
-                if b[6] != 0:  # skip image blocks
-                    continue
-                y_ratio = b[1] / page.rect.height if page.rect.height else 0
-                if y_ratio < 0.15 or y_ratio > 0.85:
-                    text = b[4].strip()
-                    if text and len(text) < 200:
-                        text_counts[text] = text_counts.get(text, 0) + 1
-        threshold = len(doc) * 0.7
-        return {t for t, c in text_counts.items() if c >= threshold}
-
-    def _extract_text(self, page: Any, repeated: set[str]) -> str:
-        """Extract text blocks, filtering headers/footers."""
-        texts = []
+    @staticmethod
+    def _read_outline(filepath: str) -> tuple[int, dict[str, Any], list[Any]]:
+        """Read page count, metadata and TOC without touching page content."""
+        doc: Any = pymupdf.open(filepath)  # type: ignore[no-untyped-call]
+        try:
+            return len(doc), doc.metadata or {}, doc.get_toc()
+        finally:
+            doc.close()
+
+    @classmethod
+    def _extract_blocks(cls, page: Any) -> list[tuple[str, bool]]:
+        """Extract text blocks in reading order, flagging header/footer candidates."""
+        height = page.rect.height
+        blocks = []
         for b in page.get_text("blocks"):
             if b[6] != 0:  # skip image blocks
                 continue
             text = b[4].strip()
-            if text and text not in repeated:
-                texts.append(text)
-        return str("\n\n".join(texts))
-
-    def _extract_tables(self, page: Any) -> str:
-        """Extract tables as markdown."""
-        try:
-            tables = page.find_tables()
-            if not tables or not tables.tables:
-                return ""
-            parts = []
-            for table in tables.tables:
-                df = table.to_pandas()
-                if not df.empty:
-                    parts.append(df.to_markdown(index=False))
-            return "\n\n".join(parts)
-        except Exception:
-            return ""
-
-    def _ocr_page(self, page: Any, image_describer: Any = None) -> str:
-        """OCR a scanned page by rendering it as image and sending to LLM vision."""
-        if not image_describer:
-            return ""
-        try:
-            import asyncio
-            pix = page.get_pixmap(dpi=200)
-            image_bytes = pix.tobytes("png")
-            loop = asyncio.new_event_loop()
-            try:
-                return str(loop.run_until_complete(
-                    image_describer.describe(image_bytes, "image/png")
-                ))
-            finally:
-                loop.close()
-        except Exception as e:
-            logger.warning(f"LLM OCR failed for page {page.number + 1}: {e}")
-            return ""
+            if not text:
+                continue
+            y_ratio = b[1] / height if height else 0
+            is_edge = (y_ratio < cls.EDGE_RATIO or y_ratio > 1 - cls.EDGE_RATIO) and len(text) < 200
+            blocks.append((text, is_edge))
+        return blocks
 
-{%- if cookiecutter.enable_rag_image_description %}
-    def _extract_images(self, doc: Any, page: Any) -> list["DocumentImage"]:
-        """Extract images from page for LLM description."""
+    @staticmethod
+    def _extract_images(doc: Any, page: Any) -> list[tuple[bytes, str]]:
+        """Extract raw image bytes and MIME types from a page."""
         images = []
         for img_info in page.get_images(full=True):
             xref = img_info[0]
@@ -266,60 +324,142 @@ class PyMuPDFParser(BaseDocumentParser):
                 if base and base["image"] and len(base["image"]) > 1000:
                     ext = base.get("ext", "png")
                     mime_map = {"png": "image/png", "jpeg": "image/jpeg", "jpg": "image/jpeg"}
-                    images.append(DocumentImage(
-                        page_num=page.number + 1,
-                        image_bytes=base["image"],
-                        mime_type=mime_map.get(ext, f"image/{ext}"),
-                    ))
+                    images.append((base["image"], mime_map.get(ext, f"image/{ext}")))
             except Exception:
                 pass
         return images
-{%- endif %}
 
-    def _parse_pdf_file(self, filepath: Path) -> Document:
-        """Parse PDF with smart extraction pipeline."""
+    @classmethod
+    def _parse_page_range(
+        cls,
+        filepath: str,
+        start: int,
+        stop: int,
+        table_detection: str,
+        render_short_pages: bool,
+        extract_images: bool,
+    ) -> list[dict[str, Any]]:
+        """Extract pages [start, stop) of a PDF. Runs in a worker process.
+
+        Returns plain dicts (picklable) with the page's text blocks, tables
+        as markdown, a PNG rendering of pages too short to be real text (for
+        OCR) and embedded images. Headers/footers are filtered by the caller,
+        which sees every page.
+        """
         doc: Any = pymupdf.open(filepath)  # type: ignore[no-untyped-call]
+        results: list[dict[str, Any]] = []
+        try:
+            for page_index in range(start, stop):
+                page = doc[page_index]
+
+                # 1. Text blocks with layout, read once per page
+                blocks = cls._extract_blocks(page)
+
+                # 2. Tables -> markdown, only where the page layout allows one
+                tables_md = ""
+                if table_detection == "always" or (
+                    table_detection == "auto" and has_ruling_lines(page)
+                ):
+                    tables_md = extract_tables(page)
+
+                # 3. Render scans/empty pages so the caller can OCR them
+                ocr_png = None
+                if render_short_pages:
+                    body_length = sum(len(text) for text, is_edge in blocks if not is_edge) + len(tables_md)
+                    if body_length < cls.MIN_TEXT_LENGTH:
+                        ocr_png = page.get_pixmap(dpi=200).tobytes("png")
+
+                results.append({
+                    "page_num": page_index + 1,
+                    "blocks": blocks,
+                    "tables": tables_md,
+                    "ocr_png": ocr_png,
+                    # 4. Images
+                    "images": cls._extract_images(doc, page) if extract_images else [],
+                })
+        finally:
+            doc.close()
+        return results
+
+    def _page_ranges(self, page_count: int) -> list[tuple[int, int]]:
+        """Split [0, page_count) into consecutive ranges of pages_per_task pages."""
+        return [
+            (start, min(start + self.pages_per_task, page_count))
+            for start in range(0, page_count, self.pages_per_task)
+        ]
+
+    def _detect_repeated_content(self, extracted_pages: list[dict[str, Any]]) -> set[str]:
+        """Detect headers/footers -- edge text appearing on >70% of pages."""
+        if len(extracted_pages) < 3:
+            return set()
+        text_counts: dict[str, int] = {}
+        for extracted in extracted_pages:
+            for text, is_edge in extracted["blocks"]:
+                if is_edge:
+                    text_counts[text] = text_counts.get(text, 0) + 1
+        threshold = len(extracted_pages) * self.REPEATED_RATIO
+        return {t for t, c in text_counts.items() if c >= threshold}
 
-        # Doc-level metadata
-        meta = doc.metadata or {}
-        toc = doc.get_toc()
-
-        # Detect repeated headers/footers
-        repeated = self._detect_repeated_content(doc)
-
-        pages = []
-        for page in doc:
-            # 1. Text with layout (skip image blocks, filter headers/footers)
-            text = self._extract_text(page, repeated)
-
-            # 2. Tables -> markdown
-            tables_md = self._extract_tables(page)
-            if tables_md:
-                text = text + "\n\n" + tables_md if text.strip() else tables_md
-
-            # 3. OCR fallback for scans/empty pages
-            if self.enable_ocr and len(text.strip()) < self.MIN_TEXT_LENGTH:
-                ocr_text = self._ocr_page(page, self._image_describer)
-                if len(ocr_text.strip()) > len(text.strip()):
-                    text = ocr_text
-                    logger.info(f"OCR fallback used for page {page.number + 1}")
+    async def _ocr_page(self, image_bytes: bytes, page_num: int) -> str:
+        """OCR a scanned page rendering via LLM vision."""
+        try:
+            return str(await self._image_describer.describe(image_bytes, "image/png"))
+        except Exception as e:
+            logger.warning(f"LLM OCR failed for page {page_num}: {e}")
+            return ""
 
+    def _extract_options(self) -> tuple[bool, bool]:
+        """Return (render_short_pages, extract_images) for the page range workers."""
+        render_short_pages = self.enable_ocr and self._image_describer is not None
 {%- if cookiecutter.enable_rag_image_description %}
-            # 4. Images
-            images = self._extract_images(doc, page)
+        extract_images = self._image_describer is not None
+{%- else %}
+        extract_images = False
 {%- endif %}
+        return render_short_pages, extract_images
+
+    async def _build_pages(self, extracted_pages: list[dict[str, Any]], repeated: set[str]) -> list[DocumentPage]:
+        """Turn extracted page data into DocumentPages (header/footer removal, OCR fallback)."""
+        texts = []
+        for extracted in extracted_pages:
+            text = "\n\n".join(text for text, _ in extracted["blocks"] if text not in repeated)
+            if extracted["tables"]:
+                text = text + "\n\n" + extracted["tables"] if text.strip() else extracted["tables"]
+            texts.append(text)
+
+        # OCR fallback for scans/empty pages, all pages at once (the describer bounds concurrency)
+        ocr_indexes = [
+            i for i, extracted in enumerate(extracted_pages)
+            if extracted["ocr_png"] and len(texts[i].strip()) < self.MIN_TEXT_LENGTH
+        ]
+        ocr_texts = await asyncio.gather(*(
+            self._ocr_page(extracted_pages[i]["ocr_png"], extracted_pages[i]["page_num"]) for i in ocr_indexes
+        ))
+        for i, ocr_text in zip(ocr_indexes, ocr_texts):
+            if len(ocr_text.strip()) > len(texts[i].strip()):
+                texts[i] = ocr_text
+                logger.info(f"OCR fallback used for page {extracted_pages[i]['page_num']}")
 
+        pages = []
+        for extracted, text in zip(extracted_pages, texts):
             pages.append(DocumentPage(
-                page_num=page.number + 1,
+                page_num=extracted["page_num"],
                 content=text,
 {%- if cookiecutter.enable_rag_image_description %}
-                images=images,
+                images=[
+                    DocumentImage(
+                        page_num=extracted["page_num"],
+                        image_bytes=image_bytes,
+                        mime_type=mime_type,
+                    )
+                    for image_bytes, mime_type in extracted["images"]
+                ],
 {%- endif %}
             ))
+        return pages
 
-        doc.close()
-
-        # Enrich metadata
+    async def _pdf_metadata(self, filepath: Path, meta: dict[str, Any], toc: list[Any]) -> DocumentMetadata:
+        """File metadata enriched with the PDF's title, author and TOC."""
         additional: dict[str, Any] = {}
         if meta.get("title"):
             additional["pdf_title"] = meta["title"]
@@ -328,17 +468,89 @@ class PyMuPDFParser(BaseDocumentParser):
         if toc:
             additional["toc"] = [{"level": t[0], "title": t[1], "page": t[2]} for t in toc[:20]]
 
-        doc_meta = self.get_document_metadata(filepath)
+        doc_meta = await asyncio.to_thread(self.get_document_metadata, filepath)
         if additional:
             doc_meta.additional_info = {**(doc_meta.additional_info or {}), **additional}
+        return doc_meta
+
+    async def _parse_pdf_file(self, filepath: Path) -> Document:
+        """Parse PDF with smart extraction pipeline."""
+        path = str(filepath)
+        page_count, meta, toc = await asyncio.to_thread(self._read_outline, path)
+
+        render_short_pages, extract_images = self._extract_options()
+        range_results = await asyncio.gather(*(
+            run_in_process(
+                self._parse_page_range,
+                path, start, stop, self.table_detection, render_short_pages, extract_images,
+            )
+            for start, stop in self._page_ranges(page_count)
+        ))
+        extracted_pages = [extracted for results in range_results for extracted in results]
 
+        # Detect repeated headers/footers across the whole document
+        repeated = self._detect_repeated_content(extracted_pages)
+
+        pages = await self._build_pages(extracted_pages, repeated)
+        doc_meta = await self._pdf_metadata(filepath, meta, toc)
         return Document(pages=pages, metadata=doc_meta)
 
+    async def read_metadata(self, filepath: Path) -> DocumentMetadata:
+        _, meta, toc = await asyncio.to_thread(self._read_outline, str(filepath))
+        return await self._pdf_metadata(filepath, meta, toc)
+
+    def cache_options(self) -> dict[str, Any]:
+        render_short_pages, extract_images = self._extract_options()
+        return {
+            "table_detection": self.table_detection,
+            "images": extract_images,
+            # OCR text comes from the vision model
+            "ocr_model": getattr(self._image_describer, "model_name", "") if render_short_pages else None,
+        }
+
+    async def iter_pages(self, filepath: Path) -> AsyncIterator[DocumentPage]:
+        """Yield pages range by range, parsing at most STREAM_LOOKAHEAD ranges ahead.
+
+        Headers/footers are detected on the first range (up to pages_per_task
+        pages) rather than on the whole document.
+        """
+        if not self.is_extension_allowed(filepath) or filepath.suffix != ".pdf":
+            raise ValueError(f"Extension {filepath.suffix} not supported by PyMuPDFParser")
+        path = str(filepath)
+        page_count, _, _ = await asyncio.to_thread(self._read_outline, path)
+
+        render_short_pages, extract_images = self._extract_options()
+        ranges = iter(self._page_ranges(page_count))
+        pending: deque[asyncio.Future[list[dict[str, Any]]]] = deque()
+
+        def submit_next() -> None:
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(asyncio.ensure_future(run_in_process(
+                    self._parse_page_range,
+                    path, *next_range, self.table_detection, render_short_pages, extract_images,
+                )))
+
+        repeated: set[str] | None = None
+        try:
+            for _ in range(self.STREAM_LOOKAHEAD):
+                submit_next()
+            while pending:
+                extracted_pages = await pending.popleft()
+                submit_next()
+                if repeated is None:
+                    repeated = self._detect_repeated_content(extracted_pages)
+                for page in await self._build_pages(extracted_pages, repeated):
+                    yield page
+        finally:
+            for future in pending:
+                future.cancel()
+
     async def parse(self, filepath: Path) -> Document:
         if not self.is_extension_allowed(filepath):
             raise ValueError(f"Extension {filepath.suffix} not supported by PyMuPDFParser")
         if filepath.suffix == ".pdf":
-            return self._parse_pdf_file(filepath)
+            return await self._parse_pdf_file(filepath)
         raise ValueError(f"Unsupported: {filepath.suffix}")
 
 
@@ -367,6 +579,9 @@ class LlamaParseParser(BaseDocumentParser):
         # Extend allowed extensions with LlamaParse-supported formats
         self.allowed = [ext.value for ext in DocumentExtensions] + list(self.EXTRA_SUPPORTED)
 
+    def cache_options(self) -> dict[str, Any]:
+        return {"tier": self.tier}
+
     async def parse(self, filepath: Path) -> Document:
         """Parse a document using LlamaParse.
 
@@ -470,6 +685,8 @@ class PdfParserFactory:
             return PyMuPDFParser(
                 enable_ocr=settings.enable_ocr if settings else False,
                 image_describer=image_describer,
+                pages_per_task=settings.pdf_pages_per_task if settings else 50,
+                table_detection=settings.pdf_table_detection if settings else "auto",
             )
 
 {%- elif not cookiecutter.use_llamaparse %}
@@ -526,84 +743,70 @@ class PyMuPDFParser(BaseDocumentParser):
 
     Features:
     - Text extraction with layout preservation (blocks)
-    - Table detection → markdown tables
+    - Table detection -> markdown tables
     - Header/footer detection and removal
     - OCR fallback for scanned pages (optional, requires tesseract)
     - Image extraction for LLM-based description
     - Document metadata (author, title, TOC)
-    """
 
-    MIN_TEXT_LENGTH = 50  # below this → likely a scan, try OCR
+    Extraction runs in the shared process pool so it never blocks the event
+    loop. Large PDFs are split into ranges of ``pages_per_task`` pages that are
+    parsed in parallel and merged back in page order. Workers return plain
+    data; OCR and image description calls are awaited in the calling process.
 
-    def __init__(self, enable_ocr: bool = False, image_describer: Any = None):
+    ``iter_pages()`` streams the same pipeline range by range for large files.
+
+    Each page's text blocks are read once and reused for header/footer
+    detection and for the page text. ``table_detection`` controls when
+    ``find_tables()`` runs: "auto" only on pages with ruling lines, "always"
+    on every page, "off" never.
+    """
+
+    MIN_TEXT_LENGTH = 50  # below this -> likely a scan, try OCR
+    STREAM_LOOKAHEAD = 2  # page ranges parsed ahead of the consumer in iter_pages()
+    EDGE_RATIO = 0.15  # blocks in the top/bottom 15% may be headers/footers
+    REPEATED_RATIO = 0.7  # edge text on >70% of pages is a header/footer
+
+    def __init__(
+        self,
+        enable_ocr: bool = False,
+        image_describer: Any = None,
+        pages_per_task: int = 50,
+        table_detection: str = "auto",
+    ):
         self.enable_ocr = enable_ocr
         self._image_describer = image_describer
+        self.pages_per_task = max(1, pages_per_task)
+        self.table_detection = table_detection
 
-    def _detect_repeated_content(self, doc: Any) -> set[str]:
-        """Detect headers/footers — text appearing on >70% of pages."""
-        if len(doc) < 3:
-            return set()
-        text_counts: dict[str, int] = {}
-        for page in doc:
-            for b in page.get_text("blocks"):
-                if b[6] != 0:  # skip image blocks
-                    continue
-                y_ratio = b[1] / page.rect.height if page.rect.height else 0
-                if y_ratio < 0.15 or y_ratio > 0.85:
-                    text = b[4].strip()
-                    if text and len(text) < 200:
-                        text_counts[text] = text_counts.get(text, 0) + 1
-        threshold = len(doc) * 0.7
-        return {t for t, c in text_counts.items() if c >= threshold}
-
-    def _extract_text(self, page: Any, repeated: set[str]) -> str:
-        """Extract text blocks, filtering headers/footers."""
-        texts = []
+    @staticmethod
+    def _read_outline(filepath: str) -> tuple[int, dict[str, Any], list[Any]]:
+        """Read page count, metadata and TOC without touching page content."""
+        doc: Any = pymupdf.open(filepath)  # type: ignore[no-untyped-call]
+        try:
+            return len(doc), doc.metadata or {}, doc.get_toc()
+        finally:
+            doc.close()
+
+    @classmethod
+    def _extract_blocks(cls, page: Any) -> list[tuple[str, bool]]:
+        """Extract text blocks in reading order, flagging header/footer candidates."""
+        height = page.rect.height
+        blocks = []
         for b in page.get_text("blocks"):
             if b[6] != 0:  # skip image blocks
                 continue
             text = b[4].strip()
-            if text and text not in repeated:
-                texts.append(text)
-        return str("\n\n".join(texts))
-
-    def _extract_tables(self, page: Any) -> str:
-        """Extract tables as markdown."""
-        try:
-            tables = page.find_tables()
-            if not tables or not tables.tables:
-                return ""
-            parts = []
-            for table in tables.tables:
-                df = table.to_pandas()
-                if not df.empty:
-                    parts.append(df.to_markdown(index=False))
-            return "\n\n".join(parts)
-        except Exception:
-            return ""
-
-    def _ocr_page(self, page: Any, image_describer: Any = None) -> str:
-        """OCR a scanned page by rendering it as image and sending to LLM vision."""
-        if not image_describer:
-            return ""
-        try:
-            import asyncio
-            pix = page.get_pixmap(dpi=200)
-            image_bytes = pix.tobytes("png")
-            loop = asyncio.new_event_loop()
-            try:
-                return str(loop.run_until_complete(
-                    image_describer.describe(image_bytes, "image/png")
-                ))
-            finally:
-                loop.close()
-        except Exception as e:
-            logger.warning(f"LLM OCR failed for page {page.number + 1}: {e}")
-            return ""
+            if not text:
+                continue
+            y_ratio = b[1] / height if height else 0
+            is_edge = (y_ratio < cls.EDGE_RATIO or y_ratio > 1 - cls.EDGE_RATIO) and len(text) < 200
+            blocks.append((text, is_edge))
+        return blocks
 
-{%- if cookiecutter.enable_rag_image_description %}
-    def _extract_images(self, doc: Any, page: Any) -> list["DocumentImage"]:
-        """Extract images from page for LLM description."""
+    @staticmethod
+    def _extract_images(doc: Any, page: Any) -> list[tuple[bytes, str]]:
+        """Extract raw image bytes and MIME types from a page."""
         images = []
         for img_info in page.get_images(full=True):
             xref = img_info[0]
@@ -612,60 +815,142 @@ class PyMuPDFParser(BaseDocumentParser):
                 if base and base["image"] and len(base["image"]) > 1000:
                     ext = base.get("ext", "png")
                     mime_map = {"png": "image/png", "jpeg": "image/jpeg", "jpg": "image/jpeg"}
-                    images.append(DocumentImage(
-                        page_num=page.number + 1,
-                        image_bytes=base["image"],
-                        mime_type=mime_map.get(ext, f"image/{ext}"),
-                    ))
+                    images.append((base["image"], mime_map.get(ext, f"image/{ext}")))
             except Exception:
                 pass
         return images
-{%- endif %}
 
-    def _parse_pdf_file(self, filepath: Path) -> Document:
-        """Parse PDF with smart extraction pipeline."""
+    @classmethod
+    def _parse_page_range(
+        cls,
+        filepath: str,
+        start: int,
+        stop: int,
+        table_detection: str,
+        render_short_pages: bool,
+        extract_images: bool,
+    ) -> list[dict[str, Any]]:
+        """Extract pages [start, stop) of a PDF. Runs in a worker process.
+
+        Returns plain dicts (picklable) with the page's text blocks, tables
+        as markdown, a PNG rendering of pages too short to be real text (for
+        OCR) and embedded images. Headers/footers are filtered by the caller,
+        which sees every page.
+        """
         doc: Any = pymupdf.open(filepath)  # type: ignore[no-untyped-call]
+        results: list[dict[str, Any]] = []
+        try:
+            for page_index in range(start, stop):
+                page = doc[page_index]
+
+                # 1. Text blocks with layout, read once per page
+                blocks = cls._extract_blocks(page)
+
+                # 2. Tables -> markdown, only where the page layout allows one
+                tables_md = ""
+                if table_detection == "always" or (
+                    table_detection == "auto" and has_ruling_lines(page)
+                ):
+                    tables_md = extract_tables(page)
+
+                # 3. Render scans/empty pages so the caller can OCR them
+                ocr_png = None
+                if render_short_pages:
+                    body_length = sum(len(text) for text, is_edge in blocks if not is_edge) + len(tables_md)
+                    if body_length < cls.MIN_TEXT_LENGTH:
+                        ocr_png = page.get_pixmap(dpi=200).tobytes("png")
+
+                results.append({
+                    "page_num": page_index + 1,
+                    "blocks": blocks,
+                    "tables": tables_md,
+                    "ocr_png": ocr_png,
+                    # 4. Images
+                    "images": cls._extract_images(doc, page) if extract_images else [],
+                })
+        finally:
+            doc.close()
+        return results
+
+    def _page_ranges(self, page_count: int) -> list[tuple[int, int]]:
+        """Split [0, page_count) into consecutive ranges of pages_per_task pages."""
+        return [
+            (start, min(start + self.pages_per_task, page_count))
+            for start in range(0, page_count, self.pages_per_task)
+        ]
+
+    def _detect_repeated_content(self, extracted_pages: list[dict[str, Any]]) -> set[str]:
+        """Detect headers/footers -- edge text appearing on >70% of pages."""
+        if len(extracted_pages) < 3:
+            return set()
+        text_counts: dict[str, int] = {}
+        for extracted in extracted_pages:
+            for text, is_edge in extracted["blocks"]:
+                if is_edge:
+                    text_counts[text] = text_counts.get(text, 0) + 1
+        threshold = len(extracted_pages) * self.REPEATED_RATIO
+        return {t for t, c in text_counts.items() if c >= threshold}
 
-        # Doc-level metadata
-        meta = doc.metadata or {}
-        toc = doc.get_toc()
-
-        # Detect repeated headers/footers
-        repeated = self._detect_repeated_content(doc)
-
-        pages = []
-        for page in doc:
-            # 1. Text with layout (skip image blocks, filter headers/footers)
-            text = self._extract_text(page, repeated)
-
-            # 2. Tables → markdown
-            tables_md = self._extract_tables(page)
-            if tables_md:
-                text = text + "\n\n" + tables_md if text.strip() else tables_md
-
-            # 3. OCR fallback for scans/empty pages
-            if self.enable_ocr and len(text.strip()) < self.MIN_TEXT_LENGTH:
-                ocr_text = self._ocr_page(page, self._image_describer)
-                if len(ocr_text.strip()) > len(text.strip()):
-                    text = ocr_text
-                    logger.info(f"OCR fallback used for page {page.number + 1}")
+    async def _ocr_page(self, image_bytes: bytes, page_num: int) -> str:
+        """OCR a scanned page rendering via LLM vision."""
+        try:
+            return str(await self._image_describer.describe(image_bytes, "image/png"))
+        except Exception as e:
+            logger.warning(f"LLM OCR failed for page {page_num}: {e}")
+            return ""
 
+    def _extract_options(self) -> tuple[bool, bool]:
+        """Return (render_short_pages, extract_images) for the page range workers."""
+        render_short_pages = self.enable_ocr and self._image_describer is not None
 {%- if cookiecutter.enable_rag_image_description %}
-            # 4. Images
-            images = self._extract_images(doc, page)
+        extract_images = self._image_describer is not None
+{%- else %}
+        extract_images = False
 {%- endif %}
+        return render_short_pages, extract_images
+
+    async def _build_pages(self, extracted_pages: list[dict[str, Any]], repeated: set[str]) -> list[DocumentPage]:
+        """Turn extracted page data into DocumentPages (header/footer removal, OCR fallback)."""
+        texts = []
+        for extracted in extracted_pages:
+            text = "\n\n".join(text for text, _ in extracted["blocks"] if text not in repeated)
+            if extracted["tables"]:
+                text = text + "\n\n" + extracted["tables"] if text.strip() else extracted["tables"]
+            texts.append(text)
+
+        # OCR fallback for scans/empty pages, all pages at once (the describer bounds concurrency)
+        ocr_indexes = [
+            i for i, extracted in enumerate(extracted_pages)
+            if extracted["ocr_png"] and len(texts[i].strip()) < self.MIN_TEXT_LENGTH
+        ]
+        ocr_texts = await asyncio.gather(*(
+            self._ocr_page(extracted_pages[i]["ocr_png"], extracted_pages[i]["page_num"]) for i in ocr_indexes
+        ))
+        for i, ocr_text in zip(ocr_indexes, ocr_texts):
+            if len(ocr_text.strip()) > len(texts[i].strip()):
+                texts[i] = ocr_text
+                logger.info(f"OCR fallback used for page {extracted_pages[i]['page_num']}")
 
+        pages = []
+        for extracted, text in zip(extracted_pages, texts):
             pages.append(DocumentPage(
-                page_num=page.number + 1,
+                page_num=extracted["page_num"],
                 content=text,
 {%- if cookiecutter.enable_rag_image_description %}
-                images=images,
+                images=[
+                    DocumentImage(
+                        page_num=extracted["page_num"],
+                        image_bytes=image_bytes,
+                        mime_type=mime_type,
+                    )
+                    for image_bytes, mime_type in extracted["images"]
+                ],
 {%- endif %}
             ))
+        return pages
 
-        doc.close()
-
-        # Enrich metadata
+    async def _pdf_metadata(self, filepath: Path, meta: dict[str, Any], toc: list[Any]) -> DocumentMetadata:
+        """File metadata enriched with the PDF's title, author and TOC."""
         additional: dict[str, Any] = {}
         if meta.get("title"):
             additional["pdf_title"] = meta["title"]
@@ -674,17 +959,89 @@ class PyMuPDFParser(BaseDocumentParser):
         if toc:
             additional["toc"] = [{"level": t[0], "title": t[1], "page": t[2]} for t in toc[:20]]
 
-        doc_meta = self.get_document_metadata(filepath)
+        doc_meta = await asyncio.to_thread(self.get_document_metadata, filepath)
         if additional:
             doc_meta.additional_info = {**(doc_meta.additional_info or {}), **additional}
+        return doc_meta
+
+    async def _parse_pdf_file(self, filepath: Path) -> Document:
+        """Parse PDF with smart extraction pipeline."""
+        path = str(filepath)
+        page_count, meta, toc = await asyncio.to_thread(self._read_outline, path)
+
+        render_short_pages, extract_images = self._extract_options()
+        range_results = await asyncio.gather(*(
+            run_in_process(
+                self._parse_page_range,
+                path, start, stop, self.table_detection, render_short_pages, extract_images,
+            )
+            for start, stop in self._page_ranges(page_count)
+        ))
+        extracted_pages = [extracted for results in range_results for extracted in results]
 
+        # Detect repeated headers/footers across the whole document
+        repeated = self._detect_repeated_content(extracted_pages)
+
+        pages = await self._build_pages(extracted_pages, repeated)
+        doc_meta = await self._pdf_metadata(filepath, meta, toc)
         return Document(pages=pages, metadata=doc_meta)
 
+    async def read_metadata(self, filepath: Path) -> DocumentMetadata:
+        _, meta, toc = await asyncio.to_thread(self._read_outline, str(filepath))
+        return await self._pdf_metadata(filepath, meta, toc)
+
+    def cache_options(self) -> dict[str, Any]:
+        render_short_pages, extract_images = self._extract_options()
+        return {
+            "table_detection": self.table_detection,
+            "images": extract_images,
+            # OCR text comes from the vision model
+            "ocr_model": getattr(self._image_describer, "model_name", "") if render_short_pages else None,
+        }
+
+    async def iter_pages(self, filepath: Path) -> AsyncIterator[DocumentPage]:
+        """Yield pages range by range, parsing at most STREAM_LOOKAHEAD ranges ahead.
+
+        Headers/footers are detected on the first range (up to pages_per_task
+        pages) rather than on the whole document.
+        """
+        if not self.is_extension_allowed(filepath) or filepath.suffix != ".pdf":
+            raise ValueError(f"Extension {filepath.suffix} not supported by PyMuPDFParser")
+        path = str(filepath)
+        page_count, _, _ = await asyncio.to_thread(self._read_outline, path)
+
+        render_short_pages, extract_images = self._extract_options()
+        ranges = iter(self._page_ranges(page_count))
+        pending: deque[asyncio.Future[list[dict[str, Any]]]] = deque()
+
+        def submit_next() -> None:
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(asyncio.ensure_future(run_in_process(
+                    self._parse_page_range,
+                    path, *next_range, self.table_detection, render_short_pages, extract_images,
+                )))
+
+        repeated: set[str] | None = None
+        try:
+            for _ in range(self.STREAM_LOOKAHEAD):
+                submit_next()
+            while pending:
+                extracted_pages = await pending.popleft()
+                submit_next()
+                if repeated is None:
+                    repeated = self._detect_repeated_content(extracted_pages)
+                for page in await self._build_pages(extracted_pages, repeated):
+                    yield page
+        finally:
+            for future in pending:
+                future.cancel()
+
     async def parse(self, filepath: Path) -> Document:
         if not self.is_extension_allowed(filepath):
             raise ValueError(f"Extension {filepath.suffix} not supported by PyMuPDFParser")
         if filepath.suffix == ".pdf":
-            return self._parse_pdf_file(filepath)
+            return await self._parse_pdf_file(filepath)
         raise ValueError(f"Unsupported: {filepath.suffix}")
 {%- else %}
 
@@ -712,6 +1069,9 @@ class LlamaParseParser(BaseDocumentParser):
         # Extend allowed extensions with LlamaParse-supported formats
         self.allowed = [ext.value for ext in DocumentExtensions] + list(self.EXTRA_SUPPORTED)
 
+    def cache_options(self) -> dict[str, Any]:
+        return {"tier": self.tier}
+
     async def parse(self, filepath: Path) -> Document:
         """Parse a document using LlamaParse.
 
@@ -833,9 +1193,13 @@ class DocumentProcessor:
         """
         self.settings = settings
         self.splitter = self._create_splitter(settings)
+        self.parse_cache = ParsedDocumentCache(settings.parse_cache_dir) if settings.parse_cache_dir else None
 
         # Always use Python native parser for plain text
         self.text_parser = TextDocumentParser()
+        {%- if cookiecutter.enable_rag_image_description %}
+        self.image_describer: Any = None
+        {%- endif %}
         {%- if cookiecutter.use_all_pdf_parsers %}
         self.docx_parser = DocxDocumentParser()
         {%- if cookiecutter.enable_rag_image_description %}
@@ -863,9 +1227,15 @@ class DocumentProcessor:
         self.pdf_parser = PyMuPDFParser(
             enable_ocr=settings.enable_ocr,
             image_describer=self.image_describer,
+            pages_per_task=settings.pdf_pages_per_task,
+            table_detection=settings.pdf_table_detection,
         )
         {%- else %}
-        self.pdf_parser = PyMuPDFParser(enable_ocr=False)
+        self.pdf_parser = PyMuPDFParser(
+            enable_ocr=False,
+            pages_per_task=settings.pdf_pages_per_task,
+            table_detection=settings.pdf_table_detection,
+        )
         {%- endif %}
         {%- endif %}
 
@@ -910,32 +1280,53 @@ class DocumentProcessor:
     def _init_image_describer(settings: RAGSettings) -> Any:
         """Initialize the image describer using the configured AI framework."""
         from app.core.config import settings as app_settings
+        from app.rag.image_describer import CachedImageDescriber
 
         model_name = getattr(app_settings, "RAG_IMAGE_DESCRIPTION_MODEL", None) or app_settings.AI_MODEL
 
-{%- if cookiecutter.use_pydantic_ai %}
+{%- if cookiecutter.use_pydantic_ai or cookiecutter.use_pydantic_deep %}
         from app.rag.image_describer import PydanticAIImageDescriber
-        return PydanticAIImageDescriber(model_name=model_name)
+        describer = PydanticAIImageDescriber(model_name=model_name)
 {%- elif cookiecutter.use_langchain or cookiecutter.use_langgraph %}
         from app.rag.image_describer import LangChainImageDescriber
-        return LangChainImageDescriber(model_name=model_name)
+        describer = LangChainImageDescriber(model_name=model_name)
 {%- elif cookiecutter.use_crewai %}
         from app.rag.image_describer import CrewAIImageDescriber
-        return CrewAIImageDescriber(model_name=model_name)
+        describer = CrewAIImageDescriber(model_name=model_name)
 {%- elif cookiecutter.use_deepagents %}
         from app.rag.image_describer import DeepAgentsImageDescriber
-        return DeepAgentsImageDescriber(model_name=model_name)
+        describer = DeepAgentsImageDescriber(model_name=model_name)
 {%- endif %}
+        return CachedImageDescriber(
+            describer,
+            model_name=model_name,
+            concurrency=settings.image_description_concurrency,
+            min_bytes=settings.image_min_bytes,
+            min_entropy=settings.image_min_entropy,
+            max_per_document=settings.image_max_per_document,
+            document_budget_seconds=settings.image_document_budget_seconds,
+            cache_dir=settings.image_cache_dir,
+        )
 
-    async def _describe_images(self, document: Document) -> None:
-        """Generate text descriptions for all images in document pages."""
-        for page in document.pages:
+    def _image_budget(self) -> AbstractContextManager[Any]:
+        """Per-document budget shared by OCR and image description calls."""
+        if self.image_describer is None:
+            return nullcontext()
+        return self.image_describer.document_budget()
+
+    async def _describe_images(self, pages: list[DocumentPage]) -> None:
+        """Generate text descriptions for all images in the given pages, concurrently."""
+        images = [image for page in pages for image in page.images]
+        if not images:
+            return
+        descriptions = await asyncio.gather(*(
+            self.image_describer.describe(image.image_bytes, image.mime_type) for image in images
+        ))
+        for image, description in zip(images, descriptions):
+            image.description = description
+        for page in pages:
             if not page.images:
                 continue
-            for image in page.images:
-                image.description = await self.image_describer.describe(
-                    image.image_bytes, image.mime_type
-                )
             img_descriptions = [
                 f"[Image: {img.description}]"
                 for img in page.images if img.description
@@ -944,70 +1335,166 @@ class DocumentProcessor:
                 page.content = f"{page.content}\n\n{chr(10).join(img_descriptions)}"
 {%- endif %}
 
-    async def process_file(self, filepath: Path) -> Document:
-        """Main entry point: filepath -> Document with chunks.
-
-        Args:
-            filepath: Path to the file to process.
-
-        Returns:
-            Document object with parsed pages and chunked content.
-
-        Raises:
-            ValueError: If the file type is not supported.
-        """
-        # Route to appropriate parser based on file extension
+    def parser_for(self, filepath: Path) -> BaseDocumentParser:
+        """Route a file to the parser for its extension."""
         if filepath.suffix in (".txt", ".md"):
-            document = await self.text_parser.parse(filepath)
+            return self.text_parser
         {%- if cookiecutter.use_all_pdf_parsers %}
         elif filepath.suffix == ".docx":
-            document = await self.docx_parser.parse(filepath)
+            return self.docx_parser
         elif filepath.suffix == ".pdf":
-            document = await self.pdf_parser.parse(filepath)
+            return self.pdf_parser
         {%- elif cookiecutter.use_llamaparse %}
         elif self.llamaparse_parser.is_extension_allowed(filepath):
-            document = await self.llamaparse_parser.parse(filepath)
+            return self.llamaparse_parser
         {%- elif cookiecutter.use_liteparse %}
         elif filepath.suffix == ".docx":
-            document = await self.docx_parser.parse(filepath)
+            return self.docx_parser
         elif filepath.suffix == ".pdf":
-            document = await self.liteparse_parser.parse(filepath)
+            return self.liteparse_parser
         {%- else %}
         elif filepath.suffix == ".docx":
-            document = await self.docx_parser.parse(filepath)
+            return self.docx_parser
         elif filepath.suffix == ".pdf":
-            document = await self.pdf_parser.parse(filepath)
+            return self.pdf_parser
         {%- endif %}
         else:
             raise ValueError(f"Unsupported file type: {filepath.suffix}")
 
+    def split_page(self, page: DocumentPage) -> list[str]:
+        """Split a page's content into chunk texts."""
+        if self.settings.chunking_strategy == "markdown":
+            # MarkdownHeaderTextSplitter returns Document objects
+            return [doc.page_content for doc in self.splitter.split_text(page.content)]
+        return list(self.splitter.split_text(page.content))
+
+    def chunk_page(self, page: DocumentPage, page_index: int) -> list[DocumentPageChunk]:
+        """Split one page into chunks that reference it by index (no copy of the page)."""
+        chunks = self.split_page(page)
 {%- if cookiecutter.enable_rag_image_description %}
-        # Describe images using LLM vision before chunking
-        await self._describe_images(document)
+        image_count = len(page.images)
 {%- endif %}
+        return [
+            DocumentPageChunk(
+                chunk_content=chunk,
+                page_index=page_index,
+                page_num=page.page_num,
+                chunk_num=chunk_num,
+                parent_doc_id=page.parent_doc_id,
+{%- if cookiecutter.enable_rag_image_description %}
+                image_count=image_count,
+{%- endif %}
+            )
+            for chunk_num, chunk in enumerate(chunks)
+        ]
+
+    async def _parse(self, parser: BaseDocumentParser, filepath: Path) -> Document:
+        """Parse a file, reusing the cached pages of an earlier parse of the same content."""
+        if self.parse_cache is None:
+            return await parser.parse(filepath)
+
+        metadata = await asyncio.to_thread(parser.get_document_metadata, filepath)
+        key = self.parse_cache.make_key(metadata.content_hash, type(parser).__name__, parser.cache_options())
+        cached = await self.parse_cache.get(key)
+        if cached is not None:
+            logger.info(f"Parse cache hit for '{filepath.name}' ({len(cached.pages)} pages)")
+            metadata.additional_info = cached.additional_info
+            return Document(pages=cached.pages, metadata=metadata)
+
+        document = await parser.parse(filepath)
+        # Cached before image descriptions are appended to the page content
+        await self.parse_cache.put(
+            key, ParsedDocument(pages=document.pages, additional_info=document.metadata.additional_info)
+        )
+        return document
 
-        pages = document.pages
+    async def process_file(self, filepath: Path) -> Document:
+        """Main entry point: filepath -> Document with chunks.
 
-        chunked_pages: list[DocumentPageChunk] = []
-        is_markdown_splitter = self.settings.chunking_strategy == "markdown"
-        for page in pages:
-            if is_markdown_splitter:
-                # MarkdownHeaderTextSplitter returns Document objects
-                md_docs = self.splitter.split_text(page.content)
-                chunks = [doc.page_content for doc in md_docs]
-            else:
-                chunks = self.splitter.split_text(page.content)
-            for chunk_num, chunk in enumerate(chunks):
-                chunked_pages.append(DocumentPageChunk(
-                    chunk_content=chunk,
-                    chunk_num=chunk_num,
-                    parent_doc_id=document.id,
-                    **page.model_dump(
-                        exclude={"parent_doc_id"}
-                    )))
+        Args:
+            filepath: Path to the file to process.
+
+        Returns:
+            Document object with parsed pages and chunked content.
+
+        Raises:
+            ValueError: If the file type is not supported.
+        """
+        parser = self.parser_for(filepath)
+{%- if cookiecutter.enable_rag_image_description %}
+        with self._image_budget():
+            document = await self._parse(parser, filepath)
+            # Describe images using LLM vision before chunking
+            await self._describe_images(document.pages)
+{%- else %}
+        document = await self._parse(parser, filepath)
+{%- endif %}
 
         # Add chunked pages to original document
-        document.chunked_pages = chunked_pages
+        document.chunked_pages = [
+            chunk for page_index, page in enumerate(document.pages) for chunk in self.chunk_page(page, page_index)
+        ]
+        document.assign_chunk_ids()
         return document
 
+    async def read_metadata(self, filepath: Path) -> DocumentMetadata:
+        """Document metadata for streaming ingestion, without parsing the content."""
+        return await self.parser_for(filepath).read_metadata(filepath)
+
+    async def iter_chunks(self, filepath: Path, window: int) -> AsyncIterator[list[DocumentPageChunk]]:
+        """Streaming counterpart of process_file(): yield chunks in windows of about ``window``.
+
+        Pages are parsed, described and chunked as they arrive and dropped once
+        chunked, so memory depends on the window size rather than the document.
+        Chunks have no parent_doc_id or final chunk_id - the caller assigns them.
+
+        The parse cache is not used: it stores and loads the pages of a
+        document all at once, which is what streaming avoids.
+
+        Raises:
+            ValueError: If the file type is not supported.
+        """
+        parser = self.parser_for(filepath)
+        # Index of the window's first page in the document, for DocumentPageChunk.page_index
+        page_offset = 0
+{%- if cookiecutter.enable_rag_image_description %}
+        with self._image_budget():
+            async for pages in self._page_windows(parser.iter_pages(filepath), window):
+                chunks = await self._chunk_window(pages, page_offset)
+                page_offset += len(pages)
+                for start in range(0, len(chunks), window):
+                    yield chunks[start:start + window]
+{%- else %}
+        async for pages in self._page_windows(parser.iter_pages(filepath), window):
+            chunks = await self._chunk_window(pages, page_offset)
+            page_offset += len(pages)
+            for start in range(0, len(chunks), window):
+                yield chunks[start:start + window]
+{%- endif %}
+
+    async def _page_windows(
+        self, pages: AsyncIterator[DocumentPage], window: int
+    ) -> AsyncIterator[list[DocumentPage]]:
+        """Group streamed pages until they hold ~window chunks of text or window pages."""
+        max_chars = window * self.settings.chunk_size
+        batch: list[DocumentPage] = []
+        chars = 0
+        async for page in pages:
+            batch.append(page)
+            chars += len(page.content)
+            if chars >= max_chars or len(batch) >= window:
+                yield batch
+                batch, chars = [], 0
+        if batch:
+            yield batch
+
+    async def _chunk_window(self, pages: list[DocumentPage], page_offset: int) -> list[DocumentPageChunk]:
+        """Chunk a window of streamed pages."""
+{%- if cookiecutter.enable_rag_image_description %}
+        await self._describe_images(pages)
+{%- endif %}
+        return [
+            chunk for i, page in enumerate(pages) for chunk in self.chunk_page(page, page_offset + i)
+        ]
+
 {%- endif %}
@@ -1,4 +1,5 @@
 {%- if cookiecutter.enable_rag %}
+import math
 from abc import ABC, abstractmethod
 
 {%- if cookiecutter.use_openai_embeddings %}
@@ -17,6 +18,13 @@ from app.rag.config import RAGSettings
 from app.rag.models import Document
 
 
+def truncate_vector(vector: list[float], dim: int) -> list[float]:
+    """Matryoshka truncation: the first ``dim`` dimensions, renormalized."""
+    head = vector[:dim]
+    norm = math.sqrt(sum(x * x for x in head)) or 1.0
+    return [x / norm for x in head]
+
+
 class BaseEmbeddingProvider(ABC):
     """Abstract base class for embedding providers.
 
@@ -35,6 +43,17 @@ class BaseEmbeddingProvider(ABC):
         pass
 
     @abstractmethod
+    def embed_passages(self, texts: list[str]) -> list[list[float]]:
+        """Embed a list of document passages (chunk texts).
+
+        Args:
+            texts: List of chunk texts to embed.
+
+        Returns:
+            List of embedding vectors, one for each input text.
+        """
+        pass
+
     def embed_document(self, document: Document) -> list[list[float]]:
         """Embed all chunks of a document.
 
@@ -44,7 +63,7 @@ class BaseEmbeddingProvider(ABC):
         Returns:
             List of embedding vectors, one for each chunk in the document.
         """
-        pass
+        return self.embed_passages([chunk.chunk_content or "" for chunk in document.chunked_pages or []])
 
     @abstractmethod
     def warmup(self) -> None:
@@ -79,16 +98,15 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
         response = self.client.embeddings.create(model=self.model, input=texts)
         return [data.embedding for data in response.data]
 
-    def embed_document(self, document: Document) -> list[list[float]]:
-        """Embed all chunks of a document using OpenAI.
+    def embed_passages(self, texts: list[str]) -> list[list[float]]:
+        """Embed document passages using OpenAI (same as queries).
 
         Args:
-            document: Document object containing chunked pages.
+            texts: List of chunk texts.
 
         Returns:
             List of embedding vectors for each chunk.
         """
-        texts = [doc.chunk_content if doc.chunk_content else "" for doc in (document.chunked_pages or [])]
         return self.embed_queries(texts)
 
     def warmup(self) -> None:
@@ -126,16 +144,15 @@ class VoyageEmbeddingProvider(BaseEmbeddingProvider):
         """
         return self.client.embed(texts, model=self.model, input_type="query").embeddings
 
-    def embed_document(self, document: Document) -> list[list[float]]:
-        """Embed all chunks of a document using Voyage AI.
+    def embed_passages(self, texts: list[str]) -> list[list[float]]:
+        """Embed document passages using Voyage AI.
 
         Args:
-            document: Document object containing chunked pages.
+            texts: List of chunk texts.
 
         Returns:
             List of embedding vectors for each chunk.
         """
-        texts = [doc.chunk_content if doc.chunk_content else "" for doc in (document.chunked_pages or [])]
         return self.client.embed(texts, model=self.model, input_type="document").embeddings
 
     def warmup(self) -> None:
@@ -170,13 +187,10 @@ class GeminiEmbeddingProvider(BaseEmbeddingProvider):
         )
         return [e.values for e in result.embeddings]
 
-    def embed_document(self, document: Document) -> list[list[float]]:
-        contents = []
-        for chunk in (document.chunked_pages or []):
-            contents.append(chunk.chunk_content if chunk.chunk_content else "")
+    def embed_passages(self, texts: list[str]) -> list[list[float]]:
         result = self.client.models.embed_content(
             model=self.model,
-            contents=contents,
+            contents=texts,
         )
         return [e.values for e in result.embeddings]
 
@@ -224,8 +238,7 @@ class SentenceTransformerEmbeddingProvider(BaseEmbeddingProvider):
             normalize_embeddings=True
             ).tolist()
 
-    def embed_document(self, document: Document) -> list[list[float]]:
-        texts = [doc.chunk_content if doc.chunk_content else "" for doc in (document.chunked_pages or [])]
+    def embed_passages(self, texts: list[str]) -> list[list[float]]:
         return self.embed_queries(texts)
 
     def warmup(self) -> None:
@@ -249,6 +262,7 @@ class EmbeddingService:
         """
         config = settings.embeddings_config
         self.expected_dim = config.dim
+        self.truncate_dim = config.truncate_dim
         {%- if cookiecutter.use_openai_embeddings %}
         self.provider = OpenAIEmbeddingProvider(model=config.model)
         {%- elif cookiecutter.use_voyage_embeddings %}
@@ -269,7 +283,7 @@ class EmbeddingService:
         Returns:
             Embedding vector for the query.
         """
-        result = self.provider.embed_queries([query])[0]
+        result = self._truncated(self.provider.embed_queries([query]))[0]
         if len(result) != self.expected_dim:
             raise ValueError(
                 f"Embedding dimension mismatch: expected {self.expected_dim}, "
@@ -286,7 +300,39 @@ class EmbeddingService:
         Returns:
             List of embedding vectors for each chunk.
         """
-        results = self.provider.embed_document(document)
+        return self._checked(self.provider.embed_document(document))
+
+    def embed_documents(self, documents: list[Document]) -> list[list[float]]:
+        """Embed the chunks of several documents in one provider request.
+
+        Args:
+            documents: Documents containing chunked pages.
+
+        Returns:
+            Embedding vectors for every chunk, in document order.
+        """
+        return self.embed_passages(
+            [chunk.chunk_content or "" for document in documents for chunk in document.chunked_pages or []]
+        )
+
+    def embed_passages(self, texts: list[str]) -> list[list[float]]:
+        """Embed chunk texts (e.g. chunks read back from a vector store to re-embed them).
+
+        Args:
+            texts: List of chunk texts.
+
+        Returns:
+            List of embedding vectors for each text.
+        """
+        return self._checked(self.provider.embed_passages(texts))
+
+    def _truncated(self, results: list[list[float]]) -> list[list[float]]:
+        if not self.truncate_dim:
+            return results
+        return [truncate_vector(vector, self.truncate_dim) for vector in results]
+
+    def _checked(self, results: list[list[float]]) -> list[list[float]]:
+        results = self._truncated(results)
         if results and len(results[0]) != self.expected_dim:
             raise ValueError(
                 f"Embedding dimension mismatch: expected {self.expected_dim}, "
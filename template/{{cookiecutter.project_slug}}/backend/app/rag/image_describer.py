@@ -5,13 +5,33 @@ Uses the configured AI framework (PydanticAI, LangChain, etc.) to describe
 images extracted from documents. Descriptions are appended to page content
 before chunking, making image content searchable via text embeddings.
 
+Documents are described through :class:`CachedImageDescriber`, which runs
+calls concurrently (bounded), describes each distinct image once, skips images
+too small or too uniform to carry information and caps the calls and time spent
+per document.
+
 Configuration:
     RAG_IMAGE_DESCRIPTION_MODEL — LLM model to use (defaults to AI_MODEL from .env)
+    RAG_IMAGE_DESCRIPTION_CONCURRENCY — parallel LLM calls per document
+    RAG_IMAGE_MIN_BYTES / RAG_IMAGE_MIN_ENTROPY — skip thresholds
+    RAG_IMAGE_MAX_PER_DOCUMENT / RAG_IMAGE_DOCUMENT_BUDGET_SECONDS — per-document budget
+    RAG_IMAGE_CACHE_DIR — on-disk description cache (empty = memory only)
 """
 
+import asyncio
 import base64
+import hashlib
 import logging
+import math
+import os
+import time
 from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +55,178 @@ def _b64_encode(image_bytes: bytes) -> str:
     return base64.b64encode(image_bytes).decode("utf-8")
 
 
-{%- if cookiecutter.use_pydantic_ai %}
+def byte_entropy(data: bytes, sample_size: int = 65536) -> float:
+    """Shannon entropy (bits per byte, 0-8) of an evenly spaced sample of ``data``.
+
+    A cheap signal on the encoded image: blank scans, solid fills and spacer
+    images are dominated by a few byte values, real pictures and text are not.
+    """
+    if not data:
+        return 0.0
+    sample = data[:: max(1, len(data) // sample_size)]
+    total = len(sample)
+    return -sum(count / total * math.log2(count / total) for count in Counter(sample).values())
+
+
+@dataclass(slots=True)
+class DescriptionBudget:
+    """Call/time budget and in-flight requests of one document."""
+
+    max_calls: int
+    deadline: float
+    semaphore: asyncio.Semaphore
+    calls: int = 0
+    inflight: dict[str, "asyncio.Task[str]"] = field(default_factory=dict)
+
+    def remaining_seconds(self) -> float | None:
+        return None if self.deadline == math.inf else self.deadline - time.monotonic()
+
+    def try_spend(self) -> bool:
+        """Reserve one LLM call; False once the call or time budget is used up."""
+        if (self.max_calls and self.calls >= self.max_calls) or time.monotonic() >= self.deadline:
+            return False
+        self.calls += 1
+        return True
+
+
+_current_budget: ContextVar[DescriptionBudget | None] = ContextVar("image_description_budget", default=None)
+
+
+class CachedImageDescriber(BaseImageDescriber):
+    """Concurrent, deduplicating, budgeted front end for an image describer.
+
+    - Images below ``min_bytes`` or ``min_entropy`` are skipped.
+    - Descriptions are cached by SHA256 of the image (and model), in memory
+      (LRU) and optionally on disk, so logos and repeated images are described
+      once; identical images within a document share one in-flight call.
+    - Inside :meth:`document_budget`, at most ``concurrency`` calls run at once
+      and at most ``max_per_document`` calls / ``document_budget_seconds`` are
+      spent; images past the budget get an empty description.
+    """
+
+    def __init__(
+        self,
+        describer: BaseImageDescriber,
+        model_name: str = "",
+        concurrency: int = 4,
+        min_bytes: int = 4096,
+        min_entropy: float = 2.0,
+        max_per_document: int = 100,
+        document_budget_seconds: float = 300.0,
+        cache_dir: str = "",
+        cache_size: int = 2048,
+    ):
+        self._describer = describer
+        self.model_name = model_name
+        self.concurrency = max(1, concurrency)
+        self.min_bytes = min_bytes
+        self.min_entropy = min_entropy
+        self.max_per_document = max_per_document
+        self.document_budget_seconds = document_budget_seconds
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_size = cache_size
+        self._memory: OrderedDict[str, str] = OrderedDict()
+
+    def _new_budget(self) -> DescriptionBudget:
+        seconds = self.document_budget_seconds
+        return DescriptionBudget(
+            max_calls=self.max_per_document,
+            deadline=time.monotonic() + seconds if seconds > 0 else math.inf,
+            semaphore=asyncio.Semaphore(self.concurrency),
+        )
+
+    @contextmanager
+    def document_budget(self) -> Iterator[DescriptionBudget]:
+        """Scope a fresh per-document budget over all describe() calls inside it."""
+        budget = self._new_budget()
+        token = _current_budget.set(budget)
+        try:
+            yield budget
+        finally:
+            _current_budget.reset(token)
+            if budget.calls:
+                logger.info(f"Image description used {budget.calls} LLM call(s) for this document")
+
+    def is_worth_describing(self, image_bytes: bytes) -> bool:
+        return len(image_bytes) >= self.min_bytes and byte_entropy(image_bytes) >= self.min_entropy
+
+    def _cache_key(self, image_bytes: bytes) -> str:
+        return hashlib.sha256(self.model_name.encode() + b"\0" + image_bytes).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def _read_disk(self, key: str) -> str | None:
+        try:
+            return self._cache_path(key).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, description: str) -> None:
+        path = self._cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(description, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache image description {key}: {e}")
+
+    async def _cache_get(self, key: str) -> str | None:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if self.cache_dir is None:
+            return None
+        description = await asyncio.to_thread(self._read_disk, key)
+        if description is not None:
+            self._remember(key, description)
+        return description
+
+    def _remember(self, key: str, description: str) -> None:
+        self._memory[key] = description
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.cache_size:
+            self._memory.popitem(last=False)
+
+    async def _call(self, key: str, image_bytes: bytes, mime_type: str, budget: DescriptionBudget) -> str:
+        async with budget.semaphore:
+            remaining = budget.remaining_seconds()
+            if remaining is not None and remaining <= 0:
+                return ""
+            try:
+                description = await asyncio.wait_for(self._describer.describe(image_bytes, mime_type), remaining)
+            except TimeoutError:
+                logger.warning("Image description budget exhausted mid-call")
+                return ""
+        # Describers return "" on failure - don't cache those, they may be transient
+        if description:
+            self._remember(key, description)
+            if self.cache_dir is not None:
+                await asyncio.to_thread(self._write_disk, key, description)
+        return description
+
+    async def describe(self, image_bytes: bytes, mime_type: str = "image/png") -> str:
+        if not self.is_worth_describing(image_bytes):
+            return ""
+        key = self._cache_key(image_bytes)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        budget = _current_budget.get() or self._new_budget()
+        task = budget.inflight.get(key)
+        if task is None:
+            if not budget.try_spend():
+                logger.debug("Image description budget exhausted, skipping image")
+                return ""
+            task = asyncio.ensure_future(self._call(key, image_bytes, mime_type, budget))
+            budget.inflight[key] = task
+        return await asyncio.shield(task)
+
+
+{%- if cookiecutter.use_pydantic_ai or cookiecutter.use_pydantic_deep %}
 
 
 class PydanticAIImageDescriber(BaseImageDescriber):
@@ -1,21 +1,50 @@
 {%- if cookiecutter.enable_rag %}
 from __future__ import annotations
 
+import dataclasses
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing, asynccontextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
 
-from app.rag.models import IngestionResult, IngestionStatus, Document
+from app.rag.models import IngestionResult, IngestionStatus, Document, DocumentMetadata, DocumentPageChunk
 from app.rag.documents import DocumentProcessor
+from app.rag.summary_index import DocumentSummaryIndex
+from app.rag.tenancy import SHARED_TENANT, check_tenant
 from app.rag.vectorstore import BaseVectorStore
+from app.rag.write_buffer import CollectionWriteBuffer
 
 logger = logging.getLogger(__name__)
 
+_current_buffer: ContextVar[CollectionWriteBuffer | None] = ContextVar("ingestion_write_buffer", default=None)
+
 
 class IngestionService:
     """
     Orchestrates the data flow:
     File Path -> Parse/Chunk -> Deduplicate -> Embed/Store -> Query-Ready
+
+    Re-ingesting a known document is incremental: chunk IDs are derived from
+    (document ID, page, content), and the new version takes over the stored
+    document's ID, so only added or changed chunks are embedded and
+    upserted, chunks that disappeared are deleted, and the chunks kept only
+    get their metadata (page_num, chunk_num) rewritten.
+
+    Files of at least ``streaming_min_bytes`` are streamed: pages are parsed
+    and chunked incrementally, and embedded/upserted ``streaming_window``
+    chunks at a time, so peak memory does not grow with the document.
+
+    Inside :meth:`write_buffer`, the chunks of concurrent ingest_file() calls
+    for that collection are embedded and upserted together (see
+    app.rag.write_buffer); each call still returns its own result.
+
+    In collections with a document summary index, each ingested or removed
+    document's summary is updated too (see app.rag.summary_index).
+
+    Documents belong to a tenant (see app.rag.tenancy); deduplication only
+    matches documents of the same tenant.
     """
 
     def __init__(
@@ -23,10 +52,19 @@ class IngestionService:
         processor: DocumentProcessor,
         vector_store: BaseVectorStore,
         on_event: Callable[..., Awaitable[None]] | None = None,
+        streaming_min_bytes: int | None = None,
+        streaming_window: int = 256,
+        write_buffer_max_vectors: int = 512,
+        write_buffer_max_wait_ms: float = 100.0,
     ):
         self.processor = processor
         self.store = vector_store
+        self.summary_index = DocumentSummaryIndex(vector_store)
         self._on_event = on_event
+        self.streaming_min_bytes = streaming_min_bytes
+        self.streaming_window = max(1, streaming_window)
+        self.write_buffer_max_vectors = write_buffer_max_vectors
+        self.write_buffer_max_wait_ms = write_buffer_max_wait_ms
 
     @classmethod
     def from_settings(
@@ -50,7 +88,43 @@ class IngestionService:
         embed_service = EmbeddingService(settings=rag_settings)
         vector_store = VectorStore(settings=rag_settings, embedding_service=embed_service)
         processor = DocumentProcessor(settings=rag_settings)
-        return cls(processor=processor, vector_store=vector_store, on_event=on_event)
+        min_mb = rag_settings.streaming_min_file_mb
+        return cls(
+            processor=processor,
+            vector_store=vector_store,
+            on_event=on_event,
+            streaming_min_bytes=int(min_mb * 1024 * 1024) if min_mb >= 0 else None,
+            streaming_window=rag_settings.streaming_window_chunks,
+            write_buffer_max_vectors=rag_settings.write_buffer_max_vectors,
+            write_buffer_max_wait_ms=rag_settings.write_buffer_max_wait_ms,
+        )
+
+    @asynccontextmanager
+    async def write_buffer(self, collection_name: str) -> AsyncIterator[CollectionWriteBuffer]:
+        """Buffer the vector writes of all ingestions into a collection inside this block.
+
+        Applies to tasks started inside the block too. Everything buffered is
+        written before the block exits.
+        """
+        buffer = self.store.write_buffer(
+            collection_name,
+            max_vectors=self.write_buffer_max_vectors,
+            max_wait_ms=self.write_buffer_max_wait_ms,
+        )
+        token = _current_buffer.set(buffer)
+        try:
+            async with buffer:
+                yield buffer
+        finally:
+            _current_buffer.reset(token)
+
+    async def _insert(self, collection_name: str, document: Document) -> None:
+        """Embed and store a document's chunks, through the active write buffer if any."""
+        buffer = _current_buffer.get()
+        if buffer is not None and buffer.collection_name == collection_name:
+            await buffer.write(document)
+        else:
+            await self.store.insert_document(collection_name=collection_name, document=document)
 
     async def _emit(self, event: str, data: dict[str, object]) -> None:
         """Emit a webhook event if callback is configured."""
@@ -61,14 +135,17 @@ class IngestionService:
                 logger.warning(f"Webhook event dispatch failed: {e}")
 
     async def _find_existing_by_source(
-        self, collection_name: str, source_path: str
+        self, collection_name: str, source_path: str, tenant: str = SHARED_TENANT
     ) -> str | None:
-        """Find an existing document by source_path.
+        """Find an existing document of a tenant by source_path.
 
         Returns the document_id if found, None otherwise.
         """
         try:
-            docs = await self.store.get_documents(collection_name)
+            docs = [
+                doc for doc in await self.store.get_documents(collection_name)
+                if (doc.additional_info or {}).get("tenant", SHARED_TENANT) == tenant
+            ]
             for doc in docs:
                 meta = doc.additional_info or {}
                 if meta.get("source_path") == source_path:
@@ -84,25 +161,64 @@ class IngestionService:
         return None
 
     async def _find_existing_by_hash(
-        self, collection_name: str, content_hash: str
+        self, collection_name: str, content_hash: str, tenant: str = SHARED_TENANT
     ) -> str | None:
-        """Find an existing document by content hash (exact duplicate check)."""
+        """Find an existing document of a tenant by content hash (exact duplicate check)."""
         try:
             docs = await self.store.get_documents(collection_name)
             for doc in docs:
                 meta = doc.additional_info or {}
-                if meta.get("content_hash") == content_hash:
+                if meta.get("content_hash") == content_hash and meta.get("tenant", SHARED_TENANT) == tenant:
                     return doc.document_id
         except Exception:
             pass
         return None
 
+    async def _find_existing(self, collection_name: str, metadata: DocumentMetadata) -> str | None:
+        """Find the stored document a new version replaces: by source_path, then content hash."""
+        existing_id = None
+        if metadata.source_path:
+            existing_id = await self._find_existing_by_source(collection_name, metadata.source_path, metadata.tenant)
+        # If not found by path, check by content hash (exact duplicate)
+        if not existing_id and metadata.content_hash:
+            existing_id = await self._find_existing_by_hash(collection_name, metadata.content_hash, metadata.tenant)
+        return existing_id
+
+    async def _sync_chunks(self, collection_name: str, document: Document, existing_id: str) -> tuple[int, int]:
+        """Diff a re-ingested document against the stored one and apply the changes.
+
+        The document must already carry ``existing_id`` and chunk IDs derived from it.
+
+        Returns:
+            Tuple of (upserted, deleted) chunk counts.
+        """
+        stored_ids = await self.store.get_chunk_ids(collection_name, existing_id)
+        chunks = {chunk.chunk_id: chunk for chunk in document.chunked_pages or []}
+
+        added = [chunk for chunk_id, chunk in chunks.items() if chunk_id not in stored_ids]
+        kept = [chunk for chunk_id, chunk in chunks.items() if chunk_id in stored_ids]
+        removed = [chunk_id for chunk_id in stored_ids if chunk_id not in chunks]
+
+        # Insert before deleting so the document never disappears from search
+        if added:
+            await self._insert(collection_name, document.model_copy(update={"chunked_pages": added}))
+        if kept:
+            # Kept chunks may have moved (chunk_num, page_num): their metadata is rewritten, not re-embedded
+            await self.store.update_chunk_metadata(collection_name, document.model_copy(update={"chunked_pages": kept}))
+        if removed:
+            await self.store.delete_chunks(collection_name, removed)
+        if not added:
+            # Inserting chunks refreshes the document's catalog record (hash, size); nothing was inserted
+            await self.store.update_document_metadata(collection_name, document)
+        return len(added), len(removed)
+
     async def ingest_file(
         self,
         filepath: Path,
         collection_name: str,
         replace: bool = True,
         source_path: str = "",
+        tenant: str = SHARED_TENANT,
     ) -> IngestionResult:
         """Processes a file and pushes it into the vector database.
 
@@ -111,10 +227,16 @@ class IngestionService:
             collection_name: Target collection name.
             replace: If True, replace existing document with same source_path.
             source_path: Override source path (e.g., gdrive://id, s3://bucket/key).
+            tenant: User or project the document belongs to (see app.rag.tenancy).
         """
         try:
+            check_tenant(tenant)
+            if self.streaming_min_bytes is not None and filepath.stat().st_size >= self.streaming_min_bytes:
+                return await self._ingest_streaming(filepath, collection_name, replace, source_path, tenant)
+
             # Processing (Parsing + Chunking)
             document: Document = await self.processor.process_file(filepath)
+            document.metadata.tenant = tenant
 
             # Set source_path override if provided (e.g., from GDrive/S3)
             if source_path:
@@ -122,45 +244,29 @@ class IngestionService:
                 document.metadata.filename = Path(source_path).name
 
             # Deduplication check
-            existing_id = None
-            if replace:
-                # Check by source_path first
-                if document.metadata.source_path:
-                    existing_id = await self._find_existing_by_source(
-                        collection_name, document.metadata.source_path
-                    )
-                # If not found by path, check by content hash (exact duplicate)
-                if not existing_id and document.metadata.content_hash:
-                    existing_id = await self._find_existing_by_hash(
-                        collection_name, document.metadata.content_hash
-                    )
+            existing_id = await self._find_existing(collection_name, document.metadata) if replace else None
 
+            # Chunk IDs derive from the document ID: a new version keeps the stored document's
             if existing_id:
-                # Remove old version before inserting new
-                await self.store.delete_document(collection_name, existing_id)
-                logger.info(f"Replaced existing document {existing_id} for '{filepath.name}'")
+                document.reassign_id(existing_id)
+            document.assign_chunk_ids()
+            upserted = len(document.chunked_pages or [])
+            deleted = 0
 
-            # Storage (Embedding + Insertion)
-            await self.store.insert_document(
-                collection_name=collection_name,
-                document=document,
-            )
-
-            action = "replaced" if existing_id else "ingested"
-
-            await self._emit("rag.document.ingested", {
-                "document_id": document.id,
-                "filename": filepath.name,
-                "collection": collection_name,
-                "action": action,
-                "chunks": len(document.chunked_pages or []),
-                "source_path": document.metadata.source_path,
-            })
+            if existing_id:
+                # Incremental update: embed only changed chunks, drop vanished ones
+                upserted, deleted = await self._sync_chunks(collection_name, document, existing_id)
+                logger.info(
+                    f"Replaced existing document {existing_id} for '{filepath.name}' "
+                    f"({upserted} chunks upserted, {deleted} deleted)"
+                )
+            else:
+                # Storage (Embedding + Insertion)
+                await self._insert(collection_name, document)
 
-            return IngestionResult(
-                status=IngestionStatus.DONE,
-                document_id=document.id,
-                message=f"Successfully {action} '{filepath.name}'",
+            return await self._ingested(
+                filepath, collection_name, document, existing_id,
+                len(document.chunked_pages or []), upserted, deleted,
             )
 
         except Exception as e:
@@ -171,6 +277,141 @@ class IngestionService:
                 message=f"Failed to process {filepath.name}",
             )
 
+    async def _ingest_streaming(
+        self, filepath: Path, collection_name: str, replace: bool, source_path: str, tenant: str
+    ) -> IngestionResult:
+        """Ingest a large file window by window (see class docstring).
+
+        Deduplication and incremental re-ingestion behave as in ingest_file():
+        each window only upserts chunks that are not stored yet, and stored
+        chunks that no window produced are deleted at the end. If the stream
+        fails, the chunks written so far are deleted again (see _rollback_stream).
+        """
+        metadata = await self.processor.read_metadata(filepath)
+        metadata.tenant = tenant
+        if source_path:
+            metadata.source_path = source_path
+            metadata.filename = Path(source_path).name
+
+        existing_id = await self._find_existing(collection_name, metadata) if replace else None
+        document = Document(pages=[], metadata=metadata)
+        stored_ids: set[str] = set()
+        stored_record: dict[str, Any] | None = None
+        if existing_id:
+            document.reassign_id(existing_id)
+            stored_ids = await self.store.get_chunk_ids(collection_name, existing_id)
+            stored_record = (await self.store.get_document_records(collection_name, [existing_id])).get(existing_id)
+
+        seen_ids: set[str] = set()
+        occurrences: dict[tuple[int, int], int] = {}
+        written: list[str] = []
+        # Positions of the stored chunks this version keeps, without their content
+        kept: list[DocumentPageChunk] = []
+        upserted = 0
+        try:
+            async with aclosing(self.processor.iter_chunks(filepath, self.streaming_window)) as windows:
+                async for chunks in windows:
+                    for chunk in chunks:
+                        chunk.parent_doc_id = document.id
+                    document.chunked_pages = chunks
+                    document.assign_chunk_ids(occurrences)
+                    added = [
+                        chunk for chunk in chunks
+                        if chunk.chunk_id not in stored_ids and chunk.chunk_id not in seen_ids
+                    ]
+                    kept.extend(
+                        dataclasses.replace(chunk, chunk_content="") for chunk in chunks
+                        if chunk.chunk_id in stored_ids and chunk.chunk_id not in seen_ids
+                    )
+                    seen_ids.update(chunk.chunk_id for chunk in chunks)
+                    if added:
+                        written.extend(chunk.chunk_id for chunk in added)
+                        await self._insert(collection_name, document.model_copy(update={"chunked_pages": added}))
+                        upserted += len(added)
+            document.chunked_pages = None
+            if not seen_ids:
+                raise ValueError("Document has no chunked pages.")
+        except Exception:
+            await self._rollback_stream(collection_name, document.id, existing_id, written, stored_record)
+            raise
+
+        deleted = 0
+        if existing_id:
+            removed = [chunk_id for chunk_id in stored_ids if chunk_id not in seen_ids]
+            if kept:
+                # Rewritten once the stream succeeded: a failed run leaves the stored version as it was
+                await self.store.update_chunk_metadata(
+                    collection_name, document.model_copy(update={"chunked_pages": kept})
+                )
+            if removed:
+                await self.store.delete_chunks(collection_name, removed)
+            deleted = len(removed)
+            if not upserted:
+                # Inserting chunks refreshes the document's catalog record (hash, size); nothing was inserted
+                await self.store.update_document_metadata(collection_name, document)
+        logger.info(f"Streamed '{filepath.name}' in windows of {self.streaming_window} chunks")
+
+        return await self._ingested(
+            filepath, collection_name, document, existing_id, len(seen_ids), upserted, deleted,
+        )
+
+    async def _rollback_stream(
+        self,
+        collection_name: str,
+        document_id: str,
+        existing_id: str | None,
+        written: list[str],
+        stored_record: dict[str, Any] | None,
+    ) -> None:
+        """Undo the windows of a failed streaming ingestion, so a half-ingested file is never searchable.
+
+        A new document is deleted entirely. A re-ingested one loses only the
+        chunks this run added and gets its previous catalog record back, so it
+        keeps serving its last successful version.
+        """
+        try:
+            if existing_id is None:
+                if written:
+                    await self.store.delete_document(collection_name, document_id)
+                return
+            if written:
+                await self.store.delete_chunks(collection_name, written)
+            if stored_record is not None:
+                await self.store.upsert_document_records(collection_name, {existing_id: stored_record})
+        except Exception as e:
+            logger.warning(f"Could not roll back partial ingestion of document {document_id}: {e}")
+
+    async def _ingested(
+        self,
+        filepath: Path,
+        collection_name: str,
+        document: Document,
+        existing_id: str | None,
+        chunks: int,
+        upserted: int,
+        deleted: int,
+    ) -> IngestionResult:
+        """Update the document's summary, emit the ingestion webhook and build the success result."""
+        action = "replaced" if existing_id else "ingested"
+        await self.summary_index.document_changed(collection_name, document.id)
+
+        await self._emit("rag.document.ingested", {
+            "document_id": document.id,
+            "filename": filepath.name,
+            "collection": collection_name,
+            "action": action,
+            "chunks": chunks,
+            "chunks_upserted": upserted,
+            "chunks_deleted": deleted,
+            "source_path": document.metadata.source_path,
+        })
+
+        return IngestionResult(
+            status=IngestionStatus.DONE,
+            document_id=document.id,
+            message=f"Successfully {action} '{filepath.name}'",
+        )
+
     async def find_existing(self, collection_name: str, source_path: str) -> str | None:
         """Check if a document with this source_path already exists. Returns document_id or None."""
         return await self._find_existing_by_source(collection_name, source_path)
@@ -189,6 +430,26 @@ class IngestionService:
             pass
         return None
 
+    async def get_source_index(
+        self, collection_name: str, tenant: str = SHARED_TENANT
+    ) -> dict[str, tuple[str, str | None]]:
+        """Map source_path -> (document_id, content_hash) for the documents of a tenant.
+
+        One listing for bulk callers, instead of a scan per file via
+        find_existing() / get_existing_hash(). Like them, it only matches
+        documents of the same tenant: a sync must not take over another
+        tenant's upload of the same path.
+        """
+        index: dict[str, tuple[str, str | None]] = {}
+        try:
+            for doc in await self.store.get_documents(collection_name):
+                meta = doc.additional_info or {}
+                if meta.get("source_path") and meta.get("tenant", SHARED_TENANT) == tenant:
+                    index[meta["source_path"]] = (doc.document_id, meta.get("content_hash"))
+        except Exception:
+            pass
+        return index
+
     async def remove_document(self, collection_name: str, document_id: str) -> bool:
         """Wipes all traces of a document from the vector store."""
         try:
@@ -196,6 +457,7 @@ class IngestionService:
                 collection_name=collection_name,
                 document_id=document_id,
             )
+            await self.summary_index.document_removed(collection_name, document_id)
             await self._emit("rag.document.deleted", {
                 "document_id": document_id,
                 "collection": collection_name,
@@ -3,17 +3,39 @@
 
 Structures used to interface with the RAG feature."""
 
+import hashlib
 import uuid
-from pydantic import BaseModel, Field, model_validator, computed_field
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field, model_validator, computed_field
 from typing import Optional, Any
 
 from enum import StrEnum
 
+from app.rag.tenancy import SHARED_TENANT
+
+# Namespace for deterministic chunk IDs (uuid5 keeps them valid IDs for every vector store)
+CHUNK_ID_NAMESPACE = uuid.UUID("5b0e6f0a-3f0d-4c2b-9f7e-2d1a8c4e6b13")
+
+
+def make_chunk_id(document_id: str, page_num: int, content: str, occurrence: int = 0) -> str:
+    """Derive a stable chunk ID from its document, page and content.
+
+    A chunk keeps its ID across re-ingestion of its document for as long as
+    its text is unchanged, so only added or edited chunks have to be
+    re-embedded. Chunks of different documents never share an ID, even for
+    the same file; ``occurrence`` tells identical chunks of one page apart.
+    """
+    content_hash = hashlib.sha256(content.encode()).hexdigest()
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{document_id}:{page_num}:{occurrence}:{content_hash}"))
+
 
 {%- if cookiecutter.enable_rag_image_description %}
 class DocumentImage(BaseModel):
     """An image extracted from a document page."""
 
+    # Image bytes round-trip through JSON (parse cache) as base64
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
     image_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     page_num: int = 0
     image_bytes: bytes = b""
@@ -34,11 +56,40 @@ class DocumentPage(BaseModel):
 {%- endif %}
     
     
-class DocumentPageChunk(DocumentPage):
-    """Content of chunked document's page."""
+@dataclass(slots=True)
+class DocumentPageChunk:
+    """A chunk of a document page.
+
+    Internal to ingestion, so a plain slotted dataclass rather than a pydantic
+    model: the chunk references its page by ``page_index`` into
+    ``Document.pages`` instead of carrying a copy of the page's content
+    (and images). ``chunk_id`` is assigned by ``Document.assign_chunk_ids()``.
+    """
+
     chunk_content: str
-    chunk_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    page_index: int
+    page_num: int
     chunk_num: int = 0
+    chunk_id: str = ""
+    parent_doc_id: Optional[str] = None
+{%- if cookiecutter.enable_rag_image_description %}
+    image_count: int = 0
+{%- endif %}
+
+
+@dataclass(slots=True)
+class StoredChunk:
+    """A chunk as a vector store holds it.
+
+    What upserts write, and what re-embedding and snapshots read back from a
+    collection. ``vector`` is only filled in when it is read back on request.
+    """
+
+    chunk_id: str
+    parent_doc_id: Optional[str]
+    content: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+    vector: Optional[list[float]] = None
 
 
 class DocumentMetadata(BaseModel):
@@ -49,6 +100,7 @@ class DocumentMetadata(BaseModel):
     filetype: str
     source_path: str = ""  # original path: local path, s3://bucket/key, gdrive://file_id
     content_hash: str = ""  # SHA256 hash for deduplication
+    tenant: str = SHARED_TENANT  # user or project the document belongs to (app.rag.tenancy)
     additional_info: Optional[dict[str, Any]] = None
 
 
@@ -69,16 +121,72 @@ class Document(BaseModel):
     def connect_pages(self) -> "Document":
         for page in self.pages:
             page.parent_doc_id = self.id
-        return self     
+        return self
+
+    def page_of(self, chunk: DocumentPageChunk) -> DocumentPage:
+        """The page a chunk was split from (only while pages are held in memory)."""
+        return self.pages[chunk.page_index]
+
+    def assign_chunk_ids(self, occurrences: dict[tuple[int, int], int] | None = None) -> None:
+        """Derive deterministic chunk IDs from the document ID, page and content.
+
+        Call it again after :meth:`reassign_id`. ``occurrences`` counts the
+        chunks seen per (page, content); pass the same dict for every window
+        of a streamed document.
+        """
+        occurrences = {} if occurrences is None else occurrences
+        for chunk in self.chunked_pages or []:
+            key = (chunk.page_num, hash(chunk.chunk_content))
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            chunk.chunk_id = make_chunk_id(self.id, chunk.page_num, chunk.chunk_content, occurrence)
+
+    def reassign_id(self, document_id: str) -> None:
+        """Take over an existing document ID (incremental re-ingestion)."""
+        self.id = document_id
+        for page in [*self.pages, *(self.chunked_pages or [])]:
+            page.parent_doc_id = document_id
          
     
-class SearchResult(BaseModel):
-    """A schema of vector store query output."""
-    
+def result_key(
+    content: str, metadata: dict[str, Any], parent_doc_id: str | None, chunk_id: str | None = None
+) -> str:
+    """Identity of a retrieved chunk, used to fuse and deduplicate results.
+
+    The stored chunk ID is preferred: it is stable across re-ingestion, while
+    ``chunk_num`` of a chunk kept unchanged can collide with a newer chunk's.
+    """
+    if chunk_id:
+        return chunk_id
+    if parent_doc_id:
+        return f"{parent_doc_id}:{metadata.get('chunk_num', '')}"
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """A vector store hit, as passed between retrieval pipeline stages.
+
+    A slotted dataclass rather than a pydantic model: each query creates,
+    rescores and deduplicates results several times, and validation buys
+    nothing inside the pipeline. ``key`` is computed once, on creation.
+    Results become ``RAGSearchResult`` only at the API boundary.
+    """
+
     content: str
     score: float
-    metadata: dict[str, Any] = Field(default_factory=dict)
-    parent_doc_id: Optional[str] = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+    parent_doc_id: str | None = None
+    chunk_id: str | None = None
+    key: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.key:
+            self.key = result_key(self.content, self.metadata, self.parent_doc_id, self.chunk_id)
+
+    def rescored(self, score: float) -> "SearchResult":
+        """Copy of this result with a new score (content and key are shared)."""
+        return SearchResult(self.content, score, self.metadata, self.parent_doc_id, self.chunk_id, self.key)
 
 
 class IngestionStatus(StrEnum):
@@ -0,0 +1,85 @@
+{%- if cookiecutter.enable_rag %}
+"""Content-addressed cache of parsed documents.
+
+Parsing is the slowest step of ingestion (and, with LlamaParse, a billed API
+call), yet its output depends only on the file's bytes and the parser's
+configuration. Parsed pages are cached under
+sha256(content_hash, parser, parser options), so re-chunking after a
+chunk_size / chunking_strategy change, retrying a failed ingestion or
+re-ingesting an unchanged file skips the parser entirely.
+
+Entries are zlib-compressed JSON files under RAG_PARSE_CACHE_DIR (empty disables
+the cache). The directory can be deleted at any time. Bump CACHE_VERSION when a
+parser's output changes, so stale entries are no longer hit.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import zlib
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.rag.models import DocumentPage
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+class ParsedDocument(BaseModel):
+    """What a parser produced for a file, apart from the per-file metadata."""
+
+    pages: list[DocumentPage]
+    additional_info: dict[str, Any] | None = None
+
+
+class ParsedDocumentCache:
+    """On-disk {key: ParsedDocument} store, sharded by key prefix."""
+
+    def __init__(self, cache_dir: str | Path, compression_level: int = 6):
+        self.cache_dir = Path(cache_dir)
+        self.compression_level = compression_level
+
+    @staticmethod
+    def make_key(content_hash: str, parser: str, options: dict[str, Any]) -> str:
+        """Cache key of a file's parse: its content hash, the parser and the parser's options."""
+        raw = json.dumps([CACHE_VERSION, content_hash, parser, options], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json.z"
+
+    def _read(self, key: str) -> ParsedDocument | None:
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            return None
+        try:
+            return ParsedDocument.model_validate_json(zlib.decompress(data))
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {key}: {e}")
+            return None
+
+    def _write(self, key: str, parsed: ParsedDocument) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(zlib.compress(parsed.model_dump_json().encode(), self.compression_level))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache parsed document {key}: {e}")
+
+    async def get(self, key: str) -> ParsedDocument | None:
+        """Return the cached parse for a key, or None on a miss."""
+        return await asyncio.to_thread(self._read, key)
+
+    async def put(self, key: str, parsed: ParsedDocument) -> None:
+        """Store a parse (serialized before returning, so callers may mutate the pages after)."""
+        await asyncio.to_thread(self._write, key, parsed)
+{%- endif %}
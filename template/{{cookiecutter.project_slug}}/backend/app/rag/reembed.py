@@ -0,0 +1,270 @@
+{%- if cookiecutter.enable_rag %}
+"""Re-embedding a collection with another embedding model, without downtime.
+
+Changing EMBEDDING_MODEL (or its dimension) invalidates every stored vector.
+Rather than dropping the collection and ingesting all files again,
+:class:`CollectionReembedder` rebuilds it next to the live one:
+
+1. A shadow collection is created with the new model's dimension.
+2. Chunks are read back from the live collection — content, metadata and IDs
+   are all stored there, so nothing is downloaded or parsed again — embedded
+   with the new model and written to the shadow, at most
+   ``max_chunks_per_minute`` to stay under the provider's rate limit.
+3. Catch-up rounds apply what ingestion changed in the live collection in the
+   meantime: chunks are compared by a fingerprint of their content and
+   metadata, and only new or changed ones are embedded again.
+4. ``swap_collection()`` puts the shadow in place of the live collection
+   (an alias switch on Milvus and Qdrant, a table rename in one transaction
+   on pgvector, two renames on Chroma). The new model, recorded for the
+   shadow when it was created, becomes the collection's: searches and
+   ingestion embed with it from then on, without changing EMBEDDING_MODEL
+   or restarting, while other collections keep their own model.
+
+Searches read the live collection until the swap. Cancelling or failing drops
+the shadow and leaves the live collection as it was. A document summary index
+(see app.rag.summary_index) is rebuilt from the new vectors after the swap.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from app.rag.config import EMBEDDING_DIMENSIONS, MATRYOSHKA_MODELS, EmbeddingsConfig, RAGSettings
+from app.rag.models import StoredChunk
+from app.rag.summary_index import DocumentSummaryIndex
+from app.rag.vectorstore import BaseVectorStore
+
+logger = logging.getLogger(__name__)
+
+EMBED_RETRIES = 5  # Attempts per batch; rate limit errors back off 1, 2, 4, 8s
+PROGRESS_INTERVAL_SECONDS = 5.0
+
+
+class ReembedCancelled(Exception):
+    """The re-embed was cancelled; its shadow collection has been dropped."""
+
+
+@dataclass(slots=True)
+class ReembedProgress:
+    """Progress of a re-embed, in chunks."""
+
+    total: int = 0  # Chunks in the live collection when the copy started
+    embedded: int = 0  # Chunks embedded with the new model (catch-up rounds included)
+    deleted: int = 0  # Chunks that left the live collection during the copy
+    rounds: int = 0
+
+
+def reembed_settings(settings: RAGSettings, model: str, dim: int | None = None) -> RAGSettings:
+    """RAG settings with another embedding model (dim derived from the model unless given).
+
+    Matryoshka truncation carries over when the new model supports it (at that size).
+    """
+    truncate_dim = settings.embeddings_config.truncate_dim
+    if model not in MATRYOSHKA_MODELS or truncate_dim >= EMBEDDING_DIMENSIONS.get(model, 0):
+        truncate_dim = 0
+    if dim is None:
+        config = EmbeddingsConfig(model=model, truncate_dim=truncate_dim)
+    else:
+        config = EmbeddingsConfig(model=model, dim=dim)
+    return settings.model_copy(update={"embeddings_config": config})
+
+
+def _fingerprint(chunk: StoredChunk) -> str:
+    payload = json.dumps([chunk.parent_doc_id, chunk.content, chunk.metadata], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
+
+
+class CollectionReembedder:
+    """Rebuilds a collection with ``target``'s embedding model and swaps it in.
+
+    ``source`` reads the live collection; ``target`` is a store configured with
+    the new model, which creates, fills and swaps in the shadow collection.
+    """
+
+    def __init__(
+        self,
+        source: BaseVectorStore,
+        target: BaseVectorStore,
+        collection_name: str,
+        *,
+        batch_size: int = 256,
+        max_chunks_per_minute: int = 0,
+        catch_up_rounds: int = 3,
+        is_cancelled: Callable[[], Awaitable[bool]] | None = None,
+        pause: Callable[[], Awaitable[None]] | None = None,
+        on_progress: Callable[[ReembedProgress], Awaitable[None]] | None = None,
+    ):
+        self.source = source
+        self.target = target
+        self.collection_name = collection_name
+        self.batch_size = max(1, batch_size)
+        self.max_chunks_per_minute = max_chunks_per_minute
+        self.catch_up_rounds = max(0, catch_up_rounds)
+        self.is_cancelled = is_cancelled
+        self.pause = pause
+        self.on_progress = on_progress
+        self.progress = ReembedProgress()
+        self._next_slot = 0.0
+        self._last_report = float("-inf")
+
+    async def run(self) -> ReembedProgress:
+        """Copy, catch up and swap. Raises ReembedCancelled if cancelled."""
+        info = await self.source.get_collection_info(self.collection_name)
+        self.progress.total = info.total_vectors
+        shadow_name = await self.target.create_shadow_collection(self.collection_name)
+        logger.info(f"Re-embedding {self.collection_name} ({self.progress.total} chunks) into {shadow_name}")
+        try:
+            # Chunk ID -> fingerprint of what the shadow holds
+            copied: dict[str, str] = {}
+            for _ in range(1 + self.catch_up_rounds):
+                changed = await self._copy_round(shadow_name, copied)
+                self.progress.rounds += 1
+                if not changed:
+                    break
+            else:
+                logger.warning(
+                    f"{self.collection_name} still changed after {self.catch_up_rounds} catch-up rounds; "
+                    "swapping anyway; writes made during the last round may be missing"
+                )
+            await self.target.swap_collection(self.collection_name, shadow_name)
+        except BaseException:
+            await self._drop(shadow_name)
+            raise
+        await self._rebuild_summary_index()
+        await self._report(force=True)
+        logger.info(
+            f"Re-embedded {self.collection_name}: {self.progress.embedded} chunks embedded "
+            f"in {self.progress.rounds} rounds, swapped in {shadow_name}"
+        )
+        return self.progress
+
+    async def _rebuild_summary_index(self) -> None:
+        """Rebuild the collection's summary index, if it has one (its vectors use the old model)."""
+        summary_index = DocumentSummaryIndex(self.target)
+        if not await summary_index.is_enabled(self.collection_name):
+            return
+        try:
+            await summary_index.build(self.collection_name)
+        except Exception as e:
+            logger.warning(f"Failed to rebuild the summary index of {self.collection_name}: {e}")
+
+    async def _copy_round(self, shadow_name: str, copied: dict[str, str]) -> int:
+        """Bring the shadow up to date with the live collection; returns the chunks changed."""
+        seen: set[str] = set()
+        changed = 0
+        async for batch in self.source.scroll_chunks(self.collection_name, self.batch_size):
+            if self.is_cancelled is not None and await self.is_cancelled():
+                raise ReembedCancelled(f"Re-embed of {self.collection_name} cancelled")
+            pending: list[tuple[StoredChunk, str]] = []
+            for chunk in batch:
+                seen.add(chunk.chunk_id)
+                fingerprint = _fingerprint(chunk)
+                if copied.get(chunk.chunk_id) != fingerprint:
+                    pending.append((chunk, fingerprint))
+            if not pending:
+                continue
+            if self.pause is not None:
+                await self.pause()
+            chunks = [chunk for chunk, _ in pending]
+            vectors = await self._embed([chunk.content for chunk in chunks])
+            await self.target.upsert_chunks(shadow_name, chunks, vectors)
+            copied.update((chunk.chunk_id, fingerprint) for chunk, fingerprint in pending)
+            changed += len(pending)
+            self.progress.embedded += len(pending)
+            await self._report()
+
+        removed = [chunk_id for chunk_id in copied if chunk_id not in seen]
+        if removed:
+            await self.target.delete_chunks(shadow_name, removed)
+            for chunk_id in removed:
+                del copied[chunk_id]
+            changed += len(removed)
+            self.progress.deleted += len(removed)
+        return changed
+
+    async def _embed(self, texts: list[str]) -> list[list[float]]:
+        await self._throttle(len(texts))
+        attempt = 0
+        while True:
+            try:
+                return await asyncio.to_thread(self.target.embedder.embed_passages, texts)
+            except ValueError:
+                # Dimension mismatch: retrying will not help
+                raise
+            except Exception as e:
+                attempt += 1
+                if attempt >= EMBED_RETRIES:
+                    raise
+                delay = 2 ** (attempt - 1)
+                logger.warning(f"Embedding a re-embed batch failed ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+
+    async def _throttle(self, count: int) -> None:
+        """Space batches out so that at most max_chunks_per_minute are embedded."""
+        if self.max_chunks_per_minute <= 0:
+            return
+        now = time.monotonic()
+        if self._next_slot > now:
+            await asyncio.sleep(self._next_slot - now)
+        self._next_slot = max(now, self._next_slot) + count * 60 / self.max_chunks_per_minute
+
+    async def _report(self, force: bool = False) -> None:
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_report < PROGRESS_INTERVAL_SECONDS:
+            return
+        self._last_report = now
+        try:
+            await self.on_progress(self.progress)
+        except Exception as e:
+            logger.warning(f"Failed to report re-embed progress: {e}")
+
+    async def _drop(self, shadow_name: str) -> None:
+        try:
+            await self.target.delete_collection(shadow_name)
+        except Exception as e:
+            logger.warning(f"Failed to drop shadow collection {shadow_name}: {e}")
+
+
+def build_reembedder(
+    collection_name: str,
+    model: str,
+    dim: int | None = None,
+    *,
+    is_cancelled: Callable[[], Awaitable[bool]] | None = None,
+    pause: Callable[[], Awaitable[None]] | None = None,
+    on_progress: Callable[[ReembedProgress], Awaitable[None]] | None = None,
+) -> CollectionReembedder:
+    """A CollectionReembedder from the application's settings, re-embedding with ``model``."""
+    from app.core.config import settings
+    from app.rag.embeddings import EmbeddingService
+{%- if cookiecutter.use_milvus %}
+    from app.rag.vectorstore import MilvusVectorStore as VectorStore
+{%- elif cookiecutter.use_qdrant %}
+    from app.rag.vectorstore import QdrantVectorStore as VectorStore
+{%- elif cookiecutter.use_chromadb %}
+    from app.rag.vectorstore import ChromaVectorStore as VectorStore
+{%- elif cookiecutter.use_pgvector %}
+    from app.rag.vectorstore import PgVectorStore as VectorStore
+{%- endif %}
+
+    source_settings = settings.rag
+    target_settings = reembed_settings(source_settings, model, dim)
+    source = VectorStore(settings=source_settings, embedding_service=EmbeddingService(settings=source_settings))
+    target = VectorStore(settings=target_settings, embedding_service=EmbeddingService(settings=target_settings))
+    return CollectionReembedder(
+        source,
+        target,
+        collection_name,
+        batch_size=settings.RAG_REEMBED_BATCH_SIZE,
+        max_chunks_per_minute=settings.RAG_REEMBED_MAX_CHUNKS_PER_MINUTE,
+        is_cancelled=is_cancelled,
+        pause=pause,
+        on_progress=on_progress,
+    )
+{%- endif %}
@@ -148,14 +148,7 @@ class CohereReranker(BaseReranker):
                 original_idx = item.index
                 original_result = results[original_idx]
                 # Create new SearchResult with updated score (Cohere provides relevance 0-1)
-                reranked.append(
-                    SearchResult(
-                        content=original_result.content,
-                        score=item.relevance_score,
-                        metadata=original_result.metadata,
-                        parent_doc_id=original_result.parent_doc_id,
-                    )
-                )
+                reranked.append(original_result.rescored(item.relevance_score))
             
             logger.debug(f"[RERANKER] Cohere reranked results: {len(reranked)} items")
             return reranked
@@ -275,14 +268,7 @@ class CrossEncoderReranker(BaseReranker):
                     f"[RERANKER] CrossEncoder score for doc {i}: {score:.4f} "
                     f"(original: {result.score:.4f}) - '{result.content[:30]}...'"
                 )
-                scored_results.append(
-                    SearchResult(
-                        content=result.content,
-                        score=float(score),  # Use cross-encoder score
-                        metadata=result.metadata,
-                        parent_doc_id=result.parent_doc_id,
-                    )
-                )
+                scored_results.append(result.rescored(float(score)))  # Use cross-encoder score
             
             # Sort by cross-encoder score (descending)
             scored_results.sort(key=lambda x: x.score, reverse=True)
@@ -1,12 +1,12 @@
 {%- if cookiecutter.enable_rag %}
 from __future__ import annotations
 
-import hashlib
 import logging
 import time
 from abc import ABC, abstractmethod
 
 from app.rag.models import SearchResult
+from app.rag.summary_index import DocumentSummaryIndex
 from app.rag.vectorstore import BaseVectorStore
 from app.rag.config import RAGSettings
 
@@ -34,7 +34,8 @@ class BaseRetrievalService(ABC):
         collection_name: str,
         limit: int = 5,
         min_score: float = 0.0,
-        filter: str = ""
+        filter: str = "",
+        tenants: list[str] | None = None,
     ) -> list[SearchResult]:
         """Execute the retrieval pipeline to find relevant chunks.
 
@@ -44,6 +45,7 @@ class BaseRetrievalService(ABC):
             limit: Maximum number of results to return.
             min_score: Minimum similarity score threshold (0.0 to 1.0).
             filter: Optional filter expression for the search.
+            tenants: Only search the documents of these tenants (see app.rag.tenancy).
 
         Returns:
             List of SearchResult objects sorted by relevance.
@@ -79,6 +81,8 @@ class RetrievalService(BaseRetrievalService):
 
     Handles query execution against any vector store backend, including
     vector search, hybrid BM25 fusion, score filtering, and reranking.
+    Collections with a document summary index are searched in two levels
+    (see app.rag.summary_index).
     """
 
     def __init__(
@@ -100,6 +104,7 @@ class RetrievalService(BaseRetrievalService):
         self._reranker_enabled = rerank_service is not None and rerank_service.is_enabled
         self._hybrid_enabled = settings.enable_hybrid_search
         self._bm25_index: dict[str, object] = {}  # collection_name -> BM25 index
+        self.summary_index = DocumentSummaryIndex(vector_store)
 
     @staticmethod
     def _rrf_fuse(
@@ -112,29 +117,69 @@ class RetrievalService(BaseRetrievalService):
         result_map: dict[str, SearchResult] = {}
 
         for rank, r in enumerate(vector_results):
-            key = f"{r.parent_doc_id}:{r.metadata.get('chunk_num', '')}" if r.parent_doc_id else hashlib.md5(r.content.encode()).hexdigest()
-            scores[key] = scores.get(key, 0) + 1.0 / (k + rank + 1)
-            result_map[key] = r
+            scores[r.key] = scores.get(r.key, 0) + 1.0 / (k + rank + 1)
+            result_map[r.key] = r
 
         for rank, r in enumerate(bm25_results):
-            key = f"{r.parent_doc_id}:{r.metadata.get('chunk_num', '')}" if r.parent_doc_id else hashlib.md5(r.content.encode()).hexdigest()
-            scores[key] = scores.get(key, 0) + 1.0 / (k + rank + 1)
-            if key not in result_map:
-                result_map[key] = r
-
-        sorted_keys = sorted(scores, key=lambda x: scores[x], reverse=True)
-        return [
-            SearchResult(
-                content=result_map[key].content,
-                score=scores[key],
-                metadata=result_map[key].metadata,
-                parent_doc_id=result_map[key].parent_doc_id,
+            scores[r.key] = scores.get(r.key, 0) + 1.0 / (k + rank + 1)
+            result_map.setdefault(r.key, r)
+
+        sorted_keys = sorted(scores, key=scores.__getitem__, reverse=True)
+        return [result_map[key].rescored(scores[key]) for key in sorted_keys]
+
+    @staticmethod
+    def _dedup(results: list[SearchResult]) -> list[SearchResult]:
+        """Keep the first (highest-ranked) result per unique chunk."""
+        seen_keys: set[str] = set()
+        deduped: list[SearchResult] = []
+        for r in results:
+            if r.key not in seen_keys:
+                seen_keys.add(r.key)
+                deduped.append(r)
+        return deduped
+
+    async def _vector_search(
+        self, query: str, collection_name: str, filter: str, limit: int, tenants: list[str] | None = None
+    ) -> list[SearchResult]:
+        """Flat vector search, or two-level if the collection has a summary index.
+
+        Two-level: the query vector selects the top documents by their summary
+        vectors, then only their chunks are searched; both levels only see
+        ``tenants``' documents if given. Falls back to flat search when that
+        finds fewer than ``limit`` chunks. Filtered searches (already
+        restricted to a document) are always flat.
+        """
+        if filter or not await self.summary_index.is_enabled(collection_name):
+            return await self.store.search(
+                collection_name=collection_name, query=query, filter=filter, limit=limit, tenants=tenants
             )
-            for key in sorted_keys
-        ]
+
+        query_vector = (await self.store.embedder_for(collection_name)).embed_query(query)
+        try:
+            document_ids = await self.summary_index.top_documents(
+                collection_name, query_vector, self.settings.summary_top_documents, tenants=tenants
+            )
+            if document_ids:
+                results = await self.store.search_vector(
+                    collection_name, query_vector, limit, document_ids=document_ids, tenants=tenants
+                )
+                if len(results) >= limit:
+                    logger.info(f"[RETRIEVAL] Searched the chunks of {len(document_ids)} summary-selected documents")
+                    return results
+        except Exception as e:
+            logger.warning(f"[RETRIEVAL] Summary index search failed for '{collection_name}', searching flat: {e}")
+        return await self.store.search_vector(collection_name, query_vector, limit, tenants=tenants)
+
+    async def _hydrate(self, collection_name: str, results: list[SearchResult]) -> list[SearchResult]:
+        """Add document-level metadata (filename, source...) to the final hits, in one lookup."""
+        try:
+            return await self.store.hydrate(collection_name, results)
+        except Exception as e:
+            logger.warning(f"[RETRIEVAL] Could not load document metadata for '{collection_name}': {e}")
+            return results
 
     async def _bm25_search(
-        self, query: str, collection_name: str, limit: int
+        self, query: str, collection_name: str, limit: int, tenants: list[str] | None = None
     ) -> list[SearchResult]:
         """BM25 keyword search over stored documents."""
         try:
@@ -150,7 +195,7 @@ class RetrievalService(BaseRetrievalService):
 
         # Build corpus from stored content via vector store search with high limit
         all_results = await self.store.search(
-            collection_name=collection_name, query=query, limit=min(limit * 10, 100)
+            collection_name=collection_name, query=query, limit=min(limit * 10, 100), tenants=tenants
         )
         if not all_results:
             return []
@@ -163,16 +208,7 @@ class RetrievalService(BaseRetrievalService):
         scored = sorted(
             zip(all_results, bm25_scores), key=lambda x: x[1], reverse=True
         )
-        return [
-            SearchResult(
-                content=r.content,
-                score=float(s),
-                metadata=r.metadata,
-                parent_doc_id=r.parent_doc_id,
-            )
-            for r, s in scored[:limit]
-            if s > 0
-        ]
+        return [r.rescored(float(s)) for r, s in scored[:limit] if s > 0]
 
     async def retrieve(
         self,
@@ -182,6 +218,7 @@ class RetrievalService(BaseRetrievalService):
         min_score: float = 0.0,
         filter: str = "",
         use_reranker: bool = False,
+        tenants: list[str] | None = None,
     ) -> list[SearchResult]:
         """Execute the retrieval pipeline: Vector Search + Reranking (optional) + Filtering.
 
@@ -192,6 +229,7 @@ class RetrievalService(BaseRetrievalService):
             min_score: Minimum similarity score threshold (0.0 to 1.0).
             filter: Optional filter expression for the search.
             use_reranker: Whether to use reranking (if configured).
+            tenants: Only search the documents of these tenants (see app.rag.tenancy).
 
         Returns:
             List of SearchResult objects sorted by relevance.
@@ -211,12 +249,7 @@ class RetrievalService(BaseRetrievalService):
         start_time = time.time()
 
         # Step 1: Execute Vector Search via the Vector Store
-        raw_results = await self.store.search(
-            collection_name=collection_name,
-            query=query,
-            filter=filter,
-            limit=limit * fetch_multiplier
-        )
+        raw_results = await self._vector_search(query, collection_name, filter, limit * fetch_multiplier, tenants)
 
         search_time = time.time() - start_time
         logger.info(
@@ -226,7 +259,7 @@ class RetrievalService(BaseRetrievalService):
 
         # Step 1b: Hybrid search (BM25 + vector fusion) if enabled
         if self._hybrid_enabled:
-            bm25_results = await self._bm25_search(query, collection_name, limit * fetch_multiplier)
+            bm25_results = await self._bm25_search(query, collection_name, limit * fetch_multiplier, tenants)
             if bm25_results:
                 raw_results = self._rrf_fuse(raw_results, bm25_results)
                 logger.info(f"[RETRIEVAL] Hybrid search: fused {len(raw_results)} results")
@@ -270,17 +303,7 @@ class RetrievalService(BaseRetrievalService):
         ]
 
         # Step 4: Deduplicate — keep highest-scored result per unique chunk
-        seen_keys: set[str] = set()
-        deduped_results: list[SearchResult] = []
-        for r in filtered_results:
-            key = (
-                f"{r.parent_doc_id}:{r.metadata.get('chunk_num', '')}"
-                if r.parent_doc_id
-                else hashlib.md5(r.content.encode()).hexdigest()
-            )
-            if key not in seen_keys:
-                seen_keys.add(key)
-                deduped_results.append(r)
+        deduped_results = self._dedup(filtered_results)
 
         if len(deduped_results) < len(filtered_results):
             logger.info(
@@ -294,8 +317,8 @@ class RetrievalService(BaseRetrievalService):
                 f"content='{r.content[:50]}...'"
             )
 
-        # Apply final limit
-        final_results = deduped_results[:limit]
+        # Apply final limit, then add the documents' metadata to the hits
+        final_results = await self._hydrate(collection_name, deduped_results[:limit])
 
         total_time = time.time() - start_time
         logger.info(
@@ -312,6 +335,7 @@ class RetrievalService(BaseRetrievalService):
         limit: int = 5,
         min_score: float = 0.0,
         use_reranker: bool = False,
+        tenants: list[str] | None = None,
     ) -> list[SearchResult]:
         """Search across multiple collections and merge results.
 
@@ -326,6 +350,7 @@ class RetrievalService(BaseRetrievalService):
                     limit=limit,
                     min_score=min_score,
                     use_reranker=use_reranker,
+                    tenants=tenants,
                 )
                 # Tag results with collection name in metadata
                 for r in results:
@@ -337,19 +362,7 @@ class RetrievalService(BaseRetrievalService):
         all_results.sort(key=lambda r: r.score, reverse=True)
 
         # Deduplicate across collections
-        seen_keys: set[str] = set()
-        deduped: list[SearchResult] = []
-        for r in all_results:
-            key = (
-                f"{r.parent_doc_id}:{r.metadata.get('chunk_num', '')}"
-                if r.parent_doc_id
-                else hashlib.md5(r.content.encode()).hexdigest()
-            )
-            if key not in seen_keys:
-                seen_keys.add(key)
-                deduped.append(r)
-
-        return deduped[:limit]
+        return self._dedup(all_results)[:limit]
 
     async def retrieve_by_document(
         self,
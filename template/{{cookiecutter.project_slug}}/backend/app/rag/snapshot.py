@@ -0,0 +1,314 @@
+{%- if cookiecutter.enable_rag %}
+"""Collection snapshots: a collection with its vectors, in one portable file.
+
+A snapshot is a zip file:
+
+    manifest.json      collection, embedding model and dimension, chunk count
+    part-00000.jsonl   id, parent_doc_id, content and metadata of each chunk
+    part-00000.f32     the same chunks' vectors, as little-endian float32 rows
+    part-00001.jsonl   ...
+    documents.jsonl    id and metadata of each document (the collection's catalog)
+
+Parts are written and read one at a time, so neither export nor import holds
+a collection in memory, and an interrupted import resumes at the first part
+it did not finish (checkpoints are kept under RAG_SYNC_MANIFEST_DIR/imports,
+keyed by snapshot and target collection).
+
+Vectors are loaded as they are, without calling the embedding provider, so a
+snapshot can only be imported into a collection using the same embedding model.
+The format does not depend on the vector store: a collection exported from
+ChromaDB imports into Qdrant.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import uuid
+import zipfile
+from array import array
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import BaseModel, Field, ValidationError
+
+from app.core.config import settings
+from app.rag.models import StoredChunk
+from app.rag.vectorstore import BaseVectorStore
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+DOCUMENTS_NAME = "documents.jsonl"
+
+
+class SnapshotError(ValueError):
+    """A file that is not a snapshot, or does not fit the vector store."""
+
+
+class SnapshotImportCancelled(Exception):
+    """The import was cancelled; a later import of the same snapshot resumes it."""
+
+
+class SnapshotManifest(BaseModel):
+    """Contents of a snapshot (its manifest.json)."""
+
+    snapshot_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    format_version: int = SNAPSHOT_FORMAT_VERSION
+    collection_name: str
+    embedding_model: str
+    dim: int
+    chunk_count: int = 0
+    parts: int = 0
+    document_count: int = 0
+    created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+
+@dataclass(slots=True)
+class SnapshotImport:
+    """Outcome of an import, in chunks and parts."""
+
+    manifest: SnapshotManifest
+    collection_name: str
+    chunks: int = 0  # Imported so far, earlier (resumed) runs included
+    parts: int = 0
+    resumed_at_part: int = 0
+
+
+def _part_name(index: int) -> str:
+    return f"part-{index:05d}"
+
+
+def _write_part(zf: zipfile.ZipFile, index: int, chunks: list[StoredChunk], dim: int) -> None:
+    lines = [
+        json.dumps(
+            {"id": c.chunk_id, "parent_doc_id": c.parent_doc_id, "content": c.content, "metadata": c.metadata},
+            default=str,
+        )
+        for c in chunks
+    ]
+    vectors = array("f")
+    for chunk in chunks:
+        if chunk.vector is None or len(chunk.vector) != dim:
+            raise SnapshotError(f"Chunk {chunk.chunk_id} has no {dim}-dimensional vector")
+        vectors.extend(chunk.vector)
+    if sys.byteorder == "big":
+        vectors.byteswap()
+    name = _part_name(index)
+    zf.writestr(f"{name}.jsonl", "\n".join(lines), compress_type=zipfile.ZIP_DEFLATED)
+    # Float32 noise does not compress; stored as is
+    zf.writestr(f"{name}.f32", vectors.tobytes(), compress_type=zipfile.ZIP_STORED)
+
+
+def _read_part(zf: zipfile.ZipFile, index: int, dim: int) -> list[StoredChunk]:
+    name = _part_name(index)
+    rows = [json.loads(line) for line in zf.read(f"{name}.jsonl").decode().splitlines() if line]
+    vectors = array("f")
+    vectors.frombytes(zf.read(f"{name}.f32"))
+    if sys.byteorder == "big":
+        vectors.byteswap()
+    if len(vectors) != len(rows) * dim:
+        raise SnapshotError(f"{name} holds {len(vectors)} floats for {len(rows)} chunks of dimension {dim}")
+    return [
+        StoredChunk(
+            chunk_id=row["id"],
+            parent_doc_id=row.get("parent_doc_id"),
+            content=row.get("content", ""),
+            metadata=row.get("metadata") or {},
+            vector=vectors[i * dim : (i + 1) * dim].tolist(),
+        )
+        for i, row in enumerate(rows)
+    ]
+
+
+def _write_documents(zf: zipfile.ZipFile, records: dict[str, dict[str, Any]]) -> None:
+    lines = [json.dumps({"id": doc_id, "metadata": metadata}, default=str) for doc_id, metadata in records.items()]
+    zf.writestr(DOCUMENTS_NAME, "\n".join(lines), compress_type=zipfile.ZIP_DEFLATED)
+
+
+def _read_documents(zf: zipfile.ZipFile) -> dict[str, dict[str, Any]]:
+    """Document records of a snapshot; empty for snapshots written before catalogs existed."""
+    if DOCUMENTS_NAME not in zf.namelist():
+        return {}
+    rows = [json.loads(line) for line in zf.read(DOCUMENTS_NAME).decode().splitlines() if line]
+    return {row["id"]: row.get("metadata") or {} for row in rows}
+
+
+class _StreamSink:
+    """Write-only, unseekable zip target whose bytes are drained as they are produced."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+async def iter_snapshot(
+    store: BaseVectorStore, collection_name: str, part_size: int | None = None
+) -> AsyncIterator[bytes]:
+    """Stream a collection as snapshot bytes, one part at a time (e.g. as a download)."""
+    config = await store.embedding_config(collection_name)
+    manifest = SnapshotManifest(collection_name=collection_name, embedding_model=config.model, dim=config.dim)
+    sink = _StreamSink()
+    # An unseekable target makes zipfile write data descriptors instead of seeking back
+    with zipfile.ZipFile(sink, "w", allowZip64=True) as zf:  # type: ignore[arg-type]
+        async for chunks in store.scroll_chunks(
+            collection_name, part_size or settings.RAG_SNAPSHOT_PART_SIZE, with_vectors=True
+        ):
+            await asyncio.to_thread(_write_part, zf, manifest.parts, chunks, manifest.dim)
+            manifest.parts += 1
+            manifest.chunk_count += len(chunks)
+            yield sink.drain()
+        records = await store.get_document_records(collection_name)
+        await asyncio.to_thread(_write_documents, zf, records)
+        manifest.document_count = len(records)
+        zf.writestr(MANIFEST_NAME, manifest.model_dump_json(indent=2))
+    yield sink.drain()
+    logger.info(
+        f"Exported {collection_name}: {manifest.chunk_count} chunks of {manifest.document_count} documents "
+        f"in {manifest.parts} parts"
+    )
+
+
+async def export_snapshot(store: BaseVectorStore, collection_name: str, path: Path) -> SnapshotManifest:
+    """Write a collection's snapshot to a file (renamed into place once complete)."""
+    tmp_path = path.with_name(f".{path.name}.part")
+    try:
+        with open(tmp_path, "wb") as fh:
+            async for data in iter_snapshot(store, collection_name):
+                await asyncio.to_thread(fh.write, data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return read_manifest(path)
+
+
+def read_manifest(path: Path | IO[bytes]) -> SnapshotManifest:
+    """Read a snapshot's manifest.
+
+    Raises:
+        SnapshotError: If the file is not a snapshot this version can read.
+    """
+    try:
+        with zipfile.ZipFile(path) as zf:
+            manifest = SnapshotManifest.model_validate_json(zf.read(MANIFEST_NAME))
+    except (zipfile.BadZipFile, KeyError, ValidationError) as e:
+        raise SnapshotError(f"Not a collection snapshot: {e}") from e
+    if manifest.format_version > SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(f"Snapshot format {manifest.format_version} is newer than this version supports")
+    return manifest
+
+
+async def check_compatible(manifest: SnapshotManifest, store: BaseVectorStore, collection_name: str) -> None:
+    """Raise SnapshotError unless the collection embeds with the snapshot's model and dimension.
+
+    A collection that does not exist yet would get the store's model.
+    """
+    config = await store.embedding_config(collection_name)
+    if (manifest.embedding_model, manifest.dim) != (config.model, config.dim):
+        raise SnapshotError(
+            f"Snapshot vectors come from {manifest.embedding_model} ({manifest.dim} dims), "
+            f"but {collection_name} uses {config.model} ({config.dim} dims)"
+        )
+
+
+class ImportCheckpoint:
+    """Parts of a snapshot already imported into a collection."""
+
+    def __init__(self, snapshot_id: str, collection_name: str, checkpoint_dir: str | Path | None = None):
+        base = Path(checkpoint_dir) if checkpoint_dir else Path(settings.RAG_SYNC_MANIFEST_DIR) / "imports"
+        self.path = base / f"{snapshot_id}-{collection_name}.json"
+
+    def load(self) -> tuple[int, int]:
+        """(parts, chunks) imported by earlier runs; (0, 0) if none or unreadable."""
+        try:
+            raw = json.loads(self.path.read_text())
+            return int(raw["parts"]), int(raw["chunks"])
+        except FileNotFoundError:
+            return 0, 0
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable import checkpoint {self.path}: {e}")
+            return 0, 0
+
+    def save(self, parts: int, chunks: int) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"parts": parts, "chunks": chunks}))
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+async def import_snapshot(
+    store: BaseVectorStore,
+    path: Path,
+    collection_name: str | None = None,
+    *,
+    restart: bool = False,
+    checkpoint_dir: str | Path | None = None,
+    is_cancelled: Callable[[], Awaitable[bool]] | None = None,
+    on_progress: Callable[[SnapshotImport], Awaitable[None]] | None = None,
+) -> SnapshotImport:
+    """Bulk-load a snapshot into a collection (the snapshot's own by default).
+
+    Chunks are upserted by ID, so importing over an existing collection
+    updates it. Resumes an earlier, interrupted import of the same snapshot
+    into the same collection unless ``restart`` is set.
+
+    Raises:
+        SnapshotError: If the file is not a snapshot or does not fit the store.
+        SnapshotImportCancelled: If ``is_cancelled`` turned true.
+    """
+    manifest = read_manifest(path)
+    name = collection_name or manifest.collection_name
+    await check_compatible(manifest, store, name)
+    await store.create_collection(name)
+
+    checkpoint = ImportCheckpoint(manifest.snapshot_id, name, checkpoint_dir)
+    start, chunks_done = (0, 0) if restart else checkpoint.load()
+    result = SnapshotImport(
+        manifest=manifest, collection_name=name, chunks=chunks_done, parts=start, resumed_at_part=start
+    )
+    if start:
+        logger.info(f"Resuming import of snapshot {manifest.snapshot_id} into {name} at part {start}/{manifest.parts}")
+
+    with zipfile.ZipFile(path) as zf:
+        for index in range(start, manifest.parts):
+            if is_cancelled is not None and await is_cancelled():
+                raise SnapshotImportCancelled(f"Import into {name} cancelled at part {index}")
+            chunks = await asyncio.to_thread(_read_part, zf, index, manifest.dim)
+            if chunks:
+                await store.upsert_chunks(name, chunks, [chunk.vector or [] for chunk in chunks])
+            result.parts = index + 1
+            result.chunks += len(chunks)
+            checkpoint.save(result.parts, result.chunks)
+            if on_progress is not None:
+                await on_progress(result)
+        records = await asyncio.to_thread(_read_documents, zf)
+    await store.upsert_document_records(name, records)
+    checkpoint.clear()
+    logger.info(f"Imported snapshot {manifest.snapshot_id} into {name}: {result.chunks} chunks")
+    return result
+{%- endif %}
@@ -0,0 +1,164 @@
+{%- if cookiecutter.enable_rag %}
+"""Document summary index: a coarse first search level for large collections.
+
+Flat nearest-neighbour search over hundreds of thousands of chunks loses
+recall and costs latency, and the reranker only ever sees the top few dozen.
+A summary index holds one vector per document — the normalized mean
+(centroid) of its chunk vectors — in a companion collection,
+``<collection>__summary``, which is hidden from collection lists. Retrieval
+then searches in two steps:
+
+1. the query vector against the summaries, selecting the top
+   ``summary_top_documents`` documents;
+2. the chunks of those documents only (a parent_doc_id filter).
+
+Each summary carries its document's tenant, so tenant-scoped searches use
+the index too: both steps filter on the tenants in scope.
+
+The index is enabled per collection, by building it (``rag-summary-index`` or
+``POST /rag/collections/{name}/summary-index``); collections without one are
+searched flat. Once built, ingestion and document deletion keep it up to date.
+``rag-bench-summary`` measures recall against flat search, and the latency of
+both, on a collection.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable
+
+from app.rag.models import StoredChunk
+from app.rag.tenancy import SHARED_TENANT
+from app.rag.vectorstore import BaseVectorStore
+from app.rag.write_buffer import BoundedTaskGroup
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_SUFFIX = "__summary"
+ENABLED_CACHE_SECONDS = 30.0  # How long "does this collection have a summary index" is cached
+
+
+def summary_collection_name(collection_name: str) -> str:
+    """Name of the companion collection holding a collection's document summaries."""
+    return f"{collection_name}{SUMMARY_SUFFIX}"
+
+
+def centroid(vectors: list[list[float]]) -> list[float]:
+    """Normalized mean of vectors (the direction cosine similarity compares)."""
+    sums = [0.0] * len(vectors[0])
+    for vector in vectors:
+        sums = [a + b for a, b in zip(sums, vector)]
+    norm = math.sqrt(sum(x * x for x in sums)) or 1.0
+    return [x / norm for x in sums]
+
+
+class DocumentSummaryIndex:
+    """Maintains and queries the summary index of a store's collections."""
+
+    def __init__(self, store: BaseVectorStore, concurrency: int = 8):
+        self.store = store
+        self.concurrency = concurrency
+        # Collection -> (has a summary index, checked at)
+        self._enabled: dict[str, tuple[bool, float]] = {}
+
+    async def is_enabled(self, collection_name: str) -> bool:
+        """Whether the collection has a summary index (cached for ENABLED_CACHE_SECONDS)."""
+        now = time.monotonic()
+        cached = self._enabled.get(collection_name)
+        if cached is not None and now - cached[1] < ENABLED_CACHE_SECONDS:
+            return cached[0]
+        try:
+            enabled = await self.store.collection_exists(summary_collection_name(collection_name))
+        except Exception as e:
+            logger.warning(f"Could not check the summary index of {collection_name}: {e}")
+            enabled = False
+        self._enabled[collection_name] = (enabled, now)
+        return enabled
+
+    async def build(
+        self, collection_name: str, on_progress: Callable[[int, int], Awaitable[None]] | None = None
+    ) -> int:
+        """(Re)build a collection's summary index from its stored chunks; returns documents indexed.
+
+        The previous index is dropped first (its dimension may be stale after
+        a re-embed); searches are flat until the new one exists.
+        """
+        await self.drop(collection_name)
+        document_ids: set[str] = set()
+        async for chunks in self.store.scroll_chunks(collection_name, 1024):
+            document_ids.update(chunk.parent_doc_id for chunk in chunks if chunk.parent_doc_id)
+
+        # Summaries are averaged chunk vectors: the collection's dimension, whatever the store's
+        dim = (await self.store.embedding_config(collection_name)).dim
+        await self.store._ensure_collection(summary_collection_name(collection_name), dim)
+        done = 0
+
+        async def _refresh(document_id: str) -> None:
+            nonlocal done
+            try:
+                await self.refresh_document(collection_name, document_id)
+            except Exception as e:
+                logger.warning(f"Failed to summarize document {document_id} of {collection_name}: {e}")
+            done += 1
+            if on_progress is not None and done % 100 == 0:
+                await on_progress(done, len(document_ids))
+
+        async with BoundedTaskGroup(self.concurrency) as group:
+            for document_id in sorted(document_ids):
+                await group.submit(_refresh(document_id))
+        if on_progress is not None:
+            await on_progress(done, len(document_ids))
+        self._enabled[collection_name] = (True, time.monotonic())
+        logger.info(f"Built the summary index of {collection_name}: {len(document_ids)} documents")
+        return len(document_ids)
+
+    async def drop(self, collection_name: str) -> None:
+        """Remove a collection's summary index (searches go back to flat)."""
+        summary = summary_collection_name(collection_name)
+        if await self.store.collection_exists(summary):
+            await self.store.delete_collection(summary)
+        self._enabled[collection_name] = (False, time.monotonic())
+
+    async def refresh_document(self, collection_name: str, document_id: str) -> None:
+        """Recompute a document's summary vector from its stored chunks."""
+        summary = summary_collection_name(collection_name)
+        vectors = await self.store.get_document_vectors(collection_name, document_id)
+        if not vectors:
+            await self.store.delete_chunks(summary, [document_id])
+            return
+        vector = await asyncio.to_thread(centroid, vectors)
+        record = (await self.store.get_document_records(collection_name, [document_id])).get(document_id, {})
+        chunk = StoredChunk(
+            chunk_id=document_id,
+            parent_doc_id=document_id,
+            content="",
+            metadata={"chunk_count": len(vectors), "tenant": record.get("tenant") or SHARED_TENANT},
+        )
+        await self.store.upsert_chunks(summary, [chunk], [vector])
+
+    async def document_changed(self, collection_name: str, document_id: str) -> None:
+        """Update a document's summary after ingestion, if the collection has an index."""
+        if not await self.is_enabled(collection_name):
+            return
+        try:
+            await self.refresh_document(collection_name, document_id)
+        except Exception as e:
+            logger.warning(f"Failed to update the summary of document {document_id}: {e}")
+
+    async def document_removed(self, collection_name: str, document_id: str) -> None:
+        """Remove a deleted document's summary, if the collection has an index."""
+        if not await self.is_enabled(collection_name):
+            return
+        try:
+            await self.store.delete_chunks(summary_collection_name(collection_name), [document_id])
+        except Exception as e:
+            logger.warning(f"Failed to remove the summary of document {document_id}: {e}")
+
+    async def top_documents(
+        self, collection_name: str, vector: list[float], limit: int, tenants: list[str] | None = None
+    ) -> list[str]:
+        """IDs of the documents whose summaries are nearest to a query vector (of ``tenants``, if given)."""
+        hits = await self.store.search_vector(summary_collection_name(collection_name), vector, limit, tenants=tenants)
+        return [hit.parent_doc_id for hit in hits if hit.parent_doc_id]
+{%- endif %}
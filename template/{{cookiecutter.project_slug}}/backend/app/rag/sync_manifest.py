@@ -0,0 +1,100 @@
+{%- if cookiecutter.enable_rag %}
+"""Stat-based manifest for local folder syncs.
+
+Remembers (size, mtime_ns, inode, content_hash, document_id) for every file a
+local sync has seen, so a resync only re-hashes files whose stat changed and
+never has to scan the vector store to find out what is already ingested.
+Files deleted from disk are found by set difference against the manifest.
+
+One manifest is kept per (collection, root path) as a JSON file under
+RAG_SYNC_MANIFEST_DIR, next to the worker that reads the folder.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ManifestEntry:
+    """Last known state of a synced file."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    content_hash: str
+    document_id: str | None = None
+
+    def matches(self, st: os.stat_result) -> bool:
+        """True if the file's stat is unchanged since it was recorded."""
+        return self.size == st.st_size and self.mtime_ns == st.st_mtime_ns and self.inode == st.st_ino
+
+
+def hash_file(filepath: Path) -> str:
+    """SHA256 of a file, streamed in fixed-size blocks."""
+    with open(filepath, "rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+class LocalSyncManifest:
+    """Persisted {source_path: ManifestEntry} map for one synced folder."""
+
+    def __init__(self, collection_name: str, root: Path, manifest_dir: str | Path | None = None):
+        key = hashlib.sha256(f"{collection_name}\0{root.resolve()}".encode()).hexdigest()[:32]
+        self.path = Path(manifest_dir or settings.RAG_SYNC_MANIFEST_DIR) / f"{key}.json"
+        self.entries: dict[str, ManifestEntry] = {}
+
+    @classmethod
+    def load(cls, collection_name: str, root: Path, manifest_dir: str | Path | None = None) -> "LocalSyncManifest":
+        """Load the manifest for a folder; a missing or corrupt file yields an empty one."""
+        manifest = cls(collection_name, root, manifest_dir)
+        try:
+            raw = json.loads(manifest.path.read_text())
+            manifest.entries = {path: ManifestEntry(**entry) for path, entry in raw.items()}
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable sync manifest {manifest.path}: {e}")
+        return manifest
+
+    def get(self, source_path: str) -> ManifestEntry | None:
+        return self.entries.get(source_path)
+
+    def record(
+        self,
+        source_path: str,
+        st: os.stat_result,
+        content_hash: str,
+        document_id: str | None = None,
+    ) -> None:
+        """Store the current stat and hash of a file (keeping its document ID if not given)."""
+        previous = self.entries.get(source_path)
+        self.entries[source_path] = ManifestEntry(
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            inode=st.st_ino,
+            content_hash=content_hash,
+            document_id=document_id or (previous.document_id if previous else None),
+        )
+
+    def remove(self, source_path: str) -> ManifestEntry | None:
+        return self.entries.pop(source_path, None)
+
+    def missing(self, seen: set[str]) -> set[str]:
+        """Paths recorded by earlier syncs that are no longer on disk."""
+        return set(self.entries) - seen
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({path: asdict(entry) for path, entry in self.entries.items()}))
+        os.replace(tmp_path, self.path)
+{%- endif %}
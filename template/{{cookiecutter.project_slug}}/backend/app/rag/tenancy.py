@@ -0,0 +1,94 @@
+{%- if cookiecutter.enable_rag %}
+"""Tenancy keys: which user or project a document belongs to.
+
+Every chunk carries a tenancy key in its metadata (``tenant``): ``shared``
+for the common knowledge base, ``user_<id>`` or ``project_<id>`` for
+documents ingested for one user or project. Scoped searches always filter
+on it. With RAG_TENANT_PARTITIONING, new collections are also partitioned by
+it with each backend's native mechanism (Milvus partition key, Qdrant tenant
+index, pgvector LIST partitions, one Chroma collection per tenant), and a
+scoped search only reads the partitions of its tenants: its cost follows the
+tenant's data, not the whole corpus.
+
+Searches are scoped with :func:`tenant_scope`. The PydanticAI assistant
+scopes its searches from its ``Deps``; the other frameworks' agent tools
+read the scope of the caller's context (:func:`set_tenant_scope`,
+:func:`scoped_to`), which defaults to shared documents only.
+"""
+
+import hashlib
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from uuid import UUID
+
+SHARED_TENANT = "shared"
+# Suffix of the collections (Chroma) and tables (pgvector) holding one tenant's chunks
+TENANT_PARTITION_SEPARATOR = "__t_"
+
+_TENANT_RE = re.compile(r"^[A-Za-z0-9_-]{1,100}$")
+
+# Tenants the agent runs of the current context may search (see set_tenant_scope)
+_current_scope: ContextVar[list[str] | None] = ContextVar("tenant_scope", default=None)
+
+
+def check_tenant(tenant: str) -> str:
+    """Validate a tenancy key (it ends up in filter expressions and DDL)."""
+    if not _TENANT_RE.match(tenant):
+        raise ValueError(f"Invalid tenant '{tenant}': use letters, digits, '_' and '-' (max 100 chars)")
+    return tenant
+
+
+def tenant_key(user_id: UUID | str | None = None, project_id: UUID | str | None = None) -> str:
+    """Tenancy key of a document: its project's, else its user's, else shared."""
+    if project_id:
+        return check_tenant(f"project_{project_id}")
+    if user_id:
+        return check_tenant(f"user_{user_id}")
+    return SHARED_TENANT
+
+
+def tenant_scope(user_id: UUID | str | None = None, project_id: UUID | str | None = None) -> list[str]:
+    """Tenants a user (in a project) may search: shared documents, their own and the project's."""
+    scope = [SHARED_TENANT]
+    if user_id:
+        scope.append(tenant_key(user_id=user_id))
+    if project_id:
+        scope.append(tenant_key(project_id=project_id))
+    return scope
+
+
+def set_tenant_scope(user_id: UUID | str | None = None, project_id: UUID | str | None = None) -> Token:
+    """Scope the agents' knowledge-base searches in the current context to a user and project.
+
+    Set once per WebSocket connection (each runs in its own task) or around
+    one agent run with :func:`scoped_to`.
+    """
+    return _current_scope.set(tenant_scope(user_id=user_id, project_id=project_id))
+
+
+@contextmanager
+def scoped_to(user_id: UUID | str | None = None, project_id: UUID | str | None = None) -> Iterator[list[str]]:
+    """Scope the agents' knowledge-base searches within the block (see :func:`set_tenant_scope`)."""
+    token = set_tenant_scope(user_id=user_id, project_id=project_id)
+    try:
+        yield _current_scope.get() or []
+    finally:
+        _current_scope.reset(token)
+
+
+def current_tenant_scope() -> list[str]:
+    """Tenants agents may search in the current context: shared documents unless scoped."""
+    return _current_scope.get() or tenant_scope()
+
+
+def tenant_partition(name: str, tenant: str) -> str:
+    """Name of the collection or table holding ``tenant``'s chunks of ``name``.
+
+    Hashed: tenancy keys are longer than the name limits of Chroma and
+    PostgreSQL leave room for.
+    """
+    digest = hashlib.sha1(f"{name}:{tenant}".encode()).hexdigest()[:16]
+    return f"{name[:40]}{TENANT_PARTITION_SEPARATOR}{digest}"
+{%- endif %}
@@ -1,29 +1,259 @@
+import ast
+import json
 import logging
+import math
+import operator
 import re
+import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
-from app.rag.models import CollectionInfo, Document, DocumentPageChunk, SearchResult, DocumentInfo
+from app.rag.models import CollectionInfo, Document, DocumentPageChunk, SearchResult, DocumentInfo, StoredChunk
+from app.rag.tenancy import SHARED_TENANT, check_tenant, tenant_partition
+from app.rag.write_buffer import CollectionWriteBuffer
 from app.schemas.rag import RAGDocumentItem, RAGDocumentList
 
+if TYPE_CHECKING:
+    from app.rag.config import EmbeddingsConfig, RAGSettings
+    from app.rag.embeddings import EmbeddingService
+
 logger = logging.getLogger(__name__)
 
 _COLLECTION_NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]{0,63}$")
-_RESERVED_COLLECTION_NAMES = frozenset({"all"})
+# Embedding model of each collection (see embedder_for), kept like a document catalog
+EMBEDDING_REGISTRY = "embedding_models"
+_RESERVED_COLLECTION_NAMES = frozenset({"all", EMBEDDING_REGISTRY})
+# Collections being rebuilt by a re-embed, or replaced by one (see app.rag.reembed),
+# collections served through an alias (Milvus, Qdrant), document summary indexes
+# (see app.rag.summary_index), document catalogs and tenant partitions (see app.rag.tenancy)
+_INTERNAL_COLLECTION_RE = re.compile(r"__(shadow|retired|live)_\d+$|__summary$|__docs$|__t_[0-9a-f]{16}$")
+# Document catalog of a collection: document-level metadata, stored once per document
+CATALOG_SUFFIX = "__docs"
+# Filter fields matched against the catalog instead of the chunks (see resolve_document_filter)
+DOCUMENT_FILTER_FIELDS = frozenset({"filename", "filesize", "filetype", "source_path", "content_hash"})
+_DOCUMENT_FIELD_RE = re.compile(rf"\b({'|'.join(sorted(DOCUMENT_FILTER_FIELDS))})\b")
+_FILTER_CLAUSE_RE = re.compile(
+    r"""^\s*(?:metadata\[\s*["'](\w+)["']\s*\]|(\w+))\s*(==|!=|>=|<=|>|<|not\s+in|in)\s*(.+?)\s*$"""
+)
+_FILTER_AND_RE = re.compile(r"\s+(?:and|AND|&&)\s+")
+_STRING_LITERAL_RE = re.compile(r""""[^"]*"|'[^']*'""")
+_FILTER_OPERATORS = {
+    "==": operator.eq, "!=": operator.ne, ">=": operator.ge, "<=": operator.le, ">": operator.gt, "<": operator.lt,
+}
+_embedders: dict[str, "EmbeddingService"] = {}  # Embedding model config (JSON) -> its service
+# How long a store trusts the collection a name serves and its recorded embedding model
+# (see BaseVectorStore._recorded_embedding): changes made by this process invalidate them at
+# once, those made by others (a worker's re-embed swapping a collection) only after this long
+SERVED_CACHE_SECONDS = 30.0
+_serving_changes = 0  # Changes this process made to collections and their models (see _serving_changed)
+
+
+def _serving_changed() -> None:
+    """Invalidate every store's cache of the collections names serve and their models."""
+    global _serving_changes
+    _serving_changes += 1
+
+
+class FilterError(ValueError):
+    """A search filter that cannot be applied."""
+
+
+def _is_filter_value(op: str, value: Any) -> bool:
+    """Whether a document clause compares to a value all stores can evaluate (a list for ``in``)."""
+    if op in ("in", "not in"):
+        return isinstance(value, list | tuple) and all(_is_filter_value("==", v) for v in value)
+    return isinstance(value, str | int | float) and not isinstance(value, bool)
+
+
+def _matches(value: Any, op: str, expected: Any) -> bool:
+    if op.startswith("not"):
+        return not _matches(value, "in", expected)
+    if op == "in":
+        return isinstance(expected, list | tuple | set) and value in expected
+    try:
+        return bool(_FILTER_OPERATORS[op](value, expected))
+    except TypeError:
+        return False
 
 
 class BaseVectorStore(ABC):
-    """Abstract base class for vector store implementations."""
+    """Abstract base class for vector store implementations.
+
+    Chunks carry only chunk-level metadata (page_num, chunk_num, ...);
+    document-level metadata (filename, filesize, source_path, content_hash,
+    ...) is stored once per document in the collection's catalog and added
+    back to search hits by :meth:`hydrate`, in one lookup per search.
+
+    Each chunk's metadata names its tenant (see app.rag.tenancy) and
+    searches given ``tenants`` only return chunks of those tenants. With
+    ``tenant_partitioning``, new collections are also partitioned by it, so
+    such searches only read those tenants' partitions.
+
+    The embedding model of each collection is recorded when it is created or
+    first written, and moves with it when a re-embed swaps it (see
+    app.rag.reembed): searches and ingestion embed with the collection's
+    model (:meth:`embedder_for`), not necessarily the store's own.
+    """
+
+    settings: "RAGSettings"
+    embedder: "EmbeddingService"
+    # Name -> the collection it serves, its model, and _serving_changes and time when looked up
+    _served: dict[str, tuple[str, "EmbeddingsConfig | None", int, float]]
+
+    async def insert_documents(self, collection_name: str, documents: list[Document]) -> None:
+        """Embeds the chunks of several documents in one request and stores them in one upsert."""
+        rows = self._chunk_rows(documents)
+        chunks = [
+            StoredChunk(
+                chunk_id=chunk.chunk_id,
+                parent_doc_id=chunk.parent_doc_id,
+                content=chunk.chunk_content,
+                metadata=self._build_chunk_metadata(chunk, document),
+            )
+            for chunk, document in rows
+        ]
+        await self._ensure_collection(collection_name)
+        embedder = await self.embedder_for(collection_name, pin=True)
+        # Upsert: chunk IDs are deterministic, re-ingested chunks overwrite themselves
+        await self.upsert_chunks(collection_name, chunks, embedder.embed_documents(documents))
+        await self.upsert_document_records(
+            collection_name, {document.id: document.metadata.model_dump() for document in documents}
+        )
+
+    @abstractmethod
+    async def upsert_chunks(
+        self, collection_name: str, chunks: list[StoredChunk], vectors: list[list[float]]
+    ) -> None:
+        """Stores chunks with their precomputed vectors (the collection must exist)."""
 
     @abstractmethod
+    def scroll_chunks(
+        self, collection_name: str, batch_size: int = 256, with_vectors: bool = False
+    ) -> AsyncIterator[list[StoredChunk]]:
+        """Yields every stored chunk in batches ordered by chunk ID (vectors only if asked for)."""
+
     async def insert_document(self, collection_name: str, document: Document) -> None:
         """Embeds and stores document chunks."""
+        await self.insert_documents(collection_name, [document])
+
+    def write_buffer(
+        self, collection_name: str, max_vectors: int = 512, max_wait_ms: float = 100.0
+    ) -> CollectionWriteBuffer:
+        """Buffer that merges the writes of many documents into batched insert_documents() calls."""
+        return CollectionWriteBuffer(self, collection_name, max_vectors=max_vectors, max_wait_ms=max_wait_ms)
 
-    @abstractmethod
     async def search(
-        self, collection_name: str, query: str, limit: int = 4, filter: str = ""
+        self,
+        collection_name: str,
+        query: str,
+        limit: int = 4,
+        filter: str = "",
+        tenants: list[str] | None = None,
+    ) -> list[SearchResult]:
+        """Retrieves similar chunks based on a text query.
+
+        Raises FilterError if ``filter`` uses document fields in a way
+        :meth:`resolve_document_filter` cannot evaluate.
+        """
+        filter, document_ids = await self.resolve_document_filter(collection_name, filter)
+        if document_ids is not None and not document_ids:
+            return []
+        embedder = await self.embedder_for(collection_name)
+        return await self.search_vector(
+            collection_name, embedder.embed_query(query), limit, filter,
+            document_ids=document_ids, tenants=tenants,
+        )
+
+    async def embedder_for(self, collection_name: str, *, pin: bool = False) -> "EmbeddingService":
+        """Embedding service of the model a collection's vectors were made with.
+
+        Collections without a record (not created yet, or written before
+        models were recorded) use this store's model; with ``pin`` it is
+        recorded for them.
+        """
+        physical, config = await self._recorded_embedding(collection_name, fresh=pin)
+        if config is None and pin:
+            await self._record_embedding(physical, self.settings.embeddings_config)
+        if config is None or config == self.settings.embeddings_config:
+            return self.embedder
+        key = config.model_dump_json()
+        if key not in _embedders:
+            from app.rag.embeddings import EmbeddingService
+
+            _embedders[key] = EmbeddingService(self.settings.model_copy(update={"embeddings_config": config}))
+        return _embedders[key]
+
+    async def embedding_config(self, collection_name: str) -> "EmbeddingsConfig":
+        """Embedding model and dimension of a collection's vectors (see :meth:`embedder_for`)."""
+        _, config = await self._recorded_embedding(collection_name)
+        return config or self.settings.embeddings_config
+
+    async def resolve_document_filter(self, collection_name: str, filter: str) -> tuple[str, list[str] | None]:
+        """Split a filter into its chunk-level part and the documents its document-level part selects.
+
+        Document fields (filename, filetype, ...) are not stored on chunks:
+        clauses on them (``==``, ``!=``, ``<``/``>``, ``in``, ``not in``,
+        joined with ``and``) are evaluated against the collection's catalog,
+        by the store itself where it can query the catalog.
+        Returns the remaining chunk filter, and the IDs of the matching
+        documents or None when the filter has no document-level clause.
+        """
+        if not filter or not _DOCUMENT_FIELD_RE.search(_STRING_LITERAL_RE.sub('""', filter)):
+            return filter, None
+
+        unsupported = FilterError(
+            f"Document fields ({', '.join(sorted(DOCUMENT_FILTER_FIELDS))}) can only be compared "
+            f"to literals and combined with 'and', e.g. 'filetype == \"pdf\" and filesize < 1000000'"
+        )
+        chunk_clauses: list[str] = []
+        document_clauses: list[tuple[str, str, Any]] = []
+        for clause in _FILTER_AND_RE.split(filter.strip()):
+            m = _FILTER_CLAUSE_RE.match(clause)
+            field = m.group(1) or m.group(2) if m else None
+            if m and field in DOCUMENT_FILTER_FIELDS:
+                op = " ".join(m.group(3).split())
+                try:
+                    value = ast.literal_eval(m.group(4))
+                except (ValueError, SyntaxError) as e:
+                    raise unsupported from e
+                if not _is_filter_value(op, value):
+                    raise unsupported
+                document_clauses.append((field, op, value))
+            elif _DOCUMENT_FIELD_RE.search(_STRING_LITERAL_RE.sub('""', clause)):
+                raise unsupported
+            else:
+                chunk_clauses.append(clause)
+
+        return " and ".join(chunk_clauses), sorted(await self._find_documents(collection_name, document_clauses))
+
+    async def _find_documents(self, collection_name: str, clauses: list[tuple[str, str, Any]]) -> list[str]:
+        """IDs of the catalog's documents matching every (field, operator, value) clause.
+
+        Reads the whole catalog; stores that can query theirs override it.
+        """
+        records = await self.get_document_records(collection_name)
+        return [
+            document_id for document_id, record in records.items()
+            if all(_matches(record.get(field), op, value) for field, op, value in clauses)
+        ]
+
+    @abstractmethod
+    async def search_vector(
+        self,
+        collection_name: str,
+        vector: list[float],
+        limit: int = 4,
+        filter: str = "",
+        document_ids: list[str] | None = None,
+        tenants: list[str] | None = None,
     ) -> list[SearchResult]:
-        """Retrieves similar chunks based on a text query."""
+        """Retrieves the chunks nearest to a query vector.
+
+        Only from ``document_ids`` if given, and only chunks of ``tenants``
+        if given (read from their partitions only in partitioned collections).
+        """
 
     @abstractmethod
     async def delete_collection(self, collection_name: str) -> None:
@@ -33,6 +263,72 @@ class BaseVectorStore(ABC):
     async def delete_document(self, collection_name: str, document_id: str) -> None:
         """Removes all chunks associated with a document ID."""
 
+    @abstractmethod
+    async def get_chunk_ids(self, collection_name: str, document_id: str) -> set[str]:
+        """Returns IDs of all chunks stored for a document ID."""
+
+    @abstractmethod
+    async def get_document_vectors(self, collection_name: str, document_id: str) -> list[list[float]]:
+        """Returns the vectors of all chunks stored for a document ID."""
+
+    @abstractmethod
+    async def delete_chunks(self, collection_name: str, chunk_ids: list[str]) -> None:
+        """Removes individual chunks by ID."""
+
+    async def update_chunk_metadata(self, collection_name: str, document: Document) -> None:
+        """Rewrites the chunk-level metadata (page_num, chunk_num, ...) of a document's stored chunks.
+
+        Only the metadata is written: chunks a re-ingestion keeps may have
+        moved, but their content and vectors have not changed.
+        """
+        chunks = [
+            StoredChunk(
+                chunk_id=chunk.chunk_id,
+                parent_doc_id=chunk.parent_doc_id,
+                content=chunk.chunk_content,
+                metadata=self._build_chunk_metadata(chunk, document),
+            )
+            for chunk, document in self._chunk_rows([document])
+        ]
+        await self._set_chunk_metadata(collection_name, chunks)
+
+    @abstractmethod
+    async def _set_chunk_metadata(self, collection_name: str, chunks: list[StoredChunk]) -> None:
+        """Replaces the metadata of stored chunks by ID (their content and vectors are kept)."""
+
+    async def update_document_metadata(self, collection_name: str, document: Document) -> None:
+        """Refreshes a document's catalog record (its chunks do not hold document-level metadata)."""
+        await self.upsert_document_records(collection_name, {document.id: document.metadata.model_dump()})
+
+    @abstractmethod
+    async def upsert_document_records(self, collection_name: str, records: dict[str, dict[str, Any]]) -> None:
+        """Stores document-level metadata by document ID in the collection's catalog."""
+
+    @abstractmethod
+    async def get_document_records(
+        self, collection_name: str, document_ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Document-level metadata by document ID, of ``document_ids`` or of every document."""
+
+    @abstractmethod
+    async def delete_document_records(self, collection_name: str, document_ids: list[str]) -> None:
+        """Removes documents from the collection's catalog."""
+
+    async def hydrate(self, collection_name: str, results: list[SearchResult]) -> list[SearchResult]:
+        """Search hits with their documents' metadata added, looked up in one batch."""
+        document_ids = sorted({r.parent_doc_id for r in results if r.parent_doc_id})
+        if not document_ids:
+            return results
+        records = await self.get_document_records(collection_name, document_ids)
+        return [
+            SearchResult(
+                r.content, r.score, {**r.metadata, **records[r.parent_doc_id]}, r.parent_doc_id, r.chunk_id, r.key
+            )
+            if r.parent_doc_id in records
+            else r
+            for r in results
+        ]
+
     @abstractmethod
     async def get_collection_info(self, collection_name: str) -> CollectionInfo:
         """Returns metadata and stats about a collection."""
@@ -41,6 +337,10 @@ class BaseVectorStore(ABC):
     async def list_collections(self) -> list[str]:
         """Returns list of all collection names."""
 
+    @abstractmethod
+    async def collection_exists(self, name: str) -> bool:
+        """Whether a collection exists (internal collections included)."""
+
     @abstractmethod
     async def get_documents(self, collection_name: str) -> list[DocumentInfo]:
         """Returns list of unique documents in a collection."""
@@ -64,7 +364,7 @@ class BaseVectorStore(ABC):
         )
 
     async def create_collection(self, name: str) -> None:
-        """Validate the name and create the collection.
+        """Validate the name and create the collection, recording this store's embedding model for it.
 
         Raises:
             ValueError: If name is invalid or reserved.
@@ -77,31 +377,173 @@ class BaseVectorStore(ABC):
         if name.lower() in _RESERVED_COLLECTION_NAMES:
             raise ValueError(f"'{name}' is a reserved collection name")
         await self._ensure_collection(name)
+        await self.embedder_for(name, pin=True)
+
+    async def create_shadow_collection(self, collection_name: str) -> str:
+        """Creates an empty collection to rebuild ``collection_name`` in.
+
+        It gets this store's embedding model (recorded for it) and dimension,
+        and stays out of ``list_collections()`` until :meth:`swap_collection`
+        puts it in place.
+        """
+        shadow_name = f"{collection_name}__shadow_{int(time.time())}"
+        await self._ensure_collection(shadow_name)
+        await self._record_embedding(shadow_name, self.settings.embeddings_config)
+        return shadow_name
+
+    @abstractmethod
+    async def swap_collection(self, collection_name: str, shadow_name: str) -> None:
+        """Serves the shadow collection as ``collection_name`` and drops the data it replaces.
+
+        The shadow's embedding model becomes the collection's, so searches
+        embed with it from then on.
+        """
+
+    @abstractmethod
+    async def _ensure_collection(self, name: str, dim: int | None = None) -> None:
+        """Creates the collection if it does not exist yet (``dim``: its vector size, this store's by default)."""
+
+    async def _physical(self, name: str) -> str:
+        """The collection a name serves (Milvus and Qdrant serve collections through aliases)."""
+        return name
+
+    @staticmethod
+    def _embedding_key(physical: str) -> str:
+        """Registry ID of a collection (IDs must be UUIDs on Qdrant)."""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"collection:{physical}"))
+
+    async def _recorded_embedding(
+        self, collection_name: str, *, fresh: bool = False
+    ) -> tuple[str, "EmbeddingsConfig | None"]:
+        """The collection a name serves, and the embedding model recorded for it (None if none).
+
+        Both are cached for SERVED_CACHE_SECONDS, sparing searches the lookups;
+        ``fresh`` skips the cache (writes must not embed with a stale model).
+        """
+        from app.rag.config import EmbeddingsConfig
+
+        cached = self._served.get(collection_name)
+        if (
+            cached is not None
+            and not fresh
+            and cached[2] == _serving_changes
+            and time.monotonic() - cached[3] < SERVED_CACHE_SECONDS
+        ):
+            return cached[0], cached[1]
+        # Taken before the lookups: a change made meanwhile leaves the entry stale
+        changes, looked_up_at = _serving_changes, time.monotonic()
+        physical = await self._physical(collection_name)
+        key = self._embedding_key(physical)
+        record = (await self.get_document_records(EMBEDDING_REGISTRY, [key])).get(key)
+        config = None if record is None else EmbeddingsConfig.model_validate(record)
+        self._served[collection_name] = (physical, config, changes, looked_up_at)
+        return physical, config
+
+    async def _served_collection(self, name: str) -> str:
+        """The collection a name serves, cached like its model (see :meth:`_recorded_embedding`)."""
+        physical, _ = await self._recorded_embedding(name)
+        return physical
+
+    async def _record_embedding(self, physical: str, config: "EmbeddingsConfig") -> None:
+        await self.upsert_document_records(EMBEDDING_REGISTRY, {self._embedding_key(physical): config.model_dump()})
+        _serving_changed()
+
+    async def _forget_embedding(self, physical: str) -> None:
+        await self.delete_document_records(EMBEDDING_REGISTRY, [self._embedding_key(physical)])
+        _serving_changed()
+
+    async def _move_embedding(self, source: str, target: str) -> None:
+        """Move the embedding model recorded for a collection renamed from ``source`` to ``target``."""
+        _, config = await self._recorded_embedding(source)
+        if config is None:
+            await self._forget_embedding(target)
+        else:
+            await self._record_embedding(target, config)
+        await self._forget_embedding(source)
+
+    def _visible_collections(self, names: list[str]) -> list[str]:
+        """Collection names without shadow, retired and summary index collections."""
+        return [name for name in names if not _INTERNAL_COLLECTION_RE.search(name)]
+
+    def _chunk_rows(self, documents: list[Document]) -> list[tuple[DocumentPageChunk, Document]]:
+        """(chunk, document) pairs of all documents, in the order embed_documents() returns vectors."""
+        if not documents or any(not document.chunked_pages for document in documents):
+            raise ValueError("Document has no chunked pages.")
+        return [(chunk, document) for document in documents for chunk in document.chunked_pages or []]
 
     def _build_chunk_metadata(self, chunk: "DocumentPageChunk", document: Document) -> dict[str, Any]:
-        """Build metadata dict for a chunk."""
+        """Build metadata dict for a chunk (document-level metadata goes to the catalog)."""
         meta = {
             "page_num": chunk.page_num,
             "chunk_num": chunk.chunk_num,
 {%- if cookiecutter.enable_rag_image_description %}
-            "has_images": bool(getattr(chunk, "images", None)),
-            "image_count": len(getattr(chunk, "images", [])),
+            "has_images": chunk.image_count > 0,
+            "image_count": chunk.image_count,
 {%- endif %}
-            **document.metadata.model_dump(),
+            "tenant": document.metadata.tenant,
         }
         return meta
 
+    @staticmethod
+    def _scoped_tenants(tenants: list[str] | None) -> list[str] | None:
+        """Validated tenants a search is restricted to; None for an unscoped search.
+
+        Chunks written before tenancy have no tenant and count as shared:
+        searches scoped to the shared tenant match them too.
+        """
+        if tenants is None:
+            return None
+        return [check_tenant(tenant) for tenant in tenants]
+
+    def _tagged_metadata(self, chunk: StoredChunk) -> dict[str, Any]:
+        """Chunk metadata with its tenant (tags chunks written before tenancy as shared)."""
+        return {**chunk.metadata, "tenant": self._chunk_tenant(chunk)}
+
+    @staticmethod
+    def _chunk_tenant(chunk: StoredChunk) -> str:
+        """Tenant of a stored chunk (chunks written before tenancy are shared)."""
+        return check_tenant(chunk.metadata.get("tenant") or SHARED_TENANT)
+
+    def _catalog_name(self, collection_name: str) -> str:
+        """Name of the collection (or table) holding a collection's document catalog."""
+        return f"{collection_name}{CATALOG_SUFFIX}"
+
+    def _candidates(self, limit: int) -> int:
+        """Candidates to fetch from a quantized index to re-score down to ``limit``."""
+        if self.settings.vector_storage == "full":
+            return limit
+        return max(limit, math.ceil(limit * self.settings.vector_oversampling))
+
+    @staticmethod
+    def _rescore(
+        vector: list[float], candidates: list[tuple[SearchResult, list[float]]], limit: int
+    ) -> list[SearchResult]:
+        """Re-rank candidates from a quantized index by exact cosine similarity to their full vectors."""
+        query_norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        rescored = []
+        for result, stored in candidates:
+            norm = math.sqrt(sum(x * x for x in stored)) or 1.0
+            rescored.append(result.rescored(sum(a * b for a, b in zip(vector, stored)) / (query_norm * norm)))
+        rescored.sort(key=lambda r: r.score, reverse=True)
+        return rescored[:limit]
+
     def _sanitize_id(self, document_id: str) -> str:
         """Sanitize document_id to prevent filter injection."""
         return document_id.replace('"', "").replace("\\", "")
 
-    def _group_documents(self, results: list[dict[str, Any]]) -> list[DocumentInfo]:
-        """Group query results by parent_doc_id into DocumentInfo list."""
+    def _group_documents(
+        self, results: list[dict[str, Any]], records: dict[str, dict[str, Any]]
+    ) -> list[DocumentInfo]:
+        """Group query results by parent_doc_id into DocumentInfo list, with their catalog records.
+
+        Chunks written before the catalog existed carry the document metadata
+        themselves; it is used when a document has no record.
+        """
         doc_map: dict[str, dict[str, Any]] = {}
         for item in results:
             doc_id = item.get("parent_doc_id")
-            metadata = item.get("metadata", {})
             if doc_id and doc_id not in doc_map:
+                metadata = {**(item.get("metadata") or {}), **records.get(doc_id, {})}
                 doc_map[doc_id] = {
                     "document_id": doc_id,
                     "filename": metadata.get("filename"),
@@ -110,6 +552,7 @@ class BaseVectorStore(ABC):
                     "additional_info": {
                         "source_path": metadata.get("source_path", ""),
                         "content_hash": metadata.get("content_hash", ""),
+                        "tenant": metadata.get("tenant", SHARED_TENANT),
                         **(metadata.get("additional_info") or {}),
                     },
                     "chunk_count": 0,
@@ -136,6 +579,9 @@ from app.core.config import settings as app_settings
 from app.rag.config import RAGSettings
 from app.rag.embeddings import EmbeddingService
 
+MILVUS_IVF_NLIST = 1024  # Clusters of IVF indexes (compact and binary storage)
+MILVUS_IVF_NPROBE = 32  # Clusters searched per query
+
 
 class MilvusVectorStore(BaseVectorStore):
     """Milvus vector store implementation."""
@@ -146,86 +592,350 @@ class MilvusVectorStore(BaseVectorStore):
         self.client = AsyncMilvusClient(
             uri=app_settings.MILVUS_URI, token=app_settings.MILVUS_TOKEN
         )
-
-    async def _ensure_collection(self, name: str) -> None:
-        if not await self.client.has_collection(name):
+        self._catalogs: set[str] = set()  # Catalog collections known to exist
+        self._tenant_fields: dict[str, bool] = {}  # Collection -> created partitioned by tenant
+        self._served = {}  # Name -> the collection it serves and its embedding model (cached)
+
+    async def _physical(self, name: str) -> str:
+        """The collection behind an alias (collections are created behind one)."""
+        try:
+            alias = await self.client.describe_alias(name)
+        except Exception:
+            return name
+        return alias.get("collection_name") or name
+
+    async def _ensure_collection(self, name: str, dim: int | None = None) -> None:
+        """Create the collection if it does not exist yet.
+
+        New collections (internal ones aside) are served through an alias
+        from the start, so that swap_collection() only ever switches aliases.
+        """
+        physical = await self._physical(name)
+        dim = dim or self.settings.embeddings_config.dim
+        created = not await self.client.has_collection(physical)
+        if created:
+            if not _INTERNAL_COLLECTION_RE.search(name):
+                physical = f"{name}__live_{int(time.time())}"
             schema = self.client.create_schema(auto_id=False)
             schema.add_field("id", DataType.VARCHAR, is_primary=True, max_length=100)
             schema.add_field("parent_doc_id", DataType.VARCHAR, max_length=100)
             schema.add_field("content", DataType.VARCHAR, max_length=65535)
-            schema.add_field(
-                "vector", DataType.FLOAT_VECTOR, dim=self.settings.embeddings_config.dim
-            )
+            schema.add_field("vector", DataType.FLOAT_VECTOR, dim=dim)
             schema.add_field("metadata", DataType.JSON)
-            await self.client.create_collection(name, schema=schema, metric_type="COSINE")
-        indexes = await self.client.list_indexes(name)
+            if self.settings.tenant_partitioning:
+                # Partition key: Milvus hashes tenants into partitions and prunes the others on search
+                schema.add_field("tenant", DataType.VARCHAR, max_length=100, is_partition_key=True)
+            await self.client.create_collection(physical, schema=schema, metric_type="COSINE")
+        indexes = await self.client.list_indexes(physical)
         if not indexes:
             index_params = self.client.prepare_index_params()
-            index_params.add_index(field_name="vector", index_type="AUTOINDEX", metric_type="COSINE")
-            await self.client.create_index(collection_name=name, index_params=index_params)
-        await self.client.load_collection(name)
-
-    async def insert_document(self, collection_name: str, document: Document) -> None:
-        await self._ensure_collection(collection_name)
-        if not document.chunked_pages:
-            raise ValueError("Document has no chunked pages.")
-        vectors = self.embedder.embed_document(document)
+            index_params.add_index(field_name="vector", metric_type="COSINE", **self._index_options(dim))
+            await self.client.create_index(collection_name=physical, index_params=index_params)
+        await self.client.load_collection(physical)
+        if created and physical != name:
+            try:
+                await self.client.create_alias(physical, name)
+            except Exception:
+                # Created concurrently by another writer: theirs serves the name
+                await self.client.drop_collection(physical)
+                if await self._physical(name) == name:
+                    raise
+            _serving_changed()
+
+    def _index_options(self, dim: int) -> dict[str, Any]:
+        """Vector index of new collections, per storage profile (raw vectors stay stored for re-scoring)."""
+        if self.settings.vector_storage == "compact":
+            # int8 per dimension: 4x smaller than float32
+            return {"index_type": "IVF_SQ8", "params": {"nlist": MILVUS_IVF_NLIST}}
+        if self.settings.vector_storage == "binary":
+            # One byte per subvector of dim/m dimensions: 16-32x smaller than float32
+            m = max(d for d in range(1, dim // 8 + 1) if dim % d == 0)
+            return {"index_type": "IVF_PQ", "params": {"nlist": MILVUS_IVF_NLIST, "m": m, "nbits": 8}}
+        return {"index_type": "AUTOINDEX"}
+
+    async def _has_tenant_field(self, name: str) -> bool:
+        """Whether a collection was created partitioned (with a ``tenant`` partition-key field)."""
+        name = await self._served_collection(name)
+        if name not in self._tenant_fields:
+            description = await self.client.describe_collection(name)
+            self._tenant_fields[name] = any(field["name"] == "tenant" for field in description["fields"])
+        return self._tenant_fields[name]
+
+    async def upsert_chunks(
+        self, collection_name: str, chunks: list[StoredChunk], vectors: list[list[float]]
+    ) -> None:
+        partitioned = await self._has_tenant_field(collection_name)
         data = [
             {
                 "id": chunk.chunk_id,
                 "parent_doc_id": chunk.parent_doc_id,
-                "content": chunk.chunk_content,
+                "content": chunk.content,
                 "vector": vectors[i],
-                "metadata": self._build_chunk_metadata(chunk, document),
+                "metadata": self._tagged_metadata(chunk),
+                **({"tenant": self._chunk_tenant(chunk)} if partitioned else {}),
             }
-            for i, chunk in enumerate(document.chunked_pages)
+            for i, chunk in enumerate(chunks)
         ]
-        await self.client.insert(collection_name, data=data)
-
-    async def search(self, collection_name: str, query: str, limit: int = 4, filter: str = "") -> list[SearchResult]:
-        query_vector = self.embedder.embed_query(query)
+        await self.client.upsert(collection_name, data=data)
+
+    async def _query_pages(
+        self, collection_name: str, filter: str, output_fields: list[str], batch_size: int = 1000
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yields all rows matching a filter, in batches (a single query returns at most 16384 rows)."""
+        # Primary key cursor: query results come back ordered by primary key
+        last_id = ""
+        while True:
+            cursor = f'id > "{self._sanitize_id(last_id)}"'
+            rows = await self.client.query(
+                collection_name=collection_name,
+                filter=f"({filter}) and {cursor}" if filter else cursor,
+                output_fields=["id", *output_fields],
+                limit=batch_size,
+            )
+            if not rows:
+                return
+            yield rows
+            last_id = max(row["id"] for row in rows)
+
+    async def scroll_chunks(
+        self, collection_name: str, batch_size: int = 256, with_vectors: bool = False
+    ) -> AsyncIterator[list[StoredChunk]]:
+        output_fields = ["parent_doc_id", "content", "metadata", *(["vector"] if with_vectors else [])]
+        async for rows in self._query_pages(collection_name, "", output_fields, batch_size):
+            yield [
+                StoredChunk(
+                    chunk_id=row["id"],
+                    parent_doc_id=row["parent_doc_id"],
+                    content=row["content"],
+                    metadata=row["metadata"] or {},
+                    vector=[float(x) for x in row["vector"]] if with_vectors else None,
+                )
+                for row in rows
+            ]
+
+    async def swap_collection(self, collection_name: str, shadow_name: str) -> None:
+        previous = await self._physical(collection_name)
+        if previous != collection_name:
+            # Repointing the alias is atomic
+            await self.client.alter_alias(shadow_name, collection_name)
+        elif await self.client.has_collection(collection_name):
+            # Created before collections got an alias: it makes way for one of the same name,
+            # and searches fail between the rename and the new alias
+            previous = f"{collection_name}__retired_{int(time.time())}"
+            await self.client.rename_collection(collection_name, previous)
+            await self.client.create_alias(shadow_name, collection_name)
+            await self._forget_embedding(collection_name)
+        else:
+            await self.client.create_alias(shadow_name, collection_name)
+            _serving_changed()
+            return
+        await self.client.drop_collection(previous)
+        self._tenant_fields.pop(previous, None)
+        await self._forget_embedding(previous)
+
+    async def search_vector(
+        self,
+        collection_name: str,
+        vector: list[float],
+        limit: int = 4,
+        filter: str = "",
+        document_ids: list[str] | None = None,
+        tenants: list[str] | None = None,
+    ) -> list[SearchResult]:
+        if document_ids is not None:
+            ids = ", ".join(f'"{self._sanitize_id(doc_id)}"' for doc_id in document_ids)
+            filter = f"({filter}) and parent_doc_id in [{ids}]" if filter else f"parent_doc_id in [{ids}]"
+        scoped = self._scoped_tenants(tenants)
+        if scoped is not None:
+            keys = ", ".join(f'"{tenant}"' for tenant in scoped)
+            tenant_filter = self._metadata_clause("tenant", "in", scoped)
+            if SHARED_TENANT in scoped:
+                # Chunks written before tenancy have no tenant: they are shared
+                tenant_filter = f'({tenant_filter} or not exists metadata["tenant"])'
+            if await self._has_tenant_field(collection_name):
+                # Filtering on the partition key prunes the other tenants' partitions
+                tenant_filter = f"tenant in [{keys}] and {tenant_filter}"
+            filter = f"({filter}) and {tenant_filter}" if filter else tenant_filter
+        quantized = self.settings.vector_storage != "full"
         results = await self.client.search(
             collection_name=collection_name,
-            data=[query_vector],
-            limit=limit,
+            data=[vector],
+            limit=self._candidates(limit),
             filter=filter,
-            output_fields=["content", "parent_doc_id", "metadata"],
+            output_fields=["content", "parent_doc_id", "metadata", *(["vector"] if quantized else [])],
+            search_params={"params": {"nprobe": MILVUS_IVF_NPROBE}} if quantized else None,
         )
-        return [
-            SearchResult(
-                content=hit["entity"]["content"],
-                score=hit["distance"],
-                metadata=hit["entity"]["metadata"],
-                parent_doc_id=hit["entity"]["parent_doc_id"],
+        hits = [
+            (
+                SearchResult(
+                    content=hit["entity"]["content"],
+                    score=hit["distance"],
+                    metadata=hit["entity"]["metadata"],
+                    parent_doc_id=hit["entity"]["parent_doc_id"],
+                    chunk_id=str(hit["id"]),
+                ),
+                hit["entity"].get("vector"),
             )
             for hit in results[0]
         ]
+        if quantized:
+            return self._rescore(vector, [(r, [float(x) for x in v]) for r, v in hits], limit)
+        return [r for r, _ in hits]
 
     async def get_collection_info(self, collection_name: str) -> CollectionInfo:
         count = await self.client.get_collection_stats(collection_name)
-        return CollectionInfo(name=collection_name, total_vectors=count.get("row_count", 0), dim=self.settings.embeddings_config.dim)
+        dim = (await self.embedding_config(collection_name)).dim
+        return CollectionInfo(name=collection_name, total_vectors=count.get("row_count", 0), dim=dim)
 
     async def delete_collection(self, collection_name: str) -> None:
-        await self.client.drop_collection(collection_name)
+        physical = await self._physical(collection_name)
+        if physical != collection_name:
+            await self.client.drop_alias(collection_name)
+        await self.client.drop_collection(physical)
+        self._tenant_fields.pop(physical, None)
+        await self._forget_embedding(physical)
+        catalog = self._catalog_name(collection_name)
+        self._catalogs.discard(catalog)
+        if await self.client.has_collection(catalog):
+            await self.client.drop_collection(catalog)
 
     async def delete_document(self, collection_name: str, document_id: str) -> None:
         sanitized = self._sanitize_id(document_id)
         await self.client.delete(collection_name=collection_name, filter=f'parent_doc_id == "{sanitized}"')
+        await self.delete_document_records(collection_name, [sanitized])
+
+    async def get_chunk_ids(self, collection_name: str, document_id: str) -> set[str]:
+        await self._ensure_collection(collection_name)
+        doc_filter = f'parent_doc_id == "{self._sanitize_id(document_id)}"'
+        return {row["id"] async for rows in self._query_pages(collection_name, doc_filter, []) for row in rows}
+
+    async def get_document_vectors(self, collection_name: str, document_id: str) -> list[list[float]]:
+        doc_filter = f'parent_doc_id == "{self._sanitize_id(document_id)}"'
+        return [
+            [float(x) for x in row["vector"]]
+            async for rows in self._query_pages(collection_name, doc_filter, ["vector"])
+            for row in rows
+        ]
+
+    async def delete_chunks(self, collection_name: str, chunk_ids: list[str]) -> None:
+        if chunk_ids:
+            await self.client.delete(collection_name=collection_name, ids=chunk_ids)
+
+    async def _set_chunk_metadata(self, collection_name: str, chunks: list[StoredChunk]) -> None:
+        # Upserts replace whole rows: write the stored content and vectors back with the new metadata
+        rows = await self.client.get(
+            collection_name, ids=[chunk.chunk_id for chunk in chunks], output_fields=["content", "vector"]
+        )
+        stored = {row["id"]: row for row in rows}
+        kept = [chunk for chunk in chunks if chunk.chunk_id in stored]
+        if kept:
+            await self.upsert_chunks(
+                collection_name,
+                [
+                    StoredChunk(chunk.chunk_id, chunk.parent_doc_id, stored[chunk.chunk_id]["content"], chunk.metadata)
+                    for chunk in kept
+                ],
+                [[float(x) for x in stored[chunk.chunk_id]["vector"]] for chunk in kept],
+            )
+
+    async def _ensure_catalog(self, collection_name: str) -> str:
+        catalog = self._catalog_name(collection_name)
+        if catalog in self._catalogs:
+            return catalog
+        if not await self.client.has_collection(catalog):
+            schema = self.client.create_schema(auto_id=False)
+            schema.add_field("id", DataType.VARCHAR, is_primary=True, max_length=100)
+            schema.add_field("metadata", DataType.JSON)
+            # Milvus collections need a vector field; records are only fetched by ID
+            schema.add_field("placeholder", DataType.FLOAT_VECTOR, dim=2)
+            index_params = self.client.prepare_index_params()
+            index_params.add_index(field_name="placeholder", index_type="FLAT", metric_type="L2")
+            await self.client.create_collection(catalog, schema=schema, index_params=index_params)
+        await self.client.load_collection(catalog)
+        self._catalogs.add(catalog)
+        return catalog
+
+    async def upsert_document_records(self, collection_name: str, records: dict[str, dict[str, Any]]) -> None:
+        if not records:
+            return
+        catalog = await self._ensure_catalog(collection_name)
+        data = [
+            {"id": doc_id, "metadata": metadata, "placeholder": [0.0, 0.0]} for doc_id, metadata in records.items()
+        ]
+        await self.client.upsert(catalog, data=data)
+
+    async def get_document_records(
+        self, collection_name: str, document_ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        catalog = await self._ensure_catalog(collection_name)
+        if document_ids is None:
+            return {
+                row["id"]: row["metadata"] async for rows in self._query_pages(catalog, "", ["metadata"]) for row in rows
+            }
+        if not document_ids:
+            return {}
+        rows = await self.client.get(catalog, ids=list(document_ids), output_fields=["id", "metadata"])
+        return {row["id"]: row["metadata"] for row in rows}
+
+    async def delete_document_records(self, collection_name: str, document_ids: list[str]) -> None:
+        if document_ids:
+            await self.client.delete(await self._ensure_catalog(collection_name), ids=list(document_ids))
+
+    @staticmethod
+    def _metadata_clause(key: str, op: str, value: Any) -> str:
+        """Milvus expression comparing ``metadata[key]`` to a JSON literal (or list of them, for ``in``).
+
+        Milvus only takes ``in`` on plain fields, so it is spelled out as
+        ``==`` alternatives; and as negated comparisons skip keys that are
+        not set, those are matched explicitly, like :func:`_matches` does.
+        """
+        path = f'metadata["{key}"]'
+        if op in ("in", "not in"):
+            matched = " or ".join(f"{path} == {json.dumps(v)}" for v in value) or "false"
+            return f"({matched})" if op == "in" else f"(not exists {path} or not ({matched}))"
+        if op == "!=":
+            return f"(not exists {path} or {path} != {json.dumps(value)})"
+        return f"{path} {op} {json.dumps(value)}"
+
+    async def _find_documents(self, collection_name: str, clauses: list[tuple[str, str, Any]]) -> list[str]:
+        # Fields come from DOCUMENT_FILTER_FIELDS, values are JSON literals (strings, numbers, lists)
+        expression = " and ".join(self._metadata_clause(field, op, value) for field, op, value in clauses)
+        catalog = await self._ensure_catalog(collection_name)
+        return [row["id"] async for rows in self._query_pages(catalog, expression, []) for row in rows]
 
     async def get_documents(self, collection_name: str) -> list[DocumentInfo]:
         await self._ensure_collection(collection_name)
-        results = await self.client.query(collection_name=collection_name, filter="", output_fields=["parent_doc_id", "metadata"], limit=10000)
-        return self._group_documents(results)
+        results = [
+            row async for rows in self._query_pages(collection_name, "", ["parent_doc_id", "metadata"]) for row in rows
+        ]
+        return self._group_documents(results, await self.get_document_records(collection_name))
 
     async def list_collections(self) -> list[str]:
-        result: list[str] = await self.client.list_collections()
-        return result
+        names: list[str] = await self.client.list_collections()
+        aliases: list[str] = await self.client.list_aliases()
+        return [*self._visible_collections(names), *aliases]
+
+    async def collection_exists(self, name: str) -> bool:
+        return bool(await self.client.has_collection(await self._physical(name)))
 {%- endif %}
 
 
 {%- if cookiecutter.use_qdrant %}
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import Distance, FilterSelector, PointStruct, VectorParams, Filter, FieldCondition, MatchValue
+from qdrant_client.models import Distance, FilterSelector, PointIdsList, PointStruct, VectorParams, Filter, FieldCondition, MatchValue
+from qdrant_client.models import KeywordIndexParams, KeywordIndexType, MatchAny, PayloadSchemaType
+from qdrant_client.models import IsEmptyCondition, PayloadField, Range
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+)
+from qdrant_client.models import CreateAlias, CreateAliasOperation, DeleteAlias, DeleteAliasOperation
+from qdrant_client.models import SetPayload, SetPayloadOperation
 
 from app.core.config import settings as app_settings
 from app.rag.config import RAGSettings
@@ -243,50 +953,176 @@ class QdrantVectorStore(BaseVectorStore):
             port=app_settings.QDRANT_PORT,
             api_key=app_settings.QDRANT_API_KEY or None,
         )
+        self._catalogs: set[str] = set()  # Catalog collections known to exist
+        self._served = {}  # Name -> the collection it serves and its embedding model (cached)
+
+    async def _aliases(self) -> dict[str, str]:
+        """Alias -> collection (collections are created behind one)."""
+        response = await self.client.get_aliases()
+        return {a.alias_name: a.collection_name for a in response.aliases}
 
-    async def _ensure_collection(self, name: str) -> None:
+    async def _physical(self, name: str) -> str:
+        return (await self._aliases()).get(name, name)
+
+    async def _ensure_collection(self, name: str, dim: int | None = None) -> None:
+        """Create the collection if it does not exist yet.
+
+        New collections (internal ones aside) are served through an alias
+        from the start, so that swap_collection() only ever switches aliases.
+        """
         collections = await self.client.get_collections()
-        if name not in [c.name for c in collections.collections]:
-            await self.client.create_collection(
-                collection_name=name,
-                vectors_config=VectorParams(
-                    size=self.settings.embeddings_config.dim,
-                    distance=Distance.COSINE,
-                ),
+        if name in [c.name for c in collections.collections] or name in await self._aliases():
+            return
+        physical = name if _INTERNAL_COLLECTION_RE.search(name) else f"{name}__live_{int(time.time())}"
+        await self.client.create_collection(
+            collection_name=physical,
+            vectors_config=VectorParams(
+                size=dim or self.settings.embeddings_config.dim,
+                distance=Distance.COSINE,
+                # Quantized collections keep only the quantized vectors in RAM
+                on_disk=self.settings.vector_storage != "full",
+            ),
+            quantization_config=self._quantization_config(),
+        )
+        # Document filters (deletes, per-document and summary-index searches) use it
+        await self.client.create_payload_index(
+            collection_name=physical, field_name="parent_doc_id", field_schema=PayloadSchemaType.KEYWORD
+        )
+        if self.settings.tenant_partitioning:
+            # Tenant index: Qdrant co-locates each tenant's points and searches only them
+            await self.client.create_payload_index(
+                collection_name=physical,
+                field_name="tenant",
+                field_schema=KeywordIndexParams(type=KeywordIndexType.KEYWORD, is_tenant=True),
             )
-
-    async def insert_document(self, collection_name: str, document: Document) -> None:
-        await self._ensure_collection(collection_name)
-        if not document.chunked_pages:
-            raise ValueError("Document has no chunked pages.")
-        vectors = self.embedder.embed_document(document)
+        if physical != name:
+            try:
+                await self.client.update_collection_aliases(change_aliases_operations=[
+                    CreateAliasOperation(create_alias=CreateAlias(collection_name=physical, alias_name=name))
+                ])
+            except Exception:
+                # Created concurrently by another writer: theirs serves the name
+                await self.client.delete_collection(physical)
+                if name not in await self._aliases():
+                    raise
+            _serving_changed()
+
+    def _quantization_config(self) -> ScalarQuantization | BinaryQuantization | None:
+        """Quantization of new collections, per storage profile."""
+        if self.settings.vector_storage == "compact":
+            # int8 per dimension: 4x smaller than float32
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+        if self.settings.vector_storage == "binary":
+            # One bit per dimension: 32x smaller than float32
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    async def upsert_chunks(
+        self, collection_name: str, chunks: list[StoredChunk], vectors: list[list[float]]
+    ) -> None:
         points = [
             PointStruct(
                 id=chunk.chunk_id,
                 vector=vectors[i],
                 payload={
-                    "content": chunk.chunk_content,
+                    "content": chunk.content,
                     "parent_doc_id": chunk.parent_doc_id,
-                    "metadata": self._build_chunk_metadata(chunk, document),
+                    "metadata": self._tagged_metadata(chunk),
+                    # Top-level copy for the tenant filter (and index, in partitioned collections)
+                    "tenant": self._chunk_tenant(chunk),
                 },
             )
-            for i, chunk in enumerate(document.chunked_pages)
+            for i, chunk in enumerate(chunks)
         ]
         await self.client.upsert(collection_name=collection_name, points=points)
 
-    async def search(self, collection_name: str, query: str, limit: int = 4, filter: str = "") -> list[SearchResult]:
-        query_vector = self.embedder.embed_query(query)
-        qdrant_filter = None
+    async def scroll_chunks(
+        self, collection_name: str, batch_size: int = 256, with_vectors: bool = False
+    ) -> AsyncIterator[list[StoredChunk]]:
+        offset = None
+        while True:
+            records, offset = await self.client.scroll(
+                collection_name=collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=with_vectors,
+            )
+            if records:
+                yield [
+                    StoredChunk(
+                        chunk_id=str(r.id),
+                        parent_doc_id=r.payload.get("parent_doc_id"),
+                        content=r.payload.get("content", ""),
+                        metadata=r.payload.get("metadata", {}),
+                        vector=r.vector if with_vectors else None,  # type: ignore[arg-type]
+                    )
+                    for r in records
+                ]
+            if offset is None:
+                return
+
+    async def swap_collection(self, collection_name: str, shadow_name: str) -> None:
+        previous = (await self._aliases()).get(collection_name)
+        operations: list[Any] = [
+            CreateAliasOperation(create_alias=CreateAlias(collection_name=shadow_name, alias_name=collection_name))
+        ]
+        if previous:
+            # Delete + create in one request is an atomic switch
+            operations.insert(0, DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=collection_name)))
+        elif await self.client.collection_exists(collection_name):
+            # Created before collections got an alias: an alias cannot take its name while it
+            # exists (and Qdrant cannot rename), so searches fail until the alias is created
+            await self.client.delete_collection(collection_name)
+            await self._forget_embedding(collection_name)
+        await self.client.update_collection_aliases(change_aliases_operations=operations)
+        _serving_changed()
+        if previous:
+            await self.client.delete_collection(previous)
+            await self._forget_embedding(previous)
+
+    async def search_vector(
+        self,
+        collection_name: str,
+        vector: list[float],
+        limit: int = 4,
+        filter: str = "",
+        document_ids: list[str] | None = None,
+        tenants: list[str] | None = None,
+    ) -> list[SearchResult]:
+        conditions: list[Any] = []
         if filter and "parent_doc_id" in filter:
-            import re
             m = re.search(r'parent_doc_id\s*==\s*"([^"]+)"', filter)
             if m:
-                qdrant_filter = Filter(must=[FieldCondition(key="parent_doc_id", match=MatchValue(value=m.group(1)))])
+                conditions.append(FieldCondition(key="parent_doc_id", match=MatchValue(value=m.group(1))))
+        if document_ids is not None:
+            conditions.append(FieldCondition(key="parent_doc_id", match=MatchAny(any=list(document_ids))))
+        scoped = self._scoped_tenants(tenants)
+        if scoped is not None:
+            tenant_condition: Any = FieldCondition(key="tenant", match=MatchAny(any=scoped))
+            if SHARED_TENANT in scoped:
+                # Chunks written before tenancy have no tenant: they are shared
+                tenant_condition = Filter(
+                    should=[tenant_condition, IsEmptyCondition(is_empty=PayloadField(key="tenant"))]
+                )
+            conditions.append(tenant_condition)
+        qdrant_filter = Filter(must=conditions) if conditions else None
+        search_params = None
+        if self.settings.vector_storage != "full":
+            # Qdrant re-scores the oversampled candidates with the original vectors
+            search_params = SearchParams(
+                quantization=QuantizationSearchParams(
+                    rescore=True, oversampling=max(1.0, self.settings.vector_oversampling)
+                )
+            )
         results = await self.client.search(
             collection_name=collection_name,
-            query_vector=query_vector,
+            query_vector=vector,
             limit=limit,
             query_filter=qdrant_filter,
+            search_params=search_params,
         )
         return [
             SearchResult(
@@ -294,6 +1130,7 @@ class QdrantVectorStore(BaseVectorStore):
                 score=hit.score,
                 metadata=hit.payload.get("metadata", {}),
                 parent_doc_id=hit.payload.get("parent_doc_id"),
+                chunk_id=str(hit.id),
             )
             for hit in results
         ]
@@ -303,11 +1140,23 @@ class QdrantVectorStore(BaseVectorStore):
         return CollectionInfo(
             name=collection_name,
             total_vectors=info.points_count or 0,
-            dim=self.settings.embeddings_config.dim,
+            dim=(await self.embedding_config(collection_name)).dim,
         )
 
     async def delete_collection(self, collection_name: str) -> None:
+        logical_name = collection_name
+        physical = (await self._aliases()).get(collection_name)
+        if physical:
+            await self.client.update_collection_aliases(
+                change_aliases_operations=[DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=collection_name))]
+            )
+            collection_name = physical
         await self.client.delete_collection(collection_name)
+        await self._forget_embedding(collection_name)
+        catalog = self._catalog_name(logical_name)
+        self._catalogs.discard(catalog)
+        if await self.client.collection_exists(catalog):
+            await self.client.delete_collection(catalog)
 
     async def delete_document(self, collection_name: str, document_id: str) -> None:
         sanitized = self._sanitize_id(document_id)
@@ -317,19 +1166,169 @@ class QdrantVectorStore(BaseVectorStore):
                 must=[FieldCondition(key="parent_doc_id", match=MatchValue(value=sanitized))]
             )),
         )
+        await self.delete_document_records(collection_name, [sanitized])
 
-    async def get_documents(self, collection_name: str) -> list[DocumentInfo]:
+    async def get_chunk_ids(self, collection_name: str, document_id: str) -> set[str]:
         await self._ensure_collection(collection_name)
-        records, _ = await self.client.scroll(collection_name=collection_name, limit=10000, with_payload=True)
-        results = [
-            {"parent_doc_id": r.payload.get("parent_doc_id"), "metadata": r.payload.get("metadata", {})}
-            for r in records
+        sanitized = self._sanitize_id(document_id)
+        doc_filter = Filter(must=[FieldCondition(key="parent_doc_id", match=MatchValue(value=sanitized))])
+        chunk_ids: set[str] = set()
+        offset = None
+        while True:
+            records, offset = await self.client.scroll(
+                collection_name=collection_name,
+                scroll_filter=doc_filter,
+                limit=1000,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+            chunk_ids.update(str(r.id) for r in records)
+            if offset is None:
+                return chunk_ids
+
+    async def get_document_vectors(self, collection_name: str, document_id: str) -> list[list[float]]:
+        doc_filter = Filter(
+            must=[FieldCondition(key="parent_doc_id", match=MatchValue(value=self._sanitize_id(document_id)))]
+        )
+        vectors: list[list[float]] = []
+        offset = None
+        while True:
+            records, offset = await self.client.scroll(
+                collection_name=collection_name,
+                scroll_filter=doc_filter,
+                limit=1000,
+                offset=offset,
+                with_payload=False,
+                with_vectors=True,
+            )
+            vectors.extend(r.vector for r in records)  # type: ignore[misc]
+            if offset is None:
+                return vectors
+
+    async def delete_chunks(self, collection_name: str, chunk_ids: list[str]) -> None:
+        if chunk_ids:
+            await self.client.delete(
+                collection_name=collection_name,
+                points_selector=PointIdsList(points=list(chunk_ids)),
+            )
+
+    async def _set_chunk_metadata(self, collection_name: str, chunks: list[StoredChunk]) -> None:
+        await self.client.batch_update_points(
+            collection_name=collection_name,
+            update_operations=[
+                SetPayloadOperation(
+                    set_payload=SetPayload(payload={"metadata": self._tagged_metadata(chunk)}, points=[chunk.chunk_id])
+                )
+                for chunk in chunks
+            ],
+        )
+
+    async def _ensure_catalog(self, collection_name: str) -> str:
+        catalog = self._catalog_name(collection_name)
+        if catalog not in self._catalogs:
+            if not await self.client.collection_exists(catalog):
+                # Payload only: records are fetched by ID, never searched
+                await self.client.create_collection(collection_name=catalog, vectors_config={})
+            self._catalogs.add(catalog)
+        return catalog
+
+    async def upsert_document_records(self, collection_name: str, records: dict[str, dict[str, Any]]) -> None:
+        if not records:
+            return
+        points = [
+            PointStruct(id=doc_id, vector={}, payload={"metadata": metadata}) for doc_id, metadata in records.items()
         ]
-        return self._group_documents(results)
+        await self.client.upsert(collection_name=await self._ensure_catalog(collection_name), points=points)
+
+    async def get_document_records(
+        self, collection_name: str, document_ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        catalog = await self._ensure_catalog(collection_name)
+        if document_ids is not None:
+            if not document_ids:
+                return {}
+            points = await self.client.retrieve(catalog, ids=list(document_ids), with_payload=True, with_vectors=False)
+            return {str(p.id): (p.payload or {}).get("metadata", {}) for p in points}
+        records: dict[str, dict[str, Any]] = {}
+        offset = None
+        while True:
+            points, offset = await self.client.scroll(
+                collection_name=catalog, limit=1000, offset=offset, with_payload=True, with_vectors=False
+            )
+            records.update((str(p.id), (p.payload or {}).get("metadata", {})) for p in points)
+            if offset is None:
+                return records
+
+    async def delete_document_records(self, collection_name: str, document_ids: list[str]) -> None:
+        if document_ids:
+            await self.client.delete(
+                collection_name=await self._ensure_catalog(collection_name),
+                points_selector=PointIdsList(points=list(document_ids)),
+            )
+
+    async def _find_documents(self, collection_name: str, clauses: list[tuple[str, str, Any]]) -> list[str]:
+        must: list[Any] = []
+        must_not: list[Any] = []
+        for field, op, value in clauses:
+            key = f"metadata.{field}"
+            values = list(value) if op in ("in", "not in") else [value]
+            if op in ("<", "<=", ">", ">="):
+                if not isinstance(value, int | float):
+                    # Qdrant only compares numbers by range
+                    return await super()._find_documents(collection_name, clauses)
+                bound = {"<": "lt", "<=": "lte", ">": "gt", ">=": "gte"}[op]
+                must.append(FieldCondition(key=key, range=Range(**{bound: value})))
+            elif not values or len({type(v) for v in values}) > 1 or isinstance(values[0], float):
+                # Qdrant only matches strings or integers by value
+                return await super()._find_documents(collection_name, clauses)
+            elif op in ("==", "!="):
+                (must if op == "==" else must_not).append(FieldCondition(key=key, match=MatchValue(value=value)))
+            else:
+                (must if op == "in" else must_not).append(FieldCondition(key=key, match=MatchAny(any=values)))
+        catalog_filter = Filter(must=must or None, must_not=must_not or None)
+        catalog = await self._ensure_catalog(collection_name)
+        document_ids: list[str] = []
+        offset = None
+        while True:
+            points, offset = await self.client.scroll(
+                collection_name=catalog,
+                scroll_filter=catalog_filter,
+                limit=1000,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+            document_ids.extend(str(p.id) for p in points)
+            if offset is None:
+                return document_ids
+
+    async def get_documents(self, collection_name: str) -> list[DocumentInfo]:
+        await self._ensure_collection(collection_name)
+        results: list[dict[str, Any]] = []
+        offset = None
+        while True:
+            records, offset = await self.client.scroll(
+                collection_name=collection_name,
+                limit=1000,
+                offset=offset,
+                with_payload=["parent_doc_id", "metadata"],
+                with_vectors=False,
+            )
+            results.extend(
+                {"parent_doc_id": r.payload.get("parent_doc_id"), "metadata": r.payload.get("metadata", {})}
+                for r in records
+            )
+            if offset is None:
+                return self._group_documents(results, await self.get_document_records(collection_name))
 
     async def list_collections(self) -> list[str]:
         collections = await self.client.get_collections()
-        return [c.name for c in collections.collections]
+        names = self._visible_collections([c.name for c in collections.collections])
+        return [*names, *await self._aliases()]
+
+    async def collection_exists(self, name: str) -> bool:
+        return await self.client.collection_exists(name) or name in await self._aliases()
 {%- endif %}
 
 
@@ -351,6 +1350,10 @@ class ChromaVectorStore(BaseVectorStore):
     def __init__(self, settings: RAGSettings, embedding_service: EmbeddingService):
         self.settings = settings
         self.embedder = embedding_service
+        self._served = {}  # Name -> the collection it serves and its embedding model (cached)
+        self._tenants_tagged: set[str] = set()  # Collections whose chunks all name their tenant
+        if settings.vector_storage != "full":
+            logger.warning(f"ChromaDB stores full vectors; vector storage '{settings.vector_storage}' is ignored")
         if app_settings.CHROMA_HOST:
             self.client = chromadb.HttpClient(
                 host=app_settings.CHROMA_HOST,
@@ -359,57 +1362,188 @@ class ChromaVectorStore(BaseVectorStore):
         else:
             self.client = chromadb.PersistentClient(path=app_settings.CHROMA_PERSIST_DIR)
 
-    def _get_collection(self, name: str) -> Any:
+    def _get_collection(self, name: str, tenant: str | None = None) -> Any:
         return self.client.get_or_create_collection(
             name=name,
-            metadata={"hnsw:space": "cosine"},
+            metadata={"hnsw:space": "cosine", **({"tenant": tenant} if tenant else {})},
         )
 
-    async def _ensure_collection(self, name: str) -> None:
-        """Ensure collection exists (ChromaDB creates on access)."""
+    def _partition(self, collection_name: str, tenant: str) -> Any:
+        """Collection holding a tenant's chunks; shared chunks stay in the collection itself."""
+        if not self.settings.tenant_partitioning or tenant == SHARED_TENANT:
+            return self._get_collection(collection_name)
+        return self._get_collection(tenant_partition(collection_name, tenant), tenant)
+
+    def _tenant_partitions(self, collection_name: str, tenants: list[str] | None = None) -> list[Any]:
+        """Existing per-tenant collections of a collection (only those of ``tenants``, if given)."""
+        if not self.settings.tenant_partitioning:
+            return []
+        partitions = []
+        for collection in self.client.list_collections():
+            tenant = (collection.metadata or {}).get("tenant")
+            if not tenant or collection.name != tenant_partition(collection_name, tenant):
+                continue
+            if tenants is None or tenant in tenants:
+                partitions.append(collection)
+        return partitions
+
+    def _partitions(self, collection_name: str, tenants: list[str] | None = None) -> list[Any]:
+        """The collection and its per-tenant collections (only those of ``tenants``, if given)."""
+        partitions = self._tenant_partitions(collection_name, tenants)
+        if tenants is None or SHARED_TENANT in tenants:
+            partitions.insert(0, self._get_collection(collection_name))
+        return partitions
+
+    def _tag_shared(self, collection: Any) -> None:
+        """Tag the chunks a collection got before tenancy as shared (once per collection and process).
+
+        Chroma cannot filter on a missing metadata key, so searches scoped to
+        the shared tenant would not find them otherwise.
+        """
+        if collection.name in self._tenants_tagged:
+            return
+        offset = 0
+        while True:
+            batch = collection.get(include=["metadatas"], limit=1000, offset=offset)
+            if not batch["ids"]:
+                break
+            untagged = [
+                (chunk_id, metadata or {})
+                for chunk_id, metadata in zip(batch["ids"], batch["metadatas"] or [None] * len(batch["ids"]))
+                if not (metadata or {}).get("tenant")
+            ]
+            if untagged:
+                collection.update(
+                    ids=[chunk_id for chunk_id, _ in untagged],
+                    metadatas=[{**metadata, "tenant": SHARED_TENANT} for _, metadata in untagged],
+                )
+            offset += len(batch["ids"])
+        self._tenants_tagged.add(collection.name)
+
+    async def _ensure_collection(self, name: str, dim: int | None = None) -> None:
+        """Ensure collection exists (ChromaDB creates on access, its dimension is set by the first vectors)."""
         import asyncio
         await asyncio.to_thread(self._get_collection, name)
 
-    async def insert_document(self, collection_name: str, document: Document) -> None:
+    async def upsert_chunks(
+        self, collection_name: str, chunks: list[StoredChunk], vectors: list[list[float]]
+    ) -> None:
         import asyncio
 
-        if not document.chunked_pages:
-            raise ValueError("Document has no chunked pages.")
-
-        vectors = self.embedder.embed_document(document)
-        ids = [chunk.chunk_id for chunk in document.chunked_pages]
-        documents = [chunk.chunk_content for chunk in document.chunked_pages]
-        metadatas = [self._build_chunk_metadata(chunk, document) for chunk in document.chunked_pages]
+        ids = [chunk.chunk_id for chunk in chunks]
+        contents = [chunk.content for chunk in chunks]
+        # parent_doc_id lives in the metadata, where document filters look for it
+        metadatas = [
+            {**self._tagged_metadata(chunk), **({"parent_doc_id": chunk.parent_doc_id} if chunk.parent_doc_id else {})}
+            for chunk in chunks
+        ]
+        rows_by_tenant: dict[str, list[int]] = {}
+        for i, chunk in enumerate(chunks):
+            rows_by_tenant.setdefault(self._chunk_tenant(chunk), []).append(i)
 
         def _upsert():
-            collection = self._get_collection(collection_name)
-            collection.upsert(ids=ids, embeddings=vectors, documents=documents, metadatas=metadatas)
+            for tenant, rows in rows_by_tenant.items():
+                self._partition(collection_name, tenant).upsert(
+                    ids=[ids[i] for i in rows],
+                    embeddings=[vectors[i] for i in rows],
+                    documents=[contents[i] for i in rows],
+                    metadatas=[metadatas[i] for i in rows],
+                )
 
         await asyncio.to_thread(_upsert)
 
-    async def search(self, collection_name: str, query: str, limit: int = 4, filter: str = "") -> list[SearchResult]:
+    async def scroll_chunks(
+        self, collection_name: str, batch_size: int = 256, with_vectors: bool = False
+    ) -> AsyncIterator[list[StoredChunk]]:
+        import asyncio
+
+        include = ["documents", "metadatas", *(["embeddings"] if with_vectors else [])]
+        for collection in await asyncio.to_thread(self._partitions, collection_name):
+            offset = 0
+            while True:
+                batch = await asyncio.to_thread(collection.get, include=include, limit=batch_size, offset=offset)
+                if not batch["ids"]:
+                    break
+                metadatas = batch["metadatas"] or [{}] * len(batch["ids"])
+                documents = batch["documents"] or [""] * len(batch["ids"])
+                embeddings = batch["embeddings"] if with_vectors else None
+                if embeddings is None:
+                    embeddings = [None] * len(batch["ids"])
+                yield [
+                    StoredChunk(
+                        chunk_id=chunk_id,
+                        parent_doc_id=(metadata or {}).get("parent_doc_id"),
+                        content=content or "",
+                        metadata={k: v for k, v in (metadata or {}).items() if k != "parent_doc_id"},
+                        vector=[float(x) for x in embedding] if embedding is not None else None,
+                    )
+                    for chunk_id, content, metadata, embedding in zip(batch["ids"], documents, metadatas, embeddings)
+                ]
+                offset += len(batch["ids"])
+
+    async def swap_collection(self, collection_name: str, shadow_name: str) -> None:
+        import asyncio
+
+        def _swap():
+            # No aliases in Chroma: renames, searches fail only in between
+            existing = {c.name for c in self.client.list_collections()}
+            retired = f"{collection_name}__retired_{int(time.time())}"
+            if collection_name in existing:
+                self.client.get_collection(collection_name).modify(name=retired)
+            self.client.get_collection(shadow_name).modify(name=collection_name)
+            # Per-tenant collections are named after their collection: replace the old ones
+            for partition in self._tenant_partitions(collection_name):
+                self.client.delete_collection(partition.name)
+            for partition in self._tenant_partitions(shadow_name):
+                partition.modify(name=tenant_partition(collection_name, partition.metadata["tenant"]))
+            if collection_name in existing:
+                self.client.delete_collection(retired)
+
+        await asyncio.to_thread(_swap)
+        await self._move_embedding(shadow_name, collection_name)
+
+    async def search_vector(
+        self,
+        collection_name: str,
+        vector: list[float],
+        limit: int = 4,
+        filter: str = "",
+        document_ids: list[str] | None = None,
+        tenants: list[str] | None = None,
+    ) -> list[SearchResult]:
         import asyncio
 
-        query_vector = self.embedder.embed_query(query)
+        # Convert Milvus-style filter to ChromaDB where clauses
+        where: list[dict[str, Any]] = []
+        if filter and "parent_doc_id" in filter:
+            m = re.search(r'parent_doc_id\s*==\s*"([^"]+)"', filter)
+            if m:
+                where.append({"parent_doc_id": m.group(1)})
+        if document_ids is not None:
+            where.append({"parent_doc_id": {"$in": list(document_ids)}})
+        scoped = self._scoped_tenants(tenants)
+        if scoped is not None:
+            where.append({"tenant": {"$in": scoped}})
 
         def _query():
-            collection = self._get_collection(collection_name)
             kwargs: dict[str, Any] = {
-                "query_embeddings": [query_vector],
+                "query_embeddings": [vector],
                 "n_results": limit,
                 "include": ["documents", "metadatas", "distances"],
             }
-            # Convert Milvus-style filter to ChromaDB where clause
-            if filter and "parent_doc_id" in filter:
-                import re
-                m = re.search(r'parent_doc_id\s*==\s*"([^"]+)"', filter)
-                if m:
-                    kwargs["where"] = {"parent_doc_id": m.group(1)}
-            return collection.query(**kwargs)
-
-        results = await asyncio.to_thread(_query)
+            if where:
+                kwargs["where"] = where[0] if len(where) == 1 else {"$and": where}
+            # One query per tenant collection in scope: the others are not read at all. The
+            # collection itself is always searched: it may hold chunks written before partitioning
+            collections = [self._get_collection(collection_name), *self._tenant_partitions(collection_name, scoped)]
+            if scoped is not None and SHARED_TENANT in scoped:
+                self._tag_shared(collections[0])
+            return [collection.query(**kwargs) for collection in collections]
+
         search_results = []
-        if results["ids"] and results["ids"][0]:
+        for results in await asyncio.to_thread(_query):
+            if not (results["ids"] and results["ids"][0]):
+                continue
             for i in range(len(results["ids"][0])):
                 metadata = results["metadatas"][0][i] if results["metadatas"] else {}
                 search_results.append(SearchResult(
@@ -417,30 +1551,150 @@ class ChromaVectorStore(BaseVectorStore):
                     score=1.0 - (results["distances"][0][i] if results["distances"] else 0.0),
                     metadata=metadata,
                     parent_doc_id=metadata.get("parent_doc_id"),
+                    chunk_id=results["ids"][0][i],
                 ))
-        return search_results
+        search_results.sort(key=lambda r: r.score, reverse=True)
+        return search_results[:limit]
 
     async def get_collection_info(self, collection_name: str) -> CollectionInfo:
         import asyncio
 
         def _info():
-            collection = self._get_collection(collection_name)
-            return collection.count()
+            return sum(collection.count() for collection in self._partitions(collection_name))
 
         count = await asyncio.to_thread(_info)
-        return CollectionInfo(name=collection_name, total_vectors=count, dim=self.settings.embeddings_config.dim)
+        dim = (await self.embedding_config(collection_name)).dim
+        return CollectionInfo(name=collection_name, total_vectors=count, dim=dim)
 
     async def delete_collection(self, collection_name: str) -> None:
         import asyncio
-        await asyncio.to_thread(self.client.delete_collection, collection_name)
+
+        catalog = self._catalog_name(collection_name)
+
+        def _delete():
+            for partition in self._tenant_partitions(collection_name):
+                self.client.delete_collection(partition.name)
+            self.client.delete_collection(collection_name)
+            if catalog in {c.name for c in self.client.list_collections()}:
+                self.client.delete_collection(catalog)
+
+        await asyncio.to_thread(_delete)
+        await self._forget_embedding(collection_name)
 
     async def delete_document(self, collection_name: str, document_id: str) -> None:
         import asyncio
         sanitized = self._sanitize_id(document_id)
 
         def _delete():
-            collection = self._get_collection(collection_name)
-            collection.delete(where={"parent_doc_id": sanitized})
+            for collection in self._partitions(collection_name):
+                collection.delete(where={"parent_doc_id": sanitized})
+
+        await asyncio.to_thread(_delete)
+        await self.delete_document_records(collection_name, [sanitized])
+
+    async def get_chunk_ids(self, collection_name: str, document_id: str) -> set[str]:
+        import asyncio
+        sanitized = self._sanitize_id(document_id)
+
+        def _get():
+            return [
+                collection.get(where={"parent_doc_id": sanitized}, include=[])
+                for collection in self._partitions(collection_name)
+            ]
+
+        return {chunk_id for result in await asyncio.to_thread(_get) for chunk_id in result["ids"] or []}
+
+    async def get_document_vectors(self, collection_name: str, document_id: str) -> list[list[float]]:
+        import asyncio
+        sanitized = self._sanitize_id(document_id)
+
+        def _get():
+            return [
+                collection.get(where={"parent_doc_id": sanitized}, include=["embeddings"])
+                for collection in self._partitions(collection_name)
+            ]
+
+        vectors: list[list[float]] = []
+        for result in await asyncio.to_thread(_get):
+            embeddings = result["embeddings"]
+            vectors.extend([float(x) for x in embedding] for embedding in (embeddings if embeddings is not None else []))
+        return vectors
+
+    async def delete_chunks(self, collection_name: str, chunk_ids: list[str]) -> None:
+        import asyncio
+
+        if not chunk_ids:
+            return
+
+        def _delete():
+            for collection in self._partitions(collection_name):
+                collection.delete(ids=list(chunk_ids))
+
+        await asyncio.to_thread(_delete)
+
+    async def _set_chunk_metadata(self, collection_name: str, chunks: list[StoredChunk]) -> None:
+        import asyncio
+
+        chunks_by_tenant: dict[str, list[StoredChunk]] = {}
+        for chunk in chunks:
+            chunks_by_tenant.setdefault(self._chunk_tenant(chunk), []).append(chunk)
+
+        def _update():
+            for tenant, tenant_chunks in chunks_by_tenant.items():
+                self._partition(collection_name, tenant).update(
+                    ids=[chunk.chunk_id for chunk in tenant_chunks],
+                    metadatas=[
+                        {**self._tagged_metadata(chunk), "parent_doc_id": chunk.parent_doc_id}
+                        if chunk.parent_doc_id
+                        else self._tagged_metadata(chunk)
+                        for chunk in tenant_chunks
+                    ],
+                )
+
+        await asyncio.to_thread(_update)
+
+    async def upsert_document_records(self, collection_name: str, records: dict[str, dict[str, Any]]) -> None:
+        import asyncio
+
+        if not records:
+            return
+
+        def _upsert():
+            catalog = self._get_collection(self._catalog_name(collection_name))
+            # Records are JSON documents (Chroma metadata cannot nest); the embedding is a placeholder
+            catalog.upsert(
+                ids=list(records),
+                embeddings=[[1.0]] * len(records),
+                documents=[json.dumps(metadata, default=str) for metadata in records.values()],
+            )
+
+        await asyncio.to_thread(_upsert)
+
+    async def get_document_records(
+        self, collection_name: str, document_ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        import asyncio
+
+        if document_ids is not None and not document_ids:
+            return {}
+
+        def _get():
+            catalog = self._get_collection(self._catalog_name(collection_name))
+            if document_ids is None:
+                return catalog.get(include=["documents"])
+            return catalog.get(ids=list(document_ids), include=["documents"])
+
+        result = await asyncio.to_thread(_get)
+        return {doc_id: json.loads(doc or "{}") for doc_id, doc in zip(result["ids"], result["documents"] or [])}
+
+    async def delete_document_records(self, collection_name: str, document_ids: list[str]) -> None:
+        import asyncio
+
+        if not document_ids:
+            return
+
+        def _delete():
+            self._get_collection(self._catalog_name(collection_name)).delete(ids=list(document_ids))
 
         await asyncio.to_thread(_delete)
 
@@ -448,15 +1702,14 @@ class ChromaVectorStore(BaseVectorStore):
         import asyncio
 
         def _get():
-            collection = self._get_collection(collection_name)
-            return collection.get(include=["metadatas"])
+            return [collection.get(include=["metadatas"]) for collection in self._partitions(collection_name)]
 
-        all_data = await asyncio.to_thread(_get)
         results = [
             {"parent_doc_id": m.get("parent_doc_id"), "metadata": m}
-            for m in (all_data["metadatas"] or [])
+            for data in await asyncio.to_thread(_get)
+            for m in (data["metadatas"] or [])
         ]
-        return self._group_documents(results)
+        return self._group_documents(results, await self.get_document_records(collection_name))
 
     async def list_collections(self) -> list[str]:
         import asyncio
@@ -464,13 +1717,19 @@ class ChromaVectorStore(BaseVectorStore):
         def _list():
             return [c.name for c in self.client.list_collections()]
 
-        return await asyncio.to_thread(_list)
+        return self._visible_collections(await asyncio.to_thread(_list))
+
+    async def collection_exists(self, name: str) -> bool:
+        import asyncio
+
+        def _exists():
+            return name in {c.name for c in self.client.list_collections()}
+
+        return await asyncio.to_thread(_exists)
 {%- endif %}
 
 
 {%- if cookiecutter.use_pgvector %}
-import json
-
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
@@ -501,69 +1760,252 @@ class PgVectorStore(BaseVectorStore):
         self.dim = settings.embeddings_config.dim
         self.engine = create_async_engine(app_settings.DATABASE_URL, echo=False)
         self.async_session = sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+        self._catalogs: set[str] = set()  # Catalog tables known to exist
+        self._partitions: dict[str, set[str]] = {}  # Table -> tenants known to have a partition
+        self._partitioned: dict[str, bool] = {}  # Table -> created partitioned by tenant
+        self._served = {}  # Name -> the collection it serves and its embedding model (cached)
 
     def _table(self, name: str) -> str:
         """Get validated table name for a collection."""
         return f"rag_{_validate_collection_name(name)}"
 
-    async def _ensure_collection(self, name: str) -> None:
-        """Create table for collection if not exists."""
+    async def _ensure_collection(self, name: str, dim: int | None = None) -> None:
+        """Create table for collection if not exists.
+
+        Storage profiles: ``compact`` stores halfvec (2 bytes per dimension,
+        indexable up to 4000 dimensions); ``binary`` indexes the bit-quantized
+        vectors (1 bit per dimension) and re-scores with the stored ones.
+
+        With ``tenant_partitioning`` the table is LIST-partitioned by tenant,
+        one partition (with its own HNSW index) per tenant, created on its
+        first write; scoped searches are pruned to their tenants' partitions.
+        """
         table = self._table(name)
+        dim = dim or self.dim
+        column, indexed = f"vector({dim})", "embedding vector_cosine_ops"
+        if self.settings.vector_storage == "compact":
+            column, indexed = f"halfvec({dim})", "embedding halfvec_cosine_ops"
+        elif self.settings.vector_storage == "binary":
+            indexed = f"(binary_quantize(embedding)::bit({dim})) bit_hamming_ops"
+        key, partitioning = "id VARCHAR(100) PRIMARY KEY", ""
+        if self.settings.tenant_partitioning:
+            # The primary key of a partitioned table must include the partition key
+            key = "id VARCHAR(100) NOT NULL, tenant VARCHAR(100) NOT NULL, PRIMARY KEY (tenant, id)"
+            partitioning = "PARTITION BY LIST (tenant)"
         async with self.async_session() as session:
             await session.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
             await session.execute(text(f"""
                 CREATE TABLE IF NOT EXISTS {table} (
-                    id VARCHAR(100) PRIMARY KEY,
+                    {key},
                     parent_doc_id VARCHAR(100),
                     content TEXT,
-                    embedding vector({self.dim}),
+                    embedding {column},
                     metadata JSONB DEFAULT '{% raw %}{{}}{% endraw %}'::jsonb
-                )
+                ) {partitioning}
             """))
             await session.execute(text(f"""
                 CREATE INDEX IF NOT EXISTS {table}_embedding_idx
-                ON {table} USING hnsw (embedding vector_cosine_ops)
+                ON {table} USING hnsw ({indexed})
             """))
+            # Document filters (deletes, per-document and summary-index searches) use it
+            await session.execute(text(f"CREATE INDEX IF NOT EXISTS {table}_doc_idx ON {table} (parent_doc_id)"))
+            if self.settings.tenant_partitioning:
+                # Chunk lookups by ID (deletes, scrolls) across partitions
+                await session.execute(text(f"CREATE INDEX IF NOT EXISTS {table}_id_idx ON {table} (id)"))
             await session.commit()
 
-    async def insert_document(self, collection_name: str, document: Document) -> None:
+    async def _is_partitioned(self, table: str) -> bool:
+        """Whether a table was created partitioned by tenant (with a ``tenant`` column)."""
+        if table in self._partitioned:
+            return self._partitioned[table]
+        async with self.async_session() as session:
+            result = await session.execute(
+                text("""
+                    SELECT to_regclass(:table) IS NOT NULL,
+                           EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))
+                """),
+                {"table": table},
+            )
+            exists, partitioned = result.one()
+        if exists:  # A table created later may still be partitioned
+            self._partitioned[table] = partitioned
+        return partitioned
+
+    async def _ensure_partitions(self, table: str, tenants: set[str]) -> None:
+        """Create the LIST partitions of tenants that have none yet."""
+        missing = tenants - self._partitions.setdefault(table, set())
+        if not missing:
+            return
+        async with self.async_session() as session:
+            # Partitions are found by their bounds: re-embedded tables keep their shadow's partition names
+            result = await session.execute(
+                text("""
+                    SELECT pg_get_expr(c.relpartbound, c.oid)
+                    FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = CAST(:table AS regclass)
+                """),
+                {"table": table},
+            )
+            bounds = " ".join(row[0] for row in result.fetchall())
+            for tenant in sorted(missing):
+                # Tenants are validated (letters, digits, '_' and '-'): safe as a literal
+                if f"'{tenant}'" not in bounds:
+                    await session.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS {tenant_partition(table, tenant)} "
+                        f"PARTITION OF {table} FOR VALUES IN ('{tenant}')"
+                    ))
+            await session.commit()
+        self._partitions[table].update(missing)
+
+    async def upsert_chunks(
+        self, collection_name: str, chunks: list[StoredChunk], vectors: list[list[float]]
+    ) -> None:
         table = self._table(collection_name)
-        await self._ensure_collection(collection_name)
-        if not document.chunked_pages:
-            raise ValueError("Document has no chunked pages.")
-        vectors = self.embedder.embed_document(document)
+        rows = [
+            {
+                "id": chunk.chunk_id,
+                "tenant": self._chunk_tenant(chunk),
+                "parent_doc_id": chunk.parent_doc_id,
+                "content": chunk.content,
+                "embedding": str(vectors[i]),
+                "metadata": json.dumps(self._tagged_metadata(chunk)),
+            }
+            for i, chunk in enumerate(chunks)
+        ]
+        columns, key = "id, parent_doc_id, content, embedding, metadata", "id"
+        if await self._is_partitioned(table):
+            await self._ensure_partitions(table, {row["tenant"] for row in rows})
+            columns, key = f"tenant, {columns}", "tenant, id"
+        values = ", ".join(f":{column}" for column in columns.split(", "))
         async with self.async_session() as session:
-            for i, chunk in enumerate(document.chunked_pages):
-                meta = self._build_chunk_metadata(chunk, document)
-                await session.execute(
+            # One executemany for all chunks instead of a round trip per chunk
+            await session.execute(
+                text(f"""
+                    INSERT INTO {table} ({columns})
+                    VALUES ({values})
+                    ON CONFLICT ({key}) DO UPDATE SET parent_doc_id = EXCLUDED.parent_doc_id,
+                        content = EXCLUDED.content, embedding = EXCLUDED.embedding, metadata = EXCLUDED.metadata
+                """),
+                rows,
+            )
+            await session.commit()
+
+    async def scroll_chunks(
+        self, collection_name: str, batch_size: int = 256, with_vectors: bool = False
+    ) -> AsyncIterator[list[StoredChunk]]:
+        table = self._table(collection_name)
+        last_id = ""
+        while True:
+            # Keyset pagination on the primary key
+            async with self.async_session() as session:
+                result = await session.execute(
                     text(f"""
-                        INSERT INTO {table} (id, parent_doc_id, content, embedding, metadata)
-                        VALUES (:id, :parent_doc_id, :content, :embedding, :metadata)
-                        ON CONFLICT (id) DO UPDATE SET content = :content, embedding = :embedding, metadata = :metadata
+                        SELECT id, parent_doc_id, content, metadata{", embedding::text" if with_vectors else ""}
+                        FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit
                     """),
-                    {
-                        "id": chunk.chunk_id,
-                        "parent_doc_id": chunk.parent_doc_id,
-                        "content": chunk.chunk_content,
-                        "embedding": str(vectors[i]),
-                        "metadata": json.dumps(meta),
-                    },
+                    {"last_id": last_id, "limit": batch_size},
+                )
+                rows = result.fetchall()
+            if not rows:
+                return
+            yield [
+                StoredChunk(
+                    chunk_id=row[0],
+                    parent_doc_id=row[1],
+                    content=row[2] or "",
+                    metadata=row[3] if isinstance(row[3], dict) else json.loads(row[3]),
+                    vector=json.loads(row[4]) if with_vectors else None,
                 )
+                for row in rows
+            ]
+            last_id = rows[-1][0]
+
+    async def create_shadow_collection(self, collection_name: str) -> str:
+        # Longer names would be truncated by PostgreSQL, clashing with the live table's index
+        if len(self._table(collection_name)) + len("__shadow_0000000000_embedding_idx") > 63:
+            raise ValueError(f"Collection name '{collection_name}' is too long to re-embed with pgvector")
+        return await super().create_shadow_collection(collection_name)
+
+    async def swap_collection(self, collection_name: str, shadow_name: str) -> None:
+        table, shadow = self._table(collection_name), self._table(shadow_name)
+        registry = await self._ensure_catalog(EMBEDDING_REGISTRY)
+        async with self.async_session() as session:
+            # One transaction: searches see the old table or the new one, never neither,
+            # and the embedding model recorded for the table moves with it
+            await session.execute(
+                text(f"DELETE FROM {registry} WHERE id = :live"), {"live": self._embedding_key(collection_name)}
+            )
+            await session.execute(
+                text(f"UPDATE {registry} SET id = :live WHERE id = :shadow"),
+                {"live": self._embedding_key(collection_name), "shadow": self._embedding_key(shadow_name)},
+            )
+            await session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            await session.execute(text(f"ALTER TABLE {shadow} RENAME TO {table}"))
+            await session.execute(text(f"ALTER INDEX IF EXISTS {shadow}_pkey RENAME TO {table}_pkey"))
+            await session.execute(text(f"ALTER INDEX IF EXISTS {shadow}_embedding_idx RENAME TO {table}_embedding_idx"))
+            await session.execute(text(f"ALTER INDEX IF EXISTS {shadow}_doc_idx RENAME TO {table}_doc_idx"))
+            await session.execute(text(f"ALTER INDEX IF EXISTS {shadow}_id_idx RENAME TO {table}_id_idx"))
             await session.commit()
-
-    async def search(self, collection_name: str, query: str, limit: int = 4, filter: str = "") -> list[SearchResult]:
+        self._partitions.pop(table, None)
+        self._partitioned.pop(table, None)
+        _serving_changed()
+
+    async def search_vector(
+        self,
+        collection_name: str,
+        vector: list[float],
+        limit: int = 4,
+        filter: str = "",
+        document_ids: list[str] | None = None,
+        tenants: list[str] | None = None,
+    ) -> list[SearchResult]:
         table = self._table(collection_name)
-        query_vector = self.embedder.embed_query(query)
+        # Convert Milvus-style filter to SQL conditions
+        conditions: list[str] = []
+        params: dict[str, Any] = {"query_vec": str(vector), "limit": limit}
+        if filter and "parent_doc_id" in filter:
+            m = re.search(r'parent_doc_id\s*==\s*"([^"]+)"', filter)
+            if m:
+                conditions.append("parent_doc_id = :doc_id")
+                params["doc_id"] = m.group(1)
+        if document_ids is not None:
+            conditions.append("parent_doc_id = ANY(:doc_ids)")
+            params["doc_ids"] = list(document_ids)
+        scoped = self._scoped_tenants(tenants)
+        if scoped is not None:
+            # Chunks written before tenancy have no tenant: they are shared
+            conditions.append("COALESCE(metadata->>'tenant', :shared_tenant) = ANY(:tenants)")
+            params["shared_tenant"] = SHARED_TENANT
+            if await self._is_partitioned(table):
+                # Partition pruning: only the partitions of these tenants are scanned
+                conditions.append("tenant = ANY(:tenants)")
+            params["tenants"] = scoped
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        source = table
+        if self.settings.vector_storage == "binary":
+            # Hamming distance on the bit index picks candidates, cosine on the stored vectors ranks them
+            params["candidates"] = self._candidates(limit)
+            dim = len(vector)  # The collection's model's, not necessarily the store's
+            source = f"""(
+                SELECT id, content, parent_doc_id, metadata, embedding
+                FROM {table}
+                {where}
+                ORDER BY binary_quantize(embedding)::bit({dim})
+                         <~> binary_quantize(CAST(:query_vec AS vector({dim})))
+                LIMIT :candidates
+            ) AS candidates"""
+            where = ""
         async with self.async_session() as session:
             result = await session.execute(
                 text(f"""
                     SELECT content, parent_doc_id, metadata,
-                           1 - (embedding <=> :query_vec) AS score
-                    FROM {table}
+                           1 - (embedding <=> :query_vec) AS score, id
+                    FROM {source}
+                    {where}
                     ORDER BY embedding <=> :query_vec
                     LIMIT :limit
                 """),
-                {"query_vec": str(query_vector), "limit": limit},
+                params,
             )
             rows = result.fetchall()
         return [
@@ -572,6 +2014,7 @@ class PgVectorStore(BaseVectorStore):
                 score=float(row[3]),
                 metadata=row[2] if isinstance(row[2], dict) else json.loads(row[2]),
                 parent_doc_id=row[1],
+                chunk_id=str(row[4]),
             )
             for row in rows
         ]
@@ -581,24 +2024,147 @@ class PgVectorStore(BaseVectorStore):
         async with self.async_session() as session:
             result = await session.execute(text(f"SELECT COUNT(*) FROM {table}"))
             count = result.scalar() or 0
-        return CollectionInfo(name=collection_name, total_vectors=count, dim=self.dim)
+        dim = (await self.embedding_config(collection_name)).dim
+        return CollectionInfo(name=collection_name, total_vectors=count, dim=dim)
 
     async def delete_collection(self, collection_name: str) -> None:
         table = self._table(collection_name)
+        catalog = self._table(self._catalog_name(collection_name))
         async with self.async_session() as session:
+            # Partitions are dropped with their table
             await session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            await session.execute(text(f"DROP TABLE IF EXISTS {catalog}"))
             await session.commit()
+        self._catalogs.discard(catalog)
+        self._partitions.pop(table, None)
+        self._partitioned.pop(table, None)
+        await self._forget_embedding(collection_name)
 
     async def delete_document(self, collection_name: str, document_id: str) -> None:
         table = self._table(collection_name)
         sanitized = self._sanitize_id(document_id)
+        catalog = await self._ensure_catalog(collection_name)
         async with self.async_session() as session:
             await session.execute(
                 text(f"DELETE FROM {table} WHERE parent_doc_id = :doc_id"),
                 {"doc_id": sanitized},
             )
+            await session.execute(text(f"DELETE FROM {catalog} WHERE id = :doc_id"), {"doc_id": sanitized})
             await session.commit()
 
+    async def get_chunk_ids(self, collection_name: str, document_id: str) -> set[str]:
+        table = self._table(collection_name)
+        await self._ensure_collection(collection_name)
+        async with self.async_session() as session:
+            result = await session.execute(
+                text(f"SELECT id FROM {table} WHERE parent_doc_id = :doc_id"),
+                {"doc_id": self._sanitize_id(document_id)},
+            )
+            return {row[0] for row in result.fetchall()}
+
+    async def get_document_vectors(self, collection_name: str, document_id: str) -> list[list[float]]:
+        table = self._table(collection_name)
+        async with self.async_session() as session:
+            result = await session.execute(
+                text(f"SELECT embedding::text FROM {table} WHERE parent_doc_id = :doc_id"),
+                {"doc_id": self._sanitize_id(document_id)},
+            )
+            return [json.loads(row[0]) for row in result.fetchall()]
+
+    async def delete_chunks(self, collection_name: str, chunk_ids: list[str]) -> None:
+        if not chunk_ids:
+            return
+        table = self._table(collection_name)
+        async with self.async_session() as session:
+            await session.execute(
+                text(f"DELETE FROM {table} WHERE id = ANY(:ids)"),
+                {"ids": list(chunk_ids)},
+            )
+            await session.commit()
+
+    async def _set_chunk_metadata(self, collection_name: str, chunks: list[StoredChunk]) -> None:
+        table = self._table(collection_name)
+        async with self.async_session() as session:
+            await session.execute(
+                text(f"UPDATE {table} SET metadata = CAST(:metadata AS jsonb) WHERE id = :id"),
+                [{"id": chunk.chunk_id, "metadata": json.dumps(self._tagged_metadata(chunk))} for chunk in chunks],
+            )
+            await session.commit()
+
+    async def _ensure_catalog(self, collection_name: str) -> str:
+        table = self._table(self._catalog_name(collection_name))
+        if table not in self._catalogs:
+            async with self.async_session() as session:
+                await session.execute(text(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        id VARCHAR(100) PRIMARY KEY,
+                        metadata JSONB NOT NULL
+                    )
+                """))
+                await session.commit()
+            self._catalogs.add(table)
+        return table
+
+    async def upsert_document_records(self, collection_name: str, records: dict[str, dict[str, Any]]) -> None:
+        if not records:
+            return
+        table = await self._ensure_catalog(collection_name)
+        async with self.async_session() as session:
+            await session.execute(
+                text(f"""
+                    INSERT INTO {table} (id, metadata) VALUES (:id, CAST(:metadata AS jsonb))
+                    ON CONFLICT (id) DO UPDATE SET metadata = EXCLUDED.metadata
+                """),
+                [{"id": doc_id, "metadata": json.dumps(metadata, default=str)} for doc_id, metadata in records.items()],
+            )
+            await session.commit()
+
+    async def get_document_records(
+        self, collection_name: str, document_ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        if document_ids is not None and not document_ids:
+            return {}
+        table = await self._ensure_catalog(collection_name)
+        async with self.async_session() as session:
+            if document_ids is None:
+                result = await session.execute(text(f"SELECT id, metadata FROM {table}"))
+            else:
+                result = await session.execute(
+                    text(f"SELECT id, metadata FROM {table} WHERE id = ANY(:ids)"), {"ids": list(document_ids)}
+                )
+            rows = result.fetchall()
+        return {row[0]: row[1] if isinstance(row[1], dict) else json.loads(row[1]) for row in rows}
+
+    async def delete_document_records(self, collection_name: str, document_ids: list[str]) -> None:
+        if not document_ids:
+            return
+        table = await self._ensure_catalog(collection_name)
+        async with self.async_session() as session:
+            await session.execute(text(f"DELETE FROM {table} WHERE id = ANY(:ids)"), {"ids": list(document_ids)})
+            await session.commit()
+
+    async def _find_documents(self, collection_name: str, clauses: list[tuple[str, str, Any]]) -> list[str]:
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+        for i, (field, op, value) in enumerate(clauses):
+            # Fields come from DOCUMENT_FILTER_FIELDS; compared as jsonb, numbers as numbers
+            column, param = f"metadata->'{field}'", f"CAST(:value_{i} AS jsonb)"
+            params[f"value_{i}"] = json.dumps(list(value) if isinstance(value, tuple) else value)
+            if op == "==":
+                conditions.append(f"{column} = {param}")
+            elif op == "!=":
+                conditions.append(f"{column} IS DISTINCT FROM {param}")
+            elif op in ("in", "not in"):
+                contained = f"{param} @> jsonb_build_array({column})"
+                conditions.append(contained if op == "in" else f"NOT {contained}")
+            else:
+                # jsonb orders values of different types; a string is never less than a number here
+                conditions.append(f"(jsonb_typeof({column}) = jsonb_typeof({param}) AND {column} {op} {param})")
+        table = await self._ensure_catalog(collection_name)
+        async with self.async_session() as session:
+            result = await session.execute(text(f"SELECT id FROM {table} WHERE {' AND '.join(conditions)}"), params)
+            return [row[0] for row in result.fetchall()]
+
     async def get_documents(self, collection_name: str) -> list[DocumentInfo]:
         table = self._table(collection_name)
         await self._ensure_collection(collection_name)
@@ -611,12 +2177,20 @@ class PgVectorStore(BaseVectorStore):
             {"parent_doc_id": row[0], "metadata": row[1] if isinstance(row[1], dict) else json.loads(row[1])}
             for row in rows
         ]
-        return self._group_documents(results)
+        return self._group_documents(results, await self.get_document_records(collection_name))
 
     async def list_collections(self) -> list[str]:
         async with self.async_session() as session:
             result = await session.execute(
                 text("SELECT table_name FROM information_schema.tables WHERE table_name LIKE 'rag_%' AND table_schema = 'public'")
             )
-            return [row[0].replace("rag_", "") for row in result.fetchall()]
+            return self._visible_collections([row[0].replace("rag_", "") for row in result.fetchall()])
+
+    async def collection_exists(self, name: str) -> bool:
+        async with self.async_session() as session:
+            result = await session.execute(
+                text("SELECT 1 FROM information_schema.tables WHERE table_name = :table AND table_schema = 'public'"),
+                {"table": self._table(name)},
+            )
+            return result.first() is not None
 {%- endif %}
@@ -0,0 +1,185 @@
+{%- if cookiecutter.enable_rag %}
+"""Collection-level write buffer for vector upserts.
+
+Ingesting many small documents one by one costs an embedding request and an
+upsert round trip per document, mostly spent on latency rather than work. A
+:class:`CollectionWriteBuffer` collects the chunks of concurrently ingested
+documents and writes them together: one embedding request and one upsert per
+``max_vectors`` chunks, or after ``max_wait_ms`` if fewer arrive.
+
+Every document keeps its own outcome. :meth:`CollectionWriteBuffer.write`
+returns once that document's chunks are stored and raises its error. When a
+batched write fails, its documents are retried one by one, so one bad document
+(e.g. too long for the embedding model) does not fail the others.
+
+:meth:`CollectionWriteBuffer.flush` writes whatever is pending and waits for
+in-flight writes; leaving ``async with buffer:`` flushes, so a job ends with
+nothing left unwritten.
+
+Batching needs several documents in flight: bulk loops hand each file to a
+:class:`BoundedTaskGroup` instead of awaiting it.
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any
+
+from app.rag.models import Document
+
+if TYPE_CHECKING:
+    from app.rag.vectorstore import BaseVectorStore
+
+logger = logging.getLogger(__name__)
+
+
+class CollectionWriteBuffer:
+    """Merges the writes of many documents into batched insert_documents() calls."""
+
+    def __init__(
+        self,
+        store: "BaseVectorStore",
+        collection_name: str,
+        max_vectors: int = 512,
+        max_wait_ms: float = 100.0,
+    ):
+        self.store = store
+        self.collection_name = collection_name
+        self.max_vectors = max(1, max_vectors)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._pending: list[tuple[Document, asyncio.Future[None]]] = []
+        self._pending_vectors = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.documents = 0
+        self.vectors = 0
+
+    def add(self, document: Document) -> "asyncio.Future[None]":
+        """Queue a document's chunks; the future resolves once they are stored."""
+        if not document.chunked_pages:
+            raise ValueError("Document has no chunked pages.")
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append((document, future))
+        self._pending_vectors += len(document.chunked_pages)
+        if self._pending_vectors >= self.max_vectors:
+            self._start_write()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._start_write)
+        return future
+
+    async def write(self, document: Document) -> None:
+        """Store a document's chunks with the next batch; raises this document's error."""
+        await self.add(document)
+
+    def _start_write(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending, self._pending_vectors = self._pending, [], 0
+        task = asyncio.create_task(self._write(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: list[tuple[Document, "asyncio.Future[None]"]]) -> None:
+        # Writers that were cancelled while waiting are dropped
+        batch = [(document, future) for document, future in batch if not future.done()]
+        if not batch:
+            return
+        documents = [document for document, _ in batch]
+        try:
+            await self.store.insert_documents(self.collection_name, documents)
+        except Exception as e:
+            if len(batch) == 1:
+                _settle(batch[0][1], e)
+                return
+            logger.warning(
+                f"Batched write of {len(batch)} documents to {self.collection_name} failed ({e}), "
+                "retrying them one by one"
+            )
+            for document, future in batch:
+                try:
+                    await self.store.insert_documents(self.collection_name, [document])
+                except Exception as doc_error:
+                    _settle(future, doc_error)
+                else:
+                    self._written([document])
+                    _settle(future)
+            return
+        self._written(documents)
+        for _, future in batch:
+            _settle(future)
+
+    def _written(self, documents: list[Document]) -> None:
+        self.batches += 1
+        self.documents += len(documents)
+        self.vectors += sum(len(document.chunked_pages or []) for document in documents)
+
+    async def flush(self) -> None:
+        """Write everything pending and wait until all writes have finished."""
+        self._start_write()
+        while self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    async def __aenter__(self) -> "CollectionWriteBuffer":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.flush()
+        if self.batches:
+            logger.info(
+                f"Buffered writes to {self.collection_name}: {self.documents} documents, "
+                f"{self.vectors} vectors in {self.batches} batches"
+            )
+
+
+class BoundedTaskGroup:
+    """Runs coroutines as tasks, at most ``limit`` at a time.
+
+    ``submit()`` waits for a free slot; leaving ``async with`` waits for all
+    tasks (or cancels them, if the block raised). Coroutines handle their own
+    errors.
+    """
+
+    def __init__(self, limit: int):
+        self._slots = asyncio.Semaphore(max(1, limit))
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Start a coroutine as soon as fewer than ``limit`` are running."""
+        try:
+            await self._slots.acquire()
+        except BaseException:
+            coro.close()
+            raise
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+
+    def _done(self, task: "asyncio.Task[None]") -> None:
+        self._tasks.discard(task)
+        self._slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Unhandled error in bulk ingestion task: {task.exception()}")
+
+    async def __aenter__(self) -> "BoundedTaskGroup":
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is not None:
+            for task in self._tasks:
+                task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+def _settle(future: "asyncio.Future[None]", error: BaseException | None = None) -> None:
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+{%- endif %}
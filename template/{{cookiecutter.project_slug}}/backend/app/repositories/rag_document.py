@@ -56,6 +56,24 @@ async def create(
     return doc
 
 
+async def create_many(
+    db: AsyncSession,
+    *,
+    collection_name: str,
+    documents: list[dict[str, Any]],
+    status: str = "processing",
+) -> list[RAGDocument]:
+    """Create many RAG document records in one batched multi-row INSERT.
+
+    Each item of ``documents`` holds filename, filesize, filetype and storage_path.
+    """
+    docs = [RAGDocument(collection_name=collection_name, status=status, **item) for item in documents]
+    # Same-table rows are flushed as multi-row INSERT ... VALUES batches (insertmanyvalues)
+    db.add_all(docs)
+    await db.flush()
+    return docs
+
+
 async def update_status(
     db: AsyncSession,
     doc_id: UUID,
@@ -64,6 +82,7 @@ async def update_status(
     error_message: str | None = None,
     vector_document_id: str | None = None,
     chunk_count: int | None = None,
+    filesize: int | None = None,
     completed_at: Any = None,
 ) -> RAGDocument | None:
     """Update the processing status of a RAG document."""
@@ -77,12 +96,43 @@ async def update_status(
         doc.vector_document_id = vector_document_id
     if chunk_count is not None:
         doc.chunk_count = chunk_count
+    if filesize is not None:
+        doc.filesize = filesize
     if completed_at is not None:
         doc.completed_at = completed_at
     await db.flush()
     return doc
 
 
+async def get_by_vector_document_id(
+    db: AsyncSession, collection_name: str, vector_document_id: str
+) -> RAGDocument | None:
+    """Get the oldest record pointing at a vector store document."""
+    result = await db.execute(
+        select(RAGDocument)
+        .where(
+            RAGDocument.collection_name == collection_name,
+            RAGDocument.vector_document_id == vector_document_id,
+        )
+        .order_by(RAGDocument.created_at)
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def count_by_vector_document_id(db: AsyncSession, collection_name: str, vector_document_id: str) -> int:
+    """Count records pointing at the same vector store document."""
+    from sqlalchemy import func
+
+    result = await db.execute(
+        select(func.count()).select_from(RAGDocument).where(
+            RAGDocument.collection_name == collection_name,
+            RAGDocument.vector_document_id == vector_document_id,
+        )
+    )
+    return result.scalar_one()
+
+
 async def delete(db: AsyncSession, doc_id: UUID) -> bool:
     """Delete a RAG document by ID."""
     doc = await db.get(RAGDocument, doc_id)
@@ -160,6 +210,24 @@ def create(
     return doc
 
 
+def create_many(
+    db: Session,
+    *,
+    collection_name: str,
+    documents: list[dict[str, Any]],
+    status: str = "processing",
+) -> list[RAGDocument]:
+    """Create many RAG document records in one batched multi-row INSERT.
+
+    Each item of ``documents`` holds filename, filesize, filetype and storage_path.
+    """
+    docs = [RAGDocument(collection_name=collection_name, status=status, **item) for item in documents]
+    # Same-table rows are flushed as multi-row INSERT ... VALUES batches (insertmanyvalues)
+    db.add_all(docs)
+    db.flush()
+    return docs
+
+
 def update_status(
     db: Session,
     doc_id: str,
@@ -168,6 +236,7 @@ def update_status(
     error_message: str | None = None,
     vector_document_id: str | None = None,
     chunk_count: int | None = None,
+    filesize: int | None = None,
     completed_at: Any = None,
 ) -> RAGDocument | None:
     """Update the processing status of a RAG document."""
@@ -181,12 +250,41 @@ def update_status(
         doc.vector_document_id = vector_document_id
     if chunk_count is not None:
         doc.chunk_count = chunk_count
+    if filesize is not None:
+        doc.filesize = filesize
     if completed_at is not None:
         doc.completed_at = completed_at
     db.flush()
     return doc
 
 
+def get_by_vector_document_id(db: Session, collection_name: str, vector_document_id: str) -> RAGDocument | None:
+    """Get the oldest record pointing at a vector store document."""
+    result = db.execute(
+        select(RAGDocument)
+        .where(
+            RAGDocument.collection_name == collection_name,
+            RAGDocument.vector_document_id == vector_document_id,
+        )
+        .order_by(RAGDocument.created_at)
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+def count_by_vector_document_id(db: Session, collection_name: str, vector_document_id: str) -> int:
+    """Count records pointing at the same vector store document."""
+    from sqlalchemy import func
+
+    result = db.execute(
+        select(func.count()).select_from(RAGDocument).where(
+            RAGDocument.collection_name == collection_name,
+            RAGDocument.vector_document_id == vector_document_id,
+        )
+    )
+    return result.scalar_one()
+
+
 def delete(db: Session, doc_id: str) -> bool:
     """Delete a RAG document by ID."""
     doc = db.get(RAGDocument, doc_id)
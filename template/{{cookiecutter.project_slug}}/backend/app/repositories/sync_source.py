@@ -124,6 +124,19 @@ async def update_sync_status(
     await db.flush()
     return source
 
+async def update_checkpoints(
+    db: AsyncSession,
+    source_id: UUID,
+    checkpoints: dict[str, str],
+) -> SyncSource | None:
+    """Replace the per-file change-detection manifest of a sync source."""
+    source = await db.get(SyncSource, source_id)
+    if not source:
+        return None
+    source.file_checkpoints = checkpoints
+    await db.flush()
+    return source
+
 
 {%- elif cookiecutter.use_sqlite %}
 """Sync source repository (SQLite sync).
@@ -254,6 +267,19 @@ def update_sync_status(
     db.flush()
     return source
 
+def update_checkpoints(
+    db: Session,
+    source_id: str,
+    checkpoints: dict[str, str],
+) -> SyncSource | None:
+    """Replace the per-file change-detection manifest of a sync source."""
+    source = db.get(SyncSource, source_id)
+    if not source:
+        return None
+    source.file_checkpoints = json.dumps(checkpoints)
+    db.flush()
+    return source
+
 
 {%- endif %}
 {%- else %}
@@ -13,7 +13,13 @@ class RAGSearchRequest(BaseModel):
     query: str = Field(..., description="Natural language search query")
     limit: int = Field(default=4, ge=1, le=20)
     min_score: float = Field(default=0.0, ge=0.0, le=1.0)
-    filter: str | None = Field(None, description="Scalar filter expression (e.g. 'filetype == \"pdf\"')")
+    filter: str | None = Field(
+        None,
+        description=(
+            "Scalar filter expression (e.g. 'filetype == \"pdf\"'). Document fields (filename, filetype, "
+            "filesize, source_path, content_hash) are matched per document and can only be combined with 'and'"
+        ),
+    )
 
 
 class RAGSearchResult(BaseModel):
@@ -95,6 +101,31 @@ class RAGIngestResponse(BaseModel):
     collection: str
     message: str
     document_id: str | None = None
+    content_hash: str | None = Field(None, description="SHA256 of the stored upload")
+
+
+class RAGBatchIngestItem(BaseModel):
+    """A document accepted into a batch ingestion."""
+    id: str
+    filename: str
+    source_path: str = Field(description="Path inside its archive, or the uploaded filename")
+    content_hash: str
+
+
+class RAGBatchSkippedItem(BaseModel):
+    """A file of a batch upload that will not be ingested."""
+    filename: str
+    reason: str
+
+
+class RAGBatchIngestResponse(BaseModel):
+    """Response for a batch (multi-file or archive) ingestion."""
+    status: str
+    collection: str
+    accepted: int
+    documents: list[RAGBatchIngestItem]
+    skipped: list[RAGBatchSkippedItem]
+    message: str
 
 
 class RAGRetryResponse(BaseModel):
@@ -111,6 +142,12 @@ class RAGSyncRequest(BaseModel):
     path: str = Field("", description="Source path")
 
 
+class RAGReembedRequest(BaseModel):
+    """Request to re-embed a collection with another embedding model."""
+    model: str = Field(..., description="Embedding model to re-embed with")
+    dim: int | None = Field(None, description="Vector dimension (derived from known models when omitted)")
+
+
 class RAGSyncLogItem(BaseModel):
     """A sync operation log entry."""
     id: str
@@ -140,4 +177,22 @@ class RAGSyncResponse(BaseModel):
     status: str
     message: str
 {%- endif %}
+{%- if cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq %}
+
+
+class RAGQueueStats(BaseModel):
+    """Depth and recent wait times of one task queue."""
+    queue: str
+    depth: int = Field(description="Jobs waiting to be picked up")
+    wait_samples: int = Field(0, description="Recent jobs the wait times are computed over")
+    wait_avg_seconds: float | None = None
+    wait_p50_seconds: float | None = None
+    wait_p95_seconds: float | None = None
+    wait_max_seconds: float | None = None
+
+
+class RAGQueueStatsList(BaseModel):
+    """Per-queue stats of the RAG task queues."""
+    items: list[RAGQueueStats]
+{%- endif %}
 {%- endif %}
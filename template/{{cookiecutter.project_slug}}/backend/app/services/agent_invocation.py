@@ -23,6 +23,9 @@ from sqlalchemy.orm import Session
 {%- endif %}
 
 from app.core.config import settings
+{%- if cookiecutter.enable_rag %}
+from app.rag.tenancy import scoped_to
+{%- endif %}
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +78,20 @@ class AgentInvocationService:
         # 3. Call agent
         tool_events: list[ToolEvent] = []
         try:
+{%- if cookiecutter.enable_rag %}
+            # Knowledge-base searches of any framework's agent only see shared documents
+            # and this user's and project's
+            with scoped_to(user_id=user_id, project_id=project_id):
+                response_text, tool_events = await self._call_agent(
+                    user_message=user_message,
+                    history=history,
+                    conversation_id=conversation_id,
+                    user_id=user_id,
+                    project_id=project_id,
+                    system_prompt_override=system_prompt_override,
+                    model_override=model_override,
+                )
+{%- else %}
             response_text, tool_events = await self._call_agent(
                 user_message=user_message,
                 history=history,
@@ -84,6 +101,7 @@ class AgentInvocationService:
                 system_prompt_override=system_prompt_override,
                 model_override=model_override,
             )
+{%- endif %}
         except Exception as exc:
             logger.exception("Agent invocation failed: %s", exc)
             response_text = "Sorry, I encountered an error processing your request."
@@ -133,10 +151,15 @@ class AgentInvocationService:
         from app.api.routes.v1.agent import build_message_history
 
         model_name: str | None = kwargs.get("model_override")
-        assistant = get_agent(model_name=model_name)
+        # Shared per (model, system prompt) across messages - see app.agents.registry
+        assistant = get_agent(model_name=model_name, system_prompt=kwargs.get("system_prompt_override"))
 
         model_history = build_message_history(history)
-        deps = Deps()
+        user_id, project_id = kwargs.get("user_id"), kwargs.get("project_id")
+        deps = Deps(
+            user_id=str(user_id) if user_id else None,
+            project_id=str(project_id) if project_id else None,
+        )
 
         result = await assistant.agent.run(
             user_message,
@@ -223,7 +246,9 @@ class AgentInvocationService:
 
         from app.agents.langchain_assistant import get_agent
 
-        assistant = get_agent()
+        assistant = get_agent(
+            model_name=kwargs.get("model_override"), system_prompt=kwargs.get("system_prompt_override")
+        )
         lc_history = self._build_langchain_history(history)
         lc_history.append(HumanMessage(content=user_message))
 
@@ -266,7 +291,7 @@ class AgentInvocationService:
 
         from app.agents.langgraph_assistant import get_agent
 
-        assistant = get_agent()
+        assistant = get_agent(model_name=kwargs.get("model_override"))
         lc_history = self._build_langchain_history(history)
         lc_history.append(HumanMessage(content=user_message))
 
@@ -306,14 +331,17 @@ class AgentInvocationService:
     ) -> tuple[str, list[ToolEvent]]:
         """Invoke CrewAI crew (synchronous, run in thread executor)."""
         import asyncio
+        import contextvars
 
         from app.agents.crewai_assistant import get_agent
 
         assistant = get_agent()
         loop = asyncio.get_event_loop()
+        # Run in a copy of this context: the crew's tools read the caller's tenant scope
+        ctx = contextvars.copy_context()
         result = await loop.run_in_executor(
             None,
-            lambda: assistant.crew.kickoff(inputs={"question": user_message}),
+            lambda: ctx.run(assistant.crew.kickoff, inputs={"question": user_message}),
         )
         return str(result), []
 {%- endif %}
@@ -2,12 +2,24 @@
 
 Supports local filesystem storage.
 Files are organized per-user: {storage_root}/{user_id}/{uuid}_{filename}
+
+Uploads are written with :meth:`BaseFileStorage.save_stream`, which copies the
+request body to its final location chunk by chunk (hashing as it goes and
+aborting past the size limit), so the API never holds a whole file in memory.
 """
 
+import asyncio
+import hashlib
 import logging
+import os
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Protocol
+
+from app.core.exceptions import PayloadTooLargeError
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +36,29 @@ IMAGE_MIME_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
 
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes read from the request body at a time
+
+
+class AsyncReadable(Protocol):
+    """Anything with an async ``read(size)``, e.g. FastAPI's UploadFile."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+@dataclass(slots=True)
+class StoredFile:
+    """A file written by :meth:`BaseFileStorage.save_stream`."""
+
+    storage_path: str
+    size: int
+    sha256: str
+
+
+async def iter_upload(file: AsyncReadable, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read an upload in fixed-size chunks."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
 
 def classify_file(mime_type: str, filename: str) -> str:
     """Classify file type based on MIME type and extension."""
@@ -53,6 +88,21 @@ class BaseFileStorage(ABC):
     async def load(self, storage_path: str) -> bytes:
         """Load file bytes by storage path."""
 
+    @abstractmethod
+    async def save_stream(
+        self,
+        user_id: str,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        max_size: int | None = None,
+    ) -> StoredFile:
+        """Write a file chunk by chunk, without holding it in memory.
+
+        Raises:
+            PayloadTooLargeError: As soon as more than ``max_size`` bytes arrive
+                (nothing is left behind in storage).
+        """
+
     @abstractmethod
     async def delete(self, storage_path: str) -> None:
         """Delete file by storage path."""
@@ -77,6 +127,37 @@ class LocalFileStorage(BaseFileStorage):
         file_path.write_bytes(data)
         return f"{user_id}/{storage_name}"
 
+    async def save_stream(
+        self,
+        user_id: str,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        max_size: int | None = None,
+    ) -> StoredFile:
+        user_dir = self.base_dir / user_id
+        user_dir.mkdir(parents=True, exist_ok=True)
+        storage_name = make_storage_filename(filename)
+        file_path = user_dir / storage_name
+        # Written under a temporary name, so a partial upload is never visible
+        part_path = user_dir / f".{storage_name}.part"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(part_path, "wb") as fh:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise PayloadTooLargeError(
+                            message=f"File too large. Maximum {max_size // (1024 * 1024)}MB."
+                        )
+                    digest.update(chunk)
+                    await asyncio.to_thread(fh.write, chunk)
+            os.replace(part_path, file_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        return StoredFile(storage_path=f"{user_id}/{storage_name}", size=size, sha256=digest.hexdigest())
+
     async def load(self, storage_path: str) -> bytes:
         file_path = self.base_dir / storage_path
         if not file_path.exists():
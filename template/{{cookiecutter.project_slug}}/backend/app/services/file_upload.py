@@ -14,6 +14,10 @@ import tempfile
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+{% if not cookiecutter.use_all_pdf_parsers and not cookiecutter.use_llamaparse -%}
+from app.core.pdf_tables import extract_tables, has_ruling_lines
+{% endif -%}
+from app.core.process_pool import run_in_process
 from app.db.models.chat_file import ChatFile
 from app.services.file_storage import (
     ALLOWED_MIME_TYPES,
@@ -70,7 +74,7 @@ class FileUploadService:
             return self._parse_docx_content(data)
 {%- elif not cookiecutter.use_llamaparse %}
         elif file_type == "pdf":
-            return self._parse_pdf_content(data)
+            return await run_in_process(self._parse_pdf_content, data)
         elif file_type == "docx":
             return self._parse_docx_content(data)
 {%- endif %}
@@ -112,7 +116,7 @@ class FileUploadService:
 
             if not settings.LLAMAPARSE_API_KEY:
                 logger.warning("LLAMAPARSE_API_KEY not set, falling back to PyMuPDF")
-                return self._parse_pdf_pymupdf(data)
+                return await run_in_process(self._parse_pdf_pymupdf, data)
             with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
                 f.write(data)
                 temp_path = f.name
@@ -128,7 +132,7 @@ class FileUploadService:
                 os.unlink(temp_path)
         except Exception as e:
             logger.warning(f"LlamaParse PDF parsing failed: {e}")
-            return self._parse_pdf_pymupdf(data)
+            return await run_in_process(self._parse_pdf_pymupdf, data)
 
     async def _parse_pdf_liteparse(self, data: bytes) -> str | None:
         """Extract text from PDF using LiteParse."""
@@ -150,7 +154,7 @@ class FileUploadService:
                 os.unlink(temp_path)
         except Exception as e:
             logger.warning(f"LiteParse PDF parsing failed: {e}")
-            return self._parse_pdf_pymupdf(data)
+            return await run_in_process(self._parse_pdf_pymupdf, data)
 
     async def _parse_pdf_content(self, data: bytes) -> str | None:
         """Parse PDF using the parser selected by CHAT_PDF_PARSER env var."""
@@ -161,7 +165,7 @@ class FileUploadService:
             return await self._parse_pdf_llamaparse(data)
         elif parser == "liteparse":
             return await self._parse_pdf_liteparse(data)
-        return self._parse_pdf_pymupdf(data)
+        return await run_in_process(self._parse_pdf_pymupdf, data)
 
     @staticmethod
     def _parse_docx_content(data: bytes) -> str | None:
@@ -193,15 +197,10 @@ class FileUploadService:
                         text = b[4].strip()
                         if text:
                             texts.append(text)
-                try:
-                    tables = page.find_tables()
-                    if tables and tables.tables:
-                        for table in tables.tables:
-                            df = table.to_pandas()
-                            if not df.empty:
-                                texts.append(df.to_markdown(index=False))
-                except Exception:
-                    pass
+                # find_tables() is slow: only pages with ruling lines can hold the tables it finds
+                tables_md = extract_tables(page) if has_ruling_lines(page) else ""
+                if tables_md:
+                    texts.append(tables_md)
             doc.close()
             return "\n\n".join(texts) if texts else None
         except Exception as e:
@@ -278,6 +277,10 @@ import tempfile
 
 from sqlalchemy.orm import Session
 
+{% if not cookiecutter.use_all_pdf_parsers and not cookiecutter.use_llamaparse -%}
+from app.core.pdf_tables import extract_tables, has_ruling_lines
+{% endif -%}
+from app.core.process_pool import run_in_process
 from app.db.models.chat_file import ChatFile
 from app.services.file_storage import (
     ALLOWED_MIME_TYPES,
@@ -315,7 +318,7 @@ class FileUploadService:
         """Classify file type based on MIME type and extension."""
         return classify_file(mime_type, filename)
 
-    def parse_content(
+    async def parse_content(
         self,
         data: bytes,
         file_type: str,
@@ -329,12 +332,12 @@ class FileUploadService:
             return self._parse_text_content(data, mime_type)
 {%- if cookiecutter.use_all_pdf_parsers %}
         elif file_type == "pdf":
-            return self._parse_pdf_content(data)
+            return await self._parse_pdf_content(data)
         elif file_type == "docx":
             return self._parse_docx_content(data)
 {%- elif not cookiecutter.use_llamaparse %}
         elif file_type == "pdf":
-            return self._parse_pdf_content(data)
+            return await run_in_process(self._parse_pdf_content, data)
         elif file_type == "docx":
             return self._parse_docx_content(data)
 {%- endif %}
@@ -368,38 +371,34 @@ class FileUploadService:
             logger.warning(f"PyMuPDF PDF parsing failed: {e}")
             return None
 
-    def _parse_pdf_llamaparse(self, data: bytes) -> str | None:
+    async def _parse_pdf_llamaparse(self, data: bytes) -> str | None:
         """Extract text from PDF using LlamaParse."""
         try:
-            import asyncio
+            from llama_cloud import AsyncLlamaCloud
             from app.core.config import settings
 
             if not settings.LLAMAPARSE_API_KEY:
                 logger.warning("LLAMAPARSE_API_KEY not set, falling back to PyMuPDF")
-                return self._parse_pdf_pymupdf(data)
+                return await run_in_process(self._parse_pdf_pymupdf, data)
             with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
                 f.write(data)
                 temp_path = f.name
             try:
-                async def _parse():
-                    from llama_cloud import AsyncLlamaCloud
-                    client = AsyncLlamaCloud(api_key=settings.LLAMAPARSE_API_KEY)
-                    with open(temp_path, "rb") as pdf_file:
-                        result = await client.parsing.upload_and_parse(
-                            file=pdf_file,
-                            tier=settings.LLAMAPARSE_TIER,
-                        )
-                    return "\n\n".join(p.markdown for p in result.pages) if result.pages else None
-
-                return asyncio.run(_parse())
+                client = AsyncLlamaCloud(api_key=settings.LLAMAPARSE_API_KEY)
+                with open(temp_path, "rb") as pdf_file:
+                    result = await client.parsing.upload_and_parse(
+                        file=pdf_file,
+                        tier=settings.LLAMAPARSE_TIER,
+                    )
+                return "\n\n".join(p.markdown for p in result.pages) if result.pages else None
             finally:
                 os.unlink(temp_path)
         except Exception as e:
             logger.warning(f"LlamaParse PDF parsing failed: {e}")
-            return self._parse_pdf_pymupdf(data) if hasattr(self, '_parse_pdf_pymupdf') else None
+            return await run_in_process(self._parse_pdf_pymupdf, data)
 
-    def _parse_pdf_liteparse(self, data: bytes) -> str | None:
-        """Extract text from PDF using LiteParse (sync)."""
+    async def _parse_pdf_liteparse(self, data: bytes) -> str | None:
+        """Extract text from PDF using LiteParse."""
         try:
             from liteparse import LiteParse
 
@@ -408,7 +407,7 @@ class FileUploadService:
                 temp_path = f.name
             try:
                 parser = LiteParse()
-                result = parser.parse(temp_path)
+                result = await parser.aparse(temp_path)
                 pages = result.pages if hasattr(result, "pages") else [result]
                 text = "\n\n".join(
                     p.content if hasattr(p, "content") else str(p) for p in pages
@@ -418,18 +417,18 @@ class FileUploadService:
                 os.unlink(temp_path)
         except Exception as e:
             logger.warning(f"LiteParse PDF parsing failed: {e}")
-            return self._parse_pdf_pymupdf(data)
+            return await run_in_process(self._parse_pdf_pymupdf, data)
 
-    def _parse_pdf_content(self, data: bytes) -> str | None:
+    async def _parse_pdf_content(self, data: bytes) -> str | None:
         """Parse PDF using the parser selected by CHAT_PDF_PARSER env var."""
         from app.core.config import settings
 
         parser = getattr(settings, "CHAT_PDF_PARSER", "pymupdf")
         if parser == "llamaparse":
-            return self._parse_pdf_llamaparse(data)
+            return await self._parse_pdf_llamaparse(data)
         elif parser == "liteparse":
-            return self._parse_pdf_liteparse(data)
-        return self._parse_pdf_pymupdf(data)
+            return await self._parse_pdf_liteparse(data)
+        return await run_in_process(self._parse_pdf_pymupdf, data)
 
     @staticmethod
     def _parse_docx_content(data: bytes) -> str | None:
@@ -461,15 +460,10 @@ class FileUploadService:
                         text = b[4].strip()
                         if text:
                             texts.append(text)
-                try:
-                    tables = page.find_tables()
-                    if tables and tables.tables:
-                        for table in tables.tables:
-                            df = table.to_pandas()
-                            if not df.empty:
-                                texts.append(df.to_markdown(index=False))
-                except Exception:
-                    pass
+                # find_tables() is slow: only pages with ruling lines can hold the tables it finds
+                tables_md = extract_tables(page) if has_ruling_lines(page) else ""
+                if tables_md:
+                    texts.append(tables_md)
             doc.close()
             return "\n\n".join(texts) if texts else None
         except Exception as e:
@@ -82,13 +82,31 @@ class RAGDocumentService:
             storage_path=storage_path or "",
         )
 
+    async def create_documents(
+        self,
+        *,
+        collection_name: str,
+        documents: list[dict[str, Any]],
+    ) -> list[RAGDocument]:
+        """Create tracking records for a batch upload with a single multi-row insert."""
+        return await rag_document_repo.create_many(
+            self.db,
+            collection_name=collection_name,
+            documents=documents,
+        )
+
+    async def find_by_vector_document_id(self, collection_name: str, vector_document_id: str) -> RAGDocument | None:
+        """The record of a document already in the vector store (re-ingestions keep its ID)."""
+        return await rag_document_repo.get_by_vector_document_id(self.db, collection_name, vector_document_id)
+
     async def complete_ingestion(
         self,
         doc_id: str,
         vector_document_id: str,
         chunk_count: int = 0,
+        filesize: int | None = None,
     ) -> None:
-        """Mark a document as successfully ingested."""
+        """Mark a document as successfully ingested (``filesize``: the ingested file's, if it changed)."""
         doc = await self.get_document(doc_id)
         await rag_document_repo.update_status(
             self.db,
@@ -96,6 +114,7 @@ class RAGDocumentService:
             status="done",
             vector_document_id=vector_document_id,
             chunk_count=chunk_count,
+            filesize=filesize,
             completed_at=datetime.now(UTC),
         )
 
@@ -144,8 +163,11 @@ class RAGDocumentService:
         """
         doc = await self.get_document(doc_id)
 
-        # Cascade: vector store
-        if doc.vector_document_id and ingestion_service:
+        # Cascade: vector store (re-ingestion reuses the vector document ID,
+        # so keep it while a newer record still points at it)
+        if doc.vector_document_id and ingestion_service and await rag_document_repo.count_by_vector_document_id(
+            self.db, doc.collection_name, doc.vector_document_id
+        ) <= 1:
             try:
                 await ingestion_service.remove_document(
                     doc.collection_name, doc.vector_document_id
@@ -283,13 +305,31 @@ class RAGDocumentService:
             storage_path=storage_path or "",
         )
 
+    def create_documents(
+        self,
+        *,
+        collection_name: str,
+        documents: list[dict[str, Any]],
+    ) -> list[RAGDocument]:
+        """Create tracking records for a batch upload with a single multi-row insert."""
+        return rag_document_repo.create_many(
+            self.db,
+            collection_name=collection_name,
+            documents=documents,
+        )
+
+    def find_by_vector_document_id(self, collection_name: str, vector_document_id: str) -> RAGDocument | None:
+        """The record of a document already in the vector store (re-ingestions keep its ID)."""
+        return rag_document_repo.get_by_vector_document_id(self.db, collection_name, vector_document_id)
+
     def complete_ingestion(
         self,
         doc_id: str,
         vector_document_id: str,
         chunk_count: int = 0,
+        filesize: int | None = None,
     ) -> None:
-        """Mark a document as successfully ingested."""
+        """Mark a document as successfully ingested (``filesize``: the ingested file's, if it changed)."""
         doc = self.get_document(doc_id)
         rag_document_repo.update_status(
             self.db,
@@ -297,6 +337,7 @@ class RAGDocumentService:
             status="done",
             vector_document_id=vector_document_id,
             chunk_count=chunk_count,
+            filesize=filesize,
             completed_at=datetime.now(UTC),
         )
 
@@ -345,8 +386,11 @@ class RAGDocumentService:
         """
         doc = self.get_document(doc_id)
 
-        # Cascade: vector store
-        if doc.vector_document_id and ingestion_service:
+        # Cascade: vector store (re-ingestion reuses the vector document ID,
+        # so keep it while a newer record still points at it)
+        if doc.vector_document_id and ingestion_service and rag_document_repo.count_by_vector_document_id(
+            self.db, doc.collection_name, doc.vector_document_id
+        ) <= 1:
             try:
                 ingestion_service.remove_document(
                     doc.collection_name, doc.vector_document_id
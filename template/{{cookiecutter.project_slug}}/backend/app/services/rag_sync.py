@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import NotFoundError
 from app.db.models.sync_log import SyncLog
 from app.repositories import sync_log_repo
+from app.rag.cancellation import request_cancel
 from app.schemas.rag import RAGSyncLogItem, RAGSyncLogList
 
 
@@ -100,6 +101,15 @@ class RAGSyncService:
             completed_at=datetime.now(UTC),
         )
 
+    async def update_progress(self, sync_id: str, *, total_files: int, ingested: int) -> None:
+        """Record the counters of a running operation (a cancelled one is left as it is)."""
+        log = await self.get_sync_log(sync_id)
+        if log.status != "running":
+            return
+        await sync_log_repo.update_status(
+            self.db, log.id, status="running", total_files=total_files, ingested=ingested,
+        )
+
     async def cancel_sync(self, sync_id: str) -> SyncLog:
         """Cancel a running sync operation.
 
@@ -118,6 +128,7 @@ class RAGSyncService:
         )
         if cancelled is None:
             raise NotFoundError(message="Sync log not found", details={"sync_id": sync_id})
+        await request_cancel(sync_id)
         return cancelled
 
 
@@ -135,6 +146,7 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import NotFoundError
 from app.db.models.sync_log import SyncLog
 from app.repositories import sync_log_repo
+from app.rag.cancellation import request_cancel_blocking
 from app.schemas.rag import RAGSyncLogItem, RAGSyncLogList
 
 
@@ -222,6 +234,15 @@ class RAGSyncService:
             completed_at=datetime.now(UTC),
         )
 
+    def update_progress(self, sync_id: str, *, total_files: int, ingested: int) -> None:
+        """Record the counters of a running operation (a cancelled one is left as it is)."""
+        log = self.get_sync_log(sync_id)
+        if log.status != "running":
+            return
+        sync_log_repo.update_status(
+            self.db, log.id, status="running", total_files=total_files, ingested=ingested,
+        )
+
     def cancel_sync(self, sync_id: str) -> SyncLog:
         """Cancel a running sync operation.
 
@@ -240,6 +261,7 @@ class RAGSyncService:
         )
         if cancelled is None:
             raise NotFoundError(message="Sync log not found", details={"sync_id": sync_id})
+        request_cancel_blocking(sync_id)
         return cancelled
 
 
@@ -158,6 +158,18 @@ class SyncSourceService:
             last_error=error,
         )
 
+    @staticmethod
+    def get_checkpoints(source: SyncSource) -> dict[str, str]:
+        """Return the {source_path: fingerprint} manifest recorded by the last sync."""
+        checkpoints = source.file_checkpoints
+        if isinstance(checkpoints, str):
+            checkpoints = json.loads(checkpoints) if checkpoints else {}
+        return dict(checkpoints or {})
+
+    async def save_checkpoints(self, source_id: str, checkpoints: dict[str, str]) -> None:
+        """Persist the per-file manifest so the next sync can skip unchanged files."""
+        await sync_source_repo.update_checkpoints(self.db, UUID(source_id), checkpoints)
+
     @staticmethod
     def list_connectors() -> ConnectorList:
         """List available connector types with their config schemas."""
@@ -342,6 +354,18 @@ class SyncSourceService:
             last_error=error,
         )
 
+    @staticmethod
+    def get_checkpoints(source: SyncSource) -> dict[str, str]:
+        """Return the {source_path: fingerprint} manifest recorded by the last sync."""
+        checkpoints = source.file_checkpoints
+        if isinstance(checkpoints, str):
+            checkpoints = json.loads(checkpoints) if checkpoints else {}
+        return dict(checkpoints or {})
+
+    def save_checkpoints(self, source_id: str, checkpoints: dict[str, str]) -> None:
+        """Persist the per-file manifest so the next sync can skip unchanged files."""
+        sync_source_repo.update_checkpoints(self.db, source_id, checkpoints)
+
     @staticmethod
     def list_connectors() -> ConnectorList:
         """List available connector types with their config schemas."""
@@ -4,13 +4,26 @@
 Used by FastAPI BackgroundTasks when no distributed task queue is configured.
 """
 
+import asyncio
 import logging
+import os
 import tempfile
+from contextlib import aclosing
 from pathlib import Path
+from typing import Any
 
+from app.core.config import settings
 from app.db.session import get_db_context
+from app.rag.cancellation import CancellationToken
 from app.rag.ingestion import IngestionService
 from app.rag.connectors import CONNECTOR_REGISTRY
+from app.rag.reembed import ReembedCancelled, ReembedProgress, build_reembedder
+from app.rag.snapshot import SnapshotImport, SnapshotImportCancelled, import_snapshot
+from app.rag.summary_index import DocumentSummaryIndex
+from app.rag.sync_manifest import LocalSyncManifest, hash_file
+from app.rag.tenancy import SHARED_TENANT
+from app.rag.write_buffer import BoundedTaskGroup
+from app.services.file_storage import get_file_storage
 from app.services.rag_document import RAGDocumentService
 from app.services.rag_sync import RAGSyncService
 from app.services.sync_source import SyncSourceService
@@ -24,16 +37,21 @@ async def ingest_document_in_background(
     filepath: str,
     source: str,
     replace: bool,
+    tenant: str = SHARED_TENANT,
+    svc: IngestionService | None = None,
 ) -> None:
     """Ingest a single document into the vector store and update its DB record."""
     try:
-        svc = IngestionService.from_settings()
+        svc = svc or IngestionService.from_settings()
         result = await svc.ingest_file(
             filepath=Path(filepath),
             collection_name=collection,
             replace=replace,
             source_path=source,
+            tenant=tenant,
         )
+        if result.status.value != "done":
+            raise RuntimeError(result.error_message or result.message)
         async with get_db_context() as db:
             doc_svc = RAGDocumentService(db)
             await doc_svc.complete_ingestion(doc_id, vector_document_id=result.document_id)
@@ -42,8 +60,25 @@ async def ingest_document_in_background(
         async with get_db_context() as db:
             doc_svc = RAGDocumentService(db)
             await doc_svc.fail_ingestion(doc_id, error_message=str(exc))
-    finally:
-        Path(filepath).unlink(missing_ok=True)
+
+
+async def ingest_batch_in_background(
+    collection: str,
+    documents: list[dict[str, str]],
+    replace: bool,
+) -> None:
+    """Ingest the documents of a batch upload ({id, filepath, source_path, tenant}).
+
+    Several documents are in flight at once, so the chunks of small documents
+    are embedded and upserted together.
+    """
+    svc = IngestionService.from_settings()
+    async with svc.write_buffer(collection), BoundedTaskGroup(settings.RAG_BULK_INGEST_CONCURRENCY) as tasks:
+        for doc in documents:
+            await tasks.submit(ingest_document_in_background(
+                doc["id"], collection, doc["filepath"], doc["source_path"], replace,
+                doc.get("tenant", SHARED_TENANT), svc=svc,
+            ))
 
 
 async def sync_local_in_background(
@@ -55,27 +90,92 @@ async def sync_local_in_background(
     """Sync a local directory into a collection and update the sync log."""
     svc = IngestionService.from_settings()
     ingested = skipped = failed = total = 0
+    cancel_token = CancellationToken(log_id)
+    cancelled = False
 
     try:
         target = Path(path)
         files = list(target.rglob("*")) if target.is_dir() else [target]
         files = [f for f in files if f.is_file()]
         total = len(files)
-        for filepath in files:
+        manifest = LocalSyncManifest.load(collection, target)
+        # Vector store lookups only for files the manifest doesn't know yet (e.g. first run)
+        source_index = None
+        seen: set[str] = set()
+
+        async def _ingest(filepath: Path, source_path: str, st: os.stat_result, file_hash: str, replace: bool) -> None:
+            nonlocal ingested, failed
             try:
-                await svc.ingest_file(
+                result = await svc.ingest_file(
                     filepath=filepath,
                     collection_name=collection,
-                    replace=(mode == "full"),
-                    source_path=str(filepath),
+                    replace=replace,
+                    source_path=source_path,
                 )
+                if result.status.value != "done":
+                    raise RuntimeError(result.error_message or result.message)
+                manifest.record(source_path, st, file_hash, result.document_id)
                 ingested += 1
             except Exception as e:
                 logger.warning("Failed to ingest %s: %s", filepath, e)
                 failed += 1
+
+        try:
+            # Files are checked one by one; changed ones are ingested several at a time
+            async with (
+                svc.write_buffer(collection),
+                BoundedTaskGroup(settings.RAG_BULK_INGEST_CONCURRENCY) as tasks,
+            ):
+                for filepath in files:
+                    if await cancel_token.is_cancelled():
+                        cancelled = True
+                        break
+                    source_path = str(filepath)
+                    seen.add(source_path)
+                    try:
+                        st = filepath.stat()
+                        entry = manifest.get(source_path)
+                        # Stat unchanged since the last sync — nothing to hash or look up
+                        if entry is not None and entry.matches(st) and mode != "full":
+                            skipped += 1
+                            continue
+                        file_hash = await asyncio.to_thread(hash_file, filepath)
+                        if entry is not None:
+                            existing_id, existing_hash = entry.document_id, entry.content_hash
+                        else:
+                            if source_index is None:
+                                source_index = await svc.get_source_index(collection)
+                            existing_id, existing_hash = source_index.get(source_path, (None, None))
+                        if mode == "update_only" and not existing_id:
+                            skipped += 1
+                            continue
+                        if mode != "full" and existing_id and existing_hash == file_hash:
+                            manifest.record(source_path, st, file_hash, existing_id)
+                            skipped += 1
+                            continue
+                    except Exception as e:
+                        logger.warning("Failed to ingest %s: %s", filepath, e)
+                        failed += 1
+                        continue
+                    await tasks.submit(
+                        _ingest(filepath, source_path, st, file_hash, replace=(mode == "full" or existing_id is not None))
+                    )
+
+            # Files gone from disk: a full sync mirrors the folder, other modes only forget them
+            if target.is_dir() and not cancelled:
+                for source_path in manifest.missing(seen):
+                    removed = manifest.remove(source_path)
+                    if mode == "full" and removed and removed.document_id:
+                        await svc.remove_document(collection, removed.document_id)
+        finally:
+            manifest.save()
     except Exception as e:
         logger.error("Sync failed: %s", e)
 
+    if cancelled:
+        # The SyncLog was already marked cancelled by the API
+        return
+
     async with get_db_context() as db:
         sync_svc = RAGSyncService(db)
         try:
@@ -108,33 +208,188 @@ async def sync_source_in_background(source_id: str, log_id: str) -> None:
                 return
             connector = connector_cls()
             config = source.config if isinstance(source.config, dict) else {}
+            checkpoints = source_svc.get_checkpoints(source)
             files = await connector.list_files(config)
             ingestion = IngestionService.from_settings()
-            ingested = failed = 0
+            ingested = skipped = failed = 0
+            # Rebuilt from the listing, so files deleted at the source drop out
+            new_checkpoints: dict[str, str] = {}
+            cancel_token = CancellationToken(log_id)
+            cancelled = False
+            to_download = []
+            for f in files:
+                fingerprint = f.fingerprint
+                if source.sync_mode != "full" and fingerprint and checkpoints.get(f.source_path) == fingerprint:
+                    # Unchanged since the last sync — skip before downloading
+                    new_checkpoints[f.source_path] = fingerprint
+                    skipped += 1
+                else:
+                    to_download.append(f)
+
+            async def _ingest(f: Any, local_path: Path, previous: str | None) -> None:
+                nonlocal ingested, failed
+                fingerprint = f.fingerprint
+                try:
+                    result = await ingestion.ingest_file(
+                        filepath=local_path,
+                        collection_name=source.collection_name,
+                        replace=(source.sync_mode == "full" or previous is not None),
+                        source_path=f.source_path,
+                    )
+                    if result.status.value != "done":
+                        raise RuntimeError(result.error_message or result.message)
+                    ingested += 1
+                    if fingerprint:
+                        new_checkpoints[f.source_path] = fingerprint
+                except Exception as e:
+                    logger.warning("Sync file failed %s: %s", f.name, e)
+                    failed += 1
+                finally:
+                    local_path.unlink(missing_ok=True)
+
             with tempfile.TemporaryDirectory() as tmp_dir:
-                for f in files:
-                    try:
-                        local_path = await connector.download_file(f, Path(tmp_dir))
-                        await ingestion.ingest_file(
-                            filepath=local_path,
-                            collection_name=source.collection_name,
-                            replace=(source.sync_mode == "full"),
-                            source_path=f.source_path,
-                        )
-                        ingested += 1
-                    except Exception as e:
-                        logger.warning("Sync file failed %s: %s", f.name, e)
-                        failed += 1
+                # Downloads run ahead (bounded) while fetched files are being ingested,
+                # several at a time so their chunks share buffered writes
+                downloads = connector.download_files(
+                    to_download, Path(tmp_dir), concurrency=settings.RAG_SYNC_DOWNLOAD_CONCURRENCY
+                )
+                async with (
+                    aclosing(downloads),
+                    ingestion.write_buffer(source.collection_name),
+                    BoundedTaskGroup(settings.RAG_BULK_INGEST_CONCURRENCY) as tasks,
+                ):
+                    async for f, local_path, error in downloads:
+                        if await cancel_token.is_cancelled():
+                            cancelled = True
+                            if local_path is not None:
+                                local_path.unlink(missing_ok=True)
+                            break
+                        if local_path is None:
+                            logger.warning("Sync download failed %s: %s", f.name, error)
+                            failed += 1
+                            continue
+                        previous = checkpoints.get(f.source_path)
+                        # Falls back to the hash computed while downloading
+                        fingerprint = f.fingerprint
+                        if source.sync_mode != "full" and fingerprint and previous == fingerprint:
+                            new_checkpoints[f.source_path] = fingerprint
+                            skipped += 1
+                            local_path.unlink(missing_ok=True)
+                            continue
+                        await tasks.submit(_ingest(f, local_path, previous))
+            if cancelled:
+                # The SyncLog is already marked cancelled; keep checkpoints of files not reached
+                await source_svc.save_checkpoints(source_id, {**checkpoints, **new_checkpoints})
+                return
             await sync_svc.complete_sync(
                 log_id,
                 status="done" if not failed else "error",
                 total_files=len(files),
                 ingested=ingested,
+                skipped=skipped,
                 failed=failed,
             )
+            # Failed files carry no checkpoint, so the next run retries them
+            await source_svc.save_checkpoints(source_id, new_checkpoints)
         except Exception as e:
             logger.error("Source sync failed: %s", e)
             await sync_svc.complete_sync(log_id, status="error", error_message=str(e))
+
+
+async def reembed_collection_in_background(log_id: str, collection: str, model: str, dim: int | None) -> None:
+    """Re-embed a collection with another model (see app.rag.reembed) and update the sync log.
+
+    The sync log counts chunks: total_files is the collection's size, ingested
+    the chunks embedded with the new model so far.
+    """
+
+    async def _progress(progress: ReembedProgress) -> None:
+        async with get_db_context() as db:
+            await RAGSyncService(db).update_progress(log_id, total_files=progress.total, ingested=progress.embedded)
+
+    try:
+        reembedder = build_reembedder(
+            collection, model, dim, is_cancelled=CancellationToken(log_id).is_cancelled, on_progress=_progress,
+        )
+        progress = await reembedder.run()
+    except ReembedCancelled:
+        # The SyncLog was already marked cancelled by the API
+        return
+    except Exception as e:
+        logger.error("Re-embed of %s failed: %s", collection, e)
+        async with get_db_context() as db:
+            await RAGSyncService(db).complete_sync(log_id, status="error", error_message=str(e))
+        return
+
+    async with get_db_context() as db:
+        await RAGSyncService(db).complete_sync(
+            log_id, status="done", total_files=progress.total, ingested=progress.embedded,
+        )
+
+
+async def import_snapshot_in_background(
+    log_id: str, collection: str, filepath: str, storage_path: str, restart: bool = False
+) -> None:
+    """Import a collection snapshot (see app.rag.snapshot) and update the sync log.
+
+    The sync log counts chunks. The uploaded snapshot is deleted afterwards
+    either way; its import checkpoint stays, so uploading it again resumes.
+    """
+
+    async def _progress(result: SnapshotImport) -> None:
+        async with get_db_context() as db:
+            await RAGSyncService(db).update_progress(
+                log_id, total_files=result.manifest.chunk_count, ingested=result.chunks
+            )
+
+    try:
+        result = await import_snapshot(
+            IngestionService.from_settings().store,
+            Path(filepath),
+            collection,
+            restart=restart,
+            is_cancelled=CancellationToken(log_id).is_cancelled,
+            on_progress=_progress,
+        )
+    except SnapshotImportCancelled:
+        # The SyncLog was already marked cancelled by the API
+        return
+    except Exception as e:
+        logger.error("Snapshot import into %s failed: %s", collection, e)
+        async with get_db_context() as db:
+            await RAGSyncService(db).complete_sync(log_id, status="error", error_message=str(e))
+        return
+    finally:
+        await get_file_storage().delete(storage_path)
+
+    async with get_db_context() as db:
+        await RAGSyncService(db).complete_sync(
+            log_id, status="done", total_files=result.manifest.chunk_count, ingested=result.chunks,
+        )
+
+
+async def build_summary_index_in_background(log_id: str, collection: str) -> None:
+    """Build a collection's summary index (see app.rag.summary_index) and update the sync log.
+
+    The sync log counts documents.
+    """
+
+    async def _progress(done: int, total: int) -> None:
+        async with get_db_context() as db:
+            await RAGSyncService(db).update_progress(log_id, total_files=total, ingested=done)
+
+    try:
+        documents = await DocumentSummaryIndex(IngestionService.from_settings().store).build(
+            collection, on_progress=_progress
+        )
+    except Exception as e:
+        logger.error("Summary index build for %s failed: %s", collection, e)
+        async with get_db_context() as db:
+            await RAGSyncService(db).complete_sync(log_id, status="error", error_message=str(e))
+        return
+
+    async with get_db_context() as db:
+        await RAGSyncService(db).complete_sync(log_id, status="done", total_files=documents, ingested=documents)
 {%- else %}
 """RAG background tasks — not configured."""
 {%- endif %}
@@ -3,19 +3,55 @@
 
 import asyncio
 import logging
+{%- if cookiecutter.enable_rag %}
+from collections.abc import Awaitable, Callable
+{%- endif %}
 from typing import Any
 
 from arq import cron
+{%- if cookiecutter.enable_rag %}
+from arq.connections import ArqRedis, RedisSettings, create_pool
+from arq.worker import func
+{%- else %}
 from arq.connections import RedisSettings
+{%- endif %}
 
 from app.core.config import settings
+{%- if cookiecutter.enable_rag %}
+from app.worker.queues import BULK_QUEUE, INTERACTIVE_QUEUE, QUEUE_KEYS, record_wait
+{%- endif %}
 
 logger = logging.getLogger(__name__)
 
+arq_redis_settings = RedisSettings(
+    host=settings.ARQ_REDIS_HOST,
+    port=settings.ARQ_REDIS_PORT,
+    password=settings.ARQ_REDIS_PASSWORD or None,
+    database=settings.ARQ_REDIS_DB,
+)
+{%- if cookiecutter.enable_rag %}
+
+_pool: ArqRedis | None = None
+
+
+async def get_arq_pool() -> ArqRedis:
+    """Shared connection pool for enqueueing jobs from the API."""
+    global _pool
+    if _pool is None:
+        _pool = await create_pool(arq_redis_settings, default_queue_name=QUEUE_KEYS[INTERACTIVE_QUEUE])
+    return _pool
+{%- endif %}
+
 
 async def startup(ctx: dict[str, Any]) -> None:
     """Initialize resources on worker startup."""
     logger.info("ARQ worker starting up...")
+{%- if cookiecutter.use_postgresql %}
+    from app.db.session import init_worker_db
+
+    # Pooled DB engine is created on first use inside the worker's event loop
+    init_worker_db()
+{%- endif %}
     # Add any startup initialization here
     # e.g., database connections, external clients
 
@@ -23,11 +59,39 @@ async def startup(ctx: dict[str, Any]) -> None:
 async def shutdown(ctx: dict[str, Any]) -> None:
     """Cleanup resources on worker shutdown."""
     logger.info("ARQ worker shutting down...")
+{%- if cookiecutter.use_postgresql %}
+    from app.db.session import close_worker_db
+
+    await close_worker_db()
+{%- endif %}
     # Add any cleanup here
 
 
 {%- if cookiecutter.enable_rag %}
-from app.worker.tasks.rag_tasks import sync_single_source_task, check_scheduled_syncs
+
+
+def _wait_recorder(queue: str) -> Callable[[dict[str, Any]], Awaitable[None]]:
+    """on_job_start hook recording how long each job waited in the queue."""
+
+    async def on_job_start(ctx: dict[str, Any]) -> None:
+        # score is the time the job became runnable (ms), i.e. when it was enqueued
+        score = ctx.get("score")
+        if score is not None:
+            await record_wait(queue, score / 1000)
+
+    return on_job_start
+
+
+from app.worker.tasks.rag_tasks import (  # noqa: E402
+    build_summary_index_task,
+    check_scheduled_syncs,
+    ingest_batch_task,
+    ingest_document_task,
+    import_snapshot_task,
+    reembed_collection_task,
+    sync_collection_task,
+    sync_single_source_task,
+)
 {%- endif %}
 
 # === Example Tasks ===
@@ -135,12 +199,10 @@ class WorkerSettings:
     """ARQ Worker configuration."""
 
     # Redis connection settings
-    redis_settings = RedisSettings(
-        host=settings.ARQ_REDIS_HOST,
-        port=settings.ARQ_REDIS_PORT,
-        password=settings.ARQ_REDIS_PASSWORD or None,
-        database=settings.ARQ_REDIS_DB,
-    )
+    redis_settings = arq_redis_settings
+{%- if cookiecutter.enable_rag %}
+    queue_name = QUEUE_KEYS[INTERACTIVE_QUEUE]
+{%- endif %}
 
     # Register task functions
     functions = [
@@ -148,7 +210,7 @@ class WorkerSettings:
         long_running_task,
         send_email_task,
 {%- if cookiecutter.enable_rag %}
-        sync_single_source_task,
+        ingest_document_task,
 {%- endif %}
     ]
 
@@ -164,6 +226,9 @@ class WorkerSettings:
     # Worker lifecycle hooks
     on_startup = startup
     on_shutdown = shutdown
+{%- if cookiecutter.enable_rag %}
+    on_job_start = _wait_recorder(INTERACTIVE_QUEUE)
+{%- endif %}
 
     # Worker settings
     max_jobs = 10  # Maximum concurrent jobs
@@ -171,6 +236,40 @@ class WorkerSettings:
     keep_result = 3600  # Keep results for 1 hour
     poll_delay = 0.5  # Polling delay in seconds
     queue_read_limit = 100  # Number of jobs to read at once
+{%- if cookiecutter.enable_rag %}
+
+
+class BulkWorkerSettings:
+    """Worker for long-running RAG syncs (see app.worker.queues).
+
+    Run separately: arq app.worker.arq_app.BulkWorkerSettings
+    """
+
+    redis_settings = arq_redis_settings
+    queue_name = QUEUE_KEYS[BULK_QUEUE]
+
+    functions = [
+        # One job per batch upload, which can hold thousands of documents
+        func(ingest_batch_task, timeout=24 * 3600, max_tries=1),
+        sync_collection_task,
+        sync_single_source_task,
+        # Re-embeds a whole collection, throttled to the embedding provider's rate limit
+        func(reembed_collection_task, timeout=24 * 3600, max_tries=1),
+        # Resumable, so a failed import is retried by uploading the snapshot again
+        func(import_snapshot_task, timeout=24 * 3600, max_tries=1),
+        func(build_summary_index_task, timeout=24 * 3600, max_tries=1),
+    ]
+
+    on_startup = startup
+    on_shutdown = shutdown
+    on_job_start = _wait_recorder(BULK_QUEUE)
+
+    max_jobs = 2  # Syncs are long; keep the embedding API free for interactive work
+    job_timeout = 720
+    keep_result = 3600
+    poll_delay = 2.0
+    queue_read_limit = 10
+{%- endif %}
 {%- else %}
 # ARQ not enabled for this project
 {%- endif %}
@@ -1,10 +1,32 @@
 {%- if cookiecutter.use_celery %}
 """Celery application configuration."""
 
+{%- if cookiecutter.use_postgresql or cookiecutter.enable_rag %}
+{%- if cookiecutter.enable_rag %}
+import time
+{%- endif %}
+from typing import Any
+
+{%- endif %}
 from celery import Celery
 from celery.schedules import crontab
+{%- if cookiecutter.enable_rag %}
+from celery.signals import before_task_publish, task_prerun
+{%- endif %}
+{%- if cookiecutter.use_postgresql %}
+from celery.signals import worker_process_init, worker_process_shutdown
+{%- endif %}
 
 from app.core.config import settings
+{%- if cookiecutter.enable_rag %}
+from app.worker.queues import (
+    BULK_QUEUE,
+    INTERACTIVE_QUEUE,
+    QUEUE_KEYS,
+    SCHEDULED_QUEUE,
+    record_wait_blocking,
+)
+{%- endif %}
 {%- if cookiecutter.enable_logfire and cookiecutter.logfire_celery %}
 from app.core.logfire_setup import instrument_celery
 {%- endif %}
@@ -32,10 +54,65 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
     worker_concurrency=4,
 )
+{%- if cookiecutter.enable_rag %}
+
+# RAG work is split into lanes (see app.worker.queues). The default worker consumes
+# celery,interactive,scheduled; a separate worker consumes bulk with its own concurrency.
+celery_app.conf.task_routes = {
+    "app.worker.tasks.rag_tasks.ingest_document_task": {"queue": INTERACTIVE_QUEUE},
+    "app.worker.tasks.rag_tasks.check_scheduled_syncs": {"queue": SCHEDULED_QUEUE},
+    "app.worker.tasks.rag_tasks.ingest_batch_task": {"queue": BULK_QUEUE},
+    "app.worker.tasks.rag_tasks.sync_collection_task": {"queue": BULK_QUEUE},
+    "app.worker.tasks.rag_tasks.sync_single_source_task": {"queue": BULK_QUEUE},
+    "app.worker.tasks.rag_tasks.reembed_collection_task": {"queue": BULK_QUEUE},
+    "app.worker.tasks.rag_tasks.import_snapshot_task": {"queue": BULK_QUEUE},
+    "app.worker.tasks.rag_tasks.build_summary_index_task": {"queue": BULK_QUEUE},
+}
+{%- endif %}
 
 # Autodiscover tasks from app.worker.tasks module
 celery_app.autodiscover_tasks(["app.worker.tasks"])
 
+{%- if cookiecutter.use_postgresql %}
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs: Any) -> None:
+    """Drop DB connections inherited from the parent; the child builds its own pool."""
+    from app.db.session import init_worker_db
+
+    init_worker_db()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs: Any) -> None:
+    """Close the child's pooled DB connections and stop its event loop."""
+    from app.db.session import close_worker_db
+    from app.worker.event_loop import stop_worker_loop
+
+    stop_worker_loop(close_worker_db())
+{%- endif %}
+
+{%- if cookiecutter.enable_rag %}
+
+
+@before_task_publish.connect
+def stamp_enqueued_at(headers: dict[str, Any] | None = None, **kwargs: Any) -> None:
+    """Stamp messages with their publish time, to measure how long they wait in the queue."""
+    if headers is not None:
+        headers.setdefault("enqueued_at", time.time())
+
+
+@task_prerun.connect
+def record_queue_wait(task: Any = None, **kwargs: Any) -> None:
+    """Record the queue wait of each task picked up by this worker."""
+    request = getattr(task, "request", None)
+    enqueued_at = getattr(request, "enqueued_at", None)
+    queue = (getattr(request, "delivery_info", None) or {}).get("routing_key")
+    if enqueued_at is not None and queue in QUEUE_KEYS:
+        record_wait_blocking(queue, enqueued_at)
+{%- endif %}
+
 
 celery_app.conf.beat_schedule = {
     "example-every-minute": {
@@ -0,0 +1,74 @@
+{%- if cookiecutter.use_celery %}
+"""Persistent event loop for running async code from Celery tasks.
+
+Celery tasks are synchronous, and calling ``asyncio.run()`` in each one creates
+(and closes) a new event loop per task - throwing away every loop-bound resource
+built along the way: HTTP clients, vector store clients, DB connection pools.
+
+Instead, each worker process runs one long-lived loop in a daemon thread, and
+tasks submit coroutines to it with :func:`run_async`. Singletons created inside
+those coroutines stay valid for the life of the process.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_pid: int | None = None
+_lock = threading.Lock()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's background event loop, starting it on first use."""
+    global _loop, _loop_pid
+
+    with _lock:
+        # A loop inherited through fork has no thread running it - start a new one
+        if _loop is None or _loop_pid != os.getpid() or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _loop_pid = os.getpid()
+            threading.Thread(target=_loop.run_forever, name="worker-event-loop", daemon=True).start()
+        return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the worker's persistent loop and block until it finishes.
+
+    Drop-in replacement for ``asyncio.run()`` inside Celery tasks. If the calling
+    thread is interrupted (e.g. SoftTimeLimitExceeded), the coroutine is cancelled.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_worker_loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def stop_worker_loop(cleanup: Coroutine[Any, Any, Any] | None = None) -> None:
+    """Run a final cleanup coroutine on the loop, then stop it (worker shutdown)."""
+    global _loop, _loop_pid
+
+    if _loop is None or _loop_pid != os.getpid() or _loop.is_closed():
+        if cleanup is not None:
+            cleanup.close()
+        return
+    if cleanup is not None:
+        try:
+            run_async(cleanup)
+        except Exception as e:
+            logger.warning(f"Worker loop cleanup failed: {e}")
+    _loop.call_soon_threadsafe(_loop.stop)
+    _loop = None
+    _loop_pid = None
+{%- else %}
+# Celery not enabled for this project
+{%- endif %}
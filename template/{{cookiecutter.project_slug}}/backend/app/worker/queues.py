@@ -0,0 +1,194 @@
+{%- if cookiecutter.enable_rag and (cookiecutter.use_celery or cookiecutter.use_taskiq or cookiecutter.use_arq) %}
+"""Separate queues for interactive and bulk RAG work.
+
+A user uploading a document waits for it; a collection or connector sync can
+run for hours. They go to separate queues, consumed by separate workers with
+their own concurrency, so an upload never queues up behind a sync:
+
+    interactive  ingest_document_task
+{%- if cookiecutter.use_celery %}
+    scheduled    check_scheduled_syncs
+{%- else %}
+                 check_scheduled_syncs (only dispatches, so it shares the lane)
+{%- endif %}
+    bulk         ingest_batch_task, sync_collection_task, sync_single_source_task,
+                 reembed_collection_task, import_snapshot_task, build_summary_index_task
+
+Both lanes still share the embedding API and the vector store, so bulk loops
+also pause between files while interactive jobs are waiting
+(:class:`InteractiveBackpressure`).
+
+Every job records how long it waited in its queue; :func:`get_queue_stats`
+reports depth and wait times per queue (``GET /rag/queues``).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE_QUEUE = "interactive"
+BULK_QUEUE = "bulk"
+{%- if cookiecutter.use_celery %}
+SCHEDULED_QUEUE = "scheduled"
+
+# Broker queue names (also the Redis list keys)
+QUEUE_KEYS = {
+    INTERACTIVE_QUEUE: "interactive",
+    BULK_QUEUE: "bulk",
+    SCHEDULED_QUEUE: "scheduled",
+}
+{%- elif cookiecutter.use_taskiq %}
+
+# Redis list keys of the two ListQueueBrokers (the default broker is the interactive one)
+QUEUE_KEYS = {
+    INTERACTIVE_QUEUE: "taskiq",
+    BULK_QUEUE: "taskiq:bulk",
+}
+{%- elif cookiecutter.use_arq %}
+
+# ARQ queue names (Redis sorted sets; arq:queue is ARQ's default)
+QUEUE_KEYS = {
+    INTERACTIVE_QUEUE: "arq:queue",
+    BULK_QUEUE: "arq:queue:bulk",
+}
+{%- endif %}
+
+WAIT_KEY_PREFIX = "rag:queue:wait:"
+WAIT_SAMPLES = 500  # Most recent waits kept per queue
+
+
+def broker_url() -> str:
+    """Redis URL of the task broker (queue depths and wait samples live there)."""
+{%- if cookiecutter.use_celery %}
+    return settings.CELERY_BROKER_URL
+{%- elif cookiecutter.use_taskiq %}
+    return settings.TASKIQ_BROKER_URL
+{%- elif cookiecutter.use_arq %}
+    auth = f":{settings.ARQ_REDIS_PASSWORD}@" if settings.ARQ_REDIS_PASSWORD else ""
+    return f"redis://{auth}{settings.ARQ_REDIS_HOST}:{settings.ARQ_REDIS_PORT}/{settings.ARQ_REDIS_DB}"
+{%- endif %}
+
+
+def _wait_seconds(enqueued_at: Any) -> float | None:
+    try:
+        return max(0.0, time.time() - float(enqueued_at))
+    except (TypeError, ValueError):
+        return None
+
+
+async def record_wait(queue: str, enqueued_at: Any) -> None:
+    """Record how long a job waited in its queue (enqueued_at: epoch seconds)."""
+    wait = _wait_seconds(enqueued_at)
+    if wait is None:
+        return
+    try:
+        r = aioredis.from_url(broker_url())  # type: ignore[no-untyped-call]
+        try:
+            key = f"{WAIT_KEY_PREFIX}{queue}"
+            await r.pipeline().lpush(key, f"{wait:.3f}").ltrim(key, 0, WAIT_SAMPLES - 1).execute()
+        finally:
+            await r.aclose()
+    except Exception as e:
+        logger.debug(f"Failed to record queue wait for {queue}: {e}")
+
+
+def record_wait_blocking(queue: str, enqueued_at: Any) -> None:
+    """Synchronous variant of :func:`record_wait` for sync call sites."""
+    wait = _wait_seconds(enqueued_at)
+    if wait is None:
+        return
+    try:
+        r = redis.Redis.from_url(broker_url())
+        try:
+            key = f"{WAIT_KEY_PREFIX}{queue}"
+            r.pipeline().lpush(key, f"{wait:.3f}").ltrim(key, 0, WAIT_SAMPLES - 1).execute()
+        finally:
+            r.close()
+    except Exception as e:
+        logger.debug(f"Failed to record queue wait for {queue}: {e}")
+
+
+async def _depth(r: aioredis.Redis, queue: str) -> int:
+{%- if cookiecutter.use_arq %}
+    return int(await r.zcard(QUEUE_KEYS[queue]))
+{%- else %}
+    return int(await r.llen(QUEUE_KEYS[queue]))  # type: ignore[misc]
+{%- endif %}
+
+
+def _percentile(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def get_queue_stats() -> list[dict[str, Any]]:
+    """Depth and wait times (over the last WAIT_SAMPLES jobs) of each queue."""
+    r = aioredis.from_url(broker_url())  # type: ignore[no-untyped-call]
+    try:
+        stats = []
+        for queue in QUEUE_KEYS:
+            raw = await r.lrange(f"{WAIT_KEY_PREFIX}{queue}", 0, -1)  # type: ignore[misc]
+            waits = sorted(float(w) for w in raw)
+            stats.append({
+                "queue": queue,
+                "depth": await _depth(r, queue),
+                "wait_samples": len(waits),
+                "wait_avg_seconds": sum(waits) / len(waits) if waits else None,
+                "wait_p50_seconds": _percentile(waits, 0.5) if waits else None,
+                "wait_p95_seconds": _percentile(waits, 0.95) if waits else None,
+                "wait_max_seconds": waits[-1] if waits else None,
+            })
+        return stats
+    finally:
+        await r.aclose()
+
+
+class InteractiveBackpressure:
+    """Lets bulk loops pause while interactive jobs are queued.
+
+    ``await pause()`` between files is cheap to call per item: the interactive
+    queue is polled at most every ``poll_interval`` seconds. While it is not
+    empty, the loop sleeps, for at most RAG_BULK_YIELD_MAX_SECONDS per pause
+    (0 disables yielding), so a steady stream of uploads cannot starve a sync.
+    """
+
+    def __init__(self, max_wait: float | None = None, poll_interval: float = 1.0):
+        self.max_wait = settings.RAG_BULK_YIELD_MAX_SECONDS if max_wait is None else max_wait
+        self.poll_interval = poll_interval
+        self._last_poll = float("-inf")
+
+    async def _interactive_depth(self) -> int:
+        r = aioredis.from_url(broker_url())  # type: ignore[no-untyped-call]
+        try:
+            return await _depth(r, INTERACTIVE_QUEUE)
+        finally:
+            await r.aclose()
+
+    async def pause(self) -> float:
+        """Wait while interactive jobs are queued; returns the seconds paused."""
+        if self.max_wait <= 0:
+            return 0.0
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return 0.0
+        start = now
+        try:
+            while await self._interactive_depth() > 0:
+                if time.monotonic() - start >= self.max_wait:
+                    break
+                await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            logger.warning(f"Interactive queue check failed: {e}")
+        self._last_poll = time.monotonic()
+        paused = self._last_poll - start
+        if paused >= self.poll_interval:
+            logger.info(f"Bulk sync yielded {paused:.1f}s to interactive jobs")
+        return paused
+{%- endif %}
@@ -1,19 +1,62 @@
 {%- if cookiecutter.use_taskiq %}
 """Taskiq application configuration."""
 
-from taskiq import TaskiqScheduler
+{%- if cookiecutter.enable_rag %}
+import time
+
+from taskiq import TaskiqEvents, TaskiqMessage, TaskiqMiddleware, TaskiqScheduler
+{%- else %}
+from taskiq import TaskiqEvents, TaskiqScheduler
+{%- endif %}
 from taskiq_redis import ListQueueBroker, RedisAsyncResultBackend
 
 from app.core.config import settings
+{%- if cookiecutter.enable_rag %}
+from app.worker.queues import BULK_QUEUE, INTERACTIVE_QUEUE, QUEUE_KEYS, record_wait
+
+
+class QueueWaitMiddleware(TaskiqMiddleware):
+    """Stamps messages on send and records how long they waited in the queue."""
+
+    def __init__(self, queue: str) -> None:
+        super().__init__()
+        self.queue = queue
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        message.labels.setdefault("enqueued_at", str(time.time()))
+        return message
+
+    async def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        await record_wait(self.queue, message.labels.get("enqueued_at"))
+        return message
+{%- endif %}
 
 # Create Taskiq broker with Redis
 broker = ListQueueBroker(
     url=settings.TASKIQ_BROKER_URL,
+{%- if cookiecutter.enable_rag %}
+    queue_name=QUEUE_KEYS[INTERACTIVE_QUEUE],
+{%- endif %}
+).with_result_backend(
+    RedisAsyncResultBackend(
+        redis_url=settings.TASKIQ_RESULT_BACKEND,
+    )
+)
+{%- if cookiecutter.enable_rag %}
+broker.add_middlewares(QueueWaitMiddleware(INTERACTIVE_QUEUE))
+
+# Long-running RAG syncs have their own queue and worker (see app.worker.queues):
+#   taskiq worker app.worker.taskiq_app:bulk_broker app.worker.tasks.rag_tasks
+bulk_broker = ListQueueBroker(
+    url=settings.TASKIQ_BROKER_URL,
+    queue_name=QUEUE_KEYS[BULK_QUEUE],
 ).with_result_backend(
     RedisAsyncResultBackend(
         redis_url=settings.TASKIQ_RESULT_BACKEND,
     )
 )
+bulk_broker.add_middlewares(QueueWaitMiddleware(BULK_QUEUE))
+{%- endif %}
 
 # Create scheduler for periodic tasks
 scheduler = TaskiqScheduler(
@@ -23,16 +66,35 @@ scheduler = TaskiqScheduler(
 
 
 # Startup/shutdown hooks
-@broker.on_event("startup")
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+{%- if cookiecutter.enable_rag %}
+@bulk_broker.on_event(TaskiqEvents.WORKER_STARTUP)
+{%- endif %}
 async def startup() -> None:
-    """Initialize broker on startup."""
+    """Initialize worker resources on startup."""
+{%- if cookiecutter.use_postgresql %}
+    from app.db.session import init_worker_db
+
+    # Pooled DB engine is created on first use inside the worker's event loop
+    init_worker_db()
+{%- else %}
     pass
+{%- endif %}
 
 
-@broker.on_event("shutdown")
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+{%- if cookiecutter.enable_rag %}
+@bulk_broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+{%- endif %}
 async def shutdown() -> None:
-    """Cleanup on shutdown."""
+    """Cleanup worker resources on shutdown."""
+{%- if cookiecutter.use_postgresql %}
+    from app.db.session import close_worker_db
+
+    await close_worker_db()
+{%- else %}
     pass
+{%- endif %}
 {%- else %}
 # Taskiq not enabled for this project
 {%- endif %}
@@ -4,15 +4,29 @@
 import asyncio
 import json
 import logging
+import os
 import tempfile
+import weakref
+from contextlib import aclosing
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 {%- if cookiecutter.use_celery %}
 from celery import shared_task
+
+# Loads the configured app in the API process too, so .delay() honours its task routes
+from app.worker.celery_app import celery_app  # noqa: F401
+from app.worker.event_loop import run_async
 {%- elif cookiecutter.use_taskiq %}
-from app.worker.taskiq_app import broker
+from app.worker.taskiq_app import broker, bulk_broker
+{%- elif cookiecutter.use_arq %}
+from app.worker.queues import BULK_QUEUE, QUEUE_KEYS
 {%- endif %}
+from app.rag.tenancy import SHARED_TENANT
+from app.worker.queues import InteractiveBackpressure
+
+if TYPE_CHECKING:
+    from app.rag.ingestion import IngestionService
 
 logger = logging.getLogger(__name__)
 
@@ -22,43 +36,78 @@ logger = logging.getLogger(__name__)
 
 
 @shared_task(bind=True, max_retries=2, soft_time_limit=300, time_limit=360)  # type: ignore
-def ingest_document_task(self: Any, rag_document_id: str, collection_name: str, filepath: str, source_path: str, replace: bool = False) -> dict[str, Any]:
+def ingest_document_task(self: Any, rag_document_id: str, collection_name: str, filepath: str, source_path: str, replace: bool = False, tenant: str = SHARED_TENANT) -> dict[str, Any]:
     """Process a document: parse, chunk, embed, store in vector DB."""
     logger.info(f"Starting ingestion: {source_path} -> {collection_name}")
     try:
-        return asyncio.run(_run_ingestion(rag_document_id, collection_name, filepath, source_path, replace))
+        return run_async(_run_ingestion(rag_document_id, collection_name, filepath, source_path, replace, tenant))
     except Exception as exc:
         logger.error(f"Ingestion failed: {exc}")
-        asyncio.run(_update_status(rag_document_id, "error", error_message=str(exc)))
+        run_async(_update_status(rag_document_id, "error", error_message=str(exc)))
         raise self.retry(exc=exc, countdown=30) from exc
 
 
+@shared_task  # type: ignore
+def ingest_batch_task(collection_name: str, documents: list[dict[str, str]], replace: bool = False) -> dict[str, Any]:
+    """Ingest the documents of a batch upload, one after another (failures are per document)."""
+    logger.info(f"Starting batch ingestion: {len(documents)} documents -> {collection_name}")
+    return run_async(_run_batch_ingestion(collection_name, documents, replace))
+
+
 @shared_task(bind=True, max_retries=1, soft_time_limit=600, time_limit=720)  # type: ignore
 def sync_collection_task(self: Any, sync_log_id: str, source: str, collection_name: str, mode: str, path: str) -> dict[str, Any]:
     """Sync a collection from a local directory."""
     logger.info(f"Starting sync: {source} -> {collection_name} (mode={mode})")
     try:
-        return asyncio.run(_run_sync(sync_log_id, source, collection_name, mode, path))
+        return run_async(_run_sync(sync_log_id, source, collection_name, mode, path))
     except Exception as exc:
         logger.error(f"Sync failed: {exc}")
-        asyncio.run(_update_sync_log(sync_log_id, "error", error_message=str(exc)))
+        run_async(_update_sync_log(sync_log_id, "error", error_message=str(exc)))
         raise self.retry(exc=exc, countdown=60) from exc
+
+
+@shared_task  # type: ignore
+def reembed_collection_task(sync_log_id: str, collection_name: str, model: str, dim: int | None = None) -> dict[str, Any]:
+    """Re-embed a collection with another model in a shadow collection, then swap it in."""
+    logger.info(f"Starting re-embed: {collection_name} -> {model}")
+    return run_async(_run_reembed(sync_log_id, collection_name, model, dim))
+
+
+@shared_task  # type: ignore
+def import_snapshot_task(sync_log_id: str, collection_name: str, filepath: str, storage_path: str, restart: bool = False) -> dict[str, Any]:
+    """Bulk-load a collection snapshot (vectors included, nothing is embedded)."""
+    logger.info(f"Starting snapshot import: {filepath} -> {collection_name}")
+    return run_async(_run_snapshot_import(sync_log_id, collection_name, filepath, storage_path, restart))
+
+
+@shared_task  # type: ignore
+def build_summary_index_task(sync_log_id: str, collection_name: str) -> dict[str, Any]:
+    """Build a collection's document summary index (one centroid vector per document)."""
+    logger.info(f"Starting summary index build: {collection_name}")
+    return run_async(_run_summary_index_build(sync_log_id, collection_name))
 {%- elif cookiecutter.use_taskiq %}
 
 
 @broker.task
-async def ingest_document_task(rag_document_id: str, collection_name: str, filepath: str, source_path: str, replace: bool = False) -> dict[str, Any]:
+async def ingest_document_task(rag_document_id: str, collection_name: str, filepath: str, source_path: str, replace: bool = False, tenant: str = SHARED_TENANT) -> dict[str, Any]:
     """Process a document: parse, chunk, embed, store in vector DB."""
     logger.info(f"Starting ingestion: {source_path} -> {collection_name}")
     try:
-        return await _run_ingestion(rag_document_id, collection_name, filepath, source_path, replace)
+        return await _run_ingestion(rag_document_id, collection_name, filepath, source_path, replace, tenant)
     except Exception as exc:
         logger.error(f"Ingestion failed: {exc}")
         await _update_status(rag_document_id, "error", error_message=str(exc))
         raise
 
 
-@broker.task
+@bulk_broker.task
+async def ingest_batch_task(collection_name: str, documents: list[dict[str, str]], replace: bool = False) -> dict[str, Any]:
+    """Ingest the documents of a batch upload, one after another (failures are per document)."""
+    logger.info(f"Starting batch ingestion: {len(documents)} documents -> {collection_name}")
+    return await _run_batch_ingestion(collection_name, documents, replace)
+
+
+@bulk_broker.task
 async def sync_collection_task(sync_log_id: str, source: str, collection_name: str, mode: str, path: str) -> dict[str, Any]:
     """Sync a collection from a local directory."""
     logger.info(f"Starting sync: {source} -> {collection_name} (mode={mode})")
@@ -68,20 +117,47 @@ async def sync_collection_task(sync_log_id: str, source: str, collection_name: s
         logger.error(f"Sync failed: {exc}")
         await _update_sync_log(sync_log_id, "error", error_message=str(exc))
         raise
+
+
+@bulk_broker.task
+async def reembed_collection_task(sync_log_id: str, collection_name: str, model: str, dim: int | None = None) -> dict[str, Any]:
+    """Re-embed a collection with another model in a shadow collection, then swap it in."""
+    logger.info(f"Starting re-embed: {collection_name} -> {model}")
+    return await _run_reembed(sync_log_id, collection_name, model, dim)
+
+
+@bulk_broker.task
+async def import_snapshot_task(sync_log_id: str, collection_name: str, filepath: str, storage_path: str, restart: bool = False) -> dict[str, Any]:
+    """Bulk-load a collection snapshot (vectors included, nothing is embedded)."""
+    logger.info(f"Starting snapshot import: {filepath} -> {collection_name}")
+    return await _run_snapshot_import(sync_log_id, collection_name, filepath, storage_path, restart)
+
+
+@bulk_broker.task
+async def build_summary_index_task(sync_log_id: str, collection_name: str) -> dict[str, Any]:
+    """Build a collection's document summary index (one centroid vector per document)."""
+    logger.info(f"Starting summary index build: {collection_name}")
+    return await _run_summary_index_build(sync_log_id, collection_name)
 {%- elif cookiecutter.use_arq %}
 
 
-async def ingest_document_task(ctx: dict, rag_document_id: str, collection_name: str, filepath: str, source_path: str, replace: bool = False) -> dict[str, Any]:
+async def ingest_document_task(ctx: dict, rag_document_id: str, collection_name: str, filepath: str, source_path: str, replace: bool = False, tenant: str = SHARED_TENANT) -> dict[str, Any]:
     """Process a document: parse, chunk, embed, store in vector DB."""
     logger.info(f"Starting ingestion: {source_path} -> {collection_name}")
     try:
-        return await _run_ingestion(rag_document_id, collection_name, filepath, source_path, replace)
+        return await _run_ingestion(rag_document_id, collection_name, filepath, source_path, replace, tenant)
     except Exception as exc:
         logger.error(f"Ingestion failed: {exc}")
         await _update_status(rag_document_id, "error", error_message=str(exc))
         raise
 
 
+async def ingest_batch_task(ctx: dict, collection_name: str, documents: list[dict[str, str]], replace: bool = False) -> dict[str, Any]:
+    """Ingest the documents of a batch upload, one after another (failures are per document)."""
+    logger.info(f"Starting batch ingestion: {len(documents)} documents -> {collection_name}")
+    return await _run_batch_ingestion(collection_name, documents, replace)
+
+
 async def sync_collection_task(ctx: dict, sync_log_id: str, source: str, collection_name: str, mode: str, path: str) -> dict[str, Any]:
     """Sync a collection from a local directory."""
     logger.info(f"Starting sync: {source} -> {collection_name} (mode={mode})")
@@ -91,6 +167,24 @@ async def sync_collection_task(ctx: dict, sync_log_id: str, source: str, collect
         logger.error(f"Sync failed: {exc}")
         await _update_sync_log(sync_log_id, "error", error_message=str(exc))
         raise
+
+
+async def reembed_collection_task(ctx: dict, sync_log_id: str, collection_name: str, model: str, dim: int | None = None) -> dict[str, Any]:
+    """Re-embed a collection with another model in a shadow collection, then swap it in."""
+    logger.info(f"Starting re-embed: {collection_name} -> {model}")
+    return await _run_reembed(sync_log_id, collection_name, model, dim)
+
+
+async def import_snapshot_task(ctx: dict, sync_log_id: str, collection_name: str, filepath: str, storage_path: str, restart: bool = False) -> dict[str, Any]:
+    """Bulk-load a collection snapshot (vectors included, nothing is embedded)."""
+    logger.info(f"Starting snapshot import: {filepath} -> {collection_name}")
+    return await _run_snapshot_import(sync_log_id, collection_name, filepath, storage_path, restart)
+
+
+async def build_summary_index_task(ctx: dict, sync_log_id: str, collection_name: str) -> dict[str, Any]:
+    """Build a collection's document summary index (one centroid vector per document)."""
+    logger.info(f"Starting summary index build: {collection_name}")
+    return await _run_summary_index_build(sync_log_id, collection_name)
 {%- endif %}
 
 
@@ -103,7 +197,7 @@ def sync_single_source_task(self: Any, source_id: str, sync_log_id: str | None =
     """Sync a single connector source. If sync_log_id provided, use existing log."""
     logger.info(f"Starting source sync: {source_id}")
     try:
-        return asyncio.run(_run_source_sync(source_id, sync_log_id=sync_log_id))
+        return run_async(_run_source_sync(source_id, sync_log_id=sync_log_id))
     except Exception as exc:
         logger.error(f"Source sync failed: {exc}")
         raise self.retry(exc=exc, countdown=60) from exc
@@ -122,11 +216,11 @@ def check_scheduled_syncs() -> None:
                 sync_single_source_task.delay(str(source.id))
             logger.info(f"Scheduled sync check: dispatched {len(sources)} source(s)")
 
-    asyncio.run(_check())
+    run_async(_check())
 {%- elif cookiecutter.use_taskiq %}
 
 
-@broker.task
+@bulk_broker.task
 async def sync_single_source_task(source_id: str, sync_log_id: str | None = None) -> dict[str, Any]:
     """Sync a single connector source. If sync_log_id provided, use existing log."""
     logger.info(f"Starting source sync: {source_id}")
@@ -162,39 +256,50 @@ async def check_scheduled_syncs(ctx: dict) -> None:
         sources = await sync_source_repo.get_due_for_sync(db)
         pool = ctx["redis"]
         for source in sources:
-            await pool.enqueue_job("sync_single_source_task", str(source.id))
+            await pool.enqueue_job("sync_single_source_task", str(source.id), _queue_name=QUEUE_KEYS[BULK_QUEUE])
         logger.info(f"Scheduled sync check: dispatched {len(sources)} source(s)")
 {%- endif %}
 
 
 
 
-async def _run_ingestion(rag_document_id: str, collection_name: str, filepath: str, source_path: str, replace: bool) -> dict[str, Any]:
-    from app.core.config import settings
+# Built once per worker process and event loop, so the embedding model, HTTP
+# clients and vector store connections are reused across tasks
+_ingestion_service: "IngestionService | None" = None
+_ingestion_owner: tuple[int, weakref.ref[asyncio.AbstractEventLoop]] | None = None
+
+
+def _get_ingestion_service() -> "IngestionService":
+    """Get or create the worker's IngestionService singleton (call from a coroutine)."""
+    global _ingestion_service, _ingestion_owner
+    from app.rag.ingestion import IngestionService
+
+    loop = asyncio.get_running_loop()
+    if _ingestion_service is not None and _ingestion_owner is not None:
+        pid, loop_ref = _ingestion_owner
+        if pid == os.getpid() and loop_ref() is loop:
+            return _ingestion_service
+
+    _ingestion_service = IngestionService.from_settings()
+    _ingestion_owner = (os.getpid(), weakref.ref(loop))
+    return _ingestion_service
+
+
+async def _run_ingestion(
+    rag_document_id: str, collection_name: str, filepath: str, source_path: str, replace: bool, tenant: str = SHARED_TENANT
+) -> dict[str, Any]:
     from app.db.session import get_worker_db_context
     from app.services.rag_document import RAGDocumentService
-    from app.rag.documents import DocumentProcessor
-    from app.rag.embeddings import EmbeddingService
-    from app.rag.ingestion import IngestionService
-{%- if cookiecutter.use_milvus %}
-    from app.rag.vectorstore import MilvusVectorStore as VectorStore
-{%- elif cookiecutter.use_qdrant %}
-    from app.rag.vectorstore import QdrantVectorStore as VectorStore
-{%- elif cookiecutter.use_chromadb %}
-    from app.rag.vectorstore import ChromaVectorStore as VectorStore
-{%- elif cookiecutter.use_pgvector %}
-    from app.rag.vectorstore import PgVectorStore as VectorStore
-{%- endif %}
 
-    rag_settings = settings.rag
-    embed_service = EmbeddingService(settings=rag_settings)
-    vector_store = VectorStore(settings=rag_settings, embedding_service=embed_service)
-    processor = DocumentProcessor(settings=rag_settings)
-    ingestion_service = IngestionService(processor=processor, vector_store=vector_store)
+    ingestion_service = _get_ingestion_service()
 
     file_path = Path(filepath)
     try:
-        result = await ingestion_service.ingest_file(filepath=file_path, collection_name=collection_name, replace=replace, source_path=source_path)
+        result = await ingestion_service.ingest_file(
+            filepath=file_path, collection_name=collection_name, replace=replace, source_path=source_path, tenant=tenant
+        )
+        if result.status.value != "done":
+            raise RuntimeError(result.error_message or result.message)
         async with get_worker_db_context() as db:
             await RAGDocumentService(db).complete_ingestion(rag_document_id, vector_document_id=result.document_id)
         await _notify_ws(rag_document_id, "done", source_path)
@@ -205,31 +310,52 @@ async def _run_ingestion(rag_document_id: str, collection_name: str, filepath: s
         raise
 
 
+async def _run_batch_ingestion(collection_name: str, documents: list[dict[str, str]], replace: bool) -> dict[str, Any]:
+    """Ingest a batch upload's documents ({id, filepath, source_path, tenant}) in one job.
+
+    Several documents are in flight at once, so the chunks of small documents
+    are embedded and upserted together (see app.rag.write_buffer).
+    """
+    from app.core.config import settings
+    from app.rag.write_buffer import BoundedTaskGroup
+
+    backpressure = InteractiveBackpressure()
+    ingested = failed = 0
+
+    async def _ingest(doc: dict[str, str]) -> None:
+        nonlocal ingested, failed
+        try:
+            await _run_ingestion(
+                doc["id"], collection_name, doc["filepath"], doc["source_path"], replace, doc.get("tenant", SHARED_TENANT)
+            )
+            ingested += 1
+        except Exception as e:
+            # Already recorded on the document; the rest of the batch goes on
+            logger.warning(f"Batch ingestion of {doc['source_path']} failed: {e}")
+            failed += 1
+
+    async with (
+        _get_ingestion_service().write_buffer(collection_name),
+        BoundedTaskGroup(settings.RAG_BULK_INGEST_CONCURRENCY) as tasks,
+    ):
+        for doc in documents:
+            await backpressure.pause()
+            await tasks.submit(_ingest(doc))
+    logger.info(f"Batch ingestion done: {collection_name} — ingested={ingested}, failed={failed}")
+    return {"status": "done" if not failed else "error", "ingested": ingested, "failed": failed}
+
+
 async def _run_sync(sync_log_id: str, source: str, collection_name: str, mode: str, path: str) -> dict[str, Any]:
-    import hashlib
     from app.core.config import settings
     from app.db.session import get_worker_db_context
     from app.services.rag_document import RAGDocumentService
     from app.services.rag_sync import RAGSyncService
-    from app.rag.documents import DocumentProcessor
-    from app.rag.embeddings import EmbeddingService
-    from app.rag.ingestion import IngestionService
     from app.rag.config import DocumentExtensions
-{%- if cookiecutter.use_milvus %}
-    from app.rag.vectorstore import MilvusVectorStore as VectorStore
-{%- elif cookiecutter.use_qdrant %}
-    from app.rag.vectorstore import QdrantVectorStore as VectorStore
-{%- elif cookiecutter.use_chromadb %}
-    from app.rag.vectorstore import ChromaVectorStore as VectorStore
-{%- elif cookiecutter.use_pgvector %}
-    from app.rag.vectorstore import PgVectorStore as VectorStore
-{%- endif %}
+    from app.rag.cancellation import CancellationToken
+    from app.rag.sync_manifest import LocalSyncManifest, hash_file
+    from app.rag.write_buffer import BoundedTaskGroup
 
-    rag_settings = settings.rag
-    embed_service = EmbeddingService(settings=rag_settings)
-    vector_store = VectorStore(settings=rag_settings, embedding_service=embed_service)
-    processor = DocumentProcessor(settings=rag_settings)
-    ingestion_service = IngestionService(processor=processor, vector_store=vector_store)
+    ingestion_service = _get_ingestion_service()
 
     target_path = Path(path).resolve()
     if not target_path.exists():
@@ -245,37 +371,16 @@ async def _run_sync(sync_log_id: str, source: str, collection_name: str, mode: s
     files = [f for f in files if f.suffix.lower() in allowed]
     ingested = updated = skipped = failed = 0
 
-    for filepath in files:
-        # Check if sync was cancelled
-        async with get_worker_db_context() as db:
-            sync_log_check = await RAGSyncService(db).get_sync_log(sync_log_id)
-            if sync_log_check.status == "cancelled":
-                logger.info(f"Sync {sync_log_id} cancelled by user")
-                return {"status": "cancelled", "ingested": ingested, "updated": updated, "skipped": skipped, "failed": failed}
-
-        source_path = str(filepath.resolve())
-        if mode in ("new_only", "update_only"):
-            existing_id = await ingestion_service.find_existing(collection_name, source_path)
-
-            if mode == "new_only":
-                if existing_id:
-                    # File exists — check if content changed via hash
-                    file_hash = hashlib.sha256(filepath.read_bytes()).hexdigest()
-                    existing_hash = await ingestion_service.get_existing_hash(collection_name, source_path)
-                    if existing_hash and file_hash == existing_hash:
-                        skipped += 1
-                        continue
-                    # Hash changed — will re-ingest below
+    manifest = LocalSyncManifest.load(collection_name, target_path)
+    # Vector store lookups only for files the manifest doesn't know yet (e.g. first run)
+    source_index = None
+    seen: set[str] = set()
+    cancel_token = CancellationToken(sync_log_id)
+    backpressure = InteractiveBackpressure()
+    cancelled = False
 
-            elif mode == "update_only":
-                if not existing_id:
-                    skipped += 1
-                    continue
-                file_hash = hashlib.sha256(filepath.read_bytes()).hexdigest()
-                existing_hash = await ingestion_service.get_existing_hash(collection_name, source_path)
-                if existing_hash and file_hash == existing_hash:
-                    skipped += 1
-                    continue
+    async def _ingest(filepath: Path, source_path: str, st: os.stat_result, file_hash: str) -> None:
+        nonlocal ingested, updated, failed
         try:
             result = await ingestion_service.ingest_file(filepath=filepath, collection_name=collection_name, replace=True)
             if result.status.value == "done":
@@ -283,15 +388,20 @@ async def _run_sync(sync_log_id: str, source: str, collection_name: str, mode: s
                     updated += 1
                 else:
                     ingested += 1
+                manifest.record(source_path, st, file_hash, result.document_id)
                 async with get_worker_db_context() as db:
-                    doc = await RAGDocumentService(db).create_document(
-                        collection_name=collection_name,
-                        filename=filepath.name,
-                        filesize=filepath.stat().st_size,
-                        filetype=filepath.suffix.lstrip(".").lower(),
-                    )
-                    await RAGDocumentService(db).complete_ingestion(
-                        str(doc.id), vector_document_id=result.document_id
+                    doc_svc = RAGDocumentService(db)
+                    # A changed file is re-ingested under its document ID: it keeps its record
+                    doc = await doc_svc.find_by_vector_document_id(collection_name, result.document_id)
+                    if doc is None:
+                        doc = await doc_svc.create_document(
+                            collection_name=collection_name,
+                            filename=filepath.name,
+                            filesize=st.st_size,
+                            filetype=filepath.suffix.lstrip(".").lower(),
+                        )
+                    await doc_svc.complete_ingestion(
+                        str(doc.id), vector_document_id=result.document_id, filesize=st.st_size
                     )
             else:
                 failed += 1
@@ -299,6 +409,65 @@ async def _run_sync(sync_log_id: str, source: str, collection_name: str, mode: s
             logger.warning(f"Sync file error {filepath.name}: {e}")
             failed += 1
 
+    try:
+        # Files are checked one by one; changed ones are ingested several at a time
+        async with (
+            ingestion_service.write_buffer(collection_name),
+            BoundedTaskGroup(settings.RAG_BULK_INGEST_CONCURRENCY) as tasks,
+        ):
+            for filepath in files:
+                if await cancel_token.is_cancelled():
+                    cancelled = True
+                    break
+
+                source_path = str(filepath.resolve())
+                seen.add(source_path)
+                try:
+                    st = filepath.stat()
+                except OSError as e:
+                    logger.warning(f"Sync file error {filepath.name}: {e}")
+                    failed += 1
+                    continue
+                entry = manifest.get(source_path)
+
+                # Stat unchanged since the last sync — nothing to hash or look up
+                if entry is not None and entry.matches(st) and mode != "full":
+                    skipped += 1
+                    continue
+
+                file_hash = await asyncio.to_thread(hash_file, filepath)
+                if entry is not None:
+                    existing_id, existing_hash = entry.document_id, entry.content_hash
+                else:
+                    if source_index is None:
+                        source_index = await ingestion_service.get_source_index(collection_name)
+                    existing_id, existing_hash = source_index.get(source_path, (None, None))
+
+                if mode == "update_only" and not existing_id:
+                    skipped += 1
+                    continue
+                if mode != "full" and existing_id and existing_hash == file_hash:
+                    # Touched but not modified — refresh the stat so it isn't rehashed next time
+                    manifest.record(source_path, st, file_hash, existing_id)
+                    skipped += 1
+                    continue
+
+                # Only files that are actually ingested compete with interactive jobs
+                await backpressure.pause()
+                await tasks.submit(_ingest(filepath, source_path, st, file_hash))
+
+        if cancelled:
+            return {"status": "cancelled", "ingested": ingested, "updated": updated, "skipped": skipped, "failed": failed}
+
+        # Files gone from disk: a full sync mirrors the folder, other modes only forget them
+        if target_path.is_dir():
+            for source_path in manifest.missing(seen):
+                removed = manifest.remove(source_path)
+                if mode == "full" and removed and removed.document_id:
+                    await ingestion_service.remove_document(collection_name, removed.document_id)
+    finally:
+        manifest.save()
+
     async with get_worker_db_context() as db:
         await RAGSyncService(db).complete_sync(
             sync_log_id,
@@ -315,6 +484,124 @@ async def _run_sync(sync_log_id: str, source: str, collection_name: str, mode: s
 
 
 
+async def _run_reembed(sync_log_id: str, collection_name: str, model: str, dim: int | None) -> dict[str, Any]:
+    """Re-embed a collection (see app.rag.reembed), tracking progress in its SyncLog.
+
+    The SyncLog counts chunks: total_files is the collection's size, ingested
+    the chunks embedded with the new model so far.
+    """
+    from app.db.session import get_worker_db_context
+    from app.services.rag_sync import RAGSyncService
+    from app.rag.cancellation import CancellationToken
+    from app.rag.reembed import ReembedCancelled, ReembedProgress, build_reembedder
+
+    async def _progress(progress: ReembedProgress) -> None:
+        async with get_worker_db_context() as db:
+            await RAGSyncService(db).update_progress(
+                sync_log_id, total_files=progress.total, ingested=progress.embedded
+            )
+
+    reembedder = build_reembedder(
+        collection_name,
+        model,
+        dim,
+        is_cancelled=CancellationToken(sync_log_id).is_cancelled,
+        pause=InteractiveBackpressure().pause,
+        on_progress=_progress,
+    )
+    try:
+        progress = await reembedder.run()
+    except ReembedCancelled:
+        # The SyncLog is already marked cancelled; the shadow collection is gone
+        logger.info(f"Re-embed cancelled: {collection_name}")
+        return {"status": "cancelled"}
+    except Exception as exc:
+        logger.error(f"Re-embed of {collection_name} failed: {exc}")
+        await _update_sync_log(sync_log_id, "error", error_message=str(exc))
+        raise
+
+    async with get_worker_db_context() as db:
+        await RAGSyncService(db).complete_sync(
+            sync_log_id, status="done", total_files=progress.total, ingested=progress.embedded,
+        )
+    return {"status": "done", "total": progress.total, "embedded": progress.embedded, "rounds": progress.rounds}
+
+
+async def _run_snapshot_import(
+    sync_log_id: str, collection_name: str, filepath: str, storage_path: str, restart: bool
+) -> dict[str, Any]:
+    """Import a snapshot (see app.rag.snapshot), tracking progress in its SyncLog.
+
+    The SyncLog counts chunks. The uploaded snapshot is deleted afterwards
+    either way; its import checkpoint stays, so uploading it again resumes.
+    """
+    from app.db.session import get_worker_db_context
+    from app.services.file_storage import get_file_storage
+    from app.services.rag_sync import RAGSyncService
+    from app.rag.cancellation import CancellationToken
+    from app.rag.snapshot import SnapshotImport, SnapshotImportCancelled, import_snapshot
+
+    async def _progress(result: SnapshotImport) -> None:
+        async with get_worker_db_context() as db:
+            await RAGSyncService(db).update_progress(
+                sync_log_id, total_files=result.manifest.chunk_count, ingested=result.chunks
+            )
+
+    try:
+        result = await import_snapshot(
+            _get_ingestion_service().store,
+            Path(filepath),
+            collection_name,
+            restart=restart,
+            is_cancelled=CancellationToken(sync_log_id).is_cancelled,
+            on_progress=_progress,
+        )
+    except SnapshotImportCancelled:
+        logger.info(f"Snapshot import cancelled: {collection_name}")
+        return {"status": "cancelled"}
+    except Exception as exc:
+        logger.error(f"Snapshot import into {collection_name} failed: {exc}")
+        await _update_sync_log(sync_log_id, "error", error_message=str(exc))
+        raise
+    finally:
+        await get_file_storage().delete(storage_path)
+
+    async with get_worker_db_context() as db:
+        await RAGSyncService(db).complete_sync(
+            sync_log_id, status="done", total_files=result.manifest.chunk_count, ingested=result.chunks,
+        )
+    return {"status": "done", "chunks": result.chunks, "resumed_at_part": result.resumed_at_part}
+
+
+async def _run_summary_index_build(sync_log_id: str, collection_name: str) -> dict[str, Any]:
+    """Build a collection's summary index (see app.rag.summary_index), tracking progress in its SyncLog.
+
+    The SyncLog counts documents.
+    """
+    from app.db.session import get_worker_db_context
+    from app.services.rag_sync import RAGSyncService
+    from app.rag.summary_index import DocumentSummaryIndex
+
+    async def _progress(done: int, total: int) -> None:
+        async with get_worker_db_context() as db:
+            await RAGSyncService(db).update_progress(sync_log_id, total_files=total, ingested=done)
+
+    try:
+        documents = await DocumentSummaryIndex(_get_ingestion_service().store).build(
+            collection_name, on_progress=_progress
+        )
+    except Exception as exc:
+        logger.error(f"Summary index build for {collection_name} failed: {exc}")
+        await _update_sync_log(sync_log_id, "error", error_message=str(exc))
+        raise
+
+    async with get_worker_db_context() as db:
+        await RAGSyncService(db).complete_sync(
+            sync_log_id, status="done", total_files=documents, ingested=documents,
+        )
+    return {"status": "done", "documents": documents}
+
+
 async def _update_status(rag_document_id: str, status: str, error_message: str | None = None) -> None:
     from app.db.session import get_worker_db_context
     from app.services.rag_document import RAGDocumentService
@@ -355,6 +642,16 @@ async def _update_sync_log(sync_log_id: str, status: str, error_message: str | N
         logger.warning(f"Failed to update SyncLog: {e}")
 
 
+async def _save_source_checkpoints(source_id: str, checkpoints: dict[str, str]) -> None:
+    from app.db.session import get_worker_db_context
+    from app.services.sync_source import SyncSourceService
+    try:
+        async with get_worker_db_context() as db:
+            await SyncSourceService(db).save_checkpoints(source_id, checkpoints)
+    except Exception as e:
+        logger.warning(f"Failed to save checkpoints for source {source_id}: {e}")
+
+
 async def _run_source_sync(source_id: str, sync_log_id: str | None = None) -> dict[str, Any]:
     """Core sync logic for connector-based sources (shared between all task frameworks).
 
@@ -365,19 +662,9 @@ async def _run_source_sync(source_id: str, sync_log_id: str | None = None) -> di
     from app.db.session import get_worker_db_context
     from app.services.sync_source import SyncSourceService
     from app.services.rag_sync import RAGSyncService
+    from app.rag.cancellation import CancellationToken
     from app.rag.connectors import CONNECTOR_REGISTRY
-    from app.rag.documents import DocumentProcessor
-    from app.rag.embeddings import EmbeddingService
-    from app.rag.ingestion import IngestionService
-{%- if cookiecutter.use_milvus %}
-    from app.rag.vectorstore import MilvusVectorStore as VectorStore
-{%- elif cookiecutter.use_qdrant %}
-    from app.rag.vectorstore import QdrantVectorStore as VectorStore
-{%- elif cookiecutter.use_chromadb %}
-    from app.rag.vectorstore import ChromaVectorStore as VectorStore
-{%- elif cookiecutter.use_pgvector %}
-    from app.rag.vectorstore import PgVectorStore as VectorStore
-{%- endif %}
+    from app.rag.write_buffer import BoundedTaskGroup
 
     async with get_worker_db_context() as db:
         source_svc = SyncSourceService(db)
@@ -393,6 +680,7 @@ async def _run_source_sync(source_id: str, sync_log_id: str | None = None) -> di
         config = source.config if isinstance(source.config, dict) else json.loads(source.config)
         collection_name = source.collection_name
         sync_mode = source.sync_mode
+        checkpoints = source_svc.get_checkpoints(source)
 
         # Use existing SyncLog (from API trigger) or create new one (from scheduler)
         if sync_log_id:
@@ -402,36 +690,94 @@ async def _run_source_sync(source_id: str, sync_log_id: str | None = None) -> di
             log_id = str(log.id)
 
     connector = connector_cls()
-    rag_settings = settings.rag
-    embed_service = EmbeddingService(settings=rag_settings)
-    vector_store = VectorStore(settings=rag_settings, embedding_service=embed_service)
-    processor = DocumentProcessor(settings=rag_settings)
-    ingestion_svc = IngestionService(processor=processor, vector_store=vector_store)
+    ingestion_svc = _get_ingestion_service()
 
     ingested = skipped = failed = total = 0
+    # Rebuilt from the listing, so files deleted at the source drop out
+    new_checkpoints: dict[str, str] | None = None
+    cancel_token = CancellationToken(log_id)
+    backpressure = InteractiveBackpressure()
+    cancelled = False
 
     try:
         files = await connector.list_files(config)
         total = len(files)
+        new_checkpoints = {}
+
+        to_download = []
+        for remote_file in files:
+            fingerprint = remote_file.fingerprint
+            if sync_mode != "full" and fingerprint and checkpoints.get(remote_file.source_path) == fingerprint:
+                # Unchanged since the last sync — skip before downloading
+                new_checkpoints[remote_file.source_path] = fingerprint
+                skipped += 1
+            else:
+                to_download.append(remote_file)
+
+        async def _ingest(
+            remote_file: Any, local_path: Path, previous: str | None, fetched: dict[str, str]
+        ) -> None:
+            nonlocal ingested, failed
+            fingerprint = remote_file.fingerprint
+            try:
+                result = await ingestion_svc.ingest_file(
+                    filepath=local_path,
+                    collection_name=collection_name,
+                    replace=(sync_mode == "full" or previous is not None),
+                    source_path=remote_file.source_path,
+                )
+                if result.status.value != "done":
+                    raise RuntimeError(result.error_message or result.message)
+                ingested += 1
+                if fingerprint:
+                    fetched[remote_file.source_path] = fingerprint
+            except Exception as e:
+                logger.warning(f"Failed to sync {remote_file.name}: {e}")
+                failed += 1
+            finally:
+                local_path.unlink(missing_ok=True)
 
         with tempfile.TemporaryDirectory() as tmp_dir:
-            for remote_file in files:
-                try:
-                    local_path = await connector.download_file(remote_file, Path(tmp_dir))
-                    await ingestion_svc.ingest_file(
-                        filepath=local_path,
-                        collection_name=collection_name,
-                        replace=(sync_mode == "full"),
-                        source_path=remote_file.source_path,
-                    )
-                    ingested += 1
-                except Exception as e:
-                    logger.warning(f"Failed to sync {remote_file.name}: {e}")
-                    failed += 1
+            # Downloads run ahead (bounded) while fetched files are being ingested,
+            # several at a time so their chunks share buffered writes
+            downloads = connector.download_files(
+                to_download, Path(tmp_dir), concurrency=settings.RAG_SYNC_DOWNLOAD_CONCURRENCY
+            )
+            async with (
+                aclosing(downloads),
+                ingestion_svc.write_buffer(collection_name),
+                BoundedTaskGroup(settings.RAG_BULK_INGEST_CONCURRENCY) as tasks,
+            ):
+                async for remote_file, local_path, error in downloads:
+                    if await cancel_token.is_cancelled():
+                        cancelled = True
+                        if local_path is not None:
+                            local_path.unlink(missing_ok=True)
+                        break
+                    if local_path is None:
+                        logger.warning(f"Failed to download {remote_file.name}: {error}")
+                        failed += 1
+                        continue
+                    previous = checkpoints.get(remote_file.source_path)
+                    # Falls back to the hash computed while downloading
+                    fingerprint = remote_file.fingerprint
+                    if sync_mode != "full" and fingerprint and previous == fingerprint:
+                        new_checkpoints[remote_file.source_path] = fingerprint
+                        skipped += 1
+                        local_path.unlink(missing_ok=True)
+                        continue
+                    await backpressure.pause()
+                    await tasks.submit(_ingest(remote_file, local_path, previous, new_checkpoints))
     except Exception as e:
         logger.error(f"Source sync failed for {source_id}: {e}")
         failed = max(failed, 1)
 
+    if cancelled:
+        # The SyncLog is already marked cancelled; keep checkpoints of files not reached
+        await _save_source_checkpoints(source_id, {**checkpoints, **(new_checkpoints or {})})
+        logger.info(f"Source sync cancelled: {source_id} — ingested={ingested}, skipped={skipped}")
+        return {"status": "cancelled", "total": total, "ingested": ingested, "skipped": skipped, "failed": failed}
+
     async with get_worker_db_context() as db:
         sync_svc = RAGSyncService(db)
         source_svc = SyncSourceService(db)
@@ -449,6 +795,9 @@ async def _run_source_sync(source_id: str, sync_log_id: str | None = None) -> di
                 status="done" if not failed else "error",
                 error=f"{failed} files failed" if failed else None,
             )
+            # Failed files carry no checkpoint, so the next run retries them
+            if new_checkpoints is not None:
+                await source_svc.save_checkpoints(source_id, new_checkpoints)
         except Exception:
             logger.error(f"Failed to update sync status for source {source_id}")
 
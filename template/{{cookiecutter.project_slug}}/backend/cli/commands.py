@@ -140,13 +140,24 @@ def celery_cli():
 @celery_cli.command("worker")
 @click.option("--loglevel", default="info", help="Log level (debug, info, warning, error)")
 @click.option("--concurrency", default=4, type=int, help="Number of concurrent workers")
+{%- if cookiecutter.enable_rag %}
+@click.option(
+    "--queues", "-Q", default="celery,interactive,scheduled",
+    help="Queues to consume; run a second worker with -Q bulk for RAG syncs",
+)
+def celery_worker(loglevel: str, concurrency: int, queues: str):
+{%- else %}
 def celery_worker(loglevel: str, concurrency: int):
+{%- endif %}
     """Start Celery worker."""
     import subprocess
     subprocess.run([
         "celery", "-A", "app.worker.celery_app", "worker",
         f"--loglevel={loglevel}",
         f"--concurrency={concurrency}",
+{%- if cookiecutter.enable_rag %}
+        f"--queues={queues}",
+{%- endif %}
     ])
 
 
@@ -185,6 +196,22 @@ def taskiq_cli():
 @taskiq_cli.command("worker")
 @click.option("--workers", default=2, type=int, help="Number of workers")
 @click.option("--reload", is_flag=True, help="Enable auto-reload for development")
+{%- if cookiecutter.enable_rag %}
+@click.option("--bulk", is_flag=True, help="Consume the bulk queue (RAG syncs) instead of the default one")
+def taskiq_worker(workers: int, reload: bool, bulk: bool):
+    """Start Taskiq worker."""
+    import subprocess
+    if bulk:
+        cmd = [
+            "taskiq", "worker", "app.worker.taskiq_app:bulk_broker", "app.worker.tasks.rag_tasks",
+            f"--workers={workers}",
+        ]
+    else:
+        cmd = [
+            "taskiq", "worker", "app.worker.taskiq_app:broker",
+            f"--workers={workers}",
+        ]
+{%- else %}
 def taskiq_worker(workers: int, reload: bool):
     """Start Taskiq worker."""
     import subprocess
@@ -192,6 +219,7 @@ def taskiq_worker(workers: int, reload: bool):
         "taskiq", "worker", "app.worker.taskiq_app:broker",
         f"--workers={workers}",
     ]
+{%- endif %}
     if reload:
         cmd.append("--reload")
     subprocess.run(cmd)
@@ -10,7 +10,9 @@ from app.agents.prompts import DEFAULT_SYSTEM_PROMPT
 {%- if cookiecutter.enable_rag %}
 from app.agents.prompts import get_system_prompt_with_rag
 {%- endif %}
+from app.agents.registry import AgentRegistry, invalidate_agents
 from app.agents.tools.datetime_tool import get_current_datetime
+from app.core.config import settings
 
 
 class TestDeps:
@@ -96,6 +98,37 @@ class TestGetAgent:
         agent = get_agent()
         assert isinstance(agent, AssistantAgent)
 
+    def test_reuses_agent_per_model_and_prompt(self):
+        """Test get_agent returns the cached agent for the same model and prompt."""
+        invalidate_agents()
+        agent = get_agent(model_name="gpt-4")
+        assert get_agent(model_name="gpt-4") is agent
+        assert get_agent(model_name="gpt-4o") is not agent
+        assert get_agent(model_name="gpt-4", system_prompt="Custom prompt") is not agent
+
+    def test_rebuilds_agent_on_settings_change(self, monkeypatch):
+        """Test changing AI settings drops cached agents."""
+        invalidate_agents()
+        agent = get_agent()
+        monkeypatch.setattr(settings, "AI_TEMPERATURE", settings.AI_TEMPERATURE / 2)
+        assert get_agent() is not agent
+
+    def test_invalidate_agents(self):
+        """Test invalidate_agents drops cached agents."""
+        agent = get_agent()
+        invalidate_agents()
+        assert get_agent() is not agent
+
+    def test_registry_evicts_least_recently_used(self):
+        """Test the registry is bounded."""
+        registry = AgentRegistry(max_size=2)
+        first = registry.get("pydantic_ai", "a", None, object)
+        registry.get("pydantic_ai", "b", None, object)
+        registry.get("pydantic_ai", "a", None, object)
+        registry.get("pydantic_ai", "c", None, object)
+        assert len(registry) == 2
+        assert registry.get("pydantic_ai", "a", None, object) is first
+
 
 class TestAgentRoutes:
     """Tests for agent WebSocket routes."""
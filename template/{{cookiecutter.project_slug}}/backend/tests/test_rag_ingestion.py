@@ -0,0 +1,572 @@
+{%- if cookiecutter.enable_rag %}
+"""Tests for ingestion against an in-memory vector store.
+
+Covers chunk IDs, re-ingestion and deletion, buffered writes, rollback of
+failed streaming ingestions, tenant scoping and re-embedding.
+"""
+
+import asyncio
+import math
+import re
+from collections.abc import AsyncIterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.rag.config import EmbeddingsConfig
+from app.rag.documents import TextDocumentParser
+from app.rag.ingestion import IngestionService
+from app.rag.reembed import CollectionReembedder
+from app.rag.models import (
+    CollectionInfo,
+    Document,
+    DocumentInfo,
+    DocumentMetadata,
+    DocumentPage,
+    DocumentPageChunk,
+    SearchResult,
+    StoredChunk,
+    make_chunk_id,
+)
+from app.rag.tenancy import SHARED_TENANT
+from app.rag.vectorstore import BaseVectorStore
+
+
+class _Embedder:
+    """Deterministic two-dimensional vectors, from the text's length and vowel count."""
+
+    def __init__(self):
+        self.embedded: list[str] = []  # Every chunk embedded, in order
+
+    @staticmethod
+    def _vector(text: str) -> list[float]:
+        return [float(len(text)) + 1.0, float(sum(text.count(v) for v in "aeiou")) + 1.0]
+
+    def embed_query(self, query: str) -> list[float]:
+        return self._vector(query)
+
+    def embed_documents(self, documents: list[Document]) -> list[list[float]]:
+        texts = [chunk.chunk_content for document in documents for chunk in document.chunked_pages or []]
+        self.embedded.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_passages(self, texts: list[str]) -> list[list[float]]:
+        return [self._vector(text) for text in texts]
+
+
+class InMemoryVectorStore(BaseVectorStore):
+    """A vector store holding collections in dicts, to test what is built on BaseVectorStore."""
+
+    def __init__(self, config: EmbeddingsConfig | None = None):
+        self.settings = SimpleNamespace(
+            embeddings_config=config or EmbeddingsConfig(), vector_storage="full"
+        )
+        self.embedder = _Embedder()
+        self._served = {}
+        self.collections: dict[str, dict[str, StoredChunk]] = {}
+        self.catalogs: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def chunks(self, collection_name: str) -> list[StoredChunk]:
+        return list(self.collections.get(collection_name, {}).values())
+
+    async def _ensure_collection(self, name: str, dim: int | None = None) -> None:
+        self.collections.setdefault(name, {})
+
+    async def upsert_chunks(
+        self, collection_name: str, chunks: list[StoredChunk], vectors: list[list[float]]
+    ) -> None:
+        collection = self.collections[collection_name]
+        for chunk, vector in zip(chunks, vectors, strict=True):
+            collection[chunk.chunk_id] = StoredChunk(
+                chunk.chunk_id,
+                chunk.parent_doc_id,
+                chunk.content,
+                self._tagged_metadata(chunk),
+                vector,
+            )
+
+    async def scroll_chunks(
+        self, collection_name: str, batch_size: int = 256, with_vectors: bool = False
+    ) -> AsyncIterator[list[StoredChunk]]:
+        chunks = sorted(self.chunks(collection_name), key=lambda c: c.chunk_id)
+        for i in range(0, len(chunks), batch_size):
+            yield [
+                StoredChunk(
+                    c.chunk_id,
+                    c.parent_doc_id,
+                    c.content,
+                    dict(c.metadata),
+                    c.vector if with_vectors else None,
+                )
+                for c in chunks[i : i + batch_size]
+            ]
+
+    async def swap_collection(self, collection_name: str, shadow_name: str) -> None:
+        self.collections[collection_name] = self.collections.pop(shadow_name)
+        await self._move_embedding(shadow_name, collection_name)
+
+    async def search_vector(
+        self,
+        collection_name: str,
+        vector: list[float],
+        limit: int = 4,
+        filter: str = "",
+        document_ids: list[str] | None = None,
+        tenants: list[str] | None = None,
+    ) -> list[SearchResult]:
+        scoped = self._scoped_tenants(tenants)
+        hits = []
+        for chunk in self.chunks(collection_name):
+            if document_ids is not None and chunk.parent_doc_id not in document_ids:
+                continue
+            if scoped is not None and self._chunk_tenant(chunk) not in scoped:
+                continue
+            stored = chunk.vector or []
+            norm = (
+                math.sqrt(sum(x * x for x in vector)) * math.sqrt(sum(x * x for x in stored)) or 1.0
+            )
+            score = sum(a * b for a, b in zip(vector, stored)) / norm
+            hits.append(
+                SearchResult(
+                    chunk.content, score, dict(chunk.metadata), chunk.parent_doc_id, chunk.chunk_id
+                )
+            )
+        hits.sort(key=lambda r: r.score, reverse=True)
+        return hits[:limit]
+
+    async def delete_collection(self, collection_name: str) -> None:
+        self.collections.pop(collection_name, None)
+        self.catalogs.pop(collection_name, None)
+        await self._forget_embedding(collection_name)
+
+    async def delete_document(self, collection_name: str, document_id: str) -> None:
+        collection = self.collections.get(collection_name, {})
+        for chunk_id in [c.chunk_id for c in collection.values() if c.parent_doc_id == document_id]:
+            del collection[chunk_id]
+        await self.delete_document_records(collection_name, [document_id])
+
+    async def get_chunk_ids(self, collection_name: str, document_id: str) -> set[str]:
+        return {c.chunk_id for c in self.chunks(collection_name) if c.parent_doc_id == document_id}
+
+    async def get_document_vectors(
+        self, collection_name: str, document_id: str
+    ) -> list[list[float]]:
+        return [
+            c.vector or [] for c in self.chunks(collection_name) if c.parent_doc_id == document_id
+        ]
+
+    async def delete_chunks(self, collection_name: str, chunk_ids: list[str]) -> None:
+        for chunk_id in chunk_ids:
+            self.collections.get(collection_name, {}).pop(chunk_id, None)
+
+    async def _set_chunk_metadata(self, collection_name: str, chunks: list[StoredChunk]) -> None:
+        collection = self.collections[collection_name]
+        for chunk in chunks:
+            if chunk.chunk_id in collection:
+                collection[chunk.chunk_id].metadata = self._tagged_metadata(chunk)
+
+    async def upsert_document_records(
+        self, collection_name: str, records: dict[str, dict[str, Any]]
+    ) -> None:
+        self.catalogs.setdefault(collection_name, {}).update(records)
+
+    async def get_document_records(
+        self, collection_name: str, document_ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        catalog = self.catalogs.get(collection_name, {})
+        if document_ids is None:
+            return dict(catalog)
+        return {doc_id: catalog[doc_id] for doc_id in document_ids if doc_id in catalog}
+
+    async def delete_document_records(self, collection_name: str, document_ids: list[str]) -> None:
+        for doc_id in document_ids:
+            self.catalogs.get(collection_name, {}).pop(doc_id, None)
+
+    async def get_collection_info(self, collection_name: str) -> CollectionInfo:
+        dim = (await self.embedding_config(collection_name)).dim
+        return CollectionInfo(
+            name=collection_name, total_vectors=len(self.chunks(collection_name)), dim=dim
+        )
+
+    async def list_collections(self) -> list[str]:
+        return self._visible_collections(list(self.collections))
+
+    async def collection_exists(self, name: str) -> bool:
+        return name in self.collections
+
+    async def get_documents(self, collection_name: str) -> list[DocumentInfo]:
+        results = [
+            {"parent_doc_id": c.parent_doc_id, "metadata": c.metadata}
+            for c in self.chunks(collection_name)
+        ]
+        return self._group_documents(results, await self.get_document_records(collection_name))
+
+
+class _ParagraphProcessor:
+    """Parses a text file into one page per form feed, and one chunk per paragraph."""
+
+    def _chunks(self, text: str) -> list[DocumentPageChunk]:
+        chunks = []
+        for page_index, page in enumerate(text.split("\f")):
+            for chunk_num, paragraph in enumerate(p for p in page.split("\n\n") if p.strip()):
+                chunks.append(
+                    DocumentPageChunk(paragraph.strip(), page_index, page_index + 1, chunk_num)
+                )
+        return chunks
+
+    async def read_metadata(self, filepath: Path) -> DocumentMetadata:
+        return DocumentMetadata(
+            filename=filepath.name,
+            filesize=filepath.stat().st_size,
+            filetype="txt",
+            source_path=str(filepath),
+        )
+
+    async def process_file(self, filepath: Path) -> Document:
+        text = filepath.read_text()
+        pages = [
+            DocumentPage(page_num=i + 1, content=page) for i, page in enumerate(text.split("\f"))
+        ]
+        document = Document(pages=pages, metadata=await self.read_metadata(filepath))
+        document.chunked_pages = self._chunks(text)
+        for chunk in document.chunked_pages:
+            chunk.parent_doc_id = document.id
+        document.assign_chunk_ids()
+        return document
+
+    async def iter_chunks(
+        self, filepath: Path, window: int
+    ) -> AsyncIterator[list[DocumentPageChunk]]:
+        chunks = self._chunks(filepath.read_text())
+        for i in range(0, len(chunks), window):
+            yield chunks[i : i + window]
+
+
+class _FailingStream(_ParagraphProcessor):
+    """Streams the first window, then fails."""
+
+    async def iter_chunks(
+        self, filepath: Path, window: int
+    ) -> AsyncIterator[list[DocumentPageChunk]]:
+        yield self._chunks(filepath.read_text())[:window]
+        raise RuntimeError("parser crashed")
+
+
+class _RejectingStore(InMemoryVectorStore):
+    """Rejects every write holding a chunk that reads "bad"."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes: list[int] = []  # Chunks per insert_documents() call, failed ones included
+
+    async def insert_documents(self, collection_name: str, documents: list[Document]) -> None:
+        chunks = [chunk for document in documents for chunk in document.chunked_pages or []]
+        self.writes.append(len(chunks))
+        if any(chunk.chunk_content == "bad" for chunk in chunks):
+            raise ValueError("input too long")
+        await super().insert_documents(collection_name, documents)
+
+
+@pytest.fixture
+def store() -> InMemoryVectorStore:
+    return InMemoryVectorStore()
+
+
+@pytest.fixture
+def service(store: InMemoryVectorStore) -> IngestionService:
+    return IngestionService(_ParagraphProcessor(), store)  # type: ignore[arg-type]
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+class TestChunkIds:
+    """Tests for deterministic chunk IDs."""
+
+    def test_stable_for_the_same_document_page_and_content(self):
+        assert make_chunk_id("doc-1", 1, "text") == make_chunk_id("doc-1", 1, "text")
+
+    def test_unique_across_documents_pages_and_repeats(self):
+        ids = {
+            make_chunk_id("doc-1", 1, "text"),
+            make_chunk_id("doc-2", 1, "text"),
+            make_chunk_id("doc-1", 2, "text"),
+            make_chunk_id("doc-1", 1, "text", occurrence=1),
+        }
+        assert len(ids) == 4
+
+    def test_repeated_chunks_of_a_page_keep_their_own_ids(self):
+        chunks = [DocumentPageChunk("same", 0, 1, 0), DocumentPageChunk("same", 0, 1, 1)]
+        metadata = DocumentMetadata(filename="a.txt", filesize=1, filetype="txt")
+        document = Document(pages=[], chunked_pages=chunks, metadata=metadata)
+
+        document.assign_chunk_ids()
+
+        assert chunks[0].chunk_id != chunks[1].chunk_id
+
+
+class TestIngestion:
+    """Tests for ingesting, re-ingesting and removing documents."""
+
+    @pytest.mark.anyio
+    async def test_same_named_uploads_stay_separate_documents(self, tmp_path, store, service):
+        first = write(tmp_path / "one" / "notes.txt", "alpha\n\nbeta")
+        second = write(tmp_path / "two" / "notes.txt", "alpha\n\nbeta")
+
+        a = await service.ingest_file(first, "docs", replace=False, source_path="notes.txt")
+        b = await service.ingest_file(second, "docs", replace=False, source_path="notes.txt")
+
+        assert a.document_id != b.document_id
+        a_ids = await store.get_chunk_ids("docs", a.document_id)
+        b_ids = await store.get_chunk_ids("docs", b.document_id)
+        assert len(a_ids) == len(b_ids) == 2
+        assert not a_ids & b_ids
+
+        assert await service.remove_document("docs", a.document_id)
+
+        assert {c.parent_doc_id for c in store.chunks("docs")} == {b.document_id}
+        assert len(store.chunks("docs")) == 2
+
+    @pytest.mark.anyio
+    async def test_repeated_paragraphs_are_all_stored(self, tmp_path, store, service):
+        result = await service.ingest_file(
+            write(tmp_path / "a.txt", "same\n\nsame\n\nother"), "docs"
+        )
+
+        assert len(await store.get_chunk_ids("docs", result.document_id)) == 3
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_reingest_embeds_new_chunks_and_renumbers_kept_ones(self, tmp_path, store, streaming):
+        service = IngestionService(
+            _ParagraphProcessor(),  # type: ignore[arg-type]
+            store,
+            streaming_min_bytes=0 if streaming else None,
+            streaming_window=1,
+        )
+        path = write(tmp_path / "a.txt", "alpha\n\nbeta")
+        first = await service.ingest_file(path, "docs")
+        store.embedder.embedded.clear()
+
+        second = await service.ingest_file(write(path, "intro\n\nalpha\n\nbeta"), "docs")
+
+        assert second.document_id == first.document_id
+        assert store.embedder.embedded == ["intro"]
+        chunk_nums = {c.content: c.metadata["chunk_num"] for c in store.chunks("docs")}
+        assert chunk_nums == {"intro": 0, "alpha": 1, "beta": 2}
+
+    @pytest.mark.anyio
+    async def test_source_index_only_holds_the_tenants_documents(self, tmp_path, service):
+        shared = await service.ingest_file(write(tmp_path / "a.txt", "alpha"), "docs", source_path="/data/a.txt")
+        await service.ingest_file(
+            write(tmp_path / "b.txt", "beta"), "docs", source_path="/data/b.txt", tenant="user_u1"
+        )
+
+        index = await service.get_source_index("docs")
+
+        assert list(index) == ["/data/a.txt"]
+        assert index["/data/a.txt"][0] == shared.document_id
+        assert list(await service.get_source_index("docs", tenant="user_u1")) == ["/data/b.txt"]
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_reingest_deletes_vanished_chunks_only(self, tmp_path, store, streaming):
+        service = IngestionService(
+            _ParagraphProcessor(),  # type: ignore[arg-type]
+            store,
+            streaming_min_bytes=0 if streaming else None,
+        )
+        path = write(tmp_path / "a.txt", "alpha\n\nbeta\n\ngamma")
+        first = await service.ingest_file(path, "docs")
+        kept = {c.chunk_id for c in store.chunks("docs") if c.content != "beta"}
+        store.embedder.embedded.clear()
+
+        await service.ingest_file(write(path, "alpha\n\ngamma"), "docs")
+
+        assert store.embedder.embedded == []
+        assert await store.get_chunk_ids("docs", first.document_id) == kept
+        assert store.catalogs["docs"][first.document_id]["filesize"] == path.stat().st_size
+
+
+class TestWriteBuffer:
+    """Tests for ingesting several documents through one collection write buffer."""
+
+    @pytest.mark.anyio
+    async def test_documents_are_written_together(self, tmp_path, store):
+        service = IngestionService(
+            _ParagraphProcessor(), store, write_buffer_max_wait_ms=50  # type: ignore[arg-type]
+        )
+        paths = [write(tmp_path / f"{i}.txt", f"text {i}") for i in range(3)]
+
+        async with service.write_buffer("docs") as buffer:
+            results = await asyncio.gather(*(service.ingest_file(path, "docs") for path in paths))
+
+        assert [r.status.value for r in results] == ["done"] * 3
+        assert buffer.batches == 1
+        assert len(store.chunks("docs")) == 3
+
+    @pytest.mark.anyio
+    async def test_failed_batch_is_retried_per_document(self, tmp_path):
+        store = _RejectingStore()
+        service = IngestionService(
+            _ParagraphProcessor(), store, write_buffer_max_wait_ms=50  # type: ignore[arg-type]
+        )
+        texts = {"a.txt": "alpha\n\nbeta", "bad.txt": "bad", "c.txt": "gamma"}
+        paths = [write(tmp_path / name, text) for name, text in texts.items()]
+
+        async with service.write_buffer("docs"):
+            ingestions = asyncio.gather(*(service.ingest_file(path, "docs") for path in paths))
+            # Every writer must get its own outcome, none may be left waiting
+            results = await asyncio.wait_for(ingestions, timeout=5)
+
+        assert [r.status.value for r in results] == ["done", "error", "done"]
+        assert results[1].error_message == "input too long"
+        assert store.writes == [4, 2, 1, 1]
+        assert {c.content for c in store.chunks("docs")} == {"alpha", "beta", "gamma"}
+
+
+class TestStreamingRollback:
+    """Tests for undoing the windows of a streaming ingestion that fails midway."""
+
+    @pytest.mark.anyio
+    async def test_new_document_is_removed(self, tmp_path, store):
+        service = IngestionService(
+            _FailingStream(), store, streaming_min_bytes=0, streaming_window=1  # type: ignore[arg-type]
+        )
+
+        result = await service.ingest_file(write(tmp_path / "a.txt", "alpha\n\nbeta"), "docs")
+
+        assert result.status.value == "error"
+        assert store.chunks("docs") == []
+        assert store.catalogs["docs"] == {}
+
+    @pytest.mark.anyio
+    async def test_reingested_document_keeps_its_last_version(self, tmp_path, store, service):
+        path = write(tmp_path / "a.txt", "alpha\n\nbeta")
+        first = await service.ingest_file(path, "docs")
+        chunks = {c.chunk_id: (c.content, c.metadata) for c in store.chunks("docs")}
+        record = dict(store.catalogs["docs"][first.document_id])
+        failing = IngestionService(
+            _FailingStream(), store, streaming_min_bytes=0, streaming_window=1  # type: ignore[arg-type]
+        )
+
+        result = await failing.ingest_file(write(path, "intro\n\nalpha\n\ngamma"), "docs")
+
+        assert result.status.value == "error"
+        assert {c.chunk_id: (c.content, c.metadata) for c in store.chunks("docs")} == chunks
+        assert store.catalogs["docs"][first.document_id] == record
+
+
+class TestTenantScoping:
+    """Tests for searches scoped to tenants, chunks written before tenancy included."""
+
+    @pytest.mark.anyio
+    async def test_searches_only_see_their_tenants_and_shared_chunks(self, tmp_path, store, service):
+        await service.ingest_file(write(tmp_path / "a.txt", "shared notes"), "docs")
+        await service.ingest_file(write(tmp_path / "b.txt", "user notes"), "docs", tenant="user_u1")
+        await service.ingest_file(write(tmp_path / "c.txt", "other notes"), "docs", tenant="user_u2")
+        # Written before chunks carried a tenant
+        store.collections["docs"]["legacy"] = StoredChunk(
+            "legacy", "doc-legacy", "legacy notes", {"page_num": 1}, [13.0, 5.0]
+        )
+
+        async def found(tenants):
+            return {r.content for r in await store.search("docs", "notes", limit=10, tenants=tenants)}
+
+        assert await found([SHARED_TENANT, "user_u1"]) == {"shared notes", "user notes", "legacy notes"}
+        assert await found([SHARED_TENANT]) == {"shared notes", "legacy notes"}
+        assert await found(["user_u2"]) == {"other notes"}
+        assert len(await found(None)) == 4
+
+
+class TestReembed:
+    """Tests for re-embedding a collection in a shadow collection and swapping it in."""
+
+    @pytest.mark.anyio
+    async def test_shadow_is_caught_up_and_swapped_in(self, tmp_path, store, service):
+        await service.ingest_file(write(tmp_path / "a.txt", "alpha\n\nbeta"), "docs")
+        await store.create_collection("docs")
+        large = EmbeddingsConfig(model="text-embedding-3-large")
+        target = InMemoryVectorStore(large)
+        # Another store instance on the same backend, with the new model
+        target.collections, target.catalogs = store.collections, store.catalogs
+        late = [write(tmp_path / "late.txt", "gamma")]
+
+        async def pause():
+            # A write to the live collection while the shadow is filled
+            if late:
+                await service.ingest_file(late.pop(), "docs")
+
+        progress = await CollectionReembedder(store, target, "docs", batch_size=1, pause=pause).run()
+
+        assert {c.content for c in store.chunks("docs")} == {"alpha", "beta", "gamma"}
+        assert progress.rounds >= 2
+        assert await store.list_collections() == ["docs"]
+        assert await store.embedding_config("docs") == large
+
+
+class TestTextSegments:
+    """Tests for streaming text files in segments."""
+
+    @pytest.mark.anyio
+    async def test_segments_are_numbered_like_pages(self, tmp_path):
+        parser = TextDocumentParser()
+        parser.SEGMENT_BYTES = 4
+        path = write(tmp_path / "a.txt", "same\nsame\nsame\n")
+
+        pages = [page async for page in parser.iter_pages(path)]
+
+        assert [page.page_num for page in pages] == [1, 2, 3]
+        assert {page.content for page in pages} == {"same\n"}
+
+{%- if cookiecutter.use_milvus %}
+
+
+class _MilvusClient:
+    """Answers queries on parent_doc_id and the primary key cursor, like Milvus: at most 16384 rows each."""
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = sorted(rows, key=lambda row: row["id"])
+        self.queries = 0
+
+    async def query(self, collection_name, filter, output_fields, limit):
+        self.queries += 1
+        after = re.search(r'id > "([^"]*)"', filter).group(1)
+        document = re.search(r'parent_doc_id == "([^"]*)"', filter)
+        rows = [
+            row
+            for row in self.rows
+            if row["id"] > after and (document is None or row["parent_doc_id"] == document.group(1))
+        ]
+        return rows[: min(limit, 16384)]
+
+
+class TestMilvusPaging:
+    """Tests for reading more rows than one Milvus query returns."""
+
+    @pytest.mark.anyio
+    async def test_chunk_ids_of_large_documents_are_all_read(self):
+        from app.rag.vectorstore import MilvusVectorStore
+
+        rows = [{"id": f"c-{i:05d}", "parent_doc_id": "doc-1"} for i in range(20000)]
+        rows.append({"id": "c-other", "parent_doc_id": "doc-2"})
+        store = MilvusVectorStore.__new__(MilvusVectorStore)
+        store.client = _MilvusClient(rows)
+
+        async def _ensure_collection(name, dim=None):
+            pass
+
+        store._ensure_collection = _ensure_collection
+
+        chunk_ids = await store.get_chunk_ids("docs", "doc-1")
+
+        assert len(chunk_ids) == 20000
+        assert "c-other" not in chunk_ids
+        assert store.client.queries > 1
+{%- endif %}
+{%- endif %}
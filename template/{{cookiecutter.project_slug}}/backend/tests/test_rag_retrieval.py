@@ -0,0 +1,395 @@
+{%- if cookiecutter.enable_rag %}
+"""Tests and benchmarks for the retrieval pipeline's fusion, deduplication and hydration."""
+
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+
+from app.rag.config import EmbeddingsConfig
+from app.rag.embeddings import truncate_vector
+from app.rag.models import SearchResult
+from app.rag.retrieval import RetrievalService
+from app.rag.tenancy import (
+    SHARED_TENANT,
+    check_tenant,
+    current_tenant_scope,
+    scoped_to,
+    tenant_key,
+    tenant_partition,
+    tenant_scope,
+)
+from app.rag import vectorstore
+from app.rag.vectorstore import EMBEDDING_REGISTRY, BaseVectorStore, FilterError
+
+
+def make_results(n: int, offset: int = 0, doc: str = "doc-1") -> list[SearchResult]:
+    return [
+        SearchResult(
+            content=f"chunk {i} " * 50,
+            score=1.0 - i / (n + offset),
+            metadata={"chunk_num": i, "filename": "report.pdf"},
+            parent_doc_id=doc,
+        )
+        for i in range(offset, offset + n)
+    ]
+
+
+class TestSearchResult:
+    """Tests for the internal SearchResult type."""
+
+    def test_key_uses_document_and_chunk(self):
+        result = SearchResult(content="text", score=0.5, metadata={"chunk_num": 3}, parent_doc_id="doc-1")
+        assert result.key == "doc-1:3"
+
+    def test_key_prefers_stored_chunk_id(self):
+        kept = SearchResult(content="a", score=0.5, metadata={"chunk_num": 3}, parent_doc_id="doc-1", chunk_id="c-1")
+        added = SearchResult(content="b", score=0.4, metadata={"chunk_num": 3}, parent_doc_id="doc-1", chunk_id="c-2")
+        assert kept.key == "c-1"
+        assert RetrievalService._dedup([kept, added]) == [kept, added]
+
+    def test_key_falls_back_to_content_hash(self):
+        result = SearchResult(content="text", score=0.5)
+        assert result.key == hashlib.md5(b"text").hexdigest()
+
+    def test_rescored_keeps_identity(self):
+        result = SearchResult(content="text", score=0.5, metadata={"chunk_num": 1}, parent_doc_id="doc-1")
+        rescored = result.rescored(0.9)
+        assert rescored.score == 0.9
+        assert rescored.key == result.key
+        assert rescored.metadata is result.metadata
+        assert result.score == 0.5
+
+
+class TestFusionAndDedup:
+    """Tests for reciprocal rank fusion and deduplication."""
+
+    def test_rrf_fuse_merges_overlapping_results(self):
+        vector = make_results(3)
+        bm25 = list(reversed(make_results(3, offset=1)))
+        fused = RetrievalService._rrf_fuse(vector, bm25)
+
+        assert len(fused) == 4
+        assert len({r.key for r in fused}) == 4
+        # Chunks found by both searches outrank those found by one
+        assert {fused[0].key, fused[1].key} == {"doc-1:1", "doc-1:2"}
+        assert fused == sorted(fused, key=lambda r: r.score, reverse=True)
+
+    def test_dedup_keeps_first_occurrence(self):
+        results = make_results(3) + make_results(3)
+        deduped = RetrievalService._dedup(results)
+
+        assert [r.key for r in deduped] == ["doc-1:0", "doc-1:1", "doc-1:2"]
+        assert all(a is b for a, b in zip(deduped, results))
+
+    @pytest.mark.benchmark(group="retrieval")
+    def test_benchmark_rrf_fuse(self, benchmark):
+        vector = make_results(100)
+        bm25 = list(reversed(make_results(100, offset=50)))
+        fused = benchmark(RetrievalService._rrf_fuse, vector, bm25)
+        assert len(fused) == 150
+
+    @pytest.mark.benchmark(group="retrieval")
+    def test_benchmark_dedup(self, benchmark):
+        results = make_results(100) + make_results(100, doc="doc-2") + make_results(100)
+        deduped = benchmark(RetrievalService._dedup, results)
+        assert len(deduped) == 200
+
+
+class TestCompactVectors:
+    """Tests for re-scoring quantized candidates and Matryoshka truncation."""
+
+    def test_rescore_ranks_by_full_vectors(self):
+        candidates = [
+            (SearchResult(content="far", score=0.99, parent_doc_id="doc-1"), [0.0, 1.0]),
+            (SearchResult(content="near", score=0.10, parent_doc_id="doc-1"), [1.0, 0.1]),
+            (SearchResult(content="exact", score=0.50, parent_doc_id="doc-1"), [2.0, 0.0]),
+        ]
+        rescored = BaseVectorStore._rescore([1.0, 0.0], candidates, limit=2)
+
+        assert [r.content for r in rescored] == ["exact", "near"]
+        assert rescored[0].score == pytest.approx(1.0)
+
+    def test_truncate_vector_renormalizes(self):
+        vector = truncate_vector([3.0, 4.0, 12.0], 2)
+        assert vector == pytest.approx([0.6, 0.8])
+
+    def test_truncate_dim_sets_dimension(self):
+        config = EmbeddingsConfig(model="text-embedding-3-large", truncate_dim=256)
+        assert config.dim == 256
+
+    def test_truncate_dim_requires_matryoshka_model(self):
+        with pytest.raises(ValueError, match="Matryoshka"):
+            EmbeddingsConfig(model="all-MiniLM-L6-v2", truncate_dim=128)
+
+
+class _CatalogStore:
+    """Just the catalog lookup of a vector store, counting its calls."""
+
+    hydrate = BaseVectorStore.hydrate
+    resolve_document_filter = BaseVectorStore.resolve_document_filter
+    _find_documents = BaseVectorStore._find_documents
+
+    def __init__(self, records: dict[str, dict]):
+        self.records = records
+        self.lookups: list[list[str]] = []
+
+    async def get_document_records(self, collection_name, document_ids=None):
+        self.lookups.append(document_ids)
+        if document_ids is None:
+            return dict(self.records)
+        return {doc_id: self.records[doc_id] for doc_id in document_ids if doc_id in self.records}
+
+
+class TestHydration:
+    """Tests for adding document-level metadata back to slim chunk hits."""
+
+    @pytest.mark.anyio
+    async def test_hydrate_merges_records_in_one_lookup(self):
+        store = _CatalogStore({"doc-1": {"filename": "a.pdf"}, "doc-2": {"filename": "b.pdf"}})
+        results = make_results(2, doc="doc-1") + make_results(2, doc="doc-2")
+
+        hydrated = await store.hydrate("docs", results)
+
+        assert store.lookups == [["doc-1", "doc-2"]]
+        assert [r.metadata["filename"] for r in hydrated] == ["a.pdf", "a.pdf", "b.pdf", "b.pdf"]
+        assert [r.key for r in hydrated] == [r.key for r in results]
+
+    @pytest.mark.anyio
+    async def test_hydrate_keeps_legacy_chunk_metadata(self):
+        store = _CatalogStore({})
+        results = make_results(2)
+
+        hydrated = await store.hydrate("docs", results)
+
+        assert [r.metadata for r in hydrated] == [r.metadata for r in results]
+
+
+class TestDocumentFilters:
+    """Tests for filters on document-level fields, which only the catalog holds."""
+
+    @pytest.fixture
+    def store(self):
+        return _CatalogStore({
+            "doc-1": {"filename": "a.pdf", "filetype": "pdf", "filesize": 10},
+            "doc-2": {"filename": "b.docx", "filetype": "docx", "filesize": 20},
+            "doc-3": {"filename": "c.pdf", "filetype": "pdf", "filesize": 30},
+        })
+
+    @pytest.mark.anyio
+    async def test_document_fields_resolve_to_document_ids(self, store):
+        chunk_filter, document_ids = await store.resolve_document_filter(
+            "docs", 'filetype == "pdf" and filesize > 15 and metadata["page_num"] == 1'
+        )
+        assert document_ids == ["doc-3"]
+        assert chunk_filter == 'metadata["page_num"] == 1'
+
+    @pytest.mark.anyio
+    async def test_chunk_filters_skip_the_catalog(self, store):
+        assert await store.resolve_document_filter("docs", 'parent_doc_id == "filename"') == (
+            'parent_doc_id == "filename"', None,
+        )
+        assert store.lookups == []
+
+    @pytest.mark.anyio
+    async def test_unsupported_document_filters_are_rejected(self, store):
+        with pytest.raises(FilterError):
+            await store.resolve_document_filter("docs", 'filetype == "pdf" or filetype == "docx"')
+        with pytest.raises(FilterError):
+            await store.resolve_document_filter("docs", 'filetype in "pdf"')
+
+
+class _RegistryStore:
+    """The embedding model registry of a vector store, over in-memory catalogs."""
+
+    embedder_for = BaseVectorStore.embedder_for
+    embedding_config = BaseVectorStore.embedding_config
+    _physical = BaseVectorStore._physical
+    _embedding_key = staticmethod(BaseVectorStore._embedding_key)
+    _recorded_embedding = BaseVectorStore._recorded_embedding
+    _record_embedding = BaseVectorStore._record_embedding
+    _forget_embedding = BaseVectorStore._forget_embedding
+    _move_embedding = BaseVectorStore._move_embedding
+
+    def __init__(self, config: EmbeddingsConfig):
+        self.settings = SimpleNamespace(embeddings_config=config)
+        self.embedder = SimpleNamespace(name="store")
+        self.catalogs: dict[str, dict[str, dict]] = {}
+        self._served = {}
+
+    async def get_document_records(self, collection_name, document_ids=None):
+        records = self.catalogs.get(collection_name, {})
+        return {doc_id: records[doc_id] for doc_id in document_ids if doc_id in records}
+
+    async def upsert_document_records(self, collection_name, records):
+        self.catalogs.setdefault(collection_name, {}).update(records)
+
+    async def delete_document_records(self, collection_name, document_ids):
+        for doc_id in document_ids:
+            self.catalogs.get(collection_name, {}).pop(doc_id, None)
+
+
+class TestEmbeddingRegistry:
+    """Tests for picking the embedding model per collection."""
+
+    @pytest.mark.anyio
+    async def test_unrecorded_collection_is_pinned_to_the_store_model(self):
+        config = EmbeddingsConfig(model="text-embedding-3-small")
+        store = _RegistryStore(config)
+
+        assert await store.embedder_for("docs") is store.embedder
+        assert EMBEDDING_REGISTRY not in store.catalogs
+        assert await store.embedder_for("docs", pin=True) is store.embedder
+        store.settings = SimpleNamespace(embeddings_config=EmbeddingsConfig(model="text-embedding-3-large"))
+
+        assert await store.embedding_config("docs") == config
+
+    @pytest.mark.anyio
+    async def test_collection_embeds_with_its_recorded_model(self, monkeypatch):
+        recorded = EmbeddingsConfig(model="text-embedding-3-large", truncate_dim=256)
+        store = _RegistryStore(EmbeddingsConfig(model="text-embedding-3-small"))
+        await store._record_embedding("docs", recorded)
+        other = SimpleNamespace(name="large")
+        monkeypatch.setitem(vectorstore._embedders, recorded.model_dump_json(), other)
+
+        assert await store.embedder_for("docs") is other
+        assert await store.embedder_for("notes") is store.embedder
+
+    @pytest.mark.anyio
+    async def test_renamed_collection_keeps_its_model(self):
+        recorded = EmbeddingsConfig(model="text-embedding-3-large")
+        store = _RegistryStore(EmbeddingsConfig(model="text-embedding-3-small"))
+        await store._record_embedding("docs__shadow_1", recorded)
+        await store._record_embedding("docs", store.settings.embeddings_config)
+
+        await store._move_embedding("docs__shadow_1", "docs")
+
+        assert await store.embedding_config("docs") == recorded
+        assert list(store.catalogs[EMBEDDING_REGISTRY]) == [store._embedding_key("docs")]
+
+    @pytest.mark.anyio
+    async def test_recorded_model_is_cached_until_it_changes(self, monkeypatch):
+        small = EmbeddingsConfig(model="text-embedding-3-small")
+        large = EmbeddingsConfig(model="text-embedding-3-large")
+        store, reembedder = _RegistryStore(small), _RegistryStore(small)
+        reembedder.catalogs = store.catalogs
+        await store._record_embedding("docs", small)
+        assert await store.embedding_config("docs") == small
+
+        # Changed by another process: seen once the cache expires
+        store.catalogs[EMBEDDING_REGISTRY][store._embedding_key("docs")] = large.model_dump()
+        assert await store.embedding_config("docs") == small
+        monkeypatch.setattr(vectorstore, "SERVED_CACHE_SECONDS", 0.0)
+        assert await store.embedding_config("docs") == large
+        monkeypatch.undo()
+
+        # Changed by this process, through any store: seen at once
+        await reembedder._record_embedding("docs", small)
+        assert await store.embedding_config("docs") == small
+
+
+class TestTenancy:
+    """Tests for tenancy keys, search scopes and partition names."""
+
+    def test_project_takes_precedence_over_user(self):
+        assert tenant_key() == SHARED_TENANT
+        assert tenant_key(user_id="u1") == "user_u1"
+        assert tenant_key(user_id="u1", project_id="p1") == "project_p1"
+
+    def test_scope_includes_shared_documents(self):
+        assert tenant_scope() == [SHARED_TENANT]
+        assert tenant_scope(user_id="u1", project_id="p1") == [SHARED_TENANT, "user_u1", "project_p1"]
+
+    def test_agent_searches_default_to_shared_documents(self):
+        assert current_tenant_scope() == [SHARED_TENANT]
+        with scoped_to(user_id="u1", project_id="p1"):
+            assert current_tenant_scope() == [SHARED_TENANT, "user_u1", "project_p1"]
+        assert current_tenant_scope() == [SHARED_TENANT]
+
+    def test_rejects_keys_unsafe_in_filters(self):
+        with pytest.raises(ValueError, match="Invalid tenant"):
+            check_tenant("x' OR '1'='1")
+
+    def test_partition_names_are_short_and_distinct(self):
+        tenant = tenant_key(user_id="0b6b9a3e-5d7e-4c1f-9c7a-2f3d4e5f6a7b")
+        partition = tenant_partition("documents", tenant)
+
+        assert partition.startswith("documents__t_")
+        assert len(tenant_partition("d" * 200, tenant)) <= 63
+        assert partition != tenant_partition("documents", SHARED_TENANT)
+
+    @pytest.mark.anyio
+    async def test_scoped_search_uses_summary_index(self):
+        calls = []
+
+        class _Store:
+            async def embedder_for(self, collection_name):
+                return SimpleNamespace(embed_query=lambda query: [1.0, 0.0])
+
+            async def search_vector(self, collection_name, vector, limit, document_ids=None, tenants=None):
+                calls.append(("chunks", document_ids, tenants))
+                return make_results(limit)
+
+        class _SummaryIndex:
+            async def is_enabled(self, collection_name):
+                return True
+
+            async def top_documents(self, collection_name, vector, limit, tenants=None):
+                calls.append(("summaries", None, tenants))
+                return ["doc-1"]
+
+        service = RetrievalService.__new__(RetrievalService)
+        service.store, service.summary_index = _Store(), _SummaryIndex()
+        service.settings = SimpleNamespace(summary_top_documents=10)
+        scope = tenant_scope(user_id="u1")
+
+        results = await service._vector_search("query", "docs", "", 3, tenants=scope)
+
+        assert len(results) == 3
+        assert calls == [("summaries", None, scope), ("chunks", ["doc-1"], scope)]
+{%- if cookiecutter.use_milvus %}
+
+
+class TestMilvusMetadataClauses:
+    """Milvus takes no ``in`` on JSON paths, and its negations skip unset keys."""
+
+    def test_in_is_spelled_out(self):
+        clause = vectorstore.MilvusVectorStore._metadata_clause
+        assert clause("filetype", "in", ["pdf", "docx"]) == (
+            '(metadata["filetype"] == "pdf" or metadata["filetype"] == "docx")'
+        )
+        assert clause("filetype", "in", []) == "(false)"
+
+    def test_negations_match_unset_keys(self):
+        clause = vectorstore.MilvusVectorStore._metadata_clause
+        assert clause("filetype", "!=", "pdf") == (
+            '(not exists metadata["filetype"] or metadata["filetype"] != "pdf")'
+        )
+        assert clause("filesize", "not in", [10]) == (
+            '(not exists metadata["filesize"] or not (metadata["filesize"] == 10))'
+        )
+{%- endif %}
+{%- if cookiecutter.use_chromadb %}
+
+    @pytest.mark.anyio
+    async def test_chunks_written_before_tenancy_are_shared(self):
+        import chromadb
+
+        store = vectorstore.ChromaVectorStore.__new__(vectorstore.ChromaVectorStore)
+        store.settings = SimpleNamespace(tenant_partitioning=False)
+        store.client = chromadb.EphemeralClient()
+        store._tenants_tagged = set()
+        store.client.get_or_create_collection("legacy_docs").add(
+            ids=["c-1", "c-2"],
+            embeddings=[[1.0, 0.0], [1.0, 0.0]],
+            documents=["legacy", "private"],
+            metadatas=[{"parent_doc_id": "doc-1"}, {"parent_doc_id": "doc-2", "tenant": "user_u1"}],
+        )
+
+        shared = await store.search_vector("legacy_docs", [1.0, 0.0], tenants=[SHARED_TENANT])
+        private = await store.search_vector("legacy_docs", [1.0, 0.0], tenants=["user_u1"])
+
+        assert [r.content for r in shared] == ["legacy"]
+        assert [r.content for r in private] == ["private"]
+{%- endif %}
+{%- endif %}
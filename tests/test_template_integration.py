@@ -154,6 +154,8 @@ class TestGeneratedTemplateAgentsFolder:
         assert agents_path.exists(), "agents/ folder should exist when AI is enabled"
         assert (agents_path / "__init__.py").exists()
         assert (agents_path / "assistant.py").exists()
+        assert (agents_path / "registry.py").exists()
+        assert (agents_path / "http_clients.py").exists()
 
 
 class TestGeneratedTemplateSyntax: